@@ -25,6 +25,23 @@ class Methods:
         getattr(self.roll, method)()
 
 
+class CancellingMethods:
+    # windows summing to zero, as for signed trade directions
+    params = (["alternating", "random"], ["mean", "std", "sum"])
+    param_names = ["values", "method"]
+
+    def setup(self, values, method):
+        N = 10 ** 6
+        if values == "alternating":
+            arr = np.tile([1.0, -1.0], N // 2)
+        else:
+            arr = np.random.choice([1.0, -1.0], N)
+        self.roll = pd.Series(arr).rolling(1000)
+
+    def time_rolling(self, values, method):
+        getattr(self.roll, method)()
+
+
 class Apply:
     params = (
         ["DataFrame", "Series"],
@@ -2,7 +2,7 @@ import cython
 from cython import Py_ssize_t
 from cython cimport floating
 
-from libc.stdlib cimport malloc, free
+from libc.math cimport sqrt
 
 import numpy as np
 cimport numpy as cnp
@@ -36,44 +36,28 @@ cdef enum InterpolationEnumType:
 
 
 cdef inline float64_t median_linear(float64_t* a, int n) nogil:
+    """
+    Median of the non-NA values of a, which are moved in place to its
+    beginning and reordered.
+    """
     cdef:
-        int i, j, na_count = 0
-        float64_t result
-        float64_t* tmp
-
-    if n == 0:
-        return NaN
+        int i, j = 0
 
-    # count NAs
+    # move the non-NA values to the beginning
     for i in range(n):
-        if a[i] != a[i]:
-            na_count += 1
-
-    if na_count:
-        if na_count == n:
-            return NaN
+        if a[i] == a[i]:
+            a[j] = a[i]
+            j += 1
+    n = j
 
-        tmp = <float64_t*>malloc((n - na_count) * sizeof(float64_t))
-
-        j = 0
-        for i in range(n):
-            if a[i] == a[i]:
-                tmp[j] = a[i]
-                j += 1
-
-        a = tmp
-        n -= na_count
+    if n == 0:
+        return NaN
 
     if n % 2:
-        result = kth_smallest_c( a, n // 2, n)
+        return kth_smallest_c(a, n // 2, n)
     else:
-        result = (kth_smallest_c(a, n // 2, n) +
-                  kth_smallest_c(a, n // 2 - 1, n)) / 2
-
-    if na_count:
-        free(a)
-
-    return result
+        return (kth_smallest_c(a, n // 2, n) +
+                kth_smallest_c(a, n // 2 - 1, n)) / 2
 
 
 # TODO: Is this redundant with algos.kth_smallest
@@ -264,6 +248,48 @@ def group_cumsum(numeric[:, :] out,
                     out[i, j] = accum[lab, j]
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumcount(int64_t[:] out, const int64_t[:] labels,
+                   int ngroups, bint ascending=True):
+    """
+    Number each row within its group, in a single pass over the labels
+    rather than by sorting the rows by group.
+
+    Parameters
+    ----------
+    out : array of int64_t values which this method will write its results to
+    labels : array of int64_t values
+        Group labels of the rows, the rows labelled -1 are numbered as
+        one more group.
+    ngroups : int
+        Number of groups, larger than all values of labels.
+    ascending : bool, default True
+        If False, number in reverse, from length of group - 1 to 0.
+    """
+    cdef:
+        Py_ssize_t N, i, ii, offset, sign
+        int64_t lab
+        int64_t[:] label_seen = np.zeros(ngroups + 1, dtype=np.int64)
+
+    N, = (<object>labels).shape
+
+    if ascending:
+        offset, sign = 0, 1
+    else:
+        offset, sign = N - 1, -1
+
+    with nogil:
+        for i in range(N):
+            ii = offset + sign * i
+            lab = labels[ii]
+            if lab < 0:
+                lab = ngroups
+
+            out[ii] = label_seen[lab]
+            label_seen[lab] += 1
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def group_shift_indexer(int64_t[:] out, const int64_t[:] labels,
@@ -660,6 +686,192 @@ group_mean_float32 = _group_mean['float']
 group_mean_float64 = _group_mean['double']
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_multi_agg(int64_t[:, :] nobs,
+                    floating[:, :] sumx,
+                    floating[:, :] m2,
+                    floating[:, :] minx,
+                    floating[:, :] maxx,
+                    floating[:, :] values,
+                    const int64_t[:] labels,
+                    bint compute_m2=False,
+                    bint compute_minmax=False):
+    """
+    Compute in a single pass the states of several reductions of each group.
+
+    The states are the number of non-NA values and their sum (for count, sum
+    and mean), the sum of squared deviations from the mean (for var and std)
+    and the extrema (for min and max). They are computed the same way as in
+    the kernels of the individual reductions.
+
+    Parameters
+    ----------
+    nobs : int64 array
+        Number of non-NA values of each group and column, accumulated in
+        place (initially zeros).
+    sumx, m2, minx, maxx : floating array
+        The states of each group and column, of shape (ngroups, K). sumx
+        and m2 are accumulated in place (initially zeros), m2 only if
+        compute_m2. minx and maxx are filled if compute_minmax, with NaN
+        for groups without values.
+    values : floating array
+        Values to aggregate, of shape (N, K).
+    labels : int64 array
+        Group label of each row, -1 for rows without group.
+    compute_m2, compute_minmax : bool
+        Whether to compute m2, and minx and maxx.
+
+    Notes
+    -----
+    Only aggregates on axis=0.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ngroups
+        floating val, oldmean
+        floating[:, :] mean
+
+    if not len(values) == len(labels):
+        raise ValueError("len(index) != len(labels)")
+
+    N, K = (<object>values).shape
+    ngroups = len(nobs)
+
+    mean = np.zeros_like(sumx)
+    if compute_minmax:
+        minx[:, :] = np.inf
+        maxx[:, :] = -np.inf
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+                    if compute_m2:
+                        oldmean = mean[lab, j]
+                        mean[lab, j] += (val - oldmean) / nobs[lab, j]
+                        m2[lab, j] += (val - mean[lab, j]) * (val - oldmean)
+
+                    if compute_minmax:
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+
+        if compute_minmax:
+            for i in range(ngroups):
+                for j in range(K):
+                    if nobs[i, j] == 0:
+                        minx[i, j] = NAN
+                        maxx[i, j] = NAN
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_transform_reduce(floating[:, :] out,
+                           floating[:, :] values,
+                           const int64_t[:] labels,
+                           Py_ssize_t ngroups,
+                           str how,
+                           Py_ssize_t min_count=0,
+                           int64_t ddof=1):
+    """
+    Broadcast a reduction of each group to the rows of the group.
+
+    Parameters
+    ----------
+    out : floating array
+        Output of shape (N, K), filled with the reduction of the group of
+        each row, NaN for rows without group.
+    values : floating array
+        Values to reduce, of shape (N, K).
+    labels : int64 array
+        Group label of each row, -1 for rows without group.
+    ngroups : int
+        Number of groups.
+    how : {'sum', 'mean', 'min', 'max', 'var', 'std'}
+        Reduction, computed as in group_multi_agg.
+    min_count : int, default 0
+        For sum, groups with fewer non-NA values are NaN.
+    ddof : int, default 1
+        Delta degrees of freedom for var and std.
+
+    Notes
+    -----
+    Only reduces on axis=0.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        bint is_sum = how == 'sum'
+        bint is_mean = how == 'mean'
+        bint is_std = how == 'std'
+        bint compute_m2 = how in ['var', 'std']
+        bint compute_minmax = how in ['min', 'max']
+        int64_t[:, :] nobs
+        floating[:, :] sumx, m2, minx, maxx, state
+
+    if how not in ['sum', 'mean', 'min', 'max', 'var', 'std']:
+        raise ValueError(f"Unsupported reduction '{how}'")
+
+    N, K = (<object>values).shape
+
+    nobs = np.zeros((ngroups, K), dtype=np.int64)
+    sumx = np.zeros((ngroups, K), dtype=np.asarray(out).dtype)
+    m2 = np.zeros_like(sumx)
+    minx = np.empty_like(sumx)
+    maxx = np.empty_like(sumx)
+    group_multi_agg(nobs, sumx, m2, minx, maxx, values, labels,
+                    compute_m2=compute_m2, compute_minmax=compute_minmax)
+
+    # finalize the state of each group, then broadcast it
+    if how == 'min':
+        state = minx
+    elif how == 'max':
+        state = maxx
+    elif compute_m2:
+        state = m2
+    else:
+        state = sumx
+
+    with nogil:
+        for i in range(ngroups):
+            for j in range(K):
+                if is_sum:
+                    if nobs[i, j] < min_count:
+                        state[i, j] = NAN
+                elif is_mean:
+                    if nobs[i, j] == 0:
+                        state[i, j] = NAN
+                    else:
+                        state[i, j] /= nobs[i, j]
+                elif compute_m2:
+                    if nobs[i, j] <= ddof:
+                        state[i, j] = NAN
+                    else:
+                        state[i, j] /= nobs[i, j] - ddof
+                        if is_std:
+                            state[i, j] = sqrt(state[i, j])
+
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                for j in range(K):
+                    out[i, j] = NAN
+            else:
+                for j in range(K):
+                    out[i, j] = state[lab, j]
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def _group_ohlc(floating[:, :] out,
@@ -712,45 +924,136 @@ group_ohlc_float32 = _group_ohlc['float']
 group_ohlc_float64 = _group_ohlc['double']
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_ohlcv(float64_t[:, ::1] out,
+                int64_t[::1] counts,
+                int64_t[:, ::1] times,
+                const float64_t[:] prices,
+                const float64_t[:] volumes,
+                const int64_t[:] timestamps,
+                const int64_t[:] labels):
+    """
+    Open, high, low and close prices, volume and volume weighted average
+    price of the trades of each group, with their number and the timestamps
+    of the first and last ones, in a single pass.
+
+    Parameters
+    ----------
+    out : array of float64_t with shape (ngroups, 6)
+        Open, high, low, close, volume and vwap of each group.
+    counts : array of int64_t
+        Number of trades of each group.
+    times : array of int64_t with shape (ngroups, 2)
+        Timestamps of the first and last trades of each group.
+    prices : array of float64_t
+        Prices of the trades. The trades without a price are skipped.
+    volumes : array of float64_t
+        Volumes of the trades. A missing volume counts as zero.
+    timestamps : array of int64_t
+        Timestamps of the trades.
+    labels : array of int64_t
+        Group of each trade, -1 for the trades left out.
+    """
+    cdef:
+        Py_ssize_t i, lab, N = len(labels), ngroups = len(counts)
+        float64_t price, volume
+
+    if out.shape[1] != 6:
+        raise ValueError('Output array must have 6 columns')
+
+    with nogil:
+        for lab in range(ngroups):
+            out[lab, 0] = out[lab, 1] = out[lab, 2] = out[lab, 3] = NaN
+            # the notional is accumulated in the vwap column
+            out[lab, 4] = out[lab, 5] = 0
+            times[lab, 0] = times[lab, 1] = NPY_NAT
+            counts[lab] = 0
+
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            price = prices[i]
+            if price != price:
+                continue
+
+            if counts[lab] == 0:
+                out[lab, 0] = out[lab, 1] = out[lab, 2] = price
+                times[lab, 0] = timestamps[i]
+            else:
+                out[lab, 1] = max(out[lab, 1], price)
+                out[lab, 2] = min(out[lab, 2], price)
+            out[lab, 3] = price
+            times[lab, 1] = timestamps[i]
+            counts[lab] += 1
+
+            volume = volumes[i]
+            if volume == volume:
+                out[lab, 4] += volume
+                out[lab, 5] += price * volume
+
+        for lab in range(ngroups):
+            if out[lab, 4] != 0:
+                out[lab, 5] /= out[lab, 4]
+            else:
+                out[lab, 5] = NaN
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def group_quantile(ndarray[float64_t] out,
+def group_quantile(ndarray[float64_t, ndim=2] out,
                    ndarray[int64_t] labels,
                    numeric[:] values,
                    ndarray[uint8_t] mask,
-                   float64_t q,
+                   const float64_t[:] qs,
                    object interpolation):
     """
-    Calculate the quantile per group.
+    Calculate the quantiles per group.
 
     Parameters
     ----------
     out : ndarray
-        Array of aggregated values that will be written to.
+        Array of aggregated values that will be written to, of shape
+        (ngroups, len(qs)).
     labels : ndarray
         Array containing the unique group labels.
     values : ndarray
         Array containing the values to apply the function against.
-    q : float
-        The quantile value to search for.
+    mask : ndarray
+        Array indicating the missing values.
+    qs : ndarray
+        The quantile values to search for.
+    interpolation : {'linear', 'lower', 'higher', 'nearest', 'midpoint'}
 
     Notes
     -----
     Rather than explicitly returning a value, this function modifies the
     provided `out` parameter.
+
+    The non-NA values are first gathered contiguously by group with a
+    counting sort on the labels. With few quantiles, each one is then found
+    by selection within its group, each selection narrowing the range of the
+    next one. With many quantiles, the values are sorted once beforehand so
+    that the groups are gathered in sorted order.
     """
     cdef:
-        Py_ssize_t i, N=len(labels), ngroups, grp_sz, non_na_sz
-        Py_ssize_t grp_start=0, idx=0
+        Py_ssize_t i, j, k, m, N=len(labels), ngroups, nqs, non_na_sz, lo, idx
         int64_t lab
         uint8_t interp
-        float64_t q_idx, frac, val, next_val
-        ndarray[int64_t] counts, non_na_counts, sort_arr
+        bint presorted
+        float64_t q, q_idx, frac, val, next_val
+        ndarray[int64_t] non_na_counts, starts, order, q_order
+        ndarray[float64_t] data
+        float64_t* ptr
 
     assert values.shape[0] == N
 
-    if not (0 <= q <= 1):
-        raise ValueError(f"'q' must be between 0 and 1. Got '{q}' instead")
+    for j in range(len(qs)):
+        q = qs[j]
+        if not (0 <= q <= 1):
+            raise ValueError(f"'q' must be between 0 and 1. Got '{q}' instead")
 
     inter_methods = {
         'linear': INTERPOLATION_LINEAR,
@@ -761,68 +1064,94 @@ def group_quantile(ndarray[float64_t] out,
     }
     interp = inter_methods[interpolation]
 
-    counts = np.zeros_like(out, dtype=np.int64)
-    non_na_counts = np.zeros_like(out, dtype=np.int64)
-    ngroups = len(counts)
+    ngroups, nqs = (<object>out).shape
+    non_na_counts = np.zeros(ngroups, dtype=np.int64)
 
-    # First figure out the size of every group
+    # First figure out the number of non-NA values of every group
     with nogil:
         for i in range(N):
             lab = labels[i]
-            if lab == -1:  # NA group label
+            if lab == -1 or mask[i]:
                 continue
+            non_na_counts[lab] += 1
 
-            counts[lab] += 1
-            if not mask[i]:
-                non_na_counts[lab] += 1
-
-    # Get an index of values sorted by labels and then values
-    if labels.any():
-        # Put '-1' (NaN) labels as the last group so it does not interfere
-        # with the calculations.
-        labels_for_lexsort = np.where(labels == -1, labels.max() + 1, labels)
+    # selecting each quantile takes linear time, sorting is faster when
+    # many quantiles are requested
+    presorted = nqs > 32
+    if presorted:
+        order = np.argsort(values).astype(np.int64, copy=False)
     else:
-        labels_for_lexsort = labels
-    order = (values, labels_for_lexsort)
-    sort_arr = np.lexsort(order).astype(np.int64, copy=False)
+        order = np.arange(N, dtype=np.int64)
+
+    # Gather the non-NA values of each group contiguously
+    starts = np.cumsum(non_na_counts) - non_na_counts
+    data = np.empty(non_na_counts.sum(), dtype=np.float64)
+    ptr = <float64_t*>cnp.PyArray_DATA(data)
+
+    with nogil:
+        for k in range(N):
+            i = order[k]
+            lab = labels[i]
+            if lab == -1 or mask[i]:
+                continue
+            data[starts[lab]] = values[i]
+            starts[lab] += 1
+
+    q_order = np.argsort(qs).astype(np.int64, copy=False)
 
     with nogil:
         for i in range(ngroups):
-            # Figure out how many group elements there are
-            grp_sz = counts[i]
             non_na_sz = non_na_counts[i]
+            lo = 0
+
+            for k in range(nqs):
+                j = q_order[k]
+                if non_na_sz == 0:
+                    out[i, j] = NaN
+                    continue
 
-            if non_na_sz == 0:
-                out[i] = NaN
-            else:
                 # Calculate where to retrieve the desired value
                 # Casting to int will intentionally truncate result
-                idx = grp_start + <int64_t>(q * <float64_t>(non_na_sz - 1))
-
-                val = values[sort_arr[idx]]
-                # If requested quantile falls evenly on a particular index
-                # then write that index's value out. Otherwise interpolate
+                q = qs[j]
                 q_idx = q * (non_na_sz - 1)
+                idx = <Py_ssize_t>q_idx
                 frac = q_idx % 1
 
+                if presorted:
+                    val = ptr[idx]
+                else:
+                    # the values after lo are not smaller than the previous
+                    # (lower) quantiles, so the next ones are selected there
+                    val = kth_smallest_c(ptr + lo, idx - lo, non_na_sz - lo)
+                    lo = idx
+
+                # If requested quantile falls evenly on a particular index
+                # then write that index's value out. Otherwise interpolate
                 if frac == 0.0 or interp == INTERPOLATION_LOWER:
-                    out[i] = val
+                    out[i, j] = val
+                    continue
+
+                if presorted:
+                    next_val = ptr[idx + 1]
                 else:
-                    next_val = values[sort_arr[idx + 1]]
-                    if interp == INTERPOLATION_LINEAR:
-                        out[i] = val + (next_val - val) * frac
-                    elif interp == INTERPOLATION_HIGHER:
-                        out[i] = next_val
-                    elif interp == INTERPOLATION_MIDPOINT:
-                        out[i] = (val + next_val) / 2.0
-                    elif interp == INTERPOLATION_NEAREST:
-                        if frac > .5 or (frac == .5 and q > .5):  # Always OK?
-                            out[i] = next_val
-                        else:
-                            out[i] = val
+                    next_val = ptr[idx + 1]
+                    for m in range(idx + 2, non_na_sz):
+                        if ptr[m] < next_val:
+                            next_val = ptr[m]
+
+                if interp == INTERPOLATION_LINEAR:
+                    out[i, j] = val + (next_val - val) * frac
+                elif interp == INTERPOLATION_HIGHER:
+                    out[i, j] = next_val
+                elif interp == INTERPOLATION_MIDPOINT:
+                    out[i, j] = (val + next_val) / 2.0
+                elif interp == INTERPOLATION_NEAREST:
+                    if frac > .5 or (frac == .5 and q > .5):  # Always OK?
+                        out[i, j] = next_val
+                    else:
+                        out[i, j] = val
 
-            # Increment the index reference in sorted_arr for the next group
-            grp_start += grp_sz
+            ptr += non_na_sz
 
 
 # ----------------------------------------------------------------------
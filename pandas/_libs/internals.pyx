@@ -360,7 +360,7 @@ cdef slice indexer_as_slice(int64_t[:] vals):
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def get_blkno_indexers(int64_t[:] blknos, bint group=True):
+def get_blkno_indexers(const int64_t[:] blknos, bint group=True):
     """
     Enumerate contiguous runs of integers in ndarray.
 
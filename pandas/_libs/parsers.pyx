@@ -1,13 +1,10 @@
 # Copyright (c) 2012, Lambda Foundry, Inc.
 # See LICENSE for the license
-import bz2
-import gzip
 import io
 import os
 import sys
 import time
 import warnings
-import zipfile
 
 from csv import QUOTE_MINIMAL, QUOTE_NONNUMERIC, QUOTE_NONE
 from errno import ENOENT
@@ -57,11 +54,11 @@ from pandas.core.dtypes.common import (
     pandas_dtype, is_extension_array_dtype)
 from pandas.core.dtypes.concat import union_categoricals
 
-from pandas.compat import _import_lzma, _get_lzma_file
 from pandas.errors import (ParserError, DtypeWarning,
                            EmptyDataError, ParserWarning)
 
-lzma = _import_lzma()
+from pandas.io.common import get_handle
+
 
 cdef:
     float64_t INF = <float64_t>np.inf
@@ -207,6 +204,10 @@ cdef extern from "parser/tokenizer.h":
 
     int parser_set_skipfirstnrows(parser_t *self, int64_t nrows)
 
+    int parser_set_fwf_colspecs(parser_t *self, int64_t ncols,
+                                const int64_t *starts, const int64_t *ends,
+                                const char *strip)
+
     void parser_set_default_options(parser_t *self)
 
     int parser_consume_rows(parser_t *self, size_t nrows)
@@ -269,6 +270,7 @@ cdef class TextReader:
         object na_fvalues
         object true_values, false_values
         object handle
+        list extra_handles
         bint na_filter, keep_default_na, verbose, has_usecols, has_mi_columns
         uint64_t parser_start
         list clocks
@@ -332,7 +334,8 @@ cdef class TextReader:
                   bint verbose=False,
                   bint mangle_dupe_cols=True,
                   float_precision=None,
-                  bint skip_blank_lines=True):
+                  bint skip_blank_lines=True,
+                  colspecs=None):
 
         # set encoding for native Python and C library
         if encoding is not None:
@@ -354,6 +357,7 @@ cdef class TextReader:
         self.clocks = []
 
         self.compression = compression
+        self.extra_handles = []
         self.memory_map = memory_map
 
         self.parser.usecols = (usecols is not None)
@@ -363,7 +367,11 @@ cdef class TextReader:
 
         parser_init(self.parser)
 
-        if delim_whitespace:
+        if colspecs is not None:
+            # fixed-width fields, the delimiter is the set of characters
+            # stripped from the fields
+            self._set_colspecs(colspecs, delimiter)
+        elif delim_whitespace:
             self.parser.delim_whitespace = delim_whitespace
         else:
             if len(delimiter) > 1:
@@ -542,6 +550,9 @@ cdef class TextReader:
         # filehandle here, e.g. and UTFRecoder
         if self.handle is not None:
             self.handle.close()
+        for handle in self.extra_handles:
+            handle.close()
+        self.extra_handles = []
 
         # also preemptively free all allocated memory
         parser_free(self.parser)
@@ -586,6 +597,27 @@ cdef class TextReader:
         else:
             self.parser.skipfunc = <PyObject *>self.skiprows
 
+    cdef _set_colspecs(self, list colspecs, object delimiter):
+        cdef:
+            Py_ssize_t i, ncols = len(colspecs)
+            ndarray[int64_t] starts = np.empty(ncols, dtype=np.int64)
+            ndarray[int64_t] ends = np.empty(ncols, dtype=np.int64)
+            bytes strip
+
+        for i, (start, end) in enumerate(colspecs):
+            starts[i] = 0 if start is None else start
+            ends[i] = -1 if end is None else end
+
+        # same characters as FixedWidthReader strips
+        if delimiter:
+            strip = b'\r\n' + delimiter.encode('utf-8')
+        else:
+            strip = b'\n\r\t '
+
+        if parser_set_fwf_colspecs(self.parser, ncols, <int64_t *>starts.data,
+                                   <int64_t *>ends.data, strip) < 0:
+            raise MemoryError()
+
     cdef _setup_parser_source(self, source):
         cdef:
             void *ptr
@@ -594,35 +626,12 @@ cdef class TextReader:
         self.parser.cb_cleanup = NULL
 
         if self.compression:
-            if self.compression == 'gzip':
-                if isinstance(source, str):
-                    source = gzip.GzipFile(source, 'rb')
-                else:
-                    source = gzip.GzipFile(fileobj=source)
-            elif self.compression == 'bz2':
-                source = bz2.BZ2File(source, 'rb')
-            elif self.compression == 'zip':
-                zip_file = zipfile.ZipFile(source)
-                zip_names = zip_file.namelist()
-
-                if len(zip_names) == 1:
-                    file_name = zip_names.pop()
-                    source = zip_file.open(file_name)
-
-                elif len(zip_names) == 0:
-                    raise ValueError(f'Zero files found in compressed '
-                                     f'zip file {source}')
-                else:
-                    raise ValueError(f'Multiple files found in compressed '
-                                     f'zip file {zip_names}')
-            elif self.compression == 'xz':
-                if isinstance(source, str):
-                    source = _get_lzma_file(lzma)(source, 'rb')
-                else:
-                    source = _get_lzma_file(lzma)(filename=source)
-            else:
-                raise ValueError(f'Unrecognized compression type: '
-                                 f'{self.compression}')
+            source, handles = get_handle(source, 'rb',
+                                         compression=self.compression,
+                                         is_text=False)
+            # the handle closes itself, the others (e.g. the zip archive)
+            # are closed along with it in close()
+            self.extra_handles = [h for h in handles if h is not source]
 
             if (self.encoding and hasattr(source, "read") and
                     not hasattr(source, "encoding")):
@@ -3,8 +3,6 @@ from copy import copy
 from cython import Py_ssize_t
 from cpython.ref cimport Py_INCREF
 
-from libc.stdlib cimport malloc, free
-
 import numpy as np
 cimport numpy as cnp
 from numpy cimport (ndarray,
@@ -15,7 +13,41 @@ from numpy cimport (ndarray,
 cnp.import_array()
 
 from pandas._libs cimport util
-from pandas._libs.lib import maybe_convert_objects, is_scalar
+from pandas._libs.lib import maybe_convert_objects
+
+
+cdef extern from "Python.h":
+    Py_ssize_t Py_REFCNT(object o)
+
+cdef extern from "numpy/arrayobject.h":
+    # steals a reference to descr
+    object PyArray_NewFromDescr(void* subtype, void* descr, int nd,
+                                cnp.npy_intp* dims, cnp.npy_intp* strides,
+                                void* data, int flags, void* obj)
+
+
+cdef inline ndarray _view_columns(ndarray values, Py_ssize_t start,
+                                  Py_ssize_t end):
+    """
+    The view values[..., start:end], made without parsing a slice.
+    """
+    cdef:
+        int nd = cnp.PyArray_NDIM(values)
+        cnp.npy_intp* strides = cnp.PyArray_STRIDES(values)
+        cnp.npy_intp dims[2]
+        cnp.PyArray_Descr* descr = cnp.PyArray_DESCR(values)
+        ndarray view
+
+    dims[0] = cnp.PyArray_DIMS(values)[0]
+    dims[nd - 1] = end - start
+    Py_INCREF(<object>descr)
+    view = PyArray_NewFromDescr(
+        <void*>ndarray, descr, nd, dims, strides,
+        cnp.PyArray_BYTES(values) + start * strides[nd - 1],
+        cnp.PyArray_FLAGS(values) & cnp.NPY_ARRAY_WRITEABLE, NULL,
+    )
+    cnp.set_array_base(view, values)
+    return view
 
 
 cdef _check_result_array(object obj, Py_ssize_t cnt):
@@ -478,144 +510,258 @@ cdef class Slider:
         self.buf.strides[0] = self.orig_stride
 
 
-class InvalidApply(Exception):
-    pass
-
-
 def apply_frame_axis0(object frame, object f, object names,
                       const int64_t[:] starts, const int64_t[:] ends):
+    """
+    Apply f to the frames of the rows starts[i]:ends[i] of frame, named
+    names[i], and return the results and whether the index of a result
+    differs from the index of its rows.
+    """
+    from pandas.core.generic import NDFrame
+
     cdef:
-        BlockSlider slider
+        BlockSlicer slicer
         Py_ssize_t i, n = len(starts)
         list results
-        object piece
-        dict item_cache
-
-    # We have already checked that we don't have a MultiIndex before calling
-    assert frame.index.nlevels == 1
+        object chunk, index, piece
+        bint mutated = False
 
+    slicer = BlockSlicer(frame)
+    names = list(names)
     results = []
 
-    slider = BlockSlider(frame)
-
-    mutated = False
-    item_cache = slider.dummy._item_cache
-    try:
-        for i in range(n):
-            slider.move(starts[i], ends[i])
-
-            item_cache.clear()  # ugh
-            chunk = slider.dummy
-            object.__setattr__(chunk, 'name', names[i])
-
-            try:
-                piece = f(chunk)
-            except Exception:
-                # We can't be more specific without knowing something about `f`
-                raise InvalidApply('Let this error raise above us')
-
-            # Need to infer if low level index slider will cause segfaults
-            require_slow_apply = i == 0 and piece is chunk
-            try:
-                if not piece.index.equals(chunk.index):
-                    mutated = True
-            except AttributeError:
-                # `piece` might not have an index, could be e.g. an int
-                pass
-
-            if not is_scalar(piece):
-                # Need to copy data to avoid appending references
-                try:
-                    piece = piece.copy(deep="all")
-                except (TypeError, AttributeError):
-                    piece = copy(piece)
-
-            results.append(piece)
-
-            # If the data was modified inplace we need to
-            # take the slow path to not risk segfaults
-            # we have already computed the first piece
-            if require_slow_apply:
-                break
-    finally:
-        slider.reset()
+    for i in range(n):
+        chunk = slicer.move(starts[i], ends[i])
+        object.__setattr__(chunk, "name", names[i])
+        # f may modify the chunk
+        index = chunk.index
+        slicer.record()
+
+        piece = f(chunk)
+        if not mutated and isinstance(piece, NDFrame):
+            mutated = not piece.index.equals(index)
+
+        results.append(piece)
+        slicer.release()
 
     return results, mutated
 
 
-cdef class BlockSlider:
-    """
-    Only capable of sliding on axis=0
+cdef class BlockSlicer:
     """
+    Make the DataFrames of row slices of a frame, whose blocks are views on
+    the blocks of the frame.
 
-    cdef public:
-        object frame, dummy, index
-        int nblocks
-        Slider idx_slider
-        list blocks
+    The columns and the block layout of the frame are shared by the slices,
+    and the DataFrame, BlockManager and Block objects are created directly
+    rather than through their constructors, which validate and lay out the
+    data again.
+
+    ``move`` reuses the objects of the previous slice, pointing its blocks
+    and index at new views, as long as ``release`` found that nothing kept a
+    reference to them or modified them.
+    """
 
     cdef:
-        char **base_ptrs
+        object frame_type, mgr_type, items, full_index, index_type
+        object index_values, index_name, blknos, blklocs
+        bint fast_frame, fast_index, reuse_index
+        bint known_consolidated, is_consolidated
+        list block_types, block_values, block_locs, block_ndims
+        list block_is_1d, block_is_ndarray
+        Py_ssize_t nblocks
+
+        # the objects of the current slice and their reference counts
+        object frame, mgr, index, blocks
+        dict frame_dict
+        Py_ssize_t frame_refs, mgr_refs, index_refs, frame_attrs
+        ndarray block_refs
 
     def __init__(self, object frame):
+        from pandas.core.frame import DataFrame
+        from pandas.core.indexes.api import Index, MultiIndex, RangeIndex
+
+        mgr = frame._mgr
+        self.frame_type = type(frame)
+        self.mgr_type = type(mgr)
+        # subclasses may hold more state, set by their constructor
+        self.fast_frame = self.frame_type is DataFrame
+
+        self.items = mgr.axes[0]
+        index = mgr.axes[1]
+        self.full_index = index
+        self.index_type = type(index)
+        self.index_values = index._values
+        self.index_name = index.name
+        self.fast_index = not isinstance(index, (MultiIndex, RangeIndex))
+        # an index holding an ndarray can be pointed at another ndarray
+        self.reuse_index = (
+            self.fast_index
+            and self.index_type._simple_new.__func__ is Index._simple_new.__func__
+            and type(self.index_values) is np.ndarray
+        )
+
+        # the slices only replace the layout of their blocks, see
+        # BlockManager.iset
+        self.blknos = mgr.blknos
+        self.blklocs = mgr.blklocs
+        self.blknos.flags.writeable = False
+        self.blklocs.flags.writeable = False
+        self.is_consolidated = mgr.is_consolidated()
+        self.known_consolidated = mgr._known_consolidated
+
+        self.nblocks = len(mgr.blocks)
+        self.block_types = [type(blk) for blk in mgr.blocks]
+        self.block_values = [blk.values for blk in mgr.blocks]
+        self.block_locs = [blk.mgr_locs for blk in mgr.blocks]
+        self.block_ndims = [blk.ndim for blk in mgr.blocks]
+        # extension arrays are 1D in a 2D block
+        self.block_is_1d = [blk.values.ndim == 1 for blk in mgr.blocks]
+        self.block_is_ndarray = [
+            type(blk.values) is np.ndarray and blk.values.ndim <= 2
+            for blk in mgr.blocks
+        ]
+        self.block_refs = np.empty(self.nblocks, dtype=np.intp)
+
+    cdef inline object _slice_values(self, Py_ssize_t i, Py_ssize_t start,
+                                     Py_ssize_t end):
+        if self.block_is_ndarray[i]:
+            return _view_columns(self.block_values[i], start, end)
+        if self.block_is_1d[i]:
+            return self.block_values[i][start:end]
+        return self.block_values[i][:, start:end]
+
+    cdef inline object _slice_index(self, Py_ssize_t start, Py_ssize_t end):
+        if self.fast_index:
+            return self.index_type._simple_new(
+                self.index_values[start:end], name=self.index_name
+            )
+        return self.full_index[start:end]
+
+    cpdef object chop(self, Py_ssize_t start, Py_ssize_t end):
+        """
+        A new DataFrame of the rows start:end.
+        """
         cdef:
             Py_ssize_t i
-            object b
-
-        self.frame = frame
-        self.dummy = frame[:0]
-        self.index = self.dummy.index
-
-        self.blocks = [b.values for b in self.dummy._mgr.blocks]
-
-        for x in self.blocks:
-            util.set_array_not_contiguous(x)
-
-        self.nblocks = len(self.blocks)
-        # See the comment in indexes/base.py about _index_data.
-        # We need this for EA-backed indexes that have a reference to a 1-d
-        # ndarray like datetime / timedelta / period.
-        self.idx_slider = Slider(
-            self.frame.index._index_data, self.dummy.index._index_data)
-
-        self.base_ptrs = <char**>malloc(sizeof(char*) * len(self.blocks))
-        for i, block in enumerate(self.blocks):
-            self.base_ptrs[i] = (<ndarray>block).data
+            list blocks = []
+            object blk, index, mgr, frame, typ
 
-    def __dealloc__(self):
-        free(self.base_ptrs)
-
-    cdef move(self, int start, int end):
+        for i in range(self.nblocks):
+            typ = self.block_types[i]
+            blk = typ.__new__(typ)
+            blk.values = self._slice_values(i, start, end)
+            blk._mgr_locs = self.block_locs[i]
+            blk.ndim = self.block_ndims[i]
+            blocks.append(blk)
+
+        index = self._slice_index(start, end)
+
+        mgr = self.mgr_type.__new__(self.mgr_type)
+        mgr.axes = [self.items, index]
+        mgr.blocks = tuple(blocks)
+        mgr._known_consolidated = self.known_consolidated
+        mgr._is_consolidated = self.is_consolidated
+        mgr._blknos = self.blknos
+        mgr._blklocs = self.blklocs
+
+        if not self.fast_frame:
+            return self.frame_type(mgr)
+        frame = self.frame_type.__new__(self.frame_type)
+        object.__setattr__(frame, "_is_copy", None)
+        object.__setattr__(frame, "_mgr", mgr)
+        object.__setattr__(frame, "_item_cache", {})
+        object.__setattr__(frame, "_attrs", {})
+        return frame
+
+    cdef object move(self, Py_ssize_t start, Py_ssize_t end):
+        """
+        The DataFrame of the rows start:end, reusing the objects of the
+        previous slice if they were released.
+        """
         cdef:
-            ndarray arr
             Py_ssize_t i
+            object values
+
+        if self.frame is None:
+            frame = self.chop(start, end)
+            if self.fast_frame:
+                self.frame = frame
+                self.frame_dict = frame.__dict__
+                self.mgr = frame._mgr
+                self.index = self.mgr.axes[1]
+                self.blocks = self.mgr.blocks
+            return frame
 
-        # move blocks
         for i in range(self.nblocks):
-            arr = self.blocks[i]
+            self.blocks[i].values = self._slice_values(i, start, end)
 
-            # axis=1 is the frame's axis=0
-            arr.data = self.base_ptrs[i] + arr.strides[1] * start
-            arr.shape[1] = end - start
-
-        # move and set the index
-        self.idx_slider.move(start, end)
-
-        object.__setattr__(self.index, '_index_data', self.idx_slider.buf)
-        self.index._engine.clear_mapping()
+        if self.reuse_index:
+            values = _view_columns(self.index_values, start, end)
+            self.index._data = values
+            self.index._index_data = values
+        else:
+            self.index = self._slice_index(start, end)
+            self.mgr.axes[1] = self.index
+        return self.frame
 
-    cdef reset(self):
+    cdef record(self):
+        """
+        Record the references to the objects of the current slice.
+        """
         cdef:
-            ndarray arr
             Py_ssize_t i
 
-        # reset blocks
+        if self.frame is None:
+            return
+        self.frame_refs = Py_REFCNT(self.frame)
+        self.mgr_refs = Py_REFCNT(self.mgr)
+        self.index_refs = Py_REFCNT(self.index)
+        self.frame_attrs = len(self.frame_dict)
         for i in range(self.nblocks):
-            arr = self.blocks[i]
+            self.block_refs[i] = Py_REFCNT(self.blocks[i])
 
-            # axis=1 is the frame's axis=0
-            arr.data = self.base_ptrs[i]
-            arr.shape[1] = 0
+    cdef release(self):
+        """
+        Discard the objects of the current slice if a reference to them was
+        kept, or if they were modified, since the last call to record.
+        """
+        cdef:
+            Py_ssize_t i
+            object frame = self.frame, mgr = self.mgr, blk
+            dict attrs = self.frame_dict
+            bint reuse
+
+        if frame is None:
+            return
+
+        # drop the references held by the caches
+        attrs["_item_cache"].clear()
+        self.index._cache.clear()
+
+        reuse = (
+            Py_REFCNT(frame) == self.frame_refs
+            and Py_REFCNT(mgr) == self.mgr_refs
+            and Py_REFCNT(self.index) == self.index_refs
+            and len(attrs) == self.frame_attrs
+            and attrs["_mgr"] is mgr
+            and attrs["_is_copy"] is None
+            and not attrs["_attrs"]
+            and mgr.blocks is self.blocks
+            and mgr.axes[0] is self.items
+            and mgr.axes[1] is self.index
+            and mgr._blknos is self.blknos
+        )
+        if reuse:
+            for i in range(self.nblocks):
+                blk = self.blocks[i]
+                if (Py_REFCNT(blk) != self.block_refs[i]
+                        or blk._mgr_locs is not self.block_locs[i]):
+                    reuse = False
+                    break
+        if not reuse:
+            self.frame = self.mgr = self.index = self.blocks = None
+            self.frame_dict = None
 
 
 def compute_reduction(arr: ndarray, f, axis: int = 0, dummy=None, labels=None):
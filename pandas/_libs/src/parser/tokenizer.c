@@ -129,6 +129,9 @@ int parser_cleanup(parser_t *self) {
         self->skipset = NULL;
     }
 
+    free_if_not_null((void *)&self->fwf_starts);
+    free_if_not_null((void *)&self->fwf_ends);
+
     if (parser_clear_data_buffers(self) < 0) {
         status = -1;
     }
@@ -555,6 +558,30 @@ int parser_set_skipfirstnrows(parser_t *self, int64_t nrows) {
     return 0;
 }
 
+int parser_set_fwf_colspecs(parser_t *self, int64_t ncols,
+                            const int64_t *starts, const int64_t *ends,
+                            const char *strip) {
+    free_if_not_null((void *)&self->fwf_starts);
+    free_if_not_null((void *)&self->fwf_ends);
+    self->fwf_ncols = 0;
+
+    self->fwf_starts = (int64_t *)malloc(ncols * sizeof(int64_t));
+    self->fwf_ends = (int64_t *)malloc(ncols * sizeof(int64_t));
+    if (self->fwf_starts == NULL || self->fwf_ends == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+    memcpy(self->fwf_starts, starts, ncols * sizeof(int64_t));
+    memcpy(self->fwf_ends, ends, ncols * sizeof(int64_t));
+
+    memset(self->fwf_strip, 0, sizeof(self->fwf_strip));
+    for (; *strip != '\0'; ++strip) {
+        self->fwf_strip[(unsigned char)*strip] = 1;
+    }
+
+    self->fwf_ncols = ncols;
+    return 0;
+}
+
 static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
     int status;
     size_t bytes_read;
@@ -1131,6 +1158,127 @@ linelimit:
     return 0;
 }
 
+/*
+
+  Fixed-width tokenization
+
+  Every line is cut into fwf_ncols fields at the offsets in fwf_starts and
+  fwf_ends (half-open intervals, an end of -1 runs to the end of the line)
+  and the characters in fwf_strip are removed from both ends of each field.
+  Offsets count UTF-8 code points rather than bytes, so they agree with the
+  str slicing done by the python-fwf engine.
+
+*/
+
+static int end_fwf_field(parser_t *self) {
+    // drop the trailing strip characters of the field
+    self->stream_len -= self->fwf_trail;
+    self->fwf_trail = 0;
+    self->fwf_col++;
+    return end_field(self);
+}
+
+static int end_fwf_line(parser_t *self) {
+    // columns past the end of a short line are empty
+    if (self->state != IN_FIELD_IN_SKIP_LINE) {
+        while (self->fwf_col < self->fwf_ncols) {
+            if (end_fwf_field(self) < 0) return -1;
+        }
+    }
+    return end_line(self);
+}
+
+static int tokenize_fwf_bytes(parser_t *self,
+                              size_t line_limit, uint64_t start_lines) {
+    int64_t i, pos;
+    int should_skip;
+    unsigned char c;
+    char *buf = self->data + self->datapos;
+
+    if (self->file_lines == 0 && self->state == START_RECORD) {
+        CHECK_FOR_BOM();
+    }
+
+    for (i = self->datapos; i < self->datalen; ++i) {
+        c = (unsigned char)*buf++;
+
+        if (self->state == EAT_CRNL_NOP) {
+            self->state = START_RECORD;
+            if (c == '\n') continue;
+        }
+
+        if (self->state == START_RECORD) {
+            should_skip = skip_this_line(self, self->file_lines);
+            if (should_skip == -1) {
+                goto parsingerror;
+            }
+            self->state = should_skip ? IN_FIELD_IN_SKIP_LINE : IN_FIELD;
+            self->fwf_pos = 0;
+            self->fwf_col = 0;
+            self->fwf_trail = 0;
+
+            // the rest of the buffer plus a terminator for every column
+            if (make_stream_space(self, self->datalen - i +
+                                  self->fwf_ncols) < 0) {
+                int64_t bufsize = 100;
+                self->error_msg = (char *)malloc(bufsize);
+                snprintf(self->error_msg, bufsize, "out of memory");
+                goto parsingerror;
+            }
+        }
+
+        if (c == '\n' || c == '\r') {
+            if (end_fwf_line(self) < 0) {
+                goto parsingerror;
+            }
+            self->state = (c == '\r') ? EAT_CRNL_NOP : START_RECORD;
+            if (line_limit > 0 && self->lines == start_lines + line_limit) {
+                goto linelimit;
+            }
+            continue;
+        }
+
+        if (self->state == IN_FIELD_IN_SKIP_LINE) continue;
+
+        // continuation bytes belong to the character before them
+        if ((c & 0xC0) != 0x80) self->fwf_pos++;
+        pos = self->fwf_pos - 1;
+
+        while (self->fwf_col < self->fwf_ncols &&
+               self->fwf_ends[self->fwf_col] >= 0 &&
+               pos >= self->fwf_ends[self->fwf_col]) {
+            if (end_fwf_field(self) < 0) {
+                goto parsingerror;
+            }
+        }
+
+        if (self->fwf_col == self->fwf_ncols ||
+            pos < self->fwf_starts[self->fwf_col]) {
+            continue;
+        }
+
+        if (self->fwf_strip[c]) {
+            // leading strip characters are never written
+            if (self->stream_len == (uint64_t)self->word_start) continue;
+            self->fwf_trail++;
+        } else {
+            self->fwf_trail = 0;
+        }
+        self->stream[self->stream_len++] = c;
+    }
+
+    self->datapos = i;
+    return 0;
+
+parsingerror:
+    self->datapos = i + 1;
+    return -1;
+
+linelimit:
+    self->datapos = i + 1;
+    return 0;
+}
+
 static int parser_handle_eof(parser_t *self) {
     int64_t bufsize = 100;
 
@@ -1139,6 +1287,13 @@ static int parser_handle_eof(parser_t *self) {
 
     if (self->datalen != 0) return -1;
 
+    if (self->fwf_ncols > 0) {
+        if (self->state == IN_FIELD || self->state == IN_FIELD_IN_SKIP_LINE) {
+            return end_fwf_line(self);
+        }
+        return 0;
+    }
+
     switch (self->state) {
         case START_RECORD:
         case WHITESPACE_LINE:
@@ -1379,7 +1534,11 @@ int _tokenize_helper(parser_t *self, size_t nrows, int all) {
              "datapos= %d\n",
              self->datalen - self->datapos, self->datalen, self->datapos));
 
-        status = tokenize_bytes(self, nrows, start_lines);
+        if (self->fwf_ncols > 0) {
+            status = tokenize_fwf_bytes(self, nrows, start_lines);
+        } else {
+            status = tokenize_bytes(self, nrows, start_lines);
+        }
 
         if (status < 0) {
             // XXX
@@ -163,6 +163,15 @@ typedef struct parser_t {
     char *error_msg;
 
     int skip_empty_lines;
+
+    // fixed-width fields, tokenized instead of delimited ones if fwf_ncols > 0
+    int64_t fwf_ncols;      // number of column specifications
+    int64_t *fwf_starts;    // start offset of each column, in characters
+    int64_t *fwf_ends;      // end offset of each column, -1 for end of line
+    char fwf_strip[256];    // characters stripped from both ends of fields
+    int64_t fwf_pos;        // character offset in the current line
+    int64_t fwf_col;        // column being filled on the current line
+    int64_t fwf_trail;      // strip characters at the end of current field
 } parser_t;
 
 typedef struct coliter_t {
@@ -191,6 +200,10 @@ int parser_add_skiprow(parser_t *self, int64_t row);
 
 int parser_set_skipfirstnrows(parser_t *self, int64_t nrows);
 
+int parser_set_fwf_colspecs(parser_t *self, int64_t ncols,
+                            const int64_t *starts, const int64_t *ends,
+                            const char *strip);
+
 void parser_free(parser_t *self);
 
 void parser_del(parser_t *self);
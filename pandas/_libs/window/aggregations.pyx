@@ -3,12 +3,13 @@
 import cython
 from cython import Py_ssize_t
 from libcpp.deque cimport deque
+from libcpp.unordered_map cimport unordered_map
 
 from libc.stdlib cimport malloc, free
 
 import numpy as np
 cimport numpy as cnp
-from numpy cimport ndarray, int64_t, float64_t, float32_t
+from numpy cimport ndarray, int8_t, int64_t, float64_t, float32_t
 cnp.import_array()
 
 
@@ -16,7 +17,9 @@ cdef extern from "src/headers/cmath" namespace "std":
     bint isnan(float64_t) nogil
     bint notnan(float64_t) nogil
     int signbit(float64_t) nogil
+    float64_t fabs(float64_t) nogil
     float64_t sqrt(float64_t x) nogil
+    float64_t pow(float64_t x, float64_t y) nogil
 
 from pandas._libs.algos import is_monotonic
 
@@ -43,6 +46,8 @@ cdef extern from "../src/skiplist.h":
     double skiplist_get(skiplist_t*, int, int*) nogil
     int skiplist_insert(skiplist_t*, double) nogil
     int skiplist_remove(skiplist_t*, double) nogil
+    int skiplist_min_rank(skiplist_t*, double) nogil
+    int skiplist_max_rank(skiplist_t*, double) nogil
 
 cdef:
     float32_t MINfloat32 = np.NINF
@@ -158,96 +163,208 @@ cdef inline float64_t calc_sum(int64_t minp, int64_t nobs, float64_t sum_x) nogi
     return result
 
 
-cdef inline void add_sum(float64_t val, int64_t *nobs, float64_t *sum_x) nogil:
-    """ add a value from the sum calc """
+# The accumulators of a window are computed again from its values when they
+# have shrunk by more than this factor from their peak: the rounding error
+# left by the cancellations is relative to the peak, so this bounds the
+# relative error of the result to about REANCHOR_RATIO * eps. A recomputed
+# window can still have drifted when its own values cancel out (e.g. values
+# of alternating signs): recomputing again only helps once its large values
+# have left, so it is not recomputed before, which keeps the kernels from
+# being quadratic in the window size
+cdef float64_t REANCHOR_RATIO = 2. ** 26
+
+
+cdef inline void update_peak(float64_t acc, float64_t *peak) nogil:
+    """ keep the largest magnitude of acc since it was last anchored """
+    if fabs(acc) > peak[0]:
+        peak[0] = fabs(acc)
+
+
+cdef inline bint has_drifted(float64_t acc, float64_t peak) nogil:
+    """ whether acc must be computed again from the values of the window """
+    return peak > fabs(acc) * REANCHOR_RATIO
+
+
+cdef inline int64_t last_outlier(const float64_t[:, :] values, Py_ssize_t k,
+                                 int64_t s, int64_t e, float64_t center,
+                                 float64_t bound) nogil:
+    """ the last row of s:e whose value is further than bound from center """
+    cdef:
+        int64_t j
+
+    for j in range(e - 1, s - 1, -1):
+        if fabs(values[j, k] - center) > bound:
+            return j
+    return s - 1
+
+
+cdef inline void kahan_add(float64_t val, float64_t *sum_x,
+                           float64_t *compensation) nogil:
+    """ add val to sum_x, carrying the rounding error in compensation """
+    cdef:
+        float64_t y, t
+
+    # Kahan summation: the low order bits lost by each addition are kept in
+    # compensation and added back with the next value, so that the error
+    # does not grow with the number of values added and removed
+    y = val - compensation[0]
+    t = sum_x[0] + y
+    compensation[0] = t - sum_x[0] - y
+    sum_x[0] = t
+
+
+cdef inline void add_sum(float64_t val, int64_t *nobs, float64_t *sum_x,
+                         float64_t *compensation, float64_t *peak) nogil:
+    """ add a value from the sum calc using Kahan summation """
 
     # Not NaN
     if notnan(val):
         nobs[0] = nobs[0] + 1
-        sum_x[0] = sum_x[0] + val
+        kahan_add(val, sum_x, compensation)
+        update_peak(sum_x[0], peak)
 
 
-cdef inline void remove_sum(float64_t val, int64_t *nobs, float64_t *sum_x) nogil:
-    """ remove a value from the sum calc """
+cdef inline void remove_sum(float64_t val, int64_t *nobs, float64_t *sum_x,
+                            float64_t *compensation, float64_t *peak) nogil:
+    """ remove a value from the sum calc using Kahan summation """
 
     if notnan(val):
         nobs[0] = nobs[0] - 1
-        sum_x[0] = sum_x[0] - val
+        if nobs[0]:
+            kahan_add(-val, sum_x, compensation)
+        else:
+            # re-anchor on an empty window, discarding the residual error
+            sum_x[0] = compensation[0] = peak[0] = 0
 
 
 def roll_sum_variable(ndarray[float64_t] values, ndarray[int64_t] start,
                       ndarray[int64_t] end, int64_t minp):
+    return roll_sum_variable_2d(values[:, None], start, end, minp)[:, 0]
+
+
+def roll_sum_variable_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                         ndarray[int64_t] end, int64_t minp):
+    """
+    Rolling sum of each column of values over the same variable windows.
+    """
     cdef:
-        float64_t sum_x = 0
-        int64_t s, e
-        int64_t nobs = 0, i, j, N = len(values)
-        ndarray[float64_t] output
+        float64_t sum_x, compensation, peak
+        int64_t s, e, anchor_end
+        int64_t nobs, i, j, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
         bint is_monotonic_bounds
 
     is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(0, N):
-            s = start[i]
-            e = end[i]
+        for k in range(K):
+            sum_x = compensation = peak = 0
+            nobs = 0
+            anchor_end = 0
 
-            if i == 0 or not is_monotonic_bounds:
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
 
-                # setup
+                if i == 0 or not is_monotonic_bounds:
 
-                for j in range(s, e):
-                    add_sum(values[j], &nobs, &sum_x)
+                    # setup
 
-            else:
+                    for j in range(s, e):
+                        add_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    remove_sum(values[j], &nobs, &sum_x)
-
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    add_sum(values[j], &nobs, &sum_x)
-
-            output[i] = calc_sum(minp, nobs, sum_x)
+                else:
 
-            if not is_monotonic_bounds:
-                for j in range(s, e):
-                    remove_sum(values[j], &nobs, &sum_x)
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        remove_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
+
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        add_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
+
+                if s >= anchor_end and has_drifted(sum_x, peak):
+                    # re-anchor
+                    sum_x = compensation = peak = 0
+                    nobs = 0
+                    for j in range(s, e):
+                        add_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
+                    anchor_end = s
+                    if has_drifted(sum_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, s, e, 0,
+                            fabs(sum_x) * REANCHOR_RATIO / nobs,
+                        )
+
+                output[i, k] = calc_sum(minp, nobs, sum_x)
+
+                if not is_monotonic_bounds:
+                    for j in range(s, e):
+                        remove_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
 
-    return output
+    return np.asarray(output)
 
 
 def roll_sum_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
                    ndarray[int64_t] end, int64_t minp, int64_t win):
+    return roll_sum_fixed_2d(values[:, None], start, end, minp, win)[:, 0]
+
+
+def roll_sum_fixed_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                      ndarray[int64_t] end, int64_t minp, int64_t win):
+    """
+    Rolling sum of each column of values over the same fixed windows.
+    """
     cdef:
-        float64_t val, prev_x, sum_x = 0
-        int64_t range_endpoint
-        int64_t nobs = 0, i, N = len(values)
-        ndarray[float64_t] output
+        float64_t val, prev_x, sum_x, compensation, peak
+        int64_t range_endpoint, s, anchor_end
+        int64_t nobs, i, j, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
 
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     range_endpoint = int_max(minp, 1) - 1
 
     with nogil:
 
-        for i in range(0, range_endpoint):
-            add_sum(values[i], &nobs, &sum_x)
-            output[i] = NaN
+        for k in range(K):
+            sum_x = compensation = peak = 0
+            nobs = 0
+            anchor_end = 0
+
+            for i in range(0, range_endpoint):
+                add_sum(values[i, k], &nobs, &sum_x, &compensation, &peak)
+                output[i, k] = NaN
+
+            for i in range(range_endpoint, N):
+                val = values[i, k]
+                add_sum(val, &nobs, &sum_x, &compensation, &peak)
+
+                if i > win - 1:
+                    prev_x = values[i - win, k]
+                    remove_sum(prev_x, &nobs, &sum_x, &compensation, &peak)
+
+                s = i - win + 1 if i >= win else 0
+                if s >= anchor_end and has_drifted(sum_x, peak):
+                    # re-anchor
+                    sum_x = compensation = peak = 0
+                    nobs = 0
+                    for j in range(s, i + 1):
+                        add_sum(values[j, k], &nobs, &sum_x, &compensation, &peak)
+                    anchor_end = s
+                    if has_drifted(sum_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, s, i + 1, 0,
+                            fabs(sum_x) * REANCHOR_RATIO / nobs,
+                        )
+
+                output[i, k] = calc_sum(minp, nobs, sum_x)
 
-        for i in range(range_endpoint, N):
-            val = values[i]
-            add_sum(val, &nobs, &sum_x)
-
-            if i > win - 1:
-                prev_x = values[i - win]
-                remove_sum(prev_x, &nobs, &sum_x)
-
-            output[i] = calc_sum(minp, nobs, sum_x)
-
-    return output
+    return np.asarray(output)
 
 # ----------------------------------------------------------------------
 # Rolling mean
@@ -274,100 +391,169 @@ cdef inline float64_t calc_mean(int64_t minp, Py_ssize_t nobs,
 
 
 cdef inline void add_mean(float64_t val, Py_ssize_t *nobs, float64_t *sum_x,
-                          Py_ssize_t *neg_ct) nogil:
-    """ add a value from the mean calc """
+                          Py_ssize_t *neg_ct, float64_t *compensation,
+                          float64_t *peak) nogil:
+    """ add a value from the mean calc using Kahan summation """
 
     # Not NaN
     if notnan(val):
         nobs[0] = nobs[0] + 1
-        sum_x[0] = sum_x[0] + val
+        kahan_add(val, sum_x, compensation)
+        update_peak(sum_x[0], peak)
         if signbit(val):
             neg_ct[0] = neg_ct[0] + 1
 
 
 cdef inline void remove_mean(float64_t val, Py_ssize_t *nobs, float64_t *sum_x,
-                             Py_ssize_t *neg_ct) nogil:
-    """ remove a value from the mean calc """
+                             Py_ssize_t *neg_ct, float64_t *compensation,
+                             float64_t *peak) nogil:
+    """ remove a value from the mean calc using Kahan summation """
 
     if notnan(val):
         nobs[0] = nobs[0] - 1
-        sum_x[0] = sum_x[0] - val
+        if nobs[0]:
+            kahan_add(-val, sum_x, compensation)
+        else:
+            # re-anchor on an empty window, discarding the residual error
+            sum_x[0] = compensation[0] = peak[0] = 0
         if signbit(val):
             neg_ct[0] = neg_ct[0] - 1
 
 
 def roll_mean_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
                     ndarray[int64_t] end, int64_t minp, int64_t win):
-    cdef:
-        float64_t val, prev_x, sum_x = 0
-        Py_ssize_t nobs = 0, i, neg_ct = 0, N = len(values)
-        ndarray[float64_t] output
+    return roll_mean_fixed_2d(values[:, None], start, end, minp, win)[:, 0]
 
-    output = np.empty(N, dtype=float)
 
-    with nogil:
-        for i in range(minp - 1):
-            val = values[i]
-            add_mean(val, &nobs, &sum_x, &neg_ct)
-            output[i] = NaN
+def roll_mean_fixed_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                       ndarray[int64_t] end, int64_t minp, int64_t win):
+    """
+    Rolling mean of each column of values over the same fixed windows.
+    """
+    cdef:
+        float64_t val, prev_x, sum_x, compensation, peak
+        Py_ssize_t nobs, i, j, k, neg_ct, N = values.shape[0], K = values.shape[1]
+        Py_ssize_t s, anchor_end
+        float64_t[::1, :] output
 
-        for i in range(minp - 1, N):
-            val = values[i]
-            add_mean(val, &nobs, &sum_x, &neg_ct)
+    output = np.empty((N, K), dtype=float, order="F")
 
-            if i > win - 1:
-                prev_x = values[i - win]
-                remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
+    with nogil:
 
-            output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+        for k in range(K):
+            sum_x = compensation = peak = 0
+            nobs = 0
+            anchor_end = 0
+            neg_ct = 0
+
+            for i in range(minp - 1):
+                val = values[i, k]
+                add_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+                output[i, k] = NaN
+
+            for i in range(minp - 1, N):
+                val = values[i, k]
+                add_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+
+                if i > win - 1:
+                    prev_x = values[i - win, k]
+                    remove_mean(prev_x, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+
+                s = i - win + 1 if i >= win else 0
+                if s >= anchor_end and has_drifted(sum_x, peak):
+                    # re-anchor
+                    sum_x = compensation = peak = 0
+                    nobs = neg_ct = 0
+                    for j in range(s, i + 1):
+                        add_mean(values[j, k], &nobs, &sum_x, &neg_ct,
+                                 &compensation, &peak)
+                    anchor_end = s
+                    if has_drifted(sum_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, s, i + 1, 0,
+                            fabs(sum_x) * REANCHOR_RATIO / nobs,
+                        )
+
+                output[i, k] = calc_mean(minp, nobs, neg_ct, sum_x)
 
-    return output
+    return np.asarray(output)
 
 
 def roll_mean_variable(ndarray[float64_t] values, ndarray[int64_t] start,
                        ndarray[int64_t] end, int64_t minp):
+    return roll_mean_variable_2d(values[:, None], start, end, minp)[:, 0]
+
+
+def roll_mean_variable_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                          ndarray[int64_t] end, int64_t minp):
+    """
+    Rolling mean of each column of values over the same variable windows.
+    """
     cdef:
-        float64_t val, sum_x = 0
-        int64_t s, e
-        Py_ssize_t nobs = 0, i, j, neg_ct = 0, N = len(values)
-        ndarray[float64_t] output
+        float64_t val, sum_x, compensation, peak
+        int64_t s, e, anchor_end
+        Py_ssize_t nobs, i, j, k, neg_ct, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
         bint is_monotonic_bounds
 
     is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(0, N):
-            s = start[i]
-            e = end[i]
+        for k in range(K):
+            sum_x = compensation = peak = 0
+            nobs = 0
+            anchor_end = 0
+            neg_ct = 0
 
-            if i == 0 or not is_monotonic_bounds:
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
 
-                # setup
-                for j in range(s, e):
-                    val = values[j]
-                    add_mean(val, &nobs, &sum_x, &neg_ct)
+                if i == 0 or not is_monotonic_bounds:
 
-            else:
+                    # setup
+                    for j in range(s, e):
+                        val = values[j, k]
+                        add_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    val = values[j]
-                    remove_mean(val, &nobs, &sum_x, &neg_ct)
-
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    val = values[j]
-                    add_mean(val, &nobs, &sum_x, &neg_ct)
+                else:
 
-            output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        val = values[j, k]
+                        remove_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        val = values[j, k]
+                        add_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+
+                if s >= anchor_end and has_drifted(sum_x, peak):
+                    # re-anchor
+                    sum_x = compensation = peak = 0
+                    nobs = neg_ct = 0
+                    for j in range(s, e):
+                        val = values[j, k]
+                        add_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
+                    anchor_end = s
+                    if has_drifted(sum_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, s, e, 0,
+                            fabs(sum_x) * REANCHOR_RATIO / nobs,
+                        )
+
+                output[i, k] = calc_mean(minp, nobs, neg_ct, sum_x)
+
+                if not is_monotonic_bounds:
+                    for j in range(s, e):
+                        val = values[j, k]
+                        remove_mean(val, &nobs, &sum_x, &neg_ct, &compensation, &peak)
 
-            if not is_monotonic_bounds:
-                for j in range(s, e):
-                    val = values[j]
-                    remove_mean(val, &nobs, &sum_x, &neg_ct)
-    return output
+    return np.asarray(output)
 
 # ----------------------------------------------------------------------
 # Rolling variance
@@ -395,8 +581,9 @@ cdef inline float64_t calc_var(int64_t minp, int ddof, float64_t nobs,
 
 
 cdef inline void add_var(float64_t val, float64_t *nobs, float64_t *mean_x,
-                         float64_t *ssqdm_x) nogil:
-    """ add a value from the var calc """
+                         float64_t *ssqdm_x, float64_t *comp_mean,
+                         float64_t *comp_ssqdm, float64_t *peak) nogil:
+    """ add a value from the var calc, compensating the updates """
     cdef:
         float64_t delta
 
@@ -407,14 +594,16 @@ cdef inline void add_var(float64_t val, float64_t *nobs, float64_t *mean_x,
     nobs[0] = nobs[0] + 1
     # a part of Welford's method for the online variance-calculation
     # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
-    delta = val - mean_x[0]
-    mean_x[0] = mean_x[0] + delta / nobs[0]
-    ssqdm_x[0] = ssqdm_x[0] + ((nobs[0] - 1) * delta ** 2) / nobs[0]
+    delta = val - (mean_x[0] - comp_mean[0])
+    kahan_add(delta / nobs[0], mean_x, comp_mean)
+    kahan_add(((nobs[0] - 1) * delta ** 2) / nobs[0], ssqdm_x, comp_ssqdm)
+    update_peak(ssqdm_x[0], peak)
 
 
 cdef inline void remove_var(float64_t val, float64_t *nobs, float64_t *mean_x,
-                            float64_t *ssqdm_x) nogil:
-    """ remove a value from the var calc """
+                            float64_t *ssqdm_x, float64_t *comp_mean,
+                            float64_t *comp_ssqdm, float64_t *peak) nogil:
+    """ remove a value from the var calc, compensating the updates """
     cdef:
         float64_t delta
 
@@ -423,12 +612,14 @@ cdef inline void remove_var(float64_t val, float64_t *nobs, float64_t *mean_x,
         if nobs[0]:
             # a part of Welford's method for the online variance-calculation
             # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
-            delta = val - mean_x[0]
-            mean_x[0] = mean_x[0] - delta / nobs[0]
-            ssqdm_x[0] = ssqdm_x[0] - ((nobs[0] + 1) * delta ** 2) / nobs[0]
+            delta = val - (mean_x[0] - comp_mean[0])
+            kahan_add(-delta / nobs[0], mean_x, comp_mean)
+            kahan_add(-((nobs[0] + 1) * delta ** 2) / nobs[0], ssqdm_x,
+                      comp_ssqdm)
         else:
-            mean_x[0] = 0
-            ssqdm_x[0] = 0
+            # re-anchor on an empty window, discarding the residual error
+            mean_x[0] = ssqdm_x[0] = comp_mean[0] = comp_ssqdm[0] = 0
+            peak[0] = 0
 
 
 def roll_var_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
@@ -436,55 +627,90 @@ def roll_var_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
     """
     Numerically stable implementation using Welford's method.
     """
+    return roll_var_fixed_2d(values[:, None], start, end, minp, win, ddof)[:, 0]
+
+
+def roll_var_fixed_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                      ndarray[int64_t] end, int64_t minp, int64_t win,
+                      int ddof=1):
+    """
+    Rolling variance of each column of values over the same fixed windows,
+    using Welford's method.
+    """
     cdef:
-        float64_t mean_x = 0, ssqdm_x = 0, nobs = 0,
+        float64_t mean_x, ssqdm_x, nobs, comp_mean, comp_ssqdm, peak
         float64_t val, prev, delta, mean_x_old
-        int64_t s, e
-        Py_ssize_t i, j, N = len(values)
-        ndarray[float64_t] output
+        Py_ssize_t anchor_end
+        Py_ssize_t i, j, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
 
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     # Check for windows larger than array, addresses #7297
     win = min(win, N)
 
     with nogil:
 
-        # Over the first window, observations can only be added, never
-        # removed
-        for i in range(win):
-            add_var(values[i], &nobs, &mean_x, &ssqdm_x)
-            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+        for k in range(K):
+            mean_x = ssqdm_x = comp_mean = comp_ssqdm = peak = 0
+            nobs = 0
+            anchor_end = 0
 
-        # a part of Welford's method for the online variance-calculation
-        # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+            # Over the first window, observations can only be added, never
+            # removed
+            for i in range(win):
+                add_var(values[i, k], &nobs, &mean_x, &ssqdm_x,
+                        &comp_mean, &comp_ssqdm, &peak)
+                output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
 
-        # After the first window, observations can both be added and
-        # removed
-        for i in range(win, N):
-            val = values[i]
-            prev = values[i - win]
+            # a part of Welford's method for the online variance-calculation
+            # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
 
-            if notnan(val):
-                if prev == prev:
+            # After the first window, observations can both be added and
+            # removed
+            for i in range(win, N):
+                val = values[i, k]
+                prev = values[i - win, k]
 
-                    # Adding one observation and removing another one
-                    delta = val - prev
-                    mean_x_old = mean_x
+                if notnan(val):
+                    if prev == prev:
 
-                    mean_x += delta / nobs
-                    ssqdm_x += ((nobs - 1) * val
-                                + (nobs + 1) * prev
-                                - 2 * nobs * mean_x_old) * delta / nobs
+                        # Adding one observation and removing another one
+                        delta = val - prev
+                        mean_x_old = mean_x - comp_mean
 
-                else:
-                    add_var(val, &nobs, &mean_x, &ssqdm_x)
-            elif prev == prev:
-                remove_var(prev, &nobs, &mean_x, &ssqdm_x)
+                        kahan_add(delta / nobs, &mean_x, &comp_mean)
+                        kahan_add(((nobs - 1) * val
+                                   + (nobs + 1) * prev
+                                   - 2 * nobs * mean_x_old) * delta / nobs,
+                                  &ssqdm_x, &comp_ssqdm)
+                        update_peak(ssqdm_x, &peak)
 
-            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+                    else:
+                        add_var(val, &nobs, &mean_x, &ssqdm_x,
+                                &comp_mean, &comp_ssqdm, &peak)
+                elif prev == prev:
+                    remove_var(prev, &nobs, &mean_x, &ssqdm_x,
+                               &comp_mean, &comp_ssqdm, &peak)
+
+                if i - win + 1 >= anchor_end and has_drifted(ssqdm_x, peak):
+                    # re-anchor
+                    mean_x = ssqdm_x = comp_mean = comp_ssqdm = peak = 0
+                    nobs = 0
+                    for j in range(i - win + 1, i + 1):
+                        add_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                &comp_mean, &comp_ssqdm, &peak)
+                    anchor_end = i - win + 1
+                    if has_drifted(ssqdm_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, i - win + 1, i + 1, mean_x,
+                            sqrt(ssqdm_x * REANCHOR_RATIO / nobs),
+                        )
+
+                output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
 
-    return output
+    return np.asarray(output)
 
 
 def roll_var_variable(ndarray[float64_t] values, ndarray[int64_t] start,
@@ -492,51 +718,83 @@ def roll_var_variable(ndarray[float64_t] values, ndarray[int64_t] start,
     """
     Numerically stable implementation using Welford's method.
     """
+    return roll_var_variable_2d(values[:, None], start, end, minp, ddof)[:, 0]
+
+
+def roll_var_variable_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                         ndarray[int64_t] end, int64_t minp, int ddof=1):
+    """
+    Rolling variance of each column of values over the same variable windows,
+    using Welford's method.
+    """
     cdef:
-        float64_t mean_x = 0, ssqdm_x = 0, nobs = 0,
-        float64_t val, prev, delta, mean_x_old
-        int64_t s, e
-        Py_ssize_t i, j, N = len(values)
-        ndarray[float64_t] output
+        float64_t mean_x, ssqdm_x, nobs, comp_mean, comp_ssqdm, peak
+        int64_t s, e, anchor_end
+        Py_ssize_t i, j, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
         bint is_monotonic_bounds
 
     is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(0, N):
-
-            s = start[i]
-            e = end[i]
-
-            # Over the first window, observations can only be added
-            # never removed
-            if i == 0 or not is_monotonic_bounds:
-
-                for j in range(s, e):
-                    add_var(values[j], &nobs, &mean_x, &ssqdm_x)
+        for k in range(K):
+            mean_x = ssqdm_x = comp_mean = comp_ssqdm = peak = 0
+            nobs = 0
+            anchor_end = 0
 
-            else:
+            for i in range(0, N):
 
-                # After the first window, observations can both be added
-                # and removed
+                s = start[i]
+                e = end[i]
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    add_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                # Over the first window, observations can only be added
+                # never removed
+                if i == 0 or not is_monotonic_bounds:
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    remove_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                    for j in range(s, e):
+                        add_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                &comp_mean, &comp_ssqdm, &peak)
 
-            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+                else:
 
-            if not is_monotonic_bounds:
-                for j in range(s, e):
-                    remove_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                    # After the first window, observations can both be added
+                    # and removed
+
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        add_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                &comp_mean, &comp_ssqdm, &peak)
+
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        remove_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                   &comp_mean, &comp_ssqdm, &peak)
+
+                if s >= anchor_end and has_drifted(ssqdm_x, peak):
+                    # re-anchor
+                    mean_x = ssqdm_x = comp_mean = comp_ssqdm = peak = 0
+                    nobs = 0
+                    for j in range(s, e):
+                        add_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                &comp_mean, &comp_ssqdm, &peak)
+                    anchor_end = s
+                    if has_drifted(ssqdm_x, peak):
+                        # the window cancels itself
+                        anchor_end = 1 + last_outlier(
+                            values, k, s, e, mean_x,
+                            sqrt(ssqdm_x * REANCHOR_RATIO / nobs),
+                        )
+
+                output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
+
+                if not is_monotonic_bounds:
+                    for j in range(s, e):
+                        remove_var(values[j, k], &nobs, &mean_x, &ssqdm_x,
+                                   &comp_mean, &comp_ssqdm, &peak)
 
-    return output
+    return np.asarray(output)
 
 # ----------------------------------------------------------------------
 # Rolling skewness
@@ -608,85 +866,113 @@ cdef inline void remove_skew(float64_t val, int64_t *nobs,
 
 def roll_skew_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
                     ndarray[int64_t] end, int64_t minp, int64_t win):
+    return roll_skew_fixed_2d(values[:, None], start, end, minp, win)[:, 0]
+
+
+def roll_skew_fixed_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                       ndarray[int64_t] end, int64_t minp, int64_t win):
+    """
+    Rolling skewness of each column of values over the same fixed windows.
+    """
     cdef:
         float64_t val, prev
-        float64_t x = 0, xx = 0, xxx = 0
-        int64_t nobs = 0, i, j, N = len(values)
-        int64_t s, e
-        ndarray[float64_t] output
+        float64_t x, xx, xxx
+        int64_t nobs, i, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
 
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
-        for i in range(minp - 1):
-            val = values[i]
-            add_skew(val, &nobs, &x, &xx, &xxx)
-            output[i] = NaN
 
-        for i in range(minp - 1, N):
-            val = values[i]
-            add_skew(val, &nobs, &x, &xx, &xxx)
+        for k in range(K):
+            x = 0
+            xx = 0
+            xxx = 0
+            nobs = 0
 
-            if i > win - 1:
-                prev = values[i - win]
-                remove_skew(prev, &nobs, &x, &xx, &xxx)
+            for i in range(minp - 1):
+                val = values[i, k]
+                add_skew(val, &nobs, &x, &xx, &xxx)
+                output[i, k] = NaN
 
-            output[i] = calc_skew(minp, nobs, x, xx, xxx)
+            for i in range(minp - 1, N):
+                val = values[i, k]
+                add_skew(val, &nobs, &x, &xx, &xxx)
 
-    return output
+                if i > win - 1:
+                    prev = values[i - win, k]
+                    remove_skew(prev, &nobs, &x, &xx, &xxx)
+
+                output[i, k] = calc_skew(minp, nobs, x, xx, xxx)
+
+    return np.asarray(output)
 
 
 def roll_skew_variable(ndarray[float64_t] values, ndarray[int64_t] start,
                        ndarray[int64_t] end, int64_t minp):
+    return roll_skew_variable_2d(values[:, None], start, end, minp)[:, 0]
+
+
+def roll_skew_variable_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                          ndarray[int64_t] end, int64_t minp):
+    """
+    Rolling skewness of each column of values over the same variable windows.
+    """
     cdef:
-        float64_t val, prev
-        float64_t x = 0, xx = 0, xxx = 0
-        int64_t nobs = 0, i, j, N = len(values)
+        float64_t val
+        float64_t x, xx, xxx
+        int64_t nobs, i, j, k, N = values.shape[0], K = values.shape[1]
         int64_t s, e
-        ndarray[float64_t] output
+        float64_t[::1, :] output
         bint is_monotonic_bounds
 
     is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(0, N):
+        for k in range(K):
+            x = 0
+            xx = 0
+            xxx = 0
+            nobs = 0
 
-            s = start[i]
-            e = end[i]
+            for i in range(0, N):
 
-            # Over the first window, observations can only be added
-            # never removed
-            if i == 0 or not is_monotonic_bounds:
+                s = start[i]
+                e = end[i]
 
-                for j in range(s, e):
-                    val = values[j]
-                    add_skew(val, &nobs, &x, &xx, &xxx)
+                # Over the first window, observations can only be added
+                # never removed
+                if i == 0 or not is_monotonic_bounds:
 
-            else:
+                    for j in range(s, e):
+                        val = values[j, k]
+                        add_skew(val, &nobs, &x, &xx, &xxx)
 
-                # After the first window, observations can both be added
-                # and removed
+                else:
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    val = values[j]
-                    add_skew(val, &nobs, &x, &xx, &xxx)
+                    # After the first window, observations can both be added
+                    # and removed
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    val = values[j]
-                    remove_skew(val, &nobs, &x, &xx, &xxx)
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        val = values[j, k]
+                        add_skew(val, &nobs, &x, &xx, &xxx)
 
-            output[i] = calc_skew(minp, nobs, x, xx, xxx)
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        val = values[j, k]
+                        remove_skew(val, &nobs, &x, &xx, &xxx)
 
-            if not is_monotonic_bounds:
-                for j in range(s, e):
-                    val = values[j]
-                    remove_skew(val, &nobs, &x, &xx, &xxx)
+                output[i, k] = calc_skew(minp, nobs, x, xx, xxx)
 
-    return output
+                if not is_monotonic_bounds:
+                    for j in range(s, e):
+                        val = values[j, k]
+                        remove_skew(val, &nobs, &x, &xx, &xxx)
+
+    return np.asarray(output)
 
 # ----------------------------------------------------------------------
 # Rolling kurtosis
@@ -763,87 +1049,114 @@ cdef inline void remove_kurt(float64_t val, int64_t *nobs,
 
 def roll_kurt_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
                     ndarray[int64_t] end, int64_t minp, int64_t win):
+    return roll_kurt_fixed_2d(values[:, None], start, end, minp, win)[:, 0]
+
+
+def roll_kurt_fixed_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                       ndarray[int64_t] end, int64_t minp, int64_t win):
+    """
+    Rolling kurtosis of each column of values over the same fixed windows.
+    """
     cdef:
-        float64_t val, prev
-        float64_t x = 0, xx = 0, xxx = 0, xxxx = 0
-        int64_t nobs = 0, i, j, N = len(values)
-        int64_t s, e
-        ndarray[float64_t] output
+        float64_t prev
+        float64_t x, xx, xxx, xxxx
+        int64_t nobs, i, k, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
 
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(minp - 1):
-            add_kurt(values[i], &nobs, &x, &xx, &xxx, &xxxx)
-            output[i] = NaN
+        for k in range(K):
+            x = 0
+            xx = 0
+            xxx = 0
+            xxxx = 0
+            nobs = 0
 
-        for i in range(minp - 1, N):
-            add_kurt(values[i], &nobs, &x, &xx, &xxx, &xxxx)
+            for i in range(minp - 1):
+                add_kurt(values[i, k], &nobs, &x, &xx, &xxx, &xxxx)
+                output[i, k] = NaN
 
-            if i > win - 1:
-                prev = values[i - win]
-                remove_kurt(prev, &nobs, &x, &xx, &xxx, &xxxx)
+            for i in range(minp - 1, N):
+                add_kurt(values[i, k], &nobs, &x, &xx, &xxx, &xxxx)
 
-            output[i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
+                if i > win - 1:
+                    prev = values[i - win, k]
+                    remove_kurt(prev, &nobs, &x, &xx, &xxx, &xxxx)
 
-    return output
+                output[i, k] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
+
+    return np.asarray(output)
 
 
 def roll_kurt_variable(ndarray[float64_t] values, ndarray[int64_t] start,
                        ndarray[int64_t] end, int64_t minp):
+    return roll_kurt_variable_2d(values[:, None], start, end, minp)[:, 0]
+
+
+def roll_kurt_variable_2d(const float64_t[:, :] values, ndarray[int64_t] start,
+                          ndarray[int64_t] end, int64_t minp):
+    """
+    Rolling kurtosis of each column of values over the same variable windows.
+    """
     cdef:
-        float64_t val, prev
-        float64_t x = 0, xx = 0, xxx = 0, xxxx = 0
-        int64_t nobs = 0, i, j, s, e, N = len(values)
-        ndarray[float64_t] output
+        float64_t x, xx, xxx, xxxx
+        int64_t nobs, i, j, k, s, e, N = values.shape[0], K = values.shape[1]
+        float64_t[::1, :] output
         bint is_monotonic_bounds
 
     is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, K), dtype=float, order="F")
 
     with nogil:
 
-        for i in range(0, N):
+        for k in range(K):
+            x = 0
+            xx = 0
+            xxx = 0
+            xxxx = 0
+            nobs = 0
 
-            s = start[i]
-            e = end[i]
+            for i in range(0, N):
 
-            # Over the first window, observations can only be added
-            # never removed
-            if i == 0 or not is_monotonic_bounds:
+                s = start[i]
+                e = end[i]
 
-                for j in range(s, e):
-                    add_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                # Over the first window, observations can only be added
+                # never removed
+                if i == 0 or not is_monotonic_bounds:
 
-            else:
+                    for j in range(s, e):
+                        add_kurt(values[j, k], &nobs, &x, &xx, &xxx, &xxxx)
 
-                # After the first window, observations can both be added
-                # and removed
+                else:
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    add_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                    # After the first window, observations can both be added
+                    # and removed
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    remove_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        add_kurt(values[j, k], &nobs, &x, &xx, &xxx, &xxxx)
 
-            output[i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        remove_kurt(values[j, k], &nobs, &x, &xx, &xxx, &xxxx)
 
-            if not is_monotonic_bounds:
-                for j in range(s, e):
-                    remove_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                output[i, k] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
 
-    return output
+                if not is_monotonic_bounds:
+                    for j in range(s, e):
+                        remove_kurt(values[j, k], &nobs, &x, &xx, &xxx, &xxxx)
 
+    return np.asarray(output)
 
 # ----------------------------------------------------------------------
 # Rolling median, min, max
 
 
-def roll_median_c(ndarray[float64_t] values, ndarray[int64_t] start,
-                  ndarray[int64_t] end, int64_t minp, int64_t win=0):
+def roll_median_variable(ndarray[float64_t] values, ndarray[int64_t] start,
+                         ndarray[int64_t] end, int64_t minp, int64_t win=0):
     # GH 32865. win argument kept for compatibility
     cdef:
         float64_t val, res, prev
@@ -920,6 +1233,194 @@ def roll_median_c(ndarray[float64_t] values, ndarray[int64_t] start,
     return output
 
 
+# Two-heap median for fixed windows: the lower half of the window is kept in
+# a max-heap (stored negated so both halves are min-heaps) and the upper half
+# in a min-heap. Each value is identified by its slot in the window, and
+# ``pos`` maps the slots to their position in their heap so the value leaving
+# the window can be removed in O(log(window)).
+
+cdef inline void heap_swap(float64_t *vals, int64_t *slots, int64_t *pos,
+                           Py_ssize_t i, Py_ssize_t j) nogil:
+    cdef:
+        float64_t val = vals[i]
+        int64_t slot = slots[i]
+
+    vals[i] = vals[j]
+    slots[i] = slots[j]
+    vals[j] = val
+    slots[j] = slot
+    pos[slots[i]] = i
+    pos[slots[j]] = j
+
+
+cdef inline void heap_sift_up(float64_t *vals, int64_t *slots, int64_t *pos,
+                              Py_ssize_t i) nogil:
+    cdef:
+        Py_ssize_t parent
+
+    while i > 0:
+        parent = (i - 1) // 2
+        if vals[parent] <= vals[i]:
+            break
+        heap_swap(vals, slots, pos, parent, i)
+        i = parent
+
+
+cdef inline void heap_sift_down(float64_t *vals, int64_t *slots, int64_t *pos,
+                                Py_ssize_t n, Py_ssize_t i) nogil:
+    cdef:
+        Py_ssize_t left, right, smallest
+
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < n and vals[left] < vals[smallest]:
+            smallest = left
+        if right < n and vals[right] < vals[smallest]:
+            smallest = right
+        if smallest == i:
+            break
+        heap_swap(vals, slots, pos, smallest, i)
+        i = smallest
+
+
+cdef inline void heap_push(float64_t *vals, int64_t *slots, int64_t *pos,
+                           Py_ssize_t *n, float64_t val, int64_t slot) nogil:
+    vals[n[0]] = val
+    slots[n[0]] = slot
+    pos[slot] = n[0]
+    n[0] = n[0] + 1
+    heap_sift_up(vals, slots, pos, n[0] - 1)
+
+
+cdef inline void heap_remove(float64_t *vals, int64_t *slots, int64_t *pos,
+                             Py_ssize_t *n, Py_ssize_t i) nogil:
+    n[0] = n[0] - 1
+    if i == n[0]:
+        return
+    vals[i] = vals[n[0]]
+    slots[i] = slots[n[0]]
+    pos[slots[i]] = i
+    if i > 0 and vals[i] < vals[(i - 1) // 2]:
+        heap_sift_up(vals, slots, pos, i)
+    else:
+        heap_sift_down(vals, slots, pos, n[0], i)
+
+
+def roll_median_fixed(ndarray[float64_t] values, ndarray[int64_t] start,
+                      ndarray[int64_t] end, int64_t minp, int64_t win):
+    """
+    O(N log(window)) implementation using two heaps, for fixed windows.
+    """
+    cdef:
+        float64_t val
+        float64_t *lo_vals
+        float64_t *hi_vals
+        int64_t *lo_slots
+        int64_t *hi_slots
+        int64_t *lo_pos
+        int64_t *hi_pos
+        int8_t *side
+        Py_ssize_t i, slot, moved, cap, n_lo = 0, n_hi = 0, N = len(values)
+        int64_t nobs = 0
+        bint to_lo
+        ndarray[float64_t] output
+
+    output = np.empty(N, dtype=float)
+
+    if win == 0 or N == 0:
+        output[:] = NaN
+        return output
+
+    # the slot of a value is its position modulo the window, values never
+    # leave windows longer than the data
+    cap = min(win, N)
+    lo_vals = <float64_t *>malloc(cap * sizeof(float64_t))
+    hi_vals = <float64_t *>malloc(cap * sizeof(float64_t))
+    lo_slots = <int64_t *>malloc(cap * sizeof(int64_t))
+    hi_slots = <int64_t *>malloc(cap * sizeof(int64_t))
+    lo_pos = <int64_t *>malloc(cap * sizeof(int64_t))
+    hi_pos = <int64_t *>malloc(cap * sizeof(int64_t))
+    side = <int8_t *>malloc(cap * sizeof(int8_t))
+    if (lo_vals == NULL or hi_vals == NULL or lo_slots == NULL
+            or hi_slots == NULL or lo_pos == NULL or hi_pos == NULL
+            or side == NULL):
+        free(lo_vals)
+        free(hi_vals)
+        free(lo_slots)
+        free(hi_slots)
+        free(lo_pos)
+        free(hi_pos)
+        free(side)
+        raise MemoryError("failed to allocate the heaps")
+
+    with nogil:
+
+        for i in range(N):
+            slot = i % cap
+
+            # remove the value leaving the window
+            if i >= win:
+                if side[slot] == 0:
+                    heap_remove(lo_vals, lo_slots, lo_pos, &n_lo, lo_pos[slot])
+                    nobs -= 1
+                elif side[slot] == 1:
+                    heap_remove(hi_vals, hi_slots, hi_pos, &n_hi, hi_pos[slot])
+                    nobs -= 1
+
+            # add the value entering the window
+            val = values[i]
+            if notnan(val):
+                nobs += 1
+                # removals can empty the lower half, the value then goes
+                # there only if it is not above the upper half
+                if n_lo:
+                    to_lo = val <= -lo_vals[0]
+                else:
+                    to_lo = n_hi == 0 or val <= hi_vals[0]
+                if to_lo:
+                    heap_push(lo_vals, lo_slots, lo_pos, &n_lo, -val, slot)
+                    side[slot] = 0
+                else:
+                    heap_push(hi_vals, hi_slots, hi_pos, &n_hi, val, slot)
+                    side[slot] = 1
+            else:
+                side[slot] = -1
+
+            # the lower half holds the median, or one more value than the
+            # upper half
+            while n_lo > n_hi + 1:
+                moved = lo_slots[0]
+                val = -lo_vals[0]
+                heap_remove(lo_vals, lo_slots, lo_pos, &n_lo, 0)
+                heap_push(hi_vals, hi_slots, hi_pos, &n_hi, val, moved)
+                side[moved] = 1
+            while n_hi > n_lo:
+                moved = hi_slots[0]
+                val = hi_vals[0]
+                heap_remove(hi_vals, hi_slots, hi_pos, &n_hi, 0)
+                heap_push(lo_vals, lo_slots, lo_pos, &n_lo, -val, moved)
+                side[moved] = 0
+
+            if nobs >= minp and nobs > 0:
+                if nobs % 2:
+                    output[i] = -lo_vals[0]
+                else:
+                    output[i] = (hi_vals[0] - lo_vals[0]) / 2
+            else:
+                output[i] = NaN
+
+    free(lo_vals)
+    free(hi_vals)
+    free(lo_slots)
+    free(hi_slots)
+    free(lo_pos)
+    free(hi_pos)
+    free(side)
+    return output
+
+
 # ----------------------------------------------------------------------
 
 # Moving maximum / minimum code taken from Bottleneck under the terms
@@ -1199,6 +1700,260 @@ cdef _roll_min_max_fixed(numeric[:] values,
     return output
 
 
+# ----------------------------------------------------------------------
+# Rolling position of the maximum / minimum
+
+
+def roll_argmax(ndarray[float64_t] values, ndarray[int64_t] start,
+                ndarray[int64_t] end, int64_t minp):
+    """
+    Position of the first maximum of each window, relative to the start of
+    the window, ignoring NaNs.
+    """
+    return _roll_arg_min_max(values, start, end, minp, is_max=1)
+
+
+def roll_argmin(ndarray[float64_t] values, ndarray[int64_t] start,
+                ndarray[int64_t] end, int64_t minp):
+    """
+    Position of the first minimum of each window, relative to the start of
+    the window, ignoring NaNs.
+    """
+    return _roll_arg_min_max(values, start, end, minp, is_max=0)
+
+
+cdef _roll_arg_min_max(ndarray[float64_t] values, ndarray[int64_t] start,
+                       ndarray[int64_t] end, int64_t minp, bint is_max):
+    cdef:
+        float64_t val
+        int64_t i, j, s, e, first, nobs = 0, N = len(values)
+        deque Q[int64_t]  # position of the extremum always the front
+        ndarray[float64_t] output
+        bint is_monotonic_bounds
+
+    is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
+    output = np.empty(N, dtype=float)
+    Q = deque[int64_t]()
+
+    with nogil:
+
+        for i in range(N):
+            s = start[i]
+            e = end[i]
+
+            if i == 0 or not is_monotonic_bounds:
+                Q.clear()
+                nobs = 0
+                first = s
+            else:
+                first = end[i - 1]
+
+            for j in range(first, e):
+                val = values[j]
+                if notnan(val):
+                    nobs += 1
+                    # the earlier positions of equal values are kept, so the
+                    # front is the first extremum of the window
+                    if is_max:
+                        while not Q.empty() and values[Q.back()] < val:
+                            Q.pop_back()
+                    else:
+                        while not Q.empty() and values[Q.back()] > val:
+                            Q.pop_back()
+                    Q.push_back(j)
+
+            if i > 0 and is_monotonic_bounds:
+                for j in range(start[i - 1], s):
+                    if notnan(values[j]):
+                        nobs -= 1
+
+            # Discard entries outside and left of current window
+            while not Q.empty() and Q.front() < s:
+                Q.pop_front()
+
+            if nobs >= minp and not Q.empty():
+                output[i] = Q.front() - s
+            else:
+                output[i] = NaN
+
+    return output
+
+
+# ----------------------------------------------------------------------
+# Rolling number of distinct values
+
+
+def roll_nunique(ndarray[float64_t] values, ndarray[int64_t] start,
+                 ndarray[int64_t] end, int64_t minp):
+    """
+    Number of distinct non-NaN values of each window, keeping the count of
+    each value of the window in a hash map.
+    """
+    cdef:
+        float64_t val
+        int64_t i, j, s, e, count, nobs = 0, N = len(values)
+        unordered_map[float64_t, int64_t] counts
+        ndarray[float64_t] output
+        bint is_monotonic_bounds
+
+    is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
+    output = np.empty(N, dtype=float)
+
+    with nogil:
+
+        for i in range(N):
+            s = start[i]
+            e = end[i]
+
+            if i == 0 or not is_monotonic_bounds:
+                counts.clear()
+                nobs = 0
+
+                for j in range(s, e):
+                    val = values[j]
+                    if notnan(val):
+                        nobs += 1
+                        counts[val] = counts[val] + 1
+
+            else:
+
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = values[j]
+                    if notnan(val):
+                        nobs += 1
+                        counts[val] = counts[val] + 1
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = values[j]
+                    if notnan(val):
+                        nobs -= 1
+                        count = counts[val] - 1
+                        if count == 0:
+                            counts.erase(val)
+                        else:
+                            counts[val] = count
+
+            if nobs >= minp:
+                output[i] = <float64_t>counts.size()
+            else:
+                output[i] = NaN
+
+    return output
+
+
+# ----------------------------------------------------------------------
+# Rolling rank
+
+cdef enum RankType:
+    AVERAGE,
+    MIN,
+    MAX
+
+
+rank_types = {
+    'average': AVERAGE,
+    'min': MIN,
+    'max': MAX,
+}
+
+
+def roll_rank(ndarray[float64_t] values, ndarray[int64_t] start,
+              ndarray[int64_t] end, int64_t minp, bint percentile,
+              str method, bint ascending):
+    """
+    Rank of the value of each row within its window, ignoring NaNs.
+
+    O(N log(window)) implementation using skip list
+    """
+    cdef:
+        float64_t val, rank
+        skiplist_t *skiplist
+        int64_t i, j, s, e, win, nobs = 0, N = len(values)
+        int rank_min, rank_max
+        ndarray[float64_t] output
+        RankType rank_type
+        bint is_monotonic_bounds
+
+    try:
+        rank_type = rank_types[method]
+    except KeyError:
+        raise ValueError(f"Method '{method}' is not supported")
+
+    output = np.empty(N, dtype=float)
+    if N == 0:
+        return output
+    win = (end - start).max()
+    if win == 0:
+        output[:] = NaN
+        return output
+
+    is_monotonic_bounds = is_monotonic_start_end_bounds(start, end)
+    skiplist = skiplist_init(<int>win)
+    if skiplist == NULL:
+        raise MemoryError("skiplist_init failed")
+
+    with nogil:
+
+        for i in range(N):
+            s = start[i]
+            e = end[i]
+
+            # the values are negated to rank them in descending order
+            if i == 0 or not is_monotonic_bounds:
+
+                # setup
+                for j in range(s, e):
+                    val = values[j] if ascending else -values[j]
+                    if notnan(val):
+                        nobs += 1
+                        skiplist_insert(skiplist, val)
+
+            else:
+
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = values[j] if ascending else -values[j]
+                    if notnan(val):
+                        nobs += 1
+                        skiplist_insert(skiplist, val)
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = values[j] if ascending else -values[j]
+                    if notnan(val):
+                        skiplist_remove(skiplist, val)
+                        nobs -= 1
+
+            val = values[i] if ascending else -values[i]
+            if nobs >= minp and notnan(val):
+                rank_min = skiplist_min_rank(skiplist, val)
+                rank_max = skiplist_max_rank(skiplist, val)
+                if rank_type == MIN:
+                    rank = rank_min
+                elif rank_type == MAX:
+                    rank = rank_max
+                else:
+                    rank = (rank_min + rank_max) / 2.
+                if percentile:
+                    rank = rank / nobs
+                output[i] = rank
+            else:
+                output[i] = NaN
+
+            if not is_monotonic_bounds:
+                for j in range(s, e):
+                    val = values[j] if ascending else -values[j]
+                    if notnan(val):
+                        skiplist_remove(skiplist, val)
+                        nobs -= 1
+
+    skiplist_destroy(skiplist)
+
+    return output
+
+
 cdef enum InterpolationType:
     LINEAR,
     LOWER,
@@ -1216,24 +1971,86 @@ interpolation_types = {
 }
 
 
+cdef inline float64_t calc_quantile(skiplist_t *skiplist, int64_t nobs,
+                                    float64_t quantile,
+                                    InterpolationType interpolation_type) nogil:
+    cdef:
+        float64_t idx_with_fraction, vlow, vhigh
+        Py_ssize_t idx
+        int ret = 0
+
+    if nobs == 1:
+        # Single value in skip list
+        return skiplist_get(skiplist, 0, &ret)
+
+    idx_with_fraction = quantile * (nobs - 1)
+    idx = <int>idx_with_fraction
+
+    if idx_with_fraction == idx:
+        # no need to interpolate
+        return skiplist_get(skiplist, idx, &ret)
+
+    if interpolation_type == LINEAR:
+        vlow = skiplist_get(skiplist, idx, &ret)
+        vhigh = skiplist_get(skiplist, idx + 1, &ret)
+        return vlow + (vhigh - vlow) * (idx_with_fraction - idx)
+    elif interpolation_type == LOWER:
+        return skiplist_get(skiplist, idx, &ret)
+    elif interpolation_type == HIGHER:
+        return skiplist_get(skiplist, idx + 1, &ret)
+    elif interpolation_type == NEAREST:
+        # the same behaviour as round()
+        if idx_with_fraction - idx == 0.5:
+            if idx % 2 == 0:
+                return skiplist_get(skiplist, idx, &ret)
+            else:
+                return skiplist_get(skiplist, idx + 1, &ret)
+        elif idx_with_fraction - idx < 0.5:
+            return skiplist_get(skiplist, idx, &ret)
+        else:
+            return skiplist_get(skiplist, idx + 1, &ret)
+    else:
+        # MIDPOINT
+        vlow = skiplist_get(skiplist, idx, &ret)
+        vhigh = skiplist_get(skiplist, idx + 1, &ret)
+        return <float64_t>(vlow + vhigh) / 2
+
+
 def roll_quantile(ndarray[float64_t, cast=True] values, ndarray[int64_t] start,
                   ndarray[int64_t] end, int64_t minp, int64_t win,
                   float64_t quantile, str interpolation):
     """
     O(N log(window)) implementation using skip list
     """
+    if quantile <= 0.0 or quantile >= 1.0:
+        raise ValueError(f"quantile value {quantile} not in [0, 1]")
+
+    return roll_quantiles(values, start, end, minp, win,
+                          np.array([quantile]), interpolation)[:, 0]
+
+
+def roll_quantiles(ndarray[float64_t, cast=True] values, ndarray[int64_t] start,
+                   ndarray[int64_t] end, int64_t minp, int64_t win,
+                   const float64_t[:] quantiles, str interpolation):
+    """
+    Compute several quantiles of each window with a single skip list, in
+    O(N (log(window) + len(quantiles) log(window))).
+
+    Returns
+    -------
+    ndarray of shape (len(values), len(quantiles))
+    """
     cdef:
-        float64_t val, prev, midpoint, idx_with_fraction
+        float64_t val
         skiplist_t *skiplist
-        int64_t nobs = 0, i, j, s, e, N = len(values)
-        Py_ssize_t idx
-        ndarray[float64_t] output
-        float64_t vlow, vhigh
+        int64_t nobs = 0, i, j, k, s, e, N = len(values)
+        Py_ssize_t Q = len(quantiles)
+        float64_t[:, :] output
         InterpolationType interpolation_type
-        int ret = 0
 
-    if quantile <= 0.0 or quantile >= 1.0:
-        raise ValueError(f"quantile value {quantile} not in [0, 1]")
+    for k in range(Q):
+        if not 0.0 <= quantiles[k] <= 1.0:
+            raise ValueError(f"quantile value {quantiles[k]} not in [0, 1]")
 
     try:
         interpolation_type = interpolation_types[interpolation]
@@ -1242,11 +2059,11 @@ def roll_quantile(ndarray[float64_t, cast=True] values, ndarray[int64_t] start,
 
     # we use the Fixed/Variable Indexer here as the
     # actual skiplist ops outweigh any window computation costs
-    output = np.empty(N, dtype=float)
+    output = np.empty((N, Q), dtype=float)
 
-    if win == 0 or (end - start).max() == 0:
-        output[:] = NaN
-        return output
+    if win == 0 or N == 0 or (end - start).max() == 0:
+        output[:, :] = NaN
+        return np.asarray(output)
     win = (end - start).max()
     skiplist = skiplist_init(<int>win)
     if skiplist == NULL:
@@ -1282,50 +2099,16 @@ def roll_quantile(ndarray[float64_t, cast=True] values, ndarray[int64_t] start,
                         skiplist_remove(skiplist, val)
                         nobs -= 1
 
-            if nobs >= minp:
-                if nobs == 1:
-                    # Single value in skip list
-                    output[i] = skiplist_get(skiplist, 0, &ret)
+            for k in range(Q):
+                if nobs >= minp and nobs > 0:
+                    output[i, k] = calc_quantile(skiplist, nobs, quantiles[k],
+                                                 interpolation_type)
                 else:
-                    idx_with_fraction = quantile * (nobs - 1)
-                    idx = <int>idx_with_fraction
-
-                    if idx_with_fraction == idx:
-                        # no need to interpolate
-                        output[i] = skiplist_get(skiplist, idx, &ret)
-                        continue
-
-                    if interpolation_type == LINEAR:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = ((vlow + (vhigh - vlow) *
-                                      (idx_with_fraction - idx)))
-                    elif interpolation_type == LOWER:
-                        output[i] = skiplist_get(skiplist, idx, &ret)
-                    elif interpolation_type == HIGHER:
-                        output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == NEAREST:
-                        # the same behaviour as round()
-                        if idx_with_fraction - idx == 0.5:
-                            if idx % 2 == 0:
-                                output[i] = skiplist_get(skiplist, idx, &ret)
-                            else:
-                                output[i] = skiplist_get(
-                                    skiplist, idx + 1, &ret)
-                        elif idx_with_fraction - idx < 0.5:
-                            output[i] = skiplist_get(skiplist, idx, &ret)
-                        else:
-                            output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == MIDPOINT:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = <float64_t>(vlow + vhigh) / 2
-            else:
-                output[i] = NaN
+                    output[i, k] = NaN
 
     skiplist_destroy(skiplist)
 
-    return output
+    return np.asarray(output)
 
 
 def roll_generic_fixed(object obj,
@@ -1759,17 +2542,26 @@ def roll_weighted_var(float64_t[:] values, float64_t[:] weights,
 # Exponentially weighted moving average
 
 
-def ewma(float64_t[:] vals, float64_t com, int adjust, bint ignore_na, int minp):
+def ewma(const float64_t[:] vals, const int64_t[:] start, const int64_t[:] end,
+         int minp, float64_t com, bint adjust, bint ignore_na,
+         const float64_t[:] deltas):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
     Parameters
     ----------
     vals : ndarray (float64 type)
+    start: ndarray (int64 type)
+    end: ndarray (int64 type)
+        the bounds of the consecutive segments of vals over which the
+        averages are computed independently, e.g. the groups
+    minp: int
     com : float64
-    adjust: int
+    adjust: bool
     ignore_na: bool
-    minp: int
+    deltas: ndarray (float64 type)
+        the spacing of each value from the previous value, the weights
+        decaying by (1 - alpha) ** delta
 
     Returns
     -------
@@ -1777,10 +2569,10 @@ def ewma(float64_t[:] vals, float64_t com, int adjust, bint ignore_na, int minp)
     """
 
     cdef:
-        Py_ssize_t N = len(vals)
+        Py_ssize_t N = len(vals), S = len(start)
         ndarray[float64_t] output = np.empty(N, dtype=float)
         float64_t alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
-        Py_ssize_t i, nobs
+        Py_ssize_t i, j, s, e, nobs
         bint is_observation
 
     if N == 0:
@@ -1792,36 +2584,117 @@ def ewma(float64_t[:] vals, float64_t com, int adjust, bint ignore_na, int minp)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = vals[0]
-    is_observation = weighted_avg == weighted_avg
-    nobs = int(is_observation)
-    output[0] = weighted_avg if nobs >= minp else NaN
-    old_wt = 1.
+    with nogil:
+        for j in range(S):
+            s = start[j]
+            e = end[j]
+            if s >= e:
+                continue
+
+            weighted_avg = vals[s]
+            is_observation = weighted_avg == weighted_avg
+            nobs = <Py_ssize_t>is_observation
+            output[s] = weighted_avg if nobs >= minp else NaN
+            old_wt = 1.
+
+            for i in range(s + 1, e):
+                cur = vals[i]
+                is_observation = cur == cur
+                nobs += is_observation
+                if weighted_avg == weighted_avg:
+
+                    if is_observation or not ignore_na:
+
+                        old_wt *= pow(old_wt_factor, deltas[i - 1])
+                        if is_observation:
+
+                            # avoid numerical errors on constant series
+                            if weighted_avg != cur:
+                                weighted_avg = ((old_wt * weighted_avg) +
+                                                (new_wt * cur)) / (old_wt + new_wt)
+                            if adjust:
+                                old_wt += new_wt
+                            else:
+                                old_wt = 1.
+                elif is_observation:
+                    weighted_avg = cur
+
+                output[i] = weighted_avg if nobs >= minp else NaN
+
+    return output
+
+
+def ewma_online(const float64_t[:, :] vals, const float64_t[:] deltas, int minp,
+                float64_t com, bint adjust, bint ignore_na,
+                float64_t[:] weighted_avg, float64_t[:] old_wt, int64_t[:] nobs):
+    """
+    Continue the exponentially-weighted moving average of each column of vals
+    from the state left by the previous rows, updating the state in place.
+
+    A new state is a weighted_avg of NaN, an old_wt of 1 and nobs of 0.
+
+    Parameters
+    ----------
+    vals : ndarray (float64 type), 2-D
+        the new rows
+    deltas : ndarray (float64 type)
+        the spacing of each row from the previous row, the weights decaying
+        by (1 - alpha) ** delta
+    minp : int
+    com : float64
+    adjust: bool
+    ignore_na: bool
+    weighted_avg : ndarray (float64 type)
+        the average of each column over the previous rows
+    old_wt : ndarray (float64 type)
+        the weight of the average of each column over the previous rows
+    nobs : ndarray (int64 type)
+        the number of observations of each column in the previous rows
+
+    Returns
+    -------
+    ndarray
+    """
+
+    cdef:
+        Py_ssize_t i, j, N = vals.shape[0], K = vals.shape[1]
+        ndarray[float64_t, ndim=2] output = np.empty((N, K), dtype=np.float64)
+        float64_t alpha, old_wt_factor, new_wt, avg, cur
+        bint is_observation
+
+    minp = max(minp, 1)
+
+    alpha = 1. / (1. + com)
+    old_wt_factor = 1. - alpha
+    new_wt = 1. if adjust else alpha
 
     with nogil:
-        for i in range(1, N):
-            cur = vals[i]
-            is_observation = cur == cur
-            nobs += is_observation
-            if weighted_avg == weighted_avg:
-
-                if is_observation or not ignore_na:
-
-                    old_wt *= old_wt_factor
-                    if is_observation:
-
-                        # avoid numerical errors on constant series
-                        if weighted_avg != cur:
-                            weighted_avg = ((old_wt * weighted_avg) +
-                                            (new_wt * cur)) / (old_wt + new_wt)
-                        if adjust:
-                            old_wt += new_wt
-                        else:
-                            old_wt = 1.
-            elif is_observation:
-                weighted_avg = cur
+        for j in range(K):
+            avg = weighted_avg[j]
+            for i in range(N):
+                cur = vals[i, j]
+                is_observation = cur == cur
+                nobs[j] += is_observation
+                if avg == avg:
+
+                    if is_observation or not ignore_na:
+
+                        old_wt[j] *= pow(old_wt_factor, deltas[i])
+                        if is_observation:
+
+                            # avoid numerical errors on constant series
+                            if avg != cur:
+                                avg = ((old_wt[j] * avg) +
+                                       (new_wt * cur)) / (old_wt[j] + new_wt)
+                            if adjust:
+                                old_wt[j] += new_wt
+                            else:
+                                old_wt[j] = 1.
+                elif is_observation:
+                    avg = cur
 
-            output[i] = weighted_avg if nobs >= minp else NaN
+                output[i, j] = avg if nobs[j] >= minp else NaN
+            weighted_avg[j] = avg
 
     return output
 
@@ -1830,8 +2703,10 @@ def ewma(float64_t[:] vals, float64_t com, int adjust, bint ignore_na, int minp)
 # Exponentially weighted moving covariance
 
 
-def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
-           float64_t com, int adjust, bint ignore_na, int minp, int bias):
+def ewmcov(const float64_t[:] input_x, const float64_t[:] input_y,
+           const int64_t[:] start, const int64_t[:] end, int minp,
+           float64_t com, bint adjust, bint ignore_na, bint bias,
+           const float64_t[:] deltas):
     """
     Compute exponentially-weighted moving variance using center-of-mass.
 
@@ -1839,11 +2714,18 @@ def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
     ----------
     input_x : ndarray (float64 type)
     input_y : ndarray (float64 type)
+    start: ndarray (int64 type)
+    end: ndarray (int64 type)
+        the bounds of the consecutive segments of the inputs over which the
+        covariances are computed independently, e.g. the groups
+    minp: int
     com : float64
-    adjust: int
+    adjust: bool
     ignore_na: bool
-    minp: int
-    bias: int
+    bias: bool
+    deltas: ndarray (float64 type)
+        the spacing of each value from the previous value, the weights
+        decaying by (1 - alpha) ** delta
 
     Returns
     -------
@@ -1851,11 +2733,11 @@ def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
     """
 
     cdef:
-        Py_ssize_t N = len(input_x), M = len(input_y)
-        float64_t alpha, old_wt_factor, new_wt, mean_x, mean_y, cov
+        Py_ssize_t N = len(input_x), M = len(input_y), S = len(start)
+        float64_t alpha, old_wt_factor, new_wt, mean_x, mean_y, cov, decay
         float64_t sum_wt, sum_wt2, old_wt, cur_x, cur_y, old_mean_x, old_mean_y
         float64_t numerator, denominator
-        Py_ssize_t i, nobs
+        Py_ssize_t i, j, s, e, nobs
         ndarray[float64_t] output
         bint is_observation
 
@@ -1872,70 +2754,76 @@ def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    mean_x = input_x[0]
-    mean_y = input_y[0]
-    is_observation = (mean_x == mean_x) and (mean_y == mean_y)
-    nobs = int(is_observation)
-    if not is_observation:
-        mean_x = NaN
-        mean_y = NaN
-    output[0] = (0. if bias else NaN) if nobs >= minp else NaN
-    cov = 0.
-    sum_wt = 1.
-    sum_wt2 = 1.
-    old_wt = 1.
-
     with nogil:
-
-        for i in range(1, N):
-            cur_x = input_x[i]
-            cur_y = input_y[i]
-            is_observation = (cur_x == cur_x) and (cur_y == cur_y)
-            nobs += is_observation
-            if mean_x == mean_x:
-                if is_observation or not ignore_na:
-                    sum_wt *= old_wt_factor
-                    sum_wt2 *= (old_wt_factor * old_wt_factor)
-                    old_wt *= old_wt_factor
-                    if is_observation:
-                        old_mean_x = mean_x
-                        old_mean_y = mean_y
-
-                        # avoid numerical errors on constant series
-                        if mean_x != cur_x:
-                            mean_x = ((old_wt * old_mean_x) +
-                                      (new_wt * cur_x)) / (old_wt + new_wt)
-
-                        # avoid numerical errors on constant series
-                        if mean_y != cur_y:
-                            mean_y = ((old_wt * old_mean_y) +
-                                      (new_wt * cur_y)) / (old_wt + new_wt)
-                        cov = ((old_wt * (cov + ((old_mean_x - mean_x) *
-                                                 (old_mean_y - mean_y)))) +
-                               (new_wt * ((cur_x - mean_x) *
-                                          (cur_y - mean_y)))) / (old_wt + new_wt)
-                        sum_wt += new_wt
-                        sum_wt2 += (new_wt * new_wt)
-                        old_wt += new_wt
-                        if not adjust:
-                            sum_wt /= old_wt
-                            sum_wt2 /= (old_wt * old_wt)
-                            old_wt = 1.
-            elif is_observation:
-                mean_x = cur_x
-                mean_y = cur_y
-
-            if nobs >= minp:
-                if not bias:
-                    numerator = sum_wt * sum_wt
-                    denominator = numerator - sum_wt2
-                    if denominator > 0:
-                        output[i] = (numerator / denominator) * cov
+        for j in range(S):
+            s = start[j]
+            e = end[j]
+            if s >= e:
+                continue
+
+            mean_x = input_x[s]
+            mean_y = input_y[s]
+            is_observation = (mean_x == mean_x) and (mean_y == mean_y)
+            nobs = <Py_ssize_t>is_observation
+            if not is_observation:
+                mean_x = NaN
+                mean_y = NaN
+            output[s] = (0. if bias else NaN) if nobs >= minp else NaN
+            cov = 0.
+            sum_wt = 1.
+            sum_wt2 = 1.
+            old_wt = 1.
+
+            for i in range(s + 1, e):
+                cur_x = input_x[i]
+                cur_y = input_y[i]
+                is_observation = (cur_x == cur_x) and (cur_y == cur_y)
+                nobs += is_observation
+                if mean_x == mean_x:
+                    if is_observation or not ignore_na:
+                        decay = pow(old_wt_factor, deltas[i - 1])
+                        sum_wt *= decay
+                        sum_wt2 *= (decay * decay)
+                        old_wt *= decay
+                        if is_observation:
+                            old_mean_x = mean_x
+                            old_mean_y = mean_y
+
+                            # avoid numerical errors on constant series
+                            if mean_x != cur_x:
+                                mean_x = ((old_wt * old_mean_x) +
+                                          (new_wt * cur_x)) / (old_wt + new_wt)
+
+                            # avoid numerical errors on constant series
+                            if mean_y != cur_y:
+                                mean_y = ((old_wt * old_mean_y) +
+                                          (new_wt * cur_y)) / (old_wt + new_wt)
+                            cov = ((old_wt * (cov + ((old_mean_x - mean_x) *
+                                                     (old_mean_y - mean_y)))) +
+                                   (new_wt * ((cur_x - mean_x) *
+                                              (cur_y - mean_y)))) / (old_wt + new_wt)
+                            sum_wt += new_wt
+                            sum_wt2 += (new_wt * new_wt)
+                            old_wt += new_wt
+                            if not adjust:
+                                sum_wt /= old_wt
+                                sum_wt2 /= (old_wt * old_wt)
+                                old_wt = 1.
+                elif is_observation:
+                    mean_x = cur_x
+                    mean_y = cur_y
+
+                if nobs >= minp:
+                    if not bias:
+                        numerator = sum_wt * sum_wt
+                        denominator = numerator - sum_wt2
+                        if denominator > 0:
+                            output[i] = (numerator / denominator) * cov
+                        else:
+                            output[i] = NaN
                     else:
-                        output[i] = NaN
+                        output[i] = cov
                 else:
-                    output[i] = cov
-            else:
-                output[i] = NaN
+                    output[i] = NaN
 
     return output
@@ -44,10 +44,8 @@ def calculate_variable_window_bounds(
     cdef:
         bint left_closed = False
         bint right_closed = False
-        int index_growth_sign = 1
         ndarray[int64_t, ndim=1] start, end
-        int64_t start_bound, end_bound
-        Py_ssize_t i, j
+        int64_t[:] start_view, end_view
 
     # if windows is variable, default is 'right', otherwise default is 'both'
     if closed is None:
@@ -59,51 +57,135 @@ def calculate_variable_window_bounds(
     if closed in ['left', 'both']:
         left_closed = True
 
-    if index[num_values - 1] < index[0]:
-        index_growth_sign = -1
-
     start = np.empty(num_values, dtype='int64')
     start.fill(-1)
     end = np.empty(num_values, dtype='int64')
     end.fill(-1)
+    start_view, end_view = start, end
+
+    with nogil:
+        _fill_variable_window_bounds(start_view, end_view, index, 0, num_values,
+                                     window_size, left_closed, right_closed)
+    return start, end
+
 
-    start[0] = 0
+def calculate_grouped_variable_window_bounds(
+    const int64_t[:] group_lengths,
+    int64_t window_size,
+    object closed,
+    const int64_t[:] index
+):
+    """
+    Calculate window boundaries for rolling windows from a time offset, over
+    consecutive groups whose windows do not overlap.
+
+    Parameters
+    ----------
+    group_lengths : ndarray[int64]
+        number of values of each group, the values of a group following the
+        values of the previous group
+
+    window_size : int64
+        window size calculated from the offset
+
+    closed : str
+        string of side of the window that should be closed
+
+    index : ndarray[int64]
+        time series index to roll over, monotonic within each group
+
+    Returns
+    -------
+    (ndarray[int64], ndarray[int64])
+    """
+    cdef:
+        bint left_closed = False
+        bint right_closed = False
+        ndarray[int64_t, ndim=1] start, end
+        int64_t[:] start_view, end_view
+        Py_ssize_t i, lo = 0, num_values = len(index)
+
+    if closed is None:
+        closed = 'right'
+
+    if closed in ['right', 'both']:
+        right_closed = True
+
+    if closed in ['left', 'both']:
+        left_closed = True
+
+    start = np.empty(num_values, dtype='int64')
+    end = np.empty(num_values, dtype='int64')
+    start_view, end_view = start, end
+
+    with nogil:
+        for i in range(group_lengths.shape[0]):
+            _fill_variable_window_bounds(start_view, end_view, index, lo,
+                                         lo + group_lengths[i], window_size,
+                                         left_closed, right_closed)
+            lo += group_lengths[i]
+    return start, end
+
+
+cdef void _fill_variable_window_bounds(
+    int64_t[:] start,
+    int64_t[:] end,
+    const int64_t[:] index,
+    Py_ssize_t lo,
+    Py_ssize_t hi,
+    int64_t window_size,
+    bint left_closed,
+    bint right_closed
+) nogil:
+    """
+    Fill the window boundaries of the values between lo and hi, which only
+    span these values.
+    """
+    cdef:
+        int index_growth_sign = 1
+        int64_t start_bound, end_bound
+        Py_ssize_t i, j
+
+    if hi <= lo:
+        return
+
+    if index[hi - 1] < index[lo]:
+        index_growth_sign = -1
+
+    start[lo] = lo
 
     # right endpoint is closed
     if right_closed:
-        end[0] = 1
+        end[lo] = lo + 1
     # right endpoint is open
     else:
-        end[0] = 0
-
-    with nogil:
-
-        # start is start of slice interval (including)
-        # end is end of slice interval (not including)
-        for i in range(1, num_values):
-            end_bound = index[i]
-            start_bound = index[i] - index_growth_sign * window_size
-
-            # left endpoint is closed
-            if left_closed:
-                start_bound -= 1
-
-            # advance the start bound until we are
-            # within the constraint
-            start[i] = i
-            for j in range(start[i - 1], i):
-                if (index[j] - start_bound) * index_growth_sign > 0:
-                    start[i] = j
-                    break
-
-            # end bound is previous end
-            # or current index
-            if (index[end[i - 1]] - end_bound) * index_growth_sign <= 0:
-                end[i] = i + 1
-            else:
-                end[i] = end[i - 1]
-
-            # right endpoint is open
-            if not right_closed:
-                end[i] -= 1
-    return start, end
+        end[lo] = lo
+
+    # start is start of slice interval (including)
+    # end is end of slice interval (not including)
+    for i in range(lo + 1, hi):
+        end_bound = index[i]
+        start_bound = index[i] - index_growth_sign * window_size
+
+        # left endpoint is closed
+        if left_closed:
+            start_bound -= 1
+
+        # advance the start bound until we are
+        # within the constraint
+        start[i] = i
+        for j in range(start[i - 1], i):
+            if (index[j] - start_bound) * index_growth_sign > 0:
+                start[i] = j
+                break
+
+        # end bound is previous end
+        # or current index
+        if (index[end[i - 1]] - end_bound) * index_growth_sign <= 0:
+            end[i] = i + 1
+        else:
+            end[i] = end[i - 1]
+
+        # right endpoint is open
+        if not right_closed:
+            end[i] -= 1
@@ -30,6 +30,8 @@ VERSIONS = {
     "xlwt": "1.2.0",
     "xlsxwriter": "0.9.8",
     "numba": "0.46.0",
+    "zstandard": "0.15.0",
+    "lz4": "3.0.2",
 }
 
 
@@ -52,6 +52,15 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+num_threads_doc = """
+: int
+    The number of threads used by the groupby reductions implemented in
+    cython (e.g. sum, mean, min, max, var). The columns, or for a single
+    column the rows, are split between the threads. 0 or None uses one
+    thread per CPU. The default is 1.
+"""
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -63,6 +72,7 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numexpr", True, use_numexpr_doc, validator=is_bool, cb=use_numexpr_cb
     )
+    cf.register_option("num_threads", 1, num_threads_doc, validator=is_nonnegative_int)
 #
 # options from the "display" namespace
 
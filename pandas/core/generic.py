@@ -2657,6 +2657,7 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
         path,
         compression: Optional[str] = "infer",
         protocol: int = pickle.HIGHEST_PROTOCOL,
+        out_of_band: bool_t = False,
     ) -> None:
         """
         Pickle (serialize) object to file.
@@ -2665,8 +2666,8 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
         ----------
         path : str
             File path where the pickled object will be stored.
-        compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', None}, \
-        default 'infer'
+        compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', 'zstd', 'lz4', \
+        None}, default 'infer'
             A string representing the compression to use in the output file. By
             default, infers from the file extension in specified path.
         protocol : int
@@ -2676,6 +2677,13 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
             parameter is equivalent to setting its value to HIGHEST_PROTOCOL.
 
             .. [1] https://docs.python.org/3/library/pickle.html.
+        out_of_band : bool, default False
+            Write the data buffers of the object out-of-band, next to the
+            pickle stream, so that :func:`read_pickle` can memory-map them
+            back with ``memory_map=True``. Requires pickle protocol 5
+            (Python >= 3.8).
+
+            .. versionadded:: 1.1.0
 
         See Also
         --------
@@ -2710,7 +2718,13 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
         """
         from pandas.io.pickle import to_pickle
 
-        to_pickle(self, path, compression=compression, protocol=protocol)
+        to_pickle(
+            self,
+            path,
+            compression=compression,
+            protocol=protocol,
+            out_of_band=out_of_band,
+        )
 
     def to_clipboard(
         self, excel: bool_t = True, sep: Optional[str] = None, **kwargs
@@ -3100,12 +3114,11 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
         compression : str or dict, default 'infer'
             If str, represents compression mode. If dict, value at 'method' is
             the compression mode. Compression mode may be any of the following
-            possible values: {'infer', 'gzip', 'bz2', 'zip', 'xz', None}. If
-            compression mode is 'infer' and `path_or_buf` is path-like, then
-            detect compression mode from the following extensions: '.gz',
-            '.bz2', '.zip' or '.xz'. (otherwise no compression). If dict given
-            and mode is one of {'zip', 'gzip', 'bz2'}, or inferred as
-            one of the above, other entries passed as
+            possible values: {'infer', 'gzip', 'bz2', 'zip', 'xz', 'zstd',
+            'lz4', None}. If compression mode is 'infer' and `path_or_buf` is
+            path-like, then detect compression mode from the following
+            extensions: '.gz', '.bz2', '.zip', '.xz', '.zst' or '.lz4'.
+            (otherwise no compression). If dict given, other entries passed as
             additional compression options.
 
             .. versionchanged:: 1.0.0
@@ -10563,6 +10576,7 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
             adjust=True,
             ignore_na=False,
             axis=0,
+            times=None,
         ):
             axis = self._get_axis_number(axis)
             return EWM(
@@ -10575,6 +10589,7 @@ class NDFrame(PandasObject, SelectionMixin, indexing.IndexingMixin):
                 adjust=adjust,
                 ignore_na=ignore_na,
                 axis=axis,
+                times=times,
             )
 
         cls.ewm = ewm
@@ -1,6 +1,7 @@
+from pandas.core.groupby.accumulator import GroupByAccumulator
 from pandas.core.groupby.generic import DataFrameGroupBy, NamedAgg, SeriesGroupBy
 from pandas.core.groupby.groupby import GroupBy
-from pandas.core.groupby.grouper import Grouper
+from pandas.core.groupby.grouper import GroupByPlan, Grouper
 
 __all__ = [
     "DataFrameGroupBy",
@@ -8,4 +9,6 @@ __all__ = [
     "SeriesGroupBy",
     "GroupBy",
     "Grouper",
+    "GroupByPlan",
+    "GroupByAccumulator",
 ]
@@ -0,0 +1,501 @@
+"""
+Incremental groupby aggregation over chunks of data.
+
+The aggregations are reduced to partial states per group (counts, sums,
+sums of squared deviations, extrema, quantile sketches) which are computed
+with the groupby kernels for every chunk and merged with the states of the
+previous chunks.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pandas._typing import Label
+
+from pandas.core.dtypes.common import is_list_like
+
+from pandas.core.frame import DataFrame
+from pandas.core.indexes.api import MultiIndex
+
+# the partial states each aggregation is computed from
+_func_states: Dict[str, Tuple[str, ...]] = {
+    "count": ("count",),
+    "sum": ("sum",),
+    "mean": ("count", "sum"),
+    "var": ("count", "sum", "m2"),
+    "std": ("count", "sum", "m2"),
+    "min": ("min",),
+    "max": ("max",),
+    "first": ("first",),
+    "last": ("last",),
+    "median": ("sketch",),
+    "quantile": ("sketch",),
+}
+
+# the order of the partial states in the state frame
+_state_order = ["count", "sum", "m2", "min", "max", "first", "last", "sketch"]
+
+# aggregations only computed for the numeric columns
+_numeric_funcs = {"sum", "mean", "var", "std", "median", "quantile"}
+
+# how the partial states of a group are merged, "m2" and "sketch" are
+# merged separately
+_state_merge = {
+    "count": "sum",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "first": "first",
+    "last": "last",
+}
+
+_Sketch = Tuple[np.ndarray, np.ndarray]
+
+
+def _as_list(func: Union[str, Sequence[str]]) -> List[str]:
+    return [func] if isinstance(func, str) else list(func)
+
+
+def _compress_sketch(means: np.ndarray, weights: np.ndarray, size: int) -> _Sketch:
+    """
+    Reduce sorted centroids to at most `size` centroids, as in a t-digest.
+
+    The centroids are merged in bins of equal width on the arcsine scale of
+    the t-digest, so that a centroid around the quantile q summarizes at most
+    about a fraction ``pi * sqrt(q * (1 - q)) / size`` of the values. This
+    bounds the rank error of the quantiles computed from the sketch, and
+    keeps the tails, where this fraction is the smallest, the most accurate.
+    """
+    if len(means) <= size:
+        return means, weights
+
+    cumulative = np.cumsum(weights)
+    quantiles = (cumulative - weights / 2) / cumulative[-1]
+    scale = (np.arcsin(2 * quantiles - 1) / np.pi + 0.5) * size
+    bins = scale.astype(np.intp)
+    np.minimum(bins, size - 1, out=bins)
+    new_weights = np.bincount(bins, weights=weights, minlength=size)
+    new_means = np.bincount(bins, weights=weights * means, minlength=size)
+    mask = new_weights > 0
+    return new_means[mask] / new_weights[mask], new_weights[mask]
+
+
+def _merge_sketches(sketches: List[_Sketch], size: int) -> _Sketch:
+    if len(sketches) == 1:
+        return sketches[0]
+    means = np.concatenate([sketch[0] for sketch in sketches])
+    weights = np.concatenate([sketch[1] for sketch in sketches])
+    order = means.argsort(kind="mergesort")
+    return _compress_sketch(means[order], weights[order], size)
+
+
+def _sketch_quantile(sketch: _Sketch, q: float) -> float:
+    """
+    Quantile of a sketch, linearly interpolated between the centroids.
+
+    This is exact (with the 'linear' interpolation of ``quantile``) as long as
+    the sketch has not been compressed.
+    """
+    means, weights = sketch
+    if len(means) == 0:
+        return np.nan
+    # position of each centroid in the ranks of the values it summarizes
+    positions = np.cumsum(weights) - (weights + 1) / 2
+    return np.interp(q * (weights.sum() - 1), positions, means)
+
+
+class GroupByAccumulator:
+    """
+    Incrementally aggregate the groups of DataFrames given in chunks.
+
+    The accumulator keeps mergeable partial states per group, such as the
+    counts, sums and sums of squared deviations for ``mean``, ``var`` and
+    ``std``, or the extrema for ``min`` and ``max``. These states are
+    computed for every chunk passed to :meth:`update`, merged into the
+    states of the previous chunks, and turned into the aggregated result by
+    :meth:`result`.
+
+    The result is the same as aggregating the concatenation of all the
+    chunks, except for ``median`` and ``quantile``: these are computed from a
+    t-digest sketch of at most ``sketch_size`` centroids per group and
+    column, and are only exact for groups with at most ``sketch_size``
+    values. For larger groups, the quantile q is interpolated between
+    centroids holding at most about a fraction
+    ``pi * sqrt(q * (1 - q)) / sketch_size`` of the values of the group,
+    which bounds the error on its rank.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    by : label or list of labels
+        The columns of the chunks to group by.
+    func : str, list or dict
+        The aggregations to compute, one of 'count', 'sum', 'mean', 'var',
+        'std', 'min', 'max', 'first', 'last', 'median' and 'quantile', a
+        list of these or a dict of column labels to aggregations or lists of
+        aggregations, as in :meth:`.DataFrameGroupBy.aggregate`.
+    sort : bool, default True
+        Sort the result by the group keys.
+    dropna : bool, default True
+        Drop the rows whose group keys contain NA values.
+    ddof : int, default 1
+        Delta degrees of freedom of 'var' and 'std'.
+    q : float, default 0.5
+        The quantile computed by 'quantile'.
+    sketch_size : int, default 1000
+        Maximum number of centroids kept per group and column for 'median'
+        and 'quantile'.
+
+    See Also
+    --------
+    DataFrame.groupby : Group a DataFrame held in memory.
+    read_csv : Read a comma-separated values file, in chunks with
+        ``chunksize``.
+
+    Examples
+    --------
+    >>> chunks = [
+    ...     pd.DataFrame({"key": ["a", "b"], "x": [1, 2]}),
+    ...     pd.DataFrame({"key": ["b", "a", "a"], "x": [3, 4, 8]}),
+    ... ]
+    >>> acc = pd.core.groupby.GroupByAccumulator("key", ["sum", "mean"])
+    >>> for chunk in chunks:
+    ...     acc = acc.update(chunk)
+    >>> acc.result()
+          x
+        sum      mean
+    key
+    a    13  4.333333
+    b     5  2.500000
+    """
+
+    def __init__(
+        self,
+        by: Union[Label, List[Label]],
+        func: Union[str, List[str], Dict[Label, Union[str, List[str]]]],
+        sort: bool = True,
+        dropna: bool = True,
+        ddof: int = 1,
+        q: float = 0.5,
+        sketch_size: int = 1000,
+    ):
+        self.keys: List[Label] = list(by) if is_list_like(by) else [by]
+        self.func = func
+        self.sort = sort
+        self.dropna = dropna
+        self.ddof = ddof
+        self.q = q
+        self.sketch_size = sketch_size
+
+        if isinstance(func, dict):
+            funcs = [f for fs in func.values() for f in _as_list(fs)]
+        else:
+            funcs = _as_list(func)
+        for f in funcs:
+            if f not in _func_states:
+                raise ValueError(
+                    f"func must be one of {list(_func_states)}, got {repr(f)}"
+                )
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if sketch_size < 1:
+            raise ValueError("sketch_size must be a positive integer")
+
+        self._columns: Optional[List[Label]] = None
+        self._numeric: Optional[List[Label]] = None
+        self._states: Optional[List[str]] = None
+        self._state: Optional[DataFrame] = None
+
+    @property
+    def ngroups(self) -> int:
+        """
+        Number of groups seen so far.
+        """
+        return 0 if self._state is None else len(self._state)
+
+    def _aggregations(self) -> List[Tuple[Label, str]]:
+        """
+        The (column, aggregation) pairs of the result, in order.
+        """
+        if isinstance(self.func, dict):
+            pairs = [(col, f) for col, fs in self.func.items() for f in _as_list(fs)]
+            for col, f in pairs:
+                if col not in self._columns:
+                    raise KeyError(f"Column '{col}' does not exist!")
+                if f in _numeric_funcs and col not in self._numeric:
+                    raise TypeError(f"'{f}' is only supported for numeric columns")
+            return pairs
+        return [
+            (col, f)
+            for col in self._columns
+            for f in _as_list(self.func)
+            if f not in _numeric_funcs or col in self._numeric
+        ]
+
+    def _setup(self, chunk: DataFrame) -> None:
+        keys = set(self.keys)
+        self._columns = [col for col in chunk.columns if col not in keys]
+        self._numeric = [
+            col for col in chunk._get_numeric_data().columns if col not in keys
+        ]
+        states = {state for _, f in self._aggregations() for state in _func_states[f]}
+        # keep a fixed order of the states
+        self._states = [state for state in _state_order if state in states]
+
+    def _state_columns(self, state: str) -> List[Label]:
+        if state in ("sum", "m2", "sketch"):
+            return self._numeric
+        return self._columns
+
+    def _partial_state(self, chunk: DataFrame) -> DataFrame:
+        """
+        The partial states of the groups of a chunk.
+        """
+        from pandas.core.reshape.concat import concat
+
+        groupby = chunk.groupby(self.keys, sort=False, dropna=self.dropna)
+        pieces = {}
+        for state in self._states:
+            columns = self._state_columns(state)
+            grouped = groupby[columns]
+            if state == "sum":
+                pieces[state] = grouped.sum(min_count=0)
+            elif state == "m2":
+                count = groupby[columns].count()
+                m2 = grouped.var() * (count - 1)
+                # a single value has no deviation
+                pieces[state] = m2.mask(count == 1, 0.0)
+            elif state == "sketch":
+                pieces[state] = self._chunk_sketches(chunk, groupby)
+            else:
+                pieces[state] = getattr(grouped, state)()
+        return concat(pieces, axis=1)
+
+    def _chunk_sketches(self, chunk: DataFrame, groupby) -> DataFrame:
+        ids, _, ngroups = groupby.grouper.group_info
+        result = {}
+        for col in self._numeric:
+            values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask = ~np.isnan(values) & (ids != -1)
+            values, group_ids = values[mask], ids[mask]
+            order = np.lexsort((values, group_ids))
+            values, group_ids = values[order], group_ids[order]
+            bounds = np.searchsorted(group_ids, np.arange(ngroups + 1))
+
+            sketches = np.empty(ngroups, dtype=object)
+            for i in range(ngroups):
+                means = values[bounds[i] : bounds[i + 1]]
+                sketches[i] = _compress_sketch(
+                    means, np.ones(len(means)), self.sketch_size
+                )
+            result[col] = sketches
+        return DataFrame(
+            result, index=groupby.grouper.result_index, columns=self._numeric
+        )
+
+    def _merge_states(self, left: DataFrame, right: DataFrame) -> DataFrame:
+        from pandas.core.reshape.concat import concat
+
+        combined = concat([left, right])
+        keys = [
+            combined.index.get_level_values(i) for i in range(combined.index.nlevels)
+        ]
+        grouper = combined.groupby(keys, sort=False, dropna=False).grouper
+
+        pieces = {}
+        for state in self._states:
+            if state == "m2":
+                pieces[state] = self._merge_m2(combined, grouper)
+            elif state == "sketch":
+                pieces[state] = self._merge_sketches(combined, grouper)
+            else:
+                grouped = combined[state].groupby(grouper)
+                if state == "sum":
+                    pieces[state] = grouped.sum(min_count=0)
+                else:
+                    pieces[state] = getattr(grouped, _state_merge[state])()
+        return concat(pieces, axis=1)
+
+    def _merge_m2(self, combined: DataFrame, grouper) -> DataFrame:
+        # Chan et al.: the sums of squared deviations of the parts, plus the
+        # deviations of the means of the parts from the merged mean
+        ids = grouper.group_info[0]
+        count = combined["count"][self._numeric].to_numpy(dtype=np.float64)
+        total = combined["sum"].to_numpy(dtype=np.float64)
+        counts = combined["count"][self._numeric].groupby(grouper).sum()
+        totals = combined["sum"].groupby(grouper).sum()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = totals.to_numpy(dtype=np.float64) / counts.to_numpy(
+                dtype=np.float64
+            )
+            deviation = count * (total / count - mean[ids]) ** 2
+        deviation = DataFrame(
+            np.where(count > 0, deviation, 0.0),
+            index=combined.index,
+            columns=self._numeric,
+        )
+        m2 = combined["m2"].groupby(grouper).sum()
+        return m2 + deviation.groupby(grouper).sum()
+
+    def _merge_sketches(self, combined: DataFrame, grouper) -> DataFrame:
+        ids, _, ngroups = grouper.group_info
+        result = {}
+        for col in self._numeric:
+            parts: List[List[_Sketch]] = [[] for _ in range(ngroups)]
+            for i, sketch in zip(ids, combined[("sketch", col)]):
+                if isinstance(sketch, tuple):
+                    parts[i].append(sketch)
+
+            sketches = np.empty(ngroups, dtype=object)
+            for i, part in enumerate(parts):
+                if part:
+                    sketches[i] = _merge_sketches(part, self.sketch_size)
+            result[col] = sketches
+        return DataFrame(result, index=grouper.result_index, columns=self._numeric)
+
+    def update(self, chunk: DataFrame) -> "GroupByAccumulator":
+        """
+        Add a chunk of data to the aggregation.
+
+        Parameters
+        ----------
+        chunk : DataFrame
+            The chunk, with the same columns as the previous ones.
+
+        Returns
+        -------
+        GroupByAccumulator
+            The accumulator itself.
+        """
+        if not isinstance(chunk, DataFrame):
+            raise TypeError(f"chunk must be a DataFrame, got {type(chunk).__name__}")
+        if self._columns is None:
+            self._setup(chunk)
+        else:
+            missing = [
+                col for col in self.keys + self._columns if col not in chunk.columns
+            ]
+            if missing:
+                raise KeyError(f"Columns {missing} are missing from the chunk")
+            chunk = chunk[self.keys + self._columns]
+
+        partial = self._partial_state(chunk)
+        if self._state is None:
+            self._state = partial
+        else:
+            self._state = self._merge_states(self._state, partial)
+        return self
+
+    def merge(self, other: "GroupByAccumulator") -> "GroupByAccumulator":
+        """
+        Merge the partial states of two accumulators.
+
+        This combines the aggregations of chunks which were accumulated
+        separately, e.g. in several processes.
+
+        Parameters
+        ----------
+        other : GroupByAccumulator
+            An accumulator with the same keys and aggregations.
+
+        Returns
+        -------
+        GroupByAccumulator
+            A new accumulator holding the states of both.
+        """
+        if not isinstance(other, GroupByAccumulator):
+            raise TypeError(
+                f"other must be a GroupByAccumulator, got {type(other).__name__}"
+            )
+        config = (self.keys, self.func, self.dropna)
+        if config != (other.keys, other.func, other.dropna):
+            raise ValueError("Cannot merge accumulators with different aggregations")
+
+        result = type(self)(
+            self.keys,
+            self.func,
+            sort=self.sort,
+            dropna=self.dropna,
+            ddof=self.ddof,
+            q=self.q,
+            sketch_size=self.sketch_size,
+        )
+        if self._state is None or other._state is None:
+            source = self if other._state is None else other
+            result._columns = source._columns
+            result._numeric = source._numeric
+            result._states = source._states
+            result._state = source._state
+            return result
+
+        if self._columns != other._columns:
+            raise ValueError("Cannot merge accumulators of different columns")
+        result._columns = self._columns
+        result._numeric = self._numeric
+        result._states = self._states
+        result._state = result._merge_states(self._state, other._state)
+        return result
+
+    def _finalize(self, func: str) -> DataFrame:
+        state = self._state
+        if func in ("mean", "var", "std"):
+            count = state["count"][self._numeric]
+            if func == "mean":
+                return state["sum"] / count
+            result = state["m2"] / (count - self.ddof)
+            result = result.mask(count <= self.ddof)
+            return np.sqrt(result) if func == "std" else result
+        elif func in ("median", "quantile"):
+            q = 0.5 if func == "median" else self.q
+            sketches = state["sketch"]
+            return DataFrame(
+                {
+                    col: [
+                        _sketch_quantile(sketch, q)
+                        if isinstance(sketch, tuple)
+                        else np.nan
+                        for sketch in sketches[col]
+                    ]
+                    for col in self._numeric
+                },
+                index=state.index,
+                columns=self._numeric,
+            )
+        return state[_func_states[func][0]]
+
+    def result(self) -> DataFrame:
+        """
+        Compute the aggregations from the chunks added so far.
+
+        Returns
+        -------
+        DataFrame
+            The aggregated groups, with one column per column and aggregation
+            (a MultiIndex of the columns and the aggregations if ``func`` holds
+            lists of aggregations).
+        """
+        from pandas.core.reshape.concat import concat
+
+        if self._state is None:
+            raise ValueError("No chunk has been added to the accumulator")
+
+        pairs = self._aggregations()
+        finalized = {f: self._finalize(f) for f in dict.fromkeys(f for _, f in pairs)}
+        if isinstance(self.func, str) or (
+            isinstance(self.func, dict)
+            and all(isinstance(fs, str) for fs in self.func.values())
+        ):
+            result = DataFrame(
+                {col: finalized[f][col] for col, f in pairs},
+                index=self._state.index,
+                columns=[col for col, _ in pairs],
+            )
+        else:
+            result = concat([finalized[f][col] for col, f in pairs], axis=1)
+            result.columns = MultiIndex.from_tuples(pairs)
+
+        result.index.names = self.keys
+        if self.sort:
+            result = result.sort_index()
+        return result
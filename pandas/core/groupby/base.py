@@ -92,6 +92,21 @@ cythonized_kernels = frozenset(["cumprod", "cumsum", "shift", "cummin", "cummax"
 
 cython_cast_blacklist = frozenset(["rank", "count", "size", "idxmin", "idxmax"])
 
+# reductions DataFrameGroupBy.aggregate computes together in a single pass
+# when given as a list or dict
+fused_reductions = frozenset(["count", "sum", "mean", "var", "std", "min", "max"])
+
+# reductions whose transform is broadcast by the Cython kernel directly to the
+# rows of each group, with the keyword arguments the kernel supports
+transform_fused_reductions = {
+    "sum": frozenset(["min_count"]),
+    "mean": frozenset(),
+    "min": frozenset(),
+    "max": frozenset(),
+    "var": frozenset(["ddof"]),
+    "std": frozenset(["ddof"]),
+}
+
 # List of aggregation/reduction functions.
 # These map each group to a single numeric value
 reduction_kernels = frozenset(
@@ -163,6 +178,7 @@ groupby_other_methods = frozenset(
         "cov",
         "describe",
         "dtypes",
+        "ewm",
         "expanding",
         "filter",
         "get_group",
@@ -173,7 +189,9 @@ groupby_other_methods = frozenset(
         "ndim",
         "ngroups",
         "ohlc",
+        "ohlcv",
         "pipe",
+        "plan",
         "plot",
         "resample",
         "rolling",
@@ -19,6 +19,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    Optional,
     Sequence,
     Tuple,
     Type,
@@ -29,21 +30,27 @@ import warnings
 
 import numpy as np
 
-from pandas._libs import lib
-from pandas._typing import FrameOrSeries
+from pandas._libs import hashtable as htable, lib
+import pandas._libs.groupby as libgroupby
+from pandas._typing import FrameOrSeries, FrameOrSeriesUnion, Label
 from pandas.util._decorators import Appender, Substitution, doc
 
 from pandas.core.dtypes.cast import (
+    find_common_type,
+    infer_dtype_from_scalar,
     maybe_cast_result,
     maybe_cast_result_dtype,
     maybe_convert_objects,
     maybe_downcast_numeric,
     maybe_downcast_to_dtype,
+    maybe_promote,
 )
 from pandas.core.dtypes.common import (
     ensure_int64,
     ensure_platform_int,
     is_bool,
+    is_categorical_dtype,
+    is_extension_array_dtype,
     is_integer_dtype,
     is_interval_dtype,
     is_numeric_dtype,
@@ -73,10 +80,15 @@ from pandas.core.groupby.groupby import (
     _transform_template,
     get_groupby,
 )
+from pandas.core.groupby.numba_ import (
+    generate_numba_frame_agg_func,
+    validate_frame_udf,
+)
 from pandas.core.indexes.api import Index, MultiIndex, all_indexes_same
 import pandas.core.indexes.base as ibase
 from pandas.core.internals import BlockManager, make_block
 from pandas.core.series import Series
+from pandas.core.util.hashing import hash_array
 from pandas.core.util.numba_ import (
     NUMBA_FUNC_CACHE,
     generate_numba_func,
@@ -483,6 +495,13 @@ class SeriesGroupBy(GroupBy[Series]):
         elif func in base.transformation_kernels:
             return getattr(self, func)(*args, **kwargs)
 
+        obj = self._selected_obj
+        out = self._cython_transform_reduce(
+            func, obj._values.reshape(-1, 1), *args, **kwargs
+        )
+        if out is not None:
+            return self.obj._constructor(out[:, 0], index=obj.index, name=obj.name)
+
         # If func is a reduction, we need to broadcast the
         # result to the whole group. Compute func result
         # and deal with possible broadcasting below.
@@ -503,7 +522,7 @@ class SeriesGroupBy(GroupBy[Series]):
 
         klass = type(self._selected_obj)
 
-        results = []
+        pieces = []
         for name, group in self:
             object.__setattr__(group, "name", name)
             if engine == "numba":
@@ -517,14 +536,16 @@ class SeriesGroupBy(GroupBy[Series]):
             if isinstance(res, (ABCDataFrame, ABCSeries)):
                 res = res._values
 
-            indexer = self._get_index(name)
-            ser = klass(res, indexer)
-            results.append(ser)
+            pieces.append((self._get_index(name), res))
 
-        # check for empty "results" to avoid concat ValueError
-        if results:
+        out = _fill_transformed(pieces, len(self._selected_obj))
+        if out is not None:
+            result = klass(out)
+        elif pieces:
+            # check for empty "pieces" to avoid concat ValueError
             from pandas.core.reshape.concat import concat
 
+            results = [klass(res, indexer) for indexer, res in pieces]
             result = concat(results).sort_index()
         else:
             result = self.obj._constructor(dtype=np.float64)
@@ -601,56 +622,50 @@ class SeriesGroupBy(GroupBy[Series]):
         filtered = self._apply_filter(indices, dropna)
         return filtered
 
-    def nunique(self, dropna: bool = True) -> Series:
+    def nunique(self, dropna: bool = True, approx: bool = False) -> Series:
         """
         Return number of unique elements in the group.
 
+        Parameters
+        ----------
+        dropna : bool, default True
+            Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the number of unique elements with HyperLogLog, in
+            memory bounded by the number of groups instead of the number of
+            unique elements. The relative standard error of the estimates is
+            about 0.8%.
+
+            .. versionadded:: 1.1.0
+
         Returns
         -------
         Series
             Number of unique values within each group.
         """
-        ids, _, _ = self.grouper.group_info
+        ids, _, ngroups = self.grouper.group_info
 
         val = self.obj._values
 
-        codes, _ = algorithms.factorize(val, sort=False)
-        sorter = np.lexsort((codes, ids))
-        codes = codes[sorter]
-        ids = ids[sorter]
-
-        # group boundaries are where group ids change
-        # unique observations are where sorted values change
-        idx = np.r_[0, 1 + np.nonzero(ids[1:] != ids[:-1])[0]]
-        inc = np.r_[1, codes[1:] != codes[:-1]]
-
-        # 1st item of each group is a new unique observation
-        mask = codes == -1
-        if dropna:
-            inc[idx] = 1
-            inc[mask] = 0
-        else:
-            inc[mask & np.r_[False, mask[:-1]]] = 0
-            inc[idx] = 1
-
-        out = np.add.reduceat(inc, idx).astype("int64", copy=False)
-        if len(ids):
-            # NaN/NaT group exists if the head of ids is -1,
-            # so remove it from res and exclude its index from idx
-            if ids[0] == -1:
-                res = out[1:]
-                idx = idx[np.flatnonzero(idx)]
-            else:
-                res = out
+        if approx:
+            mask = ids != -1
+            if dropna:
+                mask &= notna(val)
+            res = _approx_nunique(ids[mask], hash_array(val[mask]), ngroups)
         else:
-            res = out[1:]
-        ri = self.grouper.result_index
+            codes, uniques = algorithms.factorize(val, sort=False)
 
-        # we might have duplications among the bins
-        if len(res) != len(ri):
-            res, out = np.zeros(len(ri), dtype=out.dtype), res
-            res[ids[idx]] = out
+            # the unique (group, value) pairs, found with a hash table
+            mask = ids != -1
+            if dropna:
+                mask &= codes != -1
+            width = len(uniques) + 1
+            pairs = algorithms.unique(ids[mask] * width + codes[mask] + 1)
+            res = np.bincount(pairs // width, minlength=ngroups).astype(
+                "int64", copy=False
+            )
 
+        ri = self.grouper.result_index
         result = self.obj._constructor(res, index=ri, name=self._selection_name)
         return self._reindex_output(result, fill_value=0)
 
@@ -686,16 +701,56 @@ class SeriesGroupBy(GroupBy[Series]):
         mask = ids != -1
         ids, val = ids[mask], val[mask]
 
+        levels = [ping.group_index for ping in self.grouper.groupings]
+        names = self.grouper.names + [self._selection_name]
+
         if bins is None:
             lab, lev = algorithms.factorize(val, sort=True)
-            llab = lambda lab, inc: lab[inc]
-        else:
 
-            # lab is a Categorical with categories an IntervalIndex
-            lab = cut(Series(val), bins, include_lowest=True)
-            lev = lab.cat.categories
-            lab = lev.take(lab.cat.codes)
-            llab = lambda lab, inc: lab[inc]._multiindex.codes[-1]
+            # count the (group, value) pairs with a hash table, and only sort
+            # the distinct pairs by group and value
+            width = len(lev) + 1
+            pairs, out = htable.value_count_int64(ids * width + lab + 1, False)
+            sorter = pairs.argsort()
+            pairs, out = pairs[sorter], out[sorter]
+            pair_ids, pair_lab = np.divmod(pairs, width)
+            pair_lab -= 1
+
+            # num. of times each group should be repeated
+            rep = np.bincount(pair_ids)
+            rep = rep[rep > 0]
+
+            # multi-index components
+            codes = self.grouper.reconstructed_codes
+            codes = [np.repeat(level_codes, rep) for level_codes in codes]
+            codes.append(pair_lab)
+
+            if dropna:
+                mask = pair_lab != -1
+                out, pair_ids = out[mask], pair_ids[mask]
+                codes = [level_codes[mask] for level_codes in codes]
+                ids = ids[lab != -1]
+
+            if normalize:
+                out = out / np.bincount(ids)[pair_ids]
+
+            if sort:
+                sorter = np.lexsort((out if ascending else -out, pair_ids))
+                out, codes[-1] = out[sorter], codes[-1][sorter]
+
+            mi = MultiIndex(
+                levels=levels + [lev], codes=codes, names=names, verify_integrity=False
+            )
+
+            if is_integer_dtype(out):
+                out = ensure_int64(out)
+            return self.obj._constructor(out, index=mi, name=self._selection_name)
+
+        # lab is a Categorical with categories an IntervalIndex
+        lab = cut(Series(val), bins, include_lowest=True)
+        lev = lab.cat.categories
+        lab = lev.take(lab.cat.codes)
+        llab = lambda lab, inc: lab[inc]._multiindex.codes[-1]
 
         if is_interval_dtype(lab.dtype):
             # TODO: should we do this inside II?
@@ -720,8 +775,7 @@ class SeriesGroupBy(GroupBy[Series]):
         # multi-index components
         codes = self.grouper.reconstructed_codes
         codes = [rep(level_codes) for level_codes in codes] + [llab(lab, inc)]
-        levels = [ping.group_index for ping in self.grouper.groupings] + [lev]
-        names = self.grouper.names + [self._selection_name]
+        levels.append(lev)
 
         if dropna:
             mask = codes[-1] != -1
@@ -741,20 +795,6 @@ class SeriesGroupBy(GroupBy[Series]):
                 acc = rep(d)
             out /= acc
 
-        if sort and bins is None:
-            cat = ids[inc][mask] if dropna else ids[inc]
-            sorter = np.lexsort((out if ascending else -out, cat))
-            out, codes[-1] = out[sorter], codes[-1][sorter]
-
-        if bins is None:
-            mi = MultiIndex(
-                levels=levels, codes=codes, names=names, verify_integrity=False
-            )
-
-            if is_integer_dtype(out):
-                out = ensure_int64(out)
-            return self.obj._constructor(out, index=mi, name=self._selection_name)
-
         # for compat. with libgroupby.value_counts need to ensure every
         # bin is present at every index level, null filled with zeros
         diff = np.zeros(len(out), dtype="bool")
@@ -941,14 +981,26 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
 
         func = maybe_mangle_lambdas(func)
 
-        if engine == "numba":
+        if engine == "numba" and validate_frame_udf(func):
+            return self._aggregate_frame_numba(
+                func, *args, engine_kwargs=engine_kwargs, **kwargs
+            )
+        elif engine == "numba":
             return self._python_agg_general(
                 func, *args, engine=engine, engine_kwargs=engine_kwargs, **kwargs
             )
 
-        result, how = self._aggregate(func, *args, **kwargs)
-        if how is None:
-            return result
+        result = None
+        if not args and not kwargs:
+            result = self._aggregate_fused(func)
+            if result is not None and isinstance(func, list):
+                # like _aggregate_multiple_funcs, lists skip the post-processing
+                return result
+
+        if result is None:
+            result, how = self._aggregate(func, *args, **kwargs)
+            if how is None:
+                return result
 
         if result is None:
 
@@ -1171,6 +1223,164 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
 
         return self._wrap_frame_output(result, obj)
 
+    def _aggregate_fused(self, func) -> Optional[DataFrame]:
+        """
+        Compute a list or dict of reductions of float64 columns in a single
+        pass over the data, with shared states for count, sum, mean and var.
+
+        Returns None if ``func`` holds other aggregations or the columns are
+        not supported, in which case each aggregation is computed separately.
+        """
+        obj = self._obj_with_exclusions
+        if self.axis != 0 or not obj.columns.is_unique:
+            return None
+        if not self.observed and any(
+            is_categorical_dtype(ping.grouper) for ping in self.grouper.groupings
+        ):
+            return None
+
+        if isinstance(func, list):
+            multi = True
+            pairs = [(col, f) for col in obj.columns for f in func]
+        elif isinstance(func, dict):
+            multi = any(isinstance(fs, list) for fs in func.values())
+            pairs = [
+                (col, f)
+                for col, fs in func.items()
+                for f in (fs if isinstance(fs, list) else [fs])
+            ]
+        else:
+            return None
+
+        if not pairs or not all(
+            isinstance(f, str) and f in base.fused_reductions for _, f in pairs
+        ):
+            return None
+        if len(set(pairs)) != len(pairs):
+            return None
+        columns = list(dict.fromkeys(col for col, _ in pairs))
+        if not all(col in obj.columns for col in columns) or not all(
+            obj[col].dtype == np.float64 for col in columns
+        ):
+            return None
+
+        funcs = {f for _, f in pairs}
+        compute_m2 = bool(funcs & {"var", "std"})
+        compute_minmax = bool(funcs & {"min", "max"})
+
+        ids, _, ngroups = self.grouper.group_info
+        values = np.column_stack([obj[col]._values for col in columns])
+        shape = (ngroups, len(columns))
+        nobs = np.zeros(shape, dtype=np.int64)
+        sumx = np.zeros(shape, dtype=np.float64)
+        m2 = np.zeros(shape if compute_m2 else (0, 0), dtype=np.float64)
+        minx = np.empty(shape if compute_minmax else (0, 0), dtype=np.float64)
+        maxx = np.empty_like(minx)
+        libgroupby.group_multi_agg(
+            nobs, sumx, m2, minx, maxx, values, ids, compute_m2, compute_minmax
+        )
+
+        finalized = {"count": nobs, "sum": sumx, "min": minx, "max": maxx}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            finalized["mean"] = sumx / nobs
+            if compute_m2:
+                var = np.where(nobs < 2, np.nan, m2 / (nobs - 1))
+                finalized["var"] = var
+                finalized["std"] = np.sqrt(var)
+
+        locs = {col: i for i, col in enumerate(columns)}
+        result = self.obj._constructor(
+            {i: finalized[f][:, locs[col]] for i, (col, f) in enumerate(pairs)},
+            index=self.grouper.result_index,
+        )
+        if multi:
+            result.columns = MultiIndex.from_tuples(pairs)
+        else:
+            result.columns = Index([col for col, _ in pairs])
+        return result
+
+    def _aggregate_frame_numba(
+        self, func, *args, engine_kwargs=None, **kwargs
+    ) -> FrameOrSeriesUnion:
+        """
+        Aggregate all the columns of each group at once with a numba jitted
+        user defined function, see generate_numba_frame_agg_func.
+
+        The values are passed as float64, with NaN for the missing values,
+        and the index as its numeric or int64 (datetime-like) values.
+        """
+        obj = self._obj_with_exclusions
+        for dtype in obj.dtypes:
+            if not is_numeric_dtype(dtype):
+                raise NotImplementedError(
+                    f"engine='numba' is not supported for {dtype} dtype"
+                )
+        index = obj.index
+        if needs_i8_conversion(index.dtype):
+            index_values = index.asi8
+        elif is_numeric_dtype(index.dtype) and not isinstance(index, MultiIndex):
+            index_values = index.to_numpy()
+        else:
+            raise NotImplementedError(
+                f"engine='numba' is not supported for an index of {index.dtype} "
+                "dtype"
+            )
+
+        cache_key = (func, "groupby_frame_agg")
+        if cache_key in NUMBA_FUNC_CACHE:
+            numba_func, group_agg = NUMBA_FUNC_CACHE[cache_key]
+        else:
+            numba_func, group_agg = generate_numba_frame_agg_func(
+                kwargs, func, engine_kwargs
+            )
+
+        starts, ends, sorter, sorted_values = self._numba_prep(
+            obj.to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        sorted_index = index_values.take(sorter)
+        column_names = tuple(obj.columns)
+
+        if len(starts) == 0:
+            num_results = 1
+        else:
+            # the shape of the result of the first group gives the output shape
+            start, stop = starts[0], ends[0]
+            first = numba_func(
+                sorted_values[start:stop],
+                sorted_index[start:stop],
+                column_names,
+                *args,
+            )
+            num_results = 1 if np.ndim(first) == 0 else len(first)
+        result = group_agg(
+            sorted_values,
+            sorted_index,
+            starts,
+            ends,
+            column_names,
+            num_results,
+            *args,
+        )
+        NUMBA_FUNC_CACHE[cache_key] = (numba_func, group_agg)
+
+        scalar = len(starts) and np.ndim(first) == 0
+        if scalar:
+            # labelled like the column of groupby(...).apply(func).reset_index()
+            labels: List[Label] = [0]
+        elif num_results == len(obj.columns):
+            labels = list(obj.columns)
+        else:
+            labels = list(range(num_results))
+
+        output = {
+            base.OutputKey(label=label, position=idx): result[:, idx]
+            for idx, label in enumerate(labels)
+        }
+        result = self._wrap_aggregated_output(output)
+        if self.as_index and scalar:
+            result = result.iloc[:, 0].rename(None)
+        return result
+
     def _aggregate_item_by_item(self, func, *args, **kwargs) -> DataFrame:
         # only for axis==0
 
@@ -1323,6 +1533,24 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
                         result = self.obj._constructor(
                             stacked_values, index=key_index, columns=index
                         )
+                    elif (
+                        is_numeric_dtype(v.dtype)
+                        and not is_extension_array_dtype(v.dtype)
+                        and all(x.dtype == v.dtype for x in values)
+                        and not is_categorical_dtype(key_index.dtype)
+                        and not needs_i8_conversion(key_index.dtype)
+                    ):
+                        # all the Series have the same numpy dtype, fill
+                        # the result directly (concat would lose the
+                        # categorical dtype and the freq of key_index)
+                        stacked_values = np.empty(
+                            (len(values), len(index)), dtype=v.dtype
+                        )
+                        for i, x in enumerate(values):
+                            stacked_values[i] = x._values
+                        result = self.obj._constructor(
+                            stacked_values, index=key_index, columns=index
+                        )
                     else:
                         # GH5788 instead of stacking; concat gets the
                         # dtypes correct
@@ -1384,6 +1612,7 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         from pandas.core.reshape.concat import concat
 
         applied = []
+        positions = []
         obj = self._obj_with_exclusions
         gen = self.grouper.get_iterator(obj, axis=self.axis)
         if engine == "numba":
@@ -1439,6 +1668,13 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             else:
                 applied.append(res)
 
+            if self.axis == 0:
+                positions.append(self._get_index(name))
+
+        result = self._fill_transformed_frame(obj, positions, applied)
+        if result is not None:
+            return result
+
         concat_index = obj.columns if self.axis == 0 else obj.index
         other_axis = 1 if self.axis == 0 else 0  # switches between 0 & 1
         concatenated = concat(applied, axis=self.axis, verify_integrity=False)
@@ -1469,6 +1705,16 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         # GH 30918
         # Use _transform_fast only when we know func is an aggregation
         if func in base.reduction_kernels:
+            obj = self._obj_with_exclusions
+            if self.axis == 0 and len(obj.columns) and (obj.dtypes == np.float64).all():
+                out = self._cython_transform_reduce(
+                    func, obj._values, *args, **kwargs
+                )
+                if out is not None:
+                    return self.obj._constructor(
+                        out, index=obj.index, columns=obj.columns
+                    )
+
             # If func is a reduction, we need to broadcast the
             # result to the whole group. Compute func result
             # and deal with possible broadcasting below.
@@ -1509,6 +1755,34 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             output, columns=result.columns, index=obj.index
         )
 
+    def _fill_transformed_frame(
+        self, obj: DataFrame, positions: List[np.ndarray], applied: List[DataFrame]
+    ) -> Optional[DataFrame]:
+        """
+        Put the transformed groups into columns aligned with the rows of
+        ``obj``, or return None if they cannot be stored in numpy arrays.
+        """
+        if self.axis != 0 or not applied or not obj.columns.is_unique:
+            return None
+        if not all(res.columns.is_unique for res in applied):
+            return None
+
+        output = []
+        for col in obj.columns:
+            pieces = [
+                (indexer, res[col]._values if col in res.columns else None)
+                for indexer, res in zip(positions, applied)
+            ]
+            out = _fill_transformed(pieces, len(obj))
+            if out is None or out.dtype == object:
+                # the frame constructor would infer the type of object values
+                return None
+            output.append(out)
+
+        return self.obj._constructor._from_arrays(
+            output, columns=obj.columns, index=obj.index
+        )
+
     def _define_paths(self, func, *args, **kwargs):
         if isinstance(func, str):
             fast_path = lambda group: getattr(group, func)(*args, **kwargs)
@@ -1833,7 +2107,7 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
 
         return self._wrap_agged_blocks(blocks, items=data.items)
 
-    def nunique(self, dropna: bool = True):
+    def nunique(self, dropna: bool = True, approx: bool = False):
         """
         Return DataFrame with number of distinct observations per group for
         each column.
@@ -1842,6 +2116,11 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the number of distinct observations with HyperLogLog, see
+            :meth:`.SeriesGroupBy.nunique`.
+
+            .. versionadded:: 1.1.0
 
         Returns
         -------
@@ -1894,7 +2173,7 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         results = concat(
             [
                 SeriesGroupBy(content, selection=label, grouper=self.grouper).nunique(
-                    dropna
+                    dropna, approx
                 )
                 for label, content in iter_func()
             ],
@@ -1911,9 +2190,146 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             self._insert_inaxis_grouper_inplace(results)
         return results
 
+    def ohlcv(self, price: Label, volume: Label, time: Label = None) -> DataFrame:
+        """
+        Compute the open, high, low and close prices, the volume and the volume
+        weighted average price of the trades of each group, with the number of
+        trades and the timestamps of the first and last ones, in a single pass.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        ----------
+        price : label
+            Column of the prices of the trades. The trades with a missing
+            price are skipped.
+        volume : label
+            Column of the volumes of the trades. A missing volume counts as
+            zero.
+        time : label, optional
+            Column of the timestamps of the trades. The index is used by
+            default.
+
+        Returns
+        -------
+        DataFrame
+            With the columns ``open``, ``high``, ``low``, ``close``,
+            ``volume``, ``vwap``, ``count``, ``first_time`` and ``last_time``.
+
+        See Also
+        --------
+        GroupBy.ohlc : Open, high, low and close values of each column.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {"sym": ["a", "b", "a", "a"],
+        ...      "price": [10.0, 20.0, 12.0, 11.0],
+        ...      "size": [100, 50, 300, 100]},
+        ...     index=pd.date_range("2020-01-01 09:30", periods=4, freq="s"),
+        ... )
+        >>> df.groupby("sym").ohlcv("price", "size")[["open", "close", "vwap"]]
+             open  close  vwap
+        sym
+        a    10.0   11.0  11.4
+        b    20.0   20.0  20.0
+        """
+        obj = self.obj
+        times = obj.index if time is None else obj[time]
+        if not needs_i8_conversion(times.dtype):
+            raise TypeError(
+                "ohlcv requires datetime-like timestamps, "
+                f"got values of dtype {times.dtype}"
+            )
+        times = times.array
+
+        ids, _, ngroups = self.grouper.group_info
+        out = np.empty((ngroups, 6), dtype=np.float64)
+        counts = np.empty(ngroups, dtype=np.int64)
+        bounds = np.empty((ngroups, 2), dtype=np.int64)
+        libgroupby.group_ohlcv(
+            out,
+            counts,
+            bounds,
+            obj[price].to_numpy(dtype=np.float64, na_value=np.nan),
+            obj[volume].to_numpy(dtype=np.float64, na_value=np.nan),
+            times.asi8,
+            ids,
+        )
+
+        columns = ["open", "high", "low", "close", "volume", "vwap"]
+        result = DataFrame(out, columns=columns, index=self.grouper.result_index)
+        result["count"] = counts
+        result["first_time"] = type(times)(bounds[:, 0], dtype=times.dtype)
+        result["last_time"] = type(times)(bounds[:, 1], dtype=times.dtype)
+
+        if not self.as_index:
+            result.index = ibase.default_index(len(result))
+            self._insert_inaxis_grouper_inplace(result)
+        return result
+
     boxplot = boxplot_frame_groupby
 
 
+def _fill_transformed(
+    pieces: List[Tuple[np.ndarray, Any]], length: int
+) -> Optional[np.ndarray]:
+    """
+    Put the transformed values of each group into an array aligned with the
+    rows of the grouped object.
+
+    Parameters
+    ----------
+    pieces : list of (ndarray, object)
+        The positions of the rows of each group and the transformed values of
+        the group: an array, a scalar broadcast to the group, or None if the
+        group has no result.
+    length : int
+        The number of rows of the grouped object.
+
+    Returns
+    -------
+    ndarray or None
+        The rows without result are missing. None if the values cannot be
+        stored in a numpy array without conversion, or do not match the
+        lengths of their groups.
+    """
+    dtypes = []
+    filled = []
+    for indexer, values in pieces:
+        if values is None:
+            continue
+        if is_scalar(values):
+            dtype, scalar = infer_dtype_from_scalar(values, pandas_dtype=True)
+            if isinstance(dtype, np.dtype) and dtype.kind in "mM":
+                # as integers, without losing the nanoseconds
+                values = scalar
+        elif isinstance(values, np.ndarray) and len(values) == len(indexer):
+            dtype = values.dtype
+        else:
+            return None
+        dtypes.append(dtype)
+        filled.append((indexer, values))
+
+    if not dtypes:
+        return None
+    dtype = find_common_type(dtypes)
+    if not isinstance(dtype, np.dtype) or (
+        dtype.kind == "O" and any(d.kind in "mM" for d in dtypes)
+    ):
+        # object arrays would hold the datetimelikes as integers
+        return None
+
+    if sum(len(indexer) for indexer, _ in filled) < length:
+        dtype, fill_value = maybe_promote(dtype, np.nan)
+        out = np.full(length, fill_value, dtype=dtype)
+    else:
+        out = np.empty(length, dtype=dtype)
+    for indexer, values in filled:
+        out[indexer] = values
+    return out
+
+
 def _recast_datetimelike_result(result: DataFrame) -> DataFrame:
     """
     If we have date/time like in the original, then coerce dates
@@ -1948,3 +2364,63 @@ def _recast_datetimelike_result(result: DataFrame) -> DataFrame:
 
         result.iloc[:, n] = converted
     return result
+
+
+# number of bits of the hashes indexing the registers of the HyperLogLog
+# estimates of nunique(approx=True), whose relative standard error is
+# 1.04 / sqrt(2 ** _hll_precision)
+_hll_precision = 14
+
+
+def _approx_nunique(ids: np.ndarray, hashes: np.ndarray, ngroups: int) -> np.ndarray:
+    """
+    HyperLogLog estimates of the number of distinct hashes of each group.
+
+    Only the registers hit by the hashes of each group are kept, so that the
+    memory used is bounded by the number of values rather than the number of
+    groups times the number of registers.
+
+    Parameters
+    ----------
+    ids : ndarray[int64]
+        Group of each hash, between 0 and ngroups - 1.
+    hashes : ndarray[uint64]
+    ngroups : int
+
+    Returns
+    -------
+    ndarray[int64]
+    """
+    p = _hll_precision
+    m = 1 << p
+
+    # the first p bits of a hash select its register, which keeps the
+    # maximum position of the leftmost 1-bit of the other bits
+    registers = (hashes >> np.uint64(64 - p)).astype(np.int64)
+    rest = hashes & np.uint64((1 << (64 - p)) - 1)
+    # 64 - p bits are exactly represented by a float64
+    _, exponent = np.frexp(rest.astype(np.float64))
+    rank = (64 - p + 1 - exponent).astype(np.float64).reshape(-1, 1)
+
+    labels, keys = algorithms.factorize(ids * m + registers)
+    max_rank = np.empty((len(keys), 1), dtype=np.float64)
+    libgroupby.group_max(
+        max_rank, np.zeros(len(keys), dtype=np.int64), rank, labels.astype(np.int64)
+    )
+
+    key_groups = keys // m
+    nonzero = np.bincount(key_groups, minlength=ngroups)
+    inverse_sum = np.bincount(
+        key_groups, weights=2.0 ** -max_rank[:, 0], minlength=ngroups
+    )
+    inverse_sum += m - nonzero
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / inverse_sum
+
+    # linear counting is more accurate for small cardinalities
+    zeros = m - nonzero
+    small = (estimate <= 2.5 * m) & (zeros > 0)
+    estimate[small] = m * np.log(m / zeros[small])
+
+    return np.round(estimate).astype(np.int64)
@@ -14,6 +14,7 @@ import inspect
 import re
 import types
 from typing import (
+    TYPE_CHECKING,
     Callable,
     Dict,
     FrozenSet,
@@ -33,7 +34,7 @@ import numpy as np
 
 from pandas._config.config import option_context
 
-from pandas._libs import Timestamp
+from pandas._libs import Timestamp, lib
 import pandas._libs.groupby as libgroupby
 from pandas._typing import F, FrameOrSeries, FrameOrSeriesUnion, Scalar
 from pandas.compat.numpy import function as nv
@@ -61,9 +62,15 @@ import pandas.core.common as com
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.groupby import base, ops
+from pandas.core.groupby.numba_ import (
+    generate_numba_reduction_func,
+    interpolation_codes,
+)
 from pandas.core.indexes.api import CategoricalIndex, Index, MultiIndex
 from pandas.core.series import Series
-from pandas.core.sorting import get_group_index_sorter
+
+if TYPE_CHECKING:
+    from pandas.core.groupby.grouper import GroupByPlan  # noqa: F401
 
 _common_see_also = """
         See Also
@@ -202,13 +209,30 @@ numeric_only : bool, default {no}
 min_count : int, default {mc}
     The required number of valid values to perform the operation. If fewer
     than ``min_count`` non-NA values are present the result will be NA.
-
+{e}
 Returns
 -------
 Series or DataFrame
     Computed {fname} of values within each group.
 """
 
+_numba_agg_engine_doc = """\
+engine : str, default 'cython'
+    * ``'cython'`` : Runs the operation through C-extensions from cython.
+    * ``'numba'`` : Runs the operation through JIT compiled code from numba.
+      Only numeric data is supported, and it is computed as float64.
+
+    .. versionadded:: 1.1.0
+engine_kwargs : dict, default None
+    * For ``'cython'`` engine, there are no accepted ``engine_kwargs``
+    * For ``'numba'`` engine, the engine can accept ``nopython``, ``nogil``
+      and ``parallel`` dictionary keys. The values must either be ``True`` or
+      ``False``. The default ``engine_kwargs`` for the ``'numba'`` engine is
+      ``{'nopython': True, 'nogil': False, 'parallel': False}``
+
+    .. versionadded:: 1.1.0
+"""
+
 _pipe_template = """
 Apply a function `func` with arguments to this %(klass)s object and return
 the function's result.
@@ -389,6 +413,15 @@ func : function, str, list or dict
     Each group's index will be passed to the user defined function
     and optionally available for use.
 
+    When aggregating the groups of a DataFrame with ``engine='numba'``,
+    a user defined function with ``values``, ``index`` and
+    ``column_names`` as its first three arguments is called once per
+    group with the 2D values of all the columns, and must return either a
+    scalar or an array holding one value per result column. The values are
+    passed as float64 with NaN for the missing values, which numpy functions
+    such as ``values.sum(axis=0)`` propagate, and the index as its numeric or,
+    for datetime-like indexes, int64 values.
+
     .. versionchanged:: 1.1.0
 *args
     Positional arguments to pass to func
@@ -910,24 +943,9 @@ b  2""",
         (though the default is sort=True) for groupby in general
         """
         ids, _, ngroups = self.grouper.group_info
-        sorter = get_group_index_sorter(ids, ngroups)
-        ids, count = ids[sorter], len(ids)
-
-        if count == 0:
-            return np.empty(0, dtype=np.int64)
-
-        run = np.r_[True, ids[:-1] != ids[1:]]
-        rep = np.diff(np.r_[np.nonzero(run)[0], count])
-        out = (~run).cumsum()
-
-        if ascending:
-            out -= np.repeat(out[run], rep)
-        else:
-            out = np.repeat(out[np.r_[run[1:], True]], rep) - out
-
-        rev = np.empty(count, dtype=np.intp)
-        rev[sorter] = np.arange(count, dtype=np.intp)
-        return out[rev].astype(np.int64, copy=False)
+        out = np.empty(len(ids), dtype=np.int64)
+        libgroupby.group_cumcount(out, ids, ngroups, ascending)
+        return out
 
     def _transform_should_cast(self, func_nm: str) -> bool:
         """
@@ -969,6 +987,32 @@ b  2""",
 
         return self._wrap_transformed_output(output)
 
+    def _cython_transform_reduce(
+        self, how: str, values: np.ndarray, *args, **kwargs
+    ) -> Optional[np.ndarray]:
+        """
+        Broadcast the reduction of each group of the 2D ``values`` directly to
+        the rows of the group, without building the aggregated result.
+
+        Returns
+        -------
+        ndarray or None
+            None if the kernel does not support the reduction, its arguments
+            or the dtype of the values.
+        """
+        if (
+            how not in base.transform_fused_reductions
+            or args
+            or not set(kwargs) <= base.transform_fused_reductions[how]
+            or values.dtype != np.float64
+        ):
+            return None
+
+        ids, _, ngroups = self.grouper.group_info
+        out = np.empty(values.shape, dtype=np.float64)
+        libgroupby.group_transform_reduce(out, values, ids, ngroups, how, **kwargs)
+        return out
+
     def _wrap_aggregated_output(self, output: Mapping[base.OutputKey, np.ndarray]):
         raise AbstractMethodError(self)
 
@@ -1099,6 +1143,70 @@ b  2""",
 
         return self._wrap_aggregated_output(output)
 
+    def _numba_prep(self, values: np.ndarray):
+        """
+        Sort `values` by group for the numba kernels.
+
+        Returns
+        -------
+        starts, ends : ndarray
+            Bounds of each group in the sorted values.
+        sorter : ndarray
+            Indexer sorting the rows by group.
+        sorted_values : ndarray
+        """
+        if self.axis != 0:
+            raise NotImplementedError("axis=1 is not supported with engine='numba'")
+
+        ids, _, ngroups = self.grouper.group_info
+        sorter = self.grouper._sort_idx
+        sorted_ids = algorithms.take_nd(ids, sorter, allow_fill=False)
+        sorted_values = values.take(sorter, axis=0)
+        starts, ends = lib.generate_slices(sorted_ids, ngroups)
+        return starts, ends, sorter, sorted_values
+
+    def _numba_agg_general(
+        self,
+        how: str,
+        engine_kwargs: Optional[Dict[str, bool]],
+        numeric_only: bool,
+        *aggregator_args,
+        cast_how: Optional[str] = None,
+    ):
+        """
+        Perform a built-in aggregation of each column of each group with numba.
+        """
+        slices = []
+        with _group_selection_context(self):
+            for obj in self._iterate_slices():
+                if not is_numeric_dtype(obj.dtype):
+                    if numeric_only:
+                        continue
+                    raise NotImplementedError(
+                        f"engine='numba' is not supported for {obj.dtype} dtype"
+                    )
+                slices.append(obj)
+
+        if len(slices) == 0:
+            raise DataError("No numeric types to aggregate")
+
+        values = np.column_stack(
+            [obj.to_numpy(dtype=np.float64, na_value=np.nan) for obj in slices]
+        )
+        starts, ends, _, sorted_values = self._numba_prep(values)
+        aggregator = generate_numba_reduction_func(how, engine_kwargs)
+        result = aggregator(sorted_values, starts, ends, *aggregator_args)
+
+        output: Dict[base.OutputKey, np.ndarray] = {}
+        for idx, obj in enumerate(slices):
+            key = base.OutputKey(label=obj.name, position=idx)
+            if cast_how is None:
+                output[key] = result[:, idx]
+            else:
+                output[key] = maybe_cast_result(result[:, idx], obj, how=cast_how)
+
+        return self._wrap_aggregated_output(output)
+
     def _concat_objects(self, keys, values, not_indexed_same: bool = False):
         from pandas.core.reshape.concat import concat
 
@@ -1335,7 +1443,12 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
     @Substitution(name="groupby")
     @Substitution(see_also=_common_see_also)
-    def mean(self, numeric_only: bool = True):
+    def mean(
+        self,
+        numeric_only: bool = True,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
         """
         Compute mean of groups, excluding missing values.
 
@@ -1344,6 +1457,20 @@ class GroupBy(_GroupBy[FrameOrSeries]):
         numeric_only : bool, default True
             Include only float, int, boolean columns. If None, will attempt to use
             everything, then use only numeric data.
+        engine : str, default 'cython'
+            * ``'cython'`` : Runs the operation through C-extensions from cython.
+            * ``'numba'`` : Runs the operation through JIT compiled code from numba.
+              Only numeric data is supported, and it is computed as float64.
+
+            .. versionadded:: 1.1.0
+        engine_kwargs : dict, default None
+            * For ``'cython'`` engine, there are no accepted ``engine_kwargs``
+            * For ``'numba'`` engine, the engine can accept ``nopython``, ``nogil``
+              and ``parallel`` dictionary keys. The values must either be ``True``
+              or ``False``. The default ``engine_kwargs`` for the ``'numba'``
+              engine is ``{'nopython': True, 'nogil': False, 'parallel': False}``
+
+            .. versionadded:: 1.1.0
 
         Returns
         -------
@@ -1383,6 +1510,10 @@ class GroupBy(_GroupBy[FrameOrSeries]):
         2    4.0
         Name: B, dtype: float64
         """
+        if engine == "numba":
+            return self._numba_agg_general(
+                "mean", engine_kwargs, numeric_only, cast_how="mean"
+            )
         return self._cython_agg_general(
             "mean",
             alt=lambda x, axis: Series(x).mean(numeric_only=numeric_only),
@@ -1416,7 +1547,12 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
     @Substitution(name="groupby")
     @Appender(_common_see_also)
-    def std(self, ddof: int = 1):
+    def std(
+        self,
+        ddof: int = 1,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
         """
         Compute standard deviation of groups, excluding missing values.
 
@@ -1426,13 +1562,27 @@ class GroupBy(_GroupBy[FrameOrSeries]):
         ----------
         ddof : int, default 1
             Degrees of freedom.
+        engine : str, default 'cython'
+            * ``'cython'`` : Runs the operation through C-extensions from cython.
+            * ``'numba'`` : Runs the operation through JIT compiled code from numba.
+              Only numeric data is supported, and it is computed as float64.
+
+            .. versionadded:: 1.1.0
+        engine_kwargs : dict, default None
+            * For ``'cython'`` engine, there are no accepted ``engine_kwargs``
+            * For ``'numba'`` engine, the engine can accept ``nopython``, ``nogil``
+              and ``parallel`` dictionary keys. The values must either be ``True``
+              or ``False``. The default ``engine_kwargs`` for the ``'numba'``
+              engine is ``{'nopython': True, 'nogil': False, 'parallel': False}``
+
+            .. versionadded:: 1.1.0
 
         Returns
         -------
         Series or DataFrame
             Standard deviation of values within each group.
         """
-        result = self.var(ddof=ddof)
+        result = self.var(ddof=ddof, engine=engine, engine_kwargs=engine_kwargs)
         if result.ndim == 1:
             result = np.sqrt(result)
         else:
@@ -1447,7 +1597,12 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
     @Substitution(name="groupby")
     @Appender(_common_see_also)
-    def var(self, ddof: int = 1):
+    def var(
+        self,
+        ddof: int = 1,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
         """
         Compute variance of groups, excluding missing values.
 
@@ -1457,12 +1612,28 @@ class GroupBy(_GroupBy[FrameOrSeries]):
         ----------
         ddof : int, default 1
             Degrees of freedom.
+        engine : str, default 'cython'
+            * ``'cython'`` : Runs the operation through C-extensions from cython.
+            * ``'numba'`` : Runs the operation through JIT compiled code from numba.
+              Only numeric data is supported, and it is computed as float64.
+
+            .. versionadded:: 1.1.0
+        engine_kwargs : dict, default None
+            * For ``'cython'`` engine, there are no accepted ``engine_kwargs``
+            * For ``'numba'`` engine, the engine can accept ``nopython``, ``nogil``
+              and ``parallel`` dictionary keys. The values must either be ``True``
+              or ``False``. The default ``engine_kwargs`` for the ``'numba'``
+              engine is ``{'nopython': True, 'nogil': False, 'parallel': False}``
+
+            .. versionadded:: 1.1.0
 
         Returns
         -------
         Series or DataFrame
             Variance of values within each group.
         """
+        if engine == "numba":
+            return self._numba_agg_general("var", engine_kwargs, True, ddof)
         if ddof == 1:
             return self._cython_agg_general(
                 "var", alt=lambda x, axis: Series(x).var(ddof=ddof)
@@ -1524,31 +1695,79 @@ class GroupBy(_GroupBy[FrameOrSeries]):
             result = self._obj_1d_constructor(result)
         return self._reindex_output(result, fill_value=0)
 
-    @doc(_groupby_agg_method_template, fname="sum", no=True, mc=0)
-    def sum(self, numeric_only: bool = True, min_count: int = 0):
+    @doc(
+        _groupby_agg_method_template,
+        fname="sum",
+        no=True,
+        mc=0,
+        e=_numba_agg_engine_doc,
+    )
+    def sum(
+        self,
+        numeric_only: bool = True,
+        min_count: int = 0,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
+        if engine == "numba":
+            return self._numba_agg_general(
+                "sum", engine_kwargs, numeric_only, min_count, cast_how="add"
+            )
         return self._agg_general(
             numeric_only=numeric_only, min_count=min_count, alias="add", npfunc=np.sum
         )
 
-    @doc(_groupby_agg_method_template, fname="prod", no=True, mc=0)
+    @doc(_groupby_agg_method_template, fname="prod", no=True, mc=0, e="")
     def prod(self, numeric_only: bool = True, min_count: int = 0):
         return self._agg_general(
             numeric_only=numeric_only, min_count=min_count, alias="prod", npfunc=np.prod
         )
 
-    @doc(_groupby_agg_method_template, fname="min", no=False, mc=-1)
-    def min(self, numeric_only: bool = False, min_count: int = -1):
+    @doc(
+        _groupby_agg_method_template,
+        fname="min",
+        no=False,
+        mc=-1,
+        e=_numba_agg_engine_doc,
+    )
+    def min(
+        self,
+        numeric_only: bool = False,
+        min_count: int = -1,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
+        if engine == "numba":
+            return self._numba_agg_general(
+                "min", engine_kwargs, numeric_only, min_count, cast_how="min"
+            )
         return self._agg_general(
             numeric_only=numeric_only, min_count=min_count, alias="min", npfunc=np.min
         )
 
-    @doc(_groupby_agg_method_template, fname="max", no=False, mc=-1)
-    def max(self, numeric_only: bool = False, min_count: int = -1):
+    @doc(
+        _groupby_agg_method_template,
+        fname="max",
+        no=False,
+        mc=-1,
+        e=_numba_agg_engine_doc,
+    )
+    def max(
+        self,
+        numeric_only: bool = False,
+        min_count: int = -1,
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
+        if engine == "numba":
+            return self._numba_agg_general(
+                "max", engine_kwargs, numeric_only, min_count, cast_how="max"
+            )
         return self._agg_general(
             numeric_only=numeric_only, min_count=min_count, alias="max", npfunc=np.max
         )
 
-    @doc(_groupby_agg_method_template, fname="first", no=False, mc=-1)
+    @doc(_groupby_agg_method_template, fname="first", no=False, mc=-1, e="")
     def first(self, numeric_only: bool = False, min_count: int = -1):
         def first_compat(obj: FrameOrSeries, axis: int = 0):
             def first(x: Series):
@@ -1573,7 +1792,7 @@ class GroupBy(_GroupBy[FrameOrSeries]):
             npfunc=first_compat,
         )
 
-    @doc(_groupby_agg_method_template, fname="last", no=False, mc=-1)
+    @doc(_groupby_agg_method_template, fname="last", no=False, mc=-1, e="")
     def last(self, numeric_only: bool = False, min_count: int = -1):
         def last_compat(obj: FrameOrSeries, axis: int = 0):
             def last(x: Series):
@@ -1743,6 +1962,16 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
         return ExpandingGroupby(self, *args, **kwargs)
 
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def ewm(self, *args, **kwargs):
+        """
+        Return an ewm grouper, providing ewm functionality per group.
+        """
+        from pandas.core.window import EWMGroupby
+
+        return EWMGroupby(self, *args, **kwargs)
+
     def _fill(self, direction, limit=None):
         """
         Shared function for `pad` and `backfill` to call Cython method.
@@ -2002,7 +2231,13 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
         return result
 
-    def quantile(self, q=0.5, interpolation: str = "linear"):
+    def quantile(
+        self,
+        q=0.5,
+        interpolation: str = "linear",
+        engine: str = "cython",
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+    ):
         """
         Return group values at the given quantile, a la numpy.percentile.
 
@@ -2012,6 +2247,20 @@ class GroupBy(_GroupBy[FrameOrSeries]):
             Value(s) between 0 and 1 providing the quantile(s) to compute.
         interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
             Method to use when the desired quantile falls between two points.
+        engine : str, default 'cython'
+            * ``'cython'`` : Runs the operation through C-extensions from cython.
+            * ``'numba'`` : Runs the operation through JIT compiled code from numba.
+              Only numeric data is supported, and it is computed as float64.
+
+            .. versionadded:: 1.1.0
+        engine_kwargs : dict, default None
+            * For ``'cython'`` engine, there are no accepted ``engine_kwargs``
+            * For ``'numba'`` engine, the engine can accept ``nopython``, ``nogil``
+              and ``parallel`` dictionary keys. The values must either be ``True``
+              or ``False``. The default ``engine_kwargs`` for the ``'numba'``
+              engine is ``{'nopython': True, 'nogil': False, 'parallel': False}``
+
+            .. versionadded:: 1.1.0
 
         Returns
         -------
@@ -2068,33 +2317,31 @@ class GroupBy(_GroupBy[FrameOrSeries]):
 
             return vals
 
-        if is_scalar(q):
-            return self._get_cythonized_result(
-                "group_quantile",
-                aggregate=True,
-                needs_values=True,
-                needs_mask=True,
-                cython_dtype=np.dtype(np.float64),
-                pre_processing=pre_processor,
-                post_processing=post_processor,
-                q=q,
-                interpolation=interpolation,
+        if engine == "numba":
+            # like the cython kernel, keep integers for the methods picking
+            # one of the values
+            cast_how = None if interpolation in {"linear", "midpoint"} else "quantile"
+
+            def aggregate(qi):
+                return self._numba_agg_general(
+                    "quantile",
+                    engine_kwargs,
+                    True,
+                    float(qi),
+                    interpolation_codes[interpolation],
+                    cast_how=cast_how,
+                )
+
+            qs = [q] if is_scalar(q) else q
+            results = [aggregate(qi) for qi in qs]
+        else:
+            results = self._cython_quantiles(
+                q, interpolation, pre_processor, post_processor
             )
+
+        if is_scalar(q):
+            return results[0]
         else:
-            results = [
-                self._get_cythonized_result(
-                    "group_quantile",
-                    aggregate=True,
-                    needs_values=True,
-                    needs_mask=True,
-                    cython_dtype=np.dtype(np.float64),
-                    pre_processing=pre_processor,
-                    post_processing=post_processor,
-                    q=qi,
-                    interpolation=interpolation,
-                )
-                for qi in q
-            ]
             result = concat(results, axis=0, keys=q)
             # fix levels to place quantiles on the inside
             # TODO(GH-10710): Ideally, we could write this as
@@ -2119,6 +2366,68 @@ class GroupBy(_GroupBy[FrameOrSeries]):
             indices = np.arange(len(result)).reshape([len(q), self.ngroups]).T.flatten()
             return result.take(indices)
 
+    def _cython_quantiles(
+        self, q, interpolation: str, pre_processing, post_processing
+    ) -> List[FrameOrSeriesUnion]:
+        """
+        Compute the quantiles of each group with a single call of the cython
+        kernel per column, for all the values of ``q``.
+
+        Returns
+        -------
+        list of Series or DataFrame
+            The aggregated result for each value of ``q``.
+        """
+        qs = np.array([q] if is_scalar(q) else q, dtype=np.float64)
+        labels, _, ngroups = self.grouper.group_info
+        outputs: List[Dict[base.OutputKey, np.ndarray]] = [{} for _ in qs]
+
+        for idx, obj in enumerate(self._iterate_slices()):
+            values = obj._values
+            vals, inference = pre_processing(values)
+            mask = isna(values).view(np.uint8)
+
+            result = np.empty((ngroups, len(qs)), dtype=np.float64)
+            libgroupby.group_quantile(result, labels, vals, mask, qs, interpolation)
+
+            key = base.OutputKey(label=obj.name, position=idx)
+            for output, res in zip(outputs, result.T):
+                output[key] = post_processing(res, inference)
+
+        return [self._wrap_aggregated_output(output) for output in outputs]
+
+    def plan(self) -> "GroupByPlan":
+        """
+        Return a reusable plan of the grouping.
+
+        The plan holds the factorized group keys so that they are computed
+        only once, and can be reused for further groupbys of this object or
+        of other objects with the same grouping keys.
+
+        .. versionadded:: 1.1.0
+
+        Returns
+        -------
+        GroupByPlan
+
+        See Also
+        --------
+        GroupByPlan.groupby : Group an object using the plan.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"A": ["a", "b", "a"], "B": [1, 2, 3]})
+        >>> plan = df.groupby("A").plan()
+        >>> df.groupby(plan).B.max()
+        A
+        a    3
+        b    2
+        Name: B, dtype: int64
+        """
+        from pandas.core.groupby.grouper import GroupByPlan
+
+        return GroupByPlan(self)
+
     @Substitution(name="groupby")
     def ngroup(self, ascending: bool = True):
         """
@@ -2,7 +2,8 @@
 Provide user facing operators for doing the split part of the
 split-apply-combine paradigm.
 """
-from typing import Dict, Hashable, List, Optional, Tuple
+import copy
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
 import warnings
 
 import numpy as np
@@ -13,11 +14,13 @@ from pandas.util._decorators import cache_readonly
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
     is_datetime64_dtype,
+    is_dtype_equal,
     is_list_like,
     is_scalar,
     is_timedelta64_dtype,
 )
 from pandas.core.dtypes.generic import ABCSeries
+from pandas.core.dtypes.missing import array_equivalent
 
 import pandas.core.algorithms as algorithms
 from pandas.core.arrays import Categorical, ExtensionArray
@@ -31,6 +34,9 @@ from pandas.core.series import Series
 
 from pandas.io.formats.printing import pprint_thing
 
+if TYPE_CHECKING:
+    from pandas.core.groupby.groupby import GroupBy  # noqa: F401
+
 
 class Grouper:
     """
@@ -598,6 +604,202 @@ class Grouping:
         return self.index.groupby(Categorical.from_codes(self.codes, self.group_index))
 
 
+class GroupByPlan:
+    """
+    A reusable, pre-computed grouping of the rows of an object.
+
+    A plan holds the factorized group keys (the group codes, the result
+    index and the indexer sorting rows by group) of a groupby, so that
+    repeated aggregations over the same keys do not have to factorize
+    them again. A plan is created with :meth:`GroupBy.plan` and is used
+    by passing it as the ``by`` argument of ``groupby``, or through
+    :meth:`GroupByPlan.groupby`.
+
+    A plan can be applied to any object whose grouping keys are equal to
+    the ones the plan was built from: the key columns must hold the same
+    values (with the same dtype) and, for keys that are not columns
+    (index levels, arrays, functions or mappings), the grouped axis must
+    be equal as well. Applying a plan to a non-matching object raises a
+    ``ValueError``.
+
+    .. versionadded:: 1.1.0
+
+    Notes
+    -----
+    The plan keeps a copy of its key columns in order to detect objects
+    whose keys have been modified since the plan was built.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"key": ["a", "b", "a"], "x": [1, 2, 3]})
+    >>> plan = df.groupby("key").plan()
+    >>> plan.ngroups
+    2
+    >>> df.groupby(plan).sum()
+         x
+    key
+    a    4
+    b    2
+    >>> other = df.assign(x=[10, 20, 30])
+    >>> plan.groupby(other).mean()
+          x
+    key
+    a    20
+    b    20
+    """
+
+    def __init__(self, groupby: "GroupBy"):
+        grouper = groupby.grouper
+        obj = groupby.obj
+
+        # factorize eagerly, these are what every application reuses
+        grouper.group_info
+        grouper.result_index
+        grouper._sort_idx
+
+        self._grouper = grouper
+        self.axis = groupby.axis
+        self.exclusions = sorted(groupby.exclusions, key=str)
+        self._groupby_kwargs: Dict[str, Any] = {
+            "as_index": groupby.as_index,
+            "sort": groupby.sort,
+            "group_keys": groupby.group_keys,
+            "observed": groupby.observed,
+            "dropna": groupby.dropna,
+        }
+
+        self._length = obj.shape[self.axis]
+        self._key_values = {}
+        if isinstance(obj, DataFrame):
+            for name in self.exclusions:
+                if name in obj:
+                    self._key_values[name] = obj[name]._values.copy()
+
+        # non-column keys are tied to the labels of the grouped axis
+        if isinstance(grouper, ops.BinGrouper) or not all(
+            ping.in_axis for ping in grouper.groupings
+        ):
+            self._group_axis: Optional[Index] = obj._get_axis(self.axis)
+        else:
+            self._group_axis = None
+
+    def __repr__(self) -> str:
+        return f"GroupByPlan(ngroups={self.ngroups}, length={self._length})"
+
+    @property
+    def ngroups(self) -> int:
+        """
+        Number of groups of the plan.
+        """
+        return self._grouper.ngroups
+
+    @property
+    def result_index(self) -> Index:
+        """
+        The group labels, as they index the result of an aggregation.
+        """
+        return self._grouper.result_index
+
+    @property
+    def group_info(self) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        The group codes of the rows, the observed group ids and the number
+        of groups.
+        """
+        return self._grouper.group_info
+
+    def matches(self, obj: FrameOrSeries, axis=0) -> bool:
+        """
+        Whether the plan can be applied to `obj`.
+
+        Parameters
+        ----------
+        obj : DataFrame or Series
+        axis : {0 or 'index', 1 or 'columns'}, default 0
+            The axis `obj` is grouped along.
+
+        Returns
+        -------
+        bool
+        """
+        axis = obj._get_axis_number(axis)
+        if axis != self.axis or obj.shape[axis] != self._length:
+            return False
+
+        if self._group_axis is not None and not obj._get_axis(axis).equals(
+            self._group_axis
+        ):
+            return False
+
+        for name, values in self._key_values.items():
+            if not isinstance(obj, DataFrame) or name not in obj:
+                return False
+            current = obj[name]._values
+            if current is not values and not (
+                is_dtype_equal(current.dtype, values.dtype)
+                and array_equivalent(current, values, strict_nan=True)
+            ):
+                return False
+        return True
+
+    def groupby(self, obj: FrameOrSeries, **kwargs):
+        """
+        Group `obj` using the plan.
+
+        Parameters
+        ----------
+        obj : DataFrame or Series
+            Object whose grouping keys match the ones of the plan.
+        **kwargs
+            Keyword arguments passed to ``groupby``, they default to the
+            ones of the groupby the plan was created from.
+
+        Returns
+        -------
+        DataFrameGroupBy or SeriesGroupBy
+        """
+        kwargs = {**self._groupby_kwargs, **kwargs}
+        if not isinstance(obj, DataFrame):
+            kwargs.pop("as_index")
+        return obj.groupby(self, axis=self.axis, **kwargs)
+
+    def _get_grouper(self, obj: FrameOrSeries, axis=0) -> "ops.BaseGrouper":
+        """
+        Return a BaseGrouper bound to `obj` sharing the plan's computations.
+        """
+        if not self.matches(obj, axis=axis):
+            raise ValueError(
+                "The grouping keys of the object do not match the ones "
+                "the GroupByPlan was built from"
+            )
+
+        grouper = _rebind(self._grouper)
+        if not isinstance(grouper, ops.BinGrouper):
+            group_axis = obj._get_axis(axis)
+            groupings = []
+            for ping in self._grouper.groupings:
+                ping = _rebind(ping)
+                ping.index = group_axis
+                if ping.obj is not None:
+                    ping.obj = obj
+                groupings.append(ping)
+            grouper.axis = group_axis
+            grouper._groupings = groupings
+        return grouper
+
+
+def _rebind(item):
+    """
+    Shallow copy a BaseGrouper or Grouping, keeping the cached results that
+    do not depend on the labels of the grouped axis.
+    """
+    result = copy.copy(item)
+    cache = getattr(item, "_cache", None)
+    if cache is not None:
+        result._cache = {k: v for k, v in cache.items() if k != "groups"}
+    return result
+
+
 def get_grouper(
     obj: FrameOrSeries,
     key=None,
@@ -692,6 +894,10 @@ def get_grouper(
     elif isinstance(key, ops.BaseGrouper):
         return key, [], obj
 
+    # a plan, reuse its computations for obj
+    elif isinstance(key, GroupByPlan):
+        return key._get_grouper(obj, axis=axis), list(key.exclusions), obj
+
     if not isinstance(key, list):
         keys = [key]
         match_axis_length = False
@@ -0,0 +1,282 @@
+"""Numba kernels for groupby operations"""
+import inspect
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from pandas._typing import Scalar
+from pandas.compat._optional import import_optional_dependency
+from pandas.errors import NumbaUtilError
+
+from pandas.core.util.numba_ import (
+    NUMBA_FUNC_CACHE,
+    check_kwargs_and_nopython,
+    get_jit_arguments,
+    jit_user_function,
+)
+
+# integer codes of the quantile interpolation methods, passed to the kernels
+interpolation_codes = {
+    "linear": 0,
+    "lower": 1,
+    "higher": 2,
+    "nearest": 3,
+    "midpoint": 4,
+}
+
+
+def _group_sum(values: np.ndarray, min_count: int) -> float:
+    total = 0.0
+    nobs = 0
+    for val in values:
+        if not np.isnan(val):
+            total += val
+            nobs += 1
+    if nobs < min_count:
+        return np.nan
+    return total
+
+
+def _group_min(values: np.ndarray, min_count: int) -> float:
+    result = np.inf
+    nobs = 0
+    for val in values:
+        if not np.isnan(val):
+            nobs += 1
+            if val < result:
+                result = val
+    if nobs == 0 or nobs < min_count:
+        return np.nan
+    return result
+
+
+def _group_max(values: np.ndarray, min_count: int) -> float:
+    result = -np.inf
+    nobs = 0
+    for val in values:
+        if not np.isnan(val):
+            nobs += 1
+            if val > result:
+                result = val
+    if nobs == 0 or nobs < min_count:
+        return np.nan
+    return result
+
+
+def _group_mean(values: np.ndarray) -> float:
+    total = 0.0
+    nobs = 0
+    for val in values:
+        if not np.isnan(val):
+            total += val
+            nobs += 1
+    if nobs == 0:
+        return np.nan
+    return total / nobs
+
+
+def _group_var(values: np.ndarray, ddof: int) -> float:
+    # Welford's method, as in the cython group_var
+    mean = 0.0
+    ssqdm = 0.0
+    nobs = 0
+    for val in values:
+        if not np.isnan(val):
+            nobs += 1
+            delta = val - mean
+            mean += delta / nobs
+            ssqdm += delta * (val - mean)
+    if nobs <= ddof:
+        return np.nan
+    return ssqdm / (nobs - ddof)
+
+
+def _group_quantile(values: np.ndarray, q: float, interpolation: int) -> float:
+    # same interpolation rules as the cython group_quantile
+    valid = np.sort(values[~np.isnan(values)])
+    nobs = len(valid)
+    if nobs == 0:
+        return np.nan
+
+    q_idx = q * (nobs - 1)
+    idx = int(q_idx)
+    frac = q_idx % 1
+    val = valid[idx]
+    if frac == 0.0 or interpolation == 1:
+        return val
+
+    next_val = valid[idx + 1]
+    if interpolation == 0:
+        return val + (next_val - val) * frac
+    elif interpolation == 2:
+        return next_val
+    elif interpolation == 3:
+        if frac > 0.5 or (frac == 0.5 and q > 0.5):
+            return next_val
+        return val
+    return (val + next_val) / 2.0
+
+
+_reductions: Dict[str, Callable[..., float]] = {
+    "sum": _group_sum,
+    "min": _group_min,
+    "max": _group_max,
+    "mean": _group_mean,
+    "var": _group_var,
+    "quantile": _group_quantile,
+}
+
+
+def generate_numba_reduction_func(
+    how: str, engine_kwargs: Optional[Dict[str, bool]]
+) -> Callable:
+    """
+    Generate a numba jitted function computing a built-in reduction of each
+    column of each group.
+
+    The returned function takes the values sorted by group as a 2D array,
+    the start and end positions of the groups and the arguments of the
+    reduction (min_count for sum, min and max, ddof for var, q and the
+    interpolation code for quantile), and returns an array of shape
+    (ngroups, ncolumns).
+
+    Parameters
+    ----------
+    how : {'sum', 'min', 'max', 'mean', 'var', 'quantile'}
+        Name of the reduction.
+    engine_kwargs : dict
+        dictionary of arguments to be passed into numba.jit
+
+    Returns
+    -------
+    Numba function
+    """
+    nopython, nogil, parallel = get_jit_arguments(engine_kwargs)
+
+    cache_key = (_reductions[how], f"groupby_{how}_{nopython}_{nogil}_{parallel}")
+    if cache_key in NUMBA_FUNC_CACHE:
+        return NUMBA_FUNC_CACHE[cache_key]
+
+    numba = import_optional_dependency("numba")
+
+    reduction = numba.jit(_reductions[how], nopython=nopython, nogil=nogil)
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def group_reduce(
+        values: np.ndarray, begin: np.ndarray, end: np.ndarray, *args
+    ) -> np.ndarray:
+        num_groups = len(begin)
+        num_columns = values.shape[1]
+        result = np.empty((num_groups, num_columns))
+        for i in loop_range(num_groups):
+            for j in range(num_columns):
+                result[i, j] = reduction(values[begin[i] : end[i], j], *args)
+        return result
+
+    NUMBA_FUNC_CACHE[cache_key] = group_reduce
+    return group_reduce
+
+
+def validate_frame_udf(func: Callable) -> bool:
+    """
+    Whether a user defined function aggregates all the columns of a group at
+    once, i.e. has the signature
+
+    def f(values, index, column_names, ...):
+        ...
+
+    Parameters
+    ----------
+    func : function
+        user defined function
+
+    Returns
+    -------
+    bool
+    """
+    if not callable(func):
+        return False
+    try:
+        udf_signature = list(inspect.signature(func).parameters.keys())
+    except (TypeError, ValueError):
+        return False
+    return udf_signature[:3] == ["values", "index", "column_names"]
+
+
+def generate_numba_frame_agg_func(
+    kwargs: Dict[str, Any],
+    func: Callable[..., Scalar],
+    engine_kwargs: Optional[Dict[str, bool]],
+) -> Tuple[Callable, Callable]:
+    """
+    Generate a numba jitted function aggregating all the columns of each group
+    with a user defined function.
+
+    1. jit the user's function
+    2. Return a groupby agg function with the jitted function inline
+
+    The user's function is called as ``func(values, index, column_names,
+    *args)`` with the 2D values and the index of a group, and must return
+    either a scalar or a 1D array of the same length for every group. The
+    arguments are passed after the number of results to the returned
+    groupby agg function.
+
+    Parameters
+    ----------
+    kwargs : dict
+        **kwargs to be passed into the function
+    func : function
+        function to be applied to each group and will be JITed
+    engine_kwargs : dict
+        dictionary of arguments to be passed into numba.jit
+
+    Returns
+    -------
+    (Numba function, Numba function)
+        The jitted user's function and the function applying it to all the
+        groups.
+    """
+    nopython, nogil, parallel = get_jit_arguments(engine_kwargs)
+
+    check_kwargs_and_nopython(kwargs, nopython)
+
+    if not validate_frame_udf(func):
+        raise NumbaUtilError(
+            f"The first 3 arguments to {func.__name__} must be "
+            "['values', 'index', 'column_names']"
+        )
+
+    numba_func = jit_user_function(func, nopython, nogil, parallel)
+
+    numba = import_optional_dependency("numba")
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def group_agg(
+        values: np.ndarray,
+        index: np.ndarray,
+        begin: np.ndarray,
+        end: np.ndarray,
+        column_names: Tuple,
+        num_results: int,
+        *args,
+    ) -> np.ndarray:
+        result = np.empty((len(begin), num_results))
+        for i in loop_range(len(begin)):
+            start = begin[i]
+            stop = end[i]
+            result[i] = numba_func(
+                values[start:stop], index[start:stop], column_names, *args
+            )
+        return result
+
+    return numba_func, group_agg
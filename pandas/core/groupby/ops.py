@@ -7,10 +7,14 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 """
 
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import os
 from typing import List, Optional, Sequence, Tuple, Type
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import NaT, iNaT, lib
 import pandas._libs.groupby as libgroupby
 import pandas._libs.reduction as libreduction
@@ -41,10 +45,9 @@ from pandas.core.dtypes.missing import _maybe_fill, isna
 
 import pandas.core.algorithms as algorithms
 from pandas.core.base import SelectionMixin
-import pandas.core.common as com
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
-from pandas.core.groupby import base, grouper
+from pandas.core.groupby import grouper
 from pandas.core.indexes.api import Index, MultiIndex, ensure_index
 from pandas.core.series import Series
 from pandas.core.sorting import (
@@ -134,7 +137,7 @@ class BaseGrouper:
 
     def _get_splitter(self, data: FrameOrSeries, axis: int = 0) -> "DataSplitter":
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis)
+        return get_splitter(data, comp_ids, ngroups, axis=axis, sort_idx=self._sort_idx)
 
     def _get_grouper(self):
         """
@@ -158,55 +161,20 @@ class BaseGrouper:
         mutated = self.mutated
         splitter = self._get_splitter(data, axis=axis)
         group_keys = self._get_group_keys()
-        result_values = None
-
-        sdata: FrameOrSeries = splitter._get_sorted_data()
-        if sdata.ndim == 2 and np.any(sdata.dtypes.apply(is_extension_array_dtype)):
-            # calling splitter.fast_apply will raise TypeError via apply_frame_axis0
-            #  if we pass EA instead of ndarray
-            #  TODO: can we have a workaround for EAs backed by ndarray?
-            pass
 
-        elif (
-            com.get_callable_name(f) not in base.plotting_methods
-            and isinstance(splitter, FrameSplitter)
-            and axis == 0
-            # fast_apply/libreduction doesn't allow non-numpy backed indexes
-            and not sdata.index._has_complex_internals
-        ):
-            try:
-                result_values, mutated = splitter.fast_apply(f, sdata, group_keys)
-
-            except libreduction.InvalidApply as err:
-                # This Exception is raised if `f` triggers an exception
-                # but it is preferable to raise the exception in Python.
-                if "Let this error raise above us" not in str(err):
-                    # TODO: can we infer anything about whether this is
-                    #  worth-retrying in pure-python?
-                    raise
-
-            else:
-                # If the fast apply path could be used we can return here.
-                # Otherwise we need to fall back to the slow implementation.
-                if len(result_values) == len(group_keys):
-                    return group_keys, result_values, mutated
+        if isinstance(splitter, FrameSplitter) and axis == 0:
+            # the groups are views on the data sorted by group, made in cython
+            #  and passed to f in the same loop; only a result indexed
+            #  differently from the group's rows changes the layout of the
+            #  output
+            sdata = splitter._get_sorted_data()
+            result_values, fast_mutated = splitter.fast_apply(f, sdata, group_keys)
+            return group_keys, result_values, mutated or fast_mutated
 
+        result_values = []
         for key, (i, group) in zip(group_keys, splitter):
             object.__setattr__(group, "name", key)
 
-            # result_values is None if fast apply path wasn't taken
-            # or fast apply aborted with an unexpected exception.
-            # In either case, initialize the result list and perform
-            # the slow iteration.
-            if result_values is None:
-                result_values = []
-
-            # If result_values is not None we're in the case that the
-            # fast apply loop was broken prematurely but we have
-            # already the result for the first group which we can reuse.
-            elif i == 0:
-                continue
-
             # group might be modified
             group_axes = group.axes
             res = f(group)
@@ -273,6 +241,12 @@ class BaseGrouper:
         comp_ids = ensure_int64(comp_ids)
         return comp_ids, obs_group_ids, ngroups
 
+    @cache_readonly
+    def _sort_idx(self) -> np.ndarray:
+        # Counting sort indexer, shared by every splitter built from us
+        comp_ids, _, ngroups = self.group_info
+        return get_group_index_sorter(comp_ids, ngroups)
+
     @cache_readonly
     def codes_info(self) -> np.ndarray:
         # return the codes of items in original grouped axis
@@ -285,7 +259,11 @@ class BaseGrouper:
     def _get_compressed_codes(self) -> Tuple[np.ndarray, np.ndarray]:
         all_codes = self.codes
         if len(all_codes) > 1:
-            group_index = get_group_index(all_codes, self.shape, sort=True, xnull=True)
+            # with sort=False the ids only need to identify the groups, so
+            # the overflow compression can keep the first-seen order
+            group_index = get_group_index(
+                all_codes, self.shape, sort=self.sort, xnull=True
+            )
             return compress_group_index(group_index, sort=self.sort)
 
         ping = self.groupings[0]
@@ -533,7 +511,9 @@ class BaseGrouper:
                 np.empty(out_shape, dtype=out_dtype), fill_value=np.nan
             )
             counts = np.zeros(self.ngroups, dtype=np.int64)
-            result = self._aggregate(result, counts, values, codes, func, min_count)
+            result = self._aggregate(
+                result, counts, values, codes, func, min_count, how=how
+            )
         elif kind == "transform":
             result = _maybe_fill(
                 np.empty_like(values, dtype=out_dtype), fill_value=np.nan
@@ -588,12 +568,42 @@ class BaseGrouper:
         return self._cython_operation("transform", values, how, axis, **kwargs)
 
     def _aggregate(
-        self, result, counts, values, comp_ids, agg_func, min_count: int = -1,
+        self,
+        result,
+        counts,
+        values,
+        comp_ids,
+        agg_func,
+        min_count: int = -1,
+        how: Optional[str] = None,
     ):
         if agg_func is libgroupby.group_nth:
             # different signature from the others
             # TODO: should we be using min_count instead of hard-coding it?
             agg_func(result, counts, values, comp_ids, rank=1, min_count=-1)
+            return result
+
+        num_threads = _get_num_threads(values)
+        if num_threads > 1 and values.shape[1] > 1:
+            _aggregate_by_columns(
+                result, counts, values, comp_ids, agg_func, min_count, num_threads
+            )
+        elif (
+            num_threads > 1
+            and how in _partial_merge
+            and min_count <= 0
+            and values.dtype.kind in ["f", "c"]
+        ):
+            _aggregate_by_rows(
+                result,
+                counts,
+                values,
+                comp_ids,
+                agg_func,
+                min_count,
+                num_threads,
+                _partial_merge[how],
+            )
         else:
             agg_func(result, counts, values, comp_ids, min_count)
 
@@ -661,7 +671,7 @@ class BaseGrouper:
 
         # avoids object / Series creation overhead
         dummy = obj.iloc[:0]
-        indexer = get_group_index_sorter(group_index, ngroups)
+        indexer = self._sort_idx
         obj = obj.take(indexer)
         group_index = algorithms.take_nd(group_index, indexer, allow_fill=False)
         grouper = libreduction.SeriesGrouper(obj, func, group_index, ngroups, dummy)
@@ -688,7 +698,9 @@ class BaseGrouper:
         counts = np.zeros(ngroups, dtype=int)
         result = None
 
-        splitter = get_splitter(obj, group_index, ngroups, axis=0)
+        splitter = get_splitter(
+            obj, group_index, ngroups, axis=0, sort_idx=self._sort_idx
+        )
 
         for label, group in splitter:
             if engine == "numba":
@@ -896,6 +908,89 @@ class BinGrouper(BaseGrouper):
         return grouper.get_result()
 
 
+# ----------------------------------------------------------------------
+# Multithreaded aggregation
+
+# below this number of values the threads cost more than they save
+_parallel_min_size = 100_000
+
+# how to combine the results of an aggregation computed on row partitions,
+# NaN marks the groups without observations in a partition
+_partial_merge = {
+    "add": np.sum,
+    "prod": np.prod,
+    "min": np.fmin.reduce,
+    "max": np.fmax.reduce,
+}
+
+
+def _get_num_threads(values: np.ndarray) -> int:
+    """
+    Number of threads to aggregate `values` with, see compute.num_threads.
+    """
+    if values.dtype == object or values.size < _parallel_min_size:
+        # the object kernels hold the GIL
+        return 1
+    num_threads = get_option("compute.num_threads")
+    if not num_threads:
+        num_threads = os.cpu_count() or 1
+    return num_threads
+
+
+def _aggregate_by_columns(
+    result, counts, values, comp_ids, agg_func, min_count: int, num_threads: int
+):
+    """
+    Run the nogil `agg_func` concurrently on groups of columns of `values`.
+
+    Each thread writes a separate group of columns of `result`; as the
+    group counts do not depend on the columns we only keep the ones of the
+    first group.
+    """
+    ncols = values.shape[1]
+    bounds = np.linspace(0, ncols, min(num_threads, ncols) + 1).astype(int)
+    all_counts = [counts] + [np.zeros_like(counts) for _ in range(len(bounds) - 2)]
+
+    def run(i: int):
+        sl = slice(bounds[i], bounds[i + 1])
+        agg_func(result[:, sl], all_counts[i], values[:, sl], comp_ids, min_count)
+
+    with ThreadPoolExecutor(max_workers=len(all_counts)) as pool:
+        # consume the results to re-raise any exception
+        list(pool.map(run, range(len(all_counts))))
+
+
+def _aggregate_by_rows(
+    result,
+    counts,
+    values,
+    comp_ids,
+    agg_func,
+    min_count: int,
+    num_threads: int,
+    merge,
+):
+    """
+    Run the nogil `agg_func` concurrently on row partitions of `values`,
+    each with its own accumulators, and combine the partial results with
+    `merge`.
+    """
+    nrows = len(values)
+    bounds = np.linspace(0, nrows, num_threads + 1).astype(int)
+    partials = np.empty((num_threads,) + result.shape, dtype=result.dtype)
+    all_counts = np.zeros((num_threads, len(counts)), dtype=counts.dtype)
+
+    def run(i: int):
+        sl = slice(bounds[i], bounds[i + 1])
+        agg_func(partials[i], all_counts[i], values[sl], comp_ids[sl], min_count)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        list(pool.map(run, range(num_threads)))
+
+    result[:] = merge(partials, axis=0)
+    counts[:] = all_counts.sum(axis=0)
+
+
 def _is_indexed_like(obj, axes) -> bool:
     if isinstance(obj, Series):
         if len(axes) > 1:
@@ -912,10 +1007,18 @@ def _is_indexed_like(obj, axes) -> bool:
 
 
 class DataSplitter:
-    def __init__(self, data: FrameOrSeries, labels, ngroups: int, axis: int = 0):
+    def __init__(
+        self,
+        data: FrameOrSeries,
+        labels,
+        ngroups: int,
+        axis: int = 0,
+        sort_idx: Optional[np.ndarray] = None,
+    ):
         self.data = data
         self.labels = ensure_int64(labels)
         self.ngroups = ngroups
+        self._sort_idx = sort_idx
 
         self.axis = axis
         assert isinstance(axis, int), axis
@@ -928,6 +1031,8 @@ class DataSplitter:
     @cache_readonly
     def sort_idx(self):
         # Counting sort indexer
+        if self._sort_idx is not None:
+            return self._sort_idx
         return get_group_index_sorter(self.labels, self.ngroups)
 
     def __iter__(self):
@@ -963,6 +1068,21 @@ class FrameSplitter(DataSplitter):
         starts, ends = lib.generate_slices(self.slabels, self.ngroups)
         return libreduction.apply_frame_axis0(sdata, f, names, starts, ends)
 
+    def __iter__(self):
+        if self.axis != 0:
+            yield from super().__iter__()
+            return
+
+        sdata = self._get_sorted_data()
+        if self.ngroups == 0:
+            return
+
+        # the groups are views on the blocks of sdata, sharing its layout
+        slicer = libreduction.BlockSlicer(sdata)
+        starts, ends = lib.generate_slices(self.slabels, self.ngroups)
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            yield i, slicer.chop(start, end)
+
     def _chop(self, sdata: DataFrame, slice_obj: slice) -> DataFrame:
         # Fastpath equivalent to:
         # if self.axis == 0:
@@ -974,7 +1094,11 @@ class FrameSplitter(DataSplitter):
 
 
 def get_splitter(
-    data: FrameOrSeries, labels: np.ndarray, ngroups: int, axis: int = 0
+    data: FrameOrSeries,
+    labels: np.ndarray,
+    ngroups: int,
+    axis: int = 0,
+    sort_idx: Optional[np.ndarray] = None,
 ) -> DataSplitter:
     if isinstance(data, Series):
         klass: Type[DataSplitter] = SeriesSplitter
@@ -982,4 +1106,4 @@ def get_splitter(
         # i.e. DataFrame
         klass = FrameSplitter
 
-    return klass(data, labels, ngroups, axis)
+    return klass(data, labels, ngroups, axis, sort_idx=sort_idx)
@@ -735,7 +735,10 @@ class BlockManager(PandasObject):
             new_blocks = self._slice_take_blocks_ax0(slobj)
         elif axis == 1:
             slicer = (slice(None), slobj)
-            new_blocks = [blk.getitem_block(slicer) for blk in self.blocks]
+            new_blocks = [
+                blk.getitem_block(slicer, new_mgr_locs=blk.mgr_locs)
+                for blk in self.blocks
+            ]
         else:
             raise IndexError("Requested axis not found in manager")
 
@@ -743,6 +746,13 @@ class BlockManager(PandasObject):
         new_axes[axis] = new_axes[axis][slobj]
 
         bm = type(self)(new_blocks, new_axes, do_integrity_check=False)
+        if axis == 1 and self._blknos is not None:
+            # slicing the rows keeps the layout of the blocks, which is shared
+            #  read-only until either manager changes it in iset
+            self._blknos.flags.writeable = False
+            self._blklocs.flags.writeable = False
+            bm._blknos = self._blknos
+            bm._blklocs = self._blklocs
         return bm
 
     @property
@@ -1057,6 +1067,10 @@ class BlockManager(PandasObject):
         # Accessing public blknos ensures the public versions are initialized
         blknos = self.blknos[loc]
         blklocs = self.blklocs[loc].copy()
+        if not self._blknos.flags.writeable:
+            # the layout is shared with other managers, see get_slice
+            self._blknos = self._blknos.copy()
+            self._blklocs = self._blklocs.copy()
 
         unfit_mgr_locs = []
         unfit_val_locs = []
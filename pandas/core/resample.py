@@ -12,8 +12,10 @@ from pandas._libs.tslibs import (
     Period,
     Timedelta,
     Timestamp,
+    iNaT,
     to_offset,
 )
+from pandas._libs.tslibs.timezones import is_utc
 from pandas._typing import TimedeltaConvertibleTypes, TimestampConvertibleTypes
 from pandas.compat.numpy import function as nv
 from pandas.errors import AbstractMethodError
@@ -22,6 +24,8 @@ from pandas.util._decorators import Appender, Substitution, doc
 from pandas.core.dtypes.generic import ABCDataFrame, ABCSeries
 
 import pandas.core.algorithms as algos
+from pandas.core.arrays import DatetimeArray
+from pandas.core.arrays._ranges import generate_regular_range
 from pandas.core.base import DataError, ShallowMixin
 from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.groupby.base import GroupByMixin
@@ -916,6 +920,43 @@ class Resampler(_GroupBy, ShallowMixin):
         """
         return self._downsample("quantile", q=q, **kwargs)
 
+    def ohlcv(self, price, volume, time=None):
+        """
+        Compute open, high, low and close prices, volume, volume weighted
+        average price, number of trades and first and last timestamps of
+        each bin, in a single pass.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        ----------
+        price : label
+            Column of the prices of the trades.
+        volume : label
+            Column of the volumes of the trades.
+        time : label, optional
+            Column of the timestamps of the trades. By default the resampled
+            ones, from the index or the ``on`` column.
+
+        Returns
+        -------
+        DataFrame
+            With the columns ``open``, ``high``, ``low``, ``close``,
+            ``volume``, ``vwap``, ``count``, ``first_time`` and ``last_time``.
+
+        See Also
+        --------
+        DataFrameGroupBy.ohlcv
+        """
+        if time is None:
+            time = self.groupby.key
+        self._set_binner()
+        if not len(self.ax):
+            # _downsample returns the empty object itself, not the ohlcv columns
+            grouped = self._selected_obj.groupby(self.grouper, axis=self.axis)
+            return grouped.ohlcv(price, volume, time=time)
+        return self._downsample("ohlcv", price=price, volume=volume, time=time)
+
 
 # downsample methods
 for method in ["sum", "prod"]:
@@ -1029,12 +1070,15 @@ class DatetimeIndexResampler(Resampler):
             return obj
 
         # do we have a regular frequency
-        if ax.freq is not None or ax.inferred_freq is not None:
-
-            if len(self.grouper.binlabels) > len(ax) and how is None:
-
-                # let's do an asfreq
-                return self.asfreq()
+        # inferring it scans the whole index, so only when it is needed
+        if (
+            how is None
+            and len(self.grouper.binlabels) > len(ax)
+            and (ax.freq is not None or ax.inferred_freq is not None)
+        ):
+
+            # let's do an asfreq
+            return self.asfreq()
 
         # we are downsampling
         # we want to call the actual grouper method here
@@ -1461,30 +1505,57 @@ class TimeGrouper(Grouper):
             origin=self.origin,
             offset=self.offset,
         )
-        # GH #12037
-        # use first/last directly instead of call replace() on them
-        # because replace() will swallow the nanosecond part
-        # thus last bin maybe slightly before the end if the end contains
-        # nanosecond part and lead to `Values falls after last bin` error
-        # GH 25758: If DST lands at midnight (e.g. 'America/Havana'), user feedback
-        # has noted that ambiguous=True provides the most sensible result
-        binner = labels = date_range(
-            freq=self.freq,
-            start=first,
-            end=last,
-            tz=ax.tz,
-            name=ax.name,
-            ambiguous=True,
-            nonexistent="shift_forward",
-        )
+        if isinstance(self.freq, Tick) and (ax.tz is None or is_utc(ax.tz)):
+            # without DST the edges are evenly spaced, and can be computed
+            # directly from the integer values of first and last
+            edges = generate_regular_range(first, last, None, self.freq)
+            binner = labels = DatetimeIndex._simple_new(
+                DatetimeArray._simple_new(edges, freq=self.freq, dtype=ax.dtype),
+                name=ax.name,
+            )
+        else:
+            # GH #12037
+            # use first/last directly instead of call replace() on them
+            # because replace() will swallow the nanosecond part
+            # thus last bin maybe slightly before the end if the end contains
+            # nanosecond part and lead to `Values falls after last bin` error
+            # GH 25758: If DST lands at midnight (e.g. 'America/Havana'), user
+            # feedback has noted that ambiguous=True provides the most sensible
+            # result
+            binner = labels = date_range(
+                freq=self.freq,
+                start=first,
+                end=last,
+                tz=ax.tz,
+                name=ax.name,
+                ambiguous=True,
+                nonexistent="shift_forward",
+            )
 
         ax_values = ax.asi8
         binner, bin_edges = self._adjust_bin_edges(binner, ax_values)
 
-        # general version, knowing nothing about relative frequencies
-        bins = lib.generate_bins_dt64(
-            ax_values, bin_edges, self.closed, hasnans=ax.hasnans
-        )
+        if len(bin_edges) < len(ax_values):
+            # fewer bins than values: search the edges in the sorted values
+            # instead of scanning all of them. NaT sort first, and are
+            # counted in their own first bin as by generate_bins_dt64
+            nat_count = (ax_values == iNaT).sum() if ax.hasnans else 0
+            if nat_count == len(ax_values):
+                raise ValueError("Invalid length for values or for binner")
+            # the sorted values must fit the edges, as in generate_bins_dt64
+            if ax_values[nat_count] < bin_edges[0]:
+                raise ValueError("Values falls before first bin")
+            if ax_values[-1] > bin_edges[-1]:
+                raise ValueError("Values falls after last bin")
+            side = "right" if self.closed == "right" else "left"
+            bins = ax_values.searchsorted(bin_edges[1:], side=side)
+            if ax.hasnans:
+                bins = np.insert(bins, 0, nat_count)
+        else:
+            # general version, knowing nothing about relative frequencies
+            bins = lib.generate_bins_dt64(
+                ax_values, bin_edges, self.closed, hasnans=ax.hasnans
+            )
 
         if self.closed == "right":
             labels = binner
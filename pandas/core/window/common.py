@@ -1,15 +1,24 @@
 """Common utility functions for rolling operations"""
 from collections import defaultdict
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple, Type, Union
 import warnings
 
 import numpy as np
 
+from pandas._typing import FrameOrSeries
+from pandas.util._decorators import cache_readonly
+
+from pandas.core.dtypes.common import ensure_int64
 from pandas.core.dtypes.generic import ABCDataFrame, ABCSeries
 
 from pandas.core.generic import _shared_docs
 from pandas.core.groupby.base import GroupByMixin
 from pandas.core.indexes.api import MultiIndex
+from pandas.core.window.indexers import (
+    FixedWindowIndexer,
+    GroupbyRollingIndexer,
+    VariableWindowIndexer,
+)
 
 _shared_docs = dict(**_shared_docs)
 _doc_template = """
@@ -62,34 +71,103 @@ class WindowGroupByMixin(GroupByMixin):
     corr = _dispatch("corr", other=None, pairwise=None)
     cov = _dispatch("cov", other=None, pairwise=None)
 
-    def _apply(
-        self,
-        func: Callable,
-        center: bool,
-        require_min_periods: int = 0,
-        floor: int = 1,
-        is_weighted: bool = False,
-        name: Optional[str] = None,
-        use_numba_cache: bool = False,
-        **kwargs,
-    ):
+    @cache_readonly
+    def _groupby_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The positions of the rows in group order, and the number of rows of
+        each group.
         """
-        Dispatch to apply; we are stripping all of the _apply kwargs and
-        performing the original function call on the grouped object.
+        grouper = self._groupby.grouper
+        ids, _, ngroups = grouper.group_info
+        # the counting sort puts the dropped rows (id -1) first
+        order = grouper._sort_idx[(ids == -1).sum() :]
+        group_lengths = np.bincount(ids.take(order), minlength=ngroups)
+        return ensure_int64(order), ensure_int64(group_lengths)
+
+    def _apply(self, func: Callable, *args, **kwargs):
         """
-        kwargs.pop("floor", None)
-        kwargs.pop("original_func", None)
+        Compute the windows of all the groups with a single call to the window
+        function over the data sorted by group, and index the result by the
+        group keys and the original index.
+        """
+        result = super()._apply(func, *args, **kwargs)
+        # Cannot use _wrap_outputs because we calculate the result all at once
+        result.index = self._get_group_index()
+        return result
 
-        # TODO: can we de-duplicate with _dispatch?
-        def f(x, name=name, *args):
-            x = self._shallow_copy(x)
+    def _get_group_index(self, positions: Optional[np.ndarray] = None) -> MultiIndex:
+        """
+        Compose the MultiIndex of the rows at ``positions`` of the data sorted
+        by group (by default all the rows) from the grouping levels then the
+        levels of the original index.
+        """
+        grouper = self._groupby.grouper
+        order, _ = self._groupby_order
+        ids, _, _ = grouper.group_info
+        rows = order if positions is None else order.take(positions)
+
+        group_keys = grouper.result_index.take(ids.take(rows))
+        obj_index = self._groupby._selected_obj.index.take(rows)
+        arrays = []
+        for index in [group_keys, obj_index]:
+            if isinstance(index, MultiIndex):
+                arrays.extend(index.get_level_values(i) for i in range(index.nlevels))
+            else:
+                arrays.append(index)
 
-            if isinstance(name, str):
-                return getattr(x, name)(*args, **kwargs)
+        return MultiIndex.from_arrays(
+            arrays, names=list(grouper.names) + list(obj_index.names)
+        )
 
-            return x.apply(name, *args, **kwargs)
+    def _create_blocks(self, obj: FrameOrSeries):
+        """
+        Split data into blocks & return conformed data.
+        """
+        # Ensure the object we're rolling over is monotonically sorted relative
+        # to the groups
+        order, _ = self._groupby_order
+        obj = obj.take(order)
+        return super()._create_blocks(obj)
 
-        return self._groupby.apply(f)
+    def _get_cython_func_type(self, func: str, table: bool = False) -> Callable:
+        """
+        Return the cython function type.
+
+        The windows are computed over the data in group order, which may not be
+        monotonic with the data, so the "variable" algorithms are always used
+        as the "fixed" algorithms assume contiguous windows over all the data.
+        """
+        suffix = "_2d" if table else ""
+        return self._get_roll_func(f"{func}_variable{suffix}")
+
+    def _get_window_indexer(self, window: int) -> GroupbyRollingIndexer:
+        """
+        Return an indexer class that will compute the window start and end bounds
+
+        Parameters
+        ----------
+        window : int
+            window size for FixedWindowIndexer
+
+        Returns
+        -------
+        GroupbyRollingIndexer
+        """
+        order, group_lengths = self._groupby_order
+        rolling_indexer: Union[Type[FixedWindowIndexer], Type[VariableWindowIndexer]]
+        if self.is_freq_type:
+            rolling_indexer = VariableWindowIndexer
+            index_array = self._groupby._selected_obj.index.asi8.take(order)
+        else:
+            rolling_indexer = FixedWindowIndexer
+            index_array = None
+        window_indexer = GroupbyRollingIndexer(
+            index_array=index_array,
+            window_size=window,
+            group_lengths=group_lengths,
+            rolling_indexer=rolling_indexer,
+        )
+        return window_indexer
 
 
 def _flex_binary_moment(arg1, arg2, f, pairwise=False):
@@ -1,17 +1,34 @@
+import datetime
 from functools import partial
 from textwrap import dedent
+from typing import Callable, List, Optional, Union
 
 import numpy as np
 
+from pandas._libs.tslibs import Timedelta
 import pandas._libs.window.aggregations as window_aggregations
+from pandas._typing import FrameOrSeries, Label, TimedeltaConvertibleTypes
 from pandas.compat.numpy import function as nv
 from pandas.util._decorators import Appender, Substitution
 
-from pandas.core.dtypes.generic import ABCDataFrame
+from pandas.core.dtypes.common import is_datetime64_ns_dtype
+from pandas.core.dtypes.generic import ABCDataFrame, ABCSeries
 
 from pandas.core.base import DataError
 import pandas.core.common as com
-from pandas.core.window.common import _doc_template, _shared_docs, zsqrt
+from pandas.core.construction import extract_array
+from pandas.core.indexes.api import MultiIndex
+from pandas.core.window.common import (
+    WindowGroupByMixin,
+    _doc_template,
+    _shared_docs,
+    zsqrt,
+)
+from pandas.core.window.indexers import (
+    BaseIndexer,
+    ExponentialMovingWindowIndexer,
+    GroupbyExponentialMovingWindowIndexer,
+)
 from pandas.core.window.rolling import _flex_binary_moment, _Rolling
 
 _bias_template = """
@@ -69,10 +86,18 @@ class EWM(_Rolling):
     span : float, optional
         Specify decay in terms of span,
         :math:`\alpha = 2 / (span + 1)`, for :math:`span \geq 1`.
-    halflife : float, optional
+    halflife : float, str, timedelta, optional
         Specify decay in terms of half-life,
         :math:`\alpha = 1 - \exp\left(-\ln(2) / halflife\right)`, for
         :math:`halflife > 0`.
+
+        If ``times`` is specified, the time unit (str or timedelta) over which an
+        observation decays to half its value. Only applicable to ``mean()``,
+        ``var()``, ``std()`` and ``cov()`` and ``corr()``, and halflife value
+        will not apply to the other functions.
+
+        .. versionadded:: 1.1.0
+
     alpha : float, optional
         Specify smoothing factor :math:`\alpha` directly,
         :math:`0 < \alpha \leq 1`.
@@ -117,6 +142,19 @@ class EWM(_Rolling):
     axis : {0 or 'index', 1 or 'columns'}, default 0
         The axis to use. The value 0 identifies the rows, and 1
         identifies the columns.
+    times : str, np.ndarray, Series, default None
+
+        .. versionadded:: 1.1.0
+
+        Times corresponding to the observations. Must be monotonically increasing
+        and ``datetime64[ns]`` dtype.
+
+        If str, the name of the column in the DataFrame representing the times.
+
+        If 1-D array like, a sequence with the same shape as the observations.
+
+        Only applicable to ``mean()``, ``var()``, ``std()``, ``cov()`` and
+        ``corr()``.
 
     Returns
     -------
@@ -152,29 +190,83 @@ class EWM(_Rolling):
     2  1.615385
     3  1.615385
     4  3.670213
+
+    Specifying ``times`` with a timedelta ``halflife`` when computing mean.
+
+    >>> times = ['2020-01-01', '2020-01-03', '2020-01-10', '2020-01-15', '2020-01-17']
+    >>> df.ewm(halflife='4 days', times=pd.DatetimeIndex(times)).mean()
+              B
+    0  0.000000
+    1  0.585786
+    2  1.523889
+    3  1.523889
+    4  3.233686
     """
 
-    _attributes = ["com", "min_periods", "adjust", "ignore_na", "axis"]
+    _attributes = [
+        "com",
+        "min_periods",
+        "adjust",
+        "ignore_na",
+        "axis",
+        "halflife",
+        "times",
+    ]
 
     def __init__(
         self,
         obj,
-        com=None,
-        span=None,
-        halflife=None,
-        alpha=None,
-        min_periods=0,
-        adjust=True,
-        ignore_na=False,
-        axis=0,
+        com: Optional[float] = None,
+        span: Optional[float] = None,
+        halflife: Optional[Union[float, TimedeltaConvertibleTypes]] = None,
+        alpha: Optional[float] = None,
+        min_periods: int = 0,
+        adjust: bool = True,
+        ignore_na: bool = False,
+        axis: int = 0,
+        times: Optional[Union[str, np.ndarray, FrameOrSeries]] = None,
+        **kwargs,
     ):
+        self.__dict__.update(kwargs)
         self.obj = obj
-        self.com = get_center_of_mass(com, span, halflife, alpha)
         self.min_periods = min_periods
         self.adjust = adjust
         self.ignore_na = ignore_na
         self.axis = axis
         self.on = None
+        # the column holding the times is not one of the columns computed
+        self._times_column = times if isinstance(times, str) else None
+        if times is not None:
+            if isinstance(times, str):
+                times = self.obj[times]
+            if not is_datetime64_ns_dtype(times):
+                raise ValueError("times must be datetime64[ns] dtype.")
+            if len(times) != len(obj):
+                raise ValueError("times must be the same length as the object.")
+            if not isinstance(halflife, (str, datetime.timedelta, np.timedelta64)):
+                raise ValueError(
+                    "halflife must be a string or datetime.timedelta object"
+                )
+            if Timedelta(halflife).value <= 0:
+                raise ValueError("halflife must satisfy: halflife > 0")
+            if com is not None or span is not None or alpha is not None:
+                raise ValueError(
+                    "com, span, and alpha are not supported when times is specified"
+                )
+            self.times = np.asarray(times, dtype="M8[ns]")
+            self.halflife = halflife
+            self.com = None
+        else:
+            if halflife is not None and isinstance(
+                halflife, (str, datetime.timedelta, np.timedelta64)
+            ):
+                raise ValueError(
+                    "halflife can only be a timedelta convertible argument if "
+                    "times is not None."
+                )
+            self.times = None
+            self.halflife = None
+            self.com = get_center_of_mass(com, span, halflife, alpha)
 
     @property
     def _constructor(self):
@@ -220,6 +312,81 @@ class EWM(_Rolling):
 
     agg = aggregate
 
+    def online(self) -> "OnlineEWM":
+        """
+        Return an object updating the exponential weighted functions with new
+        rows, keeping the state of the weighted averages of the rows seen so
+        far rather than recomputing them over the whole history.
+
+        .. versionadded:: 1.1.0
+
+        Returns
+        -------
+        OnlineEWM
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"A": [1.0, 2.0, 3.0]})
+        >>> online = df.ewm(com=0.5).online()
+        >>> online.mean()
+                  A
+        0  1.000000
+        1  1.750000
+        2  2.615385
+        >>> online.mean(update=pd.DataFrame({"A": [4.0, 5.0]}, index=[3, 4]))
+                  A
+        3  3.550000
+        4  4.520661
+        """
+        return OnlineEWM(self)
+
+    @property
+    def _com(self) -> float:
+        # with times, the weights decay by 1/2 per halflife of time elapsed
+        return 1.0 if self.times is not None else self.com
+
+    def _get_window_indexer(self) -> BaseIndexer:
+        """
+        Return an indexer class that will compute the bounds of the segments of
+        the values over which the functions are computed.
+        """
+        return ExponentialMovingWindowIndexer()
+
+    def _get_times(self) -> Optional[np.ndarray]:
+        """
+        Return the times of the values passed to the Cython functions.
+        """
+        return self.times
+
+    def _get_deltas(self, num_values: int) -> np.ndarray:
+        """
+        Return the spacing of each value from the previous value, in number of
+        halflifes if times is specified and observations otherwise.
+        """
+        times = self._get_times()
+        if times is None:
+            return np.ones(max(num_values - 1, 0), dtype=np.float64)
+        if len(times) != num_values:
+            raise ValueError("times must be the same length as the object.")
+        return np.diff(times.view(np.int64)) / Timedelta(self.halflife).value
+
+    def _get_bounds(self, num_values: int):
+        """
+        Return the start and end bounds of the segments of ``num_values``
+        values and the spacing of the values.
+        """
+        window_indexer = self._get_window_indexer()
+        start, end = window_indexer.get_window_bounds(num_values=num_values)
+        return start, end, self._get_deltas(num_values)
+
+    def _get_excluded_columns(self) -> List[Label]:
+        """
+        Return the columns of the object which are not computed.
+        """
+        if self._times_column is None:
+            return []
+        return [self._times_column]
+
     def _apply(self, func):
         """
         Rolling statistical measure using supplied function. Designed to be
@@ -233,28 +400,38 @@ class EWM(_Rolling):
         -------
         y : same type as input argument
         """
-        blocks, obj = self._create_blocks(self._selected_obj)
-        block_list = list(blocks)
+        obj = self._selected_obj
+        exclude = []
+        if isinstance(obj, ABCDataFrame):
+            excluded = self._get_excluded_columns()
+            exclude = [c for c in obj.columns if c in excluded]
+            obj = obj.drop(columns=exclude)
+        blocks, obj = self._create_blocks(obj)
 
         results = []
-        exclude = []
-        for i, b in enumerate(blocks):
+        block_list = []
+        for b in blocks:
             try:
                 values = self._prep_values(b.values)
 
             except (TypeError, NotImplementedError) as err:
                 if isinstance(obj, ABCDataFrame):
                     exclude.extend(b.columns)
-                    del block_list[i]
                     continue
                 else:
                     raise DataError("No numeric types to aggregate") from err
 
+            block_list.append(b)
             if values.size == 0:
                 results.append(values.copy())
                 continue
 
-            results.append(np.apply_along_axis(func, self.axis, values))
+            start, end, deltas = self._get_bounds(values.shape[self.axis])
+
+            def calc(x):
+                return func(x, start=start, end=end, deltas=deltas)
+
+            results.append(np.apply_along_axis(calc, self.axis, values))
 
         return self._wrap_results(results, block_list, obj, exclude)
 
@@ -273,10 +450,10 @@ class EWM(_Rolling):
         window_func = self._get_roll_func("ewma")
         window_func = partial(
             window_func,
-            com=self.com,
-            adjust=int(self.adjust),
-            ignore_na=self.ignore_na,
             minp=int(self.min_periods),
+            com=self._com,
+            adjust=self.adjust,
+            ignore_na=self.ignore_na,
         )
         return self._apply(window_func)
 
@@ -301,19 +478,50 @@ class EWM(_Rolling):
         """
         nv.validate_window_func("var", args, kwargs)
 
-        def f(arg):
+        def f(arg, start, end, deltas):
             return window_aggregations.ewmcov(
                 arg,
                 arg,
-                self.com,
-                int(self.adjust),
-                int(self.ignore_na),
+                start,
+                end,
                 int(self.min_periods),
-                int(bias),
+                self._com,
+                self.adjust,
+                self.ignore_na,
+                bias,
+                deltas,
             )
 
         return self._apply(f)
 
+    def _ewmcov(self, x: np.ndarray, y: np.ndarray, bias: bool) -> np.ndarray:
+        """
+        Exponential weighted covariance of the values of two objects.
+        """
+        start, end, deltas = self._get_bounds(len(x))
+        return window_aggregations.ewmcov(
+            x,
+            y,
+            start,
+            end,
+            int(self.min_periods),
+            self._com,
+            self.adjust,
+            self.ignore_na,
+            bias,
+            deltas,
+        )
+
+    def _binary_moment(self, other, func: Callable, pairwise: bool):
+        """
+        Compute ``func`` over the pairs of columns of the object and ``other``.
+        """
+        if isinstance(other, EWM):
+            other = other.obj
+        return _flex_binary_moment(
+            self._selected_obj, other, func, pairwise=bool(pairwise)
+        )
+
     @Substitution(name="ewm", func_name="cov")
     @Appender(_doc_template)
     def cov(self, other=None, pairwise=None, bias=False, **kwargs):
@@ -341,25 +549,14 @@ class EWM(_Rolling):
             other = self._selected_obj
             # only default unset
             pairwise = True if pairwise is None else pairwise
-        other = self._shallow_copy(other)
 
         def _get_cov(X, Y):
-            X = self._shallow_copy(X)
-            Y = self._shallow_copy(Y)
-            cov = window_aggregations.ewmcov(
-                X._prep_values(),
-                Y._prep_values(),
-                self.com,
-                int(self.adjust),
-                int(self.ignore_na),
-                int(self.min_periods),
-                int(bias),
-            )
-            return X._wrap_result(cov)
+            x_values = self._prep_values(extract_array(X, extract_numpy=True))
+            y_values = self._prep_values(extract_array(Y, extract_numpy=True))
+            cov = self._ewmcov(x_values, y_values, bias)
+            return self._wrap_result(cov, obj=X)
 
-        return _flex_binary_moment(
-            self._selected_obj, other._selected_obj, _get_cov, pairwise=bool(pairwise)
-        )
+        return self._binary_moment(other, _get_cov, pairwise)
 
     @Substitution(name="ewm", func_name="corr")
     @Appender(_doc_template)
@@ -386,32 +583,211 @@ class EWM(_Rolling):
             other = self._selected_obj
             # only default unset
             pairwise = True if pairwise is None else pairwise
-        other = self._shallow_copy(other)
 
         def _get_corr(X, Y):
-            X = self._shallow_copy(X)
-            Y = self._shallow_copy(Y)
-
-            def _cov(x, y):
-                return window_aggregations.ewmcov(
-                    x,
-                    y,
-                    self.com,
-                    int(self.adjust),
-                    int(self.ignore_na),
-                    int(self.min_periods),
-                    1,
-                )
-
-            x_values = X._prep_values()
-            y_values = Y._prep_values()
+            x_values = self._prep_values(extract_array(X, extract_numpy=True))
+            y_values = self._prep_values(extract_array(Y, extract_numpy=True))
             with np.errstate(all="ignore"):
-                cov = _cov(x_values, y_values)
-                x_var = _cov(x_values, x_values)
-                y_var = _cov(y_values, y_values)
+                cov = self._ewmcov(x_values, y_values, True)
+                x_var = self._ewmcov(x_values, x_values, True)
+                y_var = self._ewmcov(y_values, y_values, True)
                 corr = cov / zsqrt(x_var * y_var)
-            return X._wrap_result(corr)
+            return self._wrap_result(corr, obj=X)
 
-        return _flex_binary_moment(
-            self._selected_obj, other._selected_obj, _get_corr, pairwise=bool(pairwise)
+        return self._binary_moment(other, _get_corr, pairwise)
+
+
+class EWMGroupby(WindowGroupByMixin, EWM):
+    """
+    Provide an exponential moving window groupby implementation.
+    """
+
+    @property
+    def _constructor(self):
+        return EWM
+
+    def _get_window_indexer(self) -> GroupbyExponentialMovingWindowIndexer:
+        """
+        Return an indexer class that will compute the bounds of the groups in
+        the values sorted by group.
+        """
+        _, group_lengths = self._groupby_order
+        return GroupbyExponentialMovingWindowIndexer(group_lengths=group_lengths)
+
+    def _get_times(self) -> Optional[np.ndarray]:
+        if self.times is None:
+            return None
+        order, _ = self._groupby_order
+        return self.times.take(order)
+
+    def _get_excluded_columns(self) -> List[Label]:
+        # the grouping columns are constant within the groups
+        return super()._get_excluded_columns() + list(self._groupby.exclusions)
+
+    # computed for all the groups at once rather than dispatched per group
+    cov = EWM.cov
+    corr = EWM.corr
+
+    def _binary_moment(self, other, func: Callable, pairwise: bool):
+        """
+        Compute ``func`` over the pairs of columns of the object and ``other``
+        sorted by group, and index the result by the group keys and the
+        original index.
+        """
+        obj = self._selected_obj
+        if isinstance(other, EWM):
+            other = other.obj
+        if other is obj:
+            other = None
+        if obj is self._groupby.obj and obj.ndim == 2:
+            # the grouping columns are constant within the groups
+            obj = self._groupby._obj_with_exclusions
+        if other is not None:
+            if not isinstance(other, (ABCDataFrame, ABCSeries)):
+                raise TypeError("other must be a DataFrame or Series")
+            if not other.index.equals(obj.index):
+                raise ValueError("other must have the same index as the object")
+
+        order, _ = self._groupby_order
+        x = obj.take(order).reset_index(drop=True)
+        y = x if other is None else other.take(order).reset_index(drop=True)
+        result = _flex_binary_moment(x, y, func, pairwise=bool(pairwise))
+
+        if isinstance(result.index, MultiIndex):
+            # pairwise output: the rows of the sorted values, then the columns
+            rows = np.asarray(result.index.get_level_values(0), dtype=np.int64)
+            index = self._get_group_index(rows)
+            arrays = [index.get_level_values(i) for i in range(index.nlevels)]
+            arrays.append(result.index.get_level_values(-1))
+            result.index = MultiIndex.from_arrays(
+                arrays, names=list(index.names) + [result.index.names[-1]]
+            )
+        else:
+            result.index = self._get_group_index()
+        return result
+
+
+class OnlineEWM:
+    """
+    Exponential weighted functions updated with new rows.
+
+    The weighted average, its weight and the number of observations of each
+    column are kept after each call, so the cost of an update is proportional
+    to the number of new rows. Returned by :meth:`EWM.online`.
+
+    Parameters
+    ----------
+    ewm : EWM
+        The exponential weighted functions over the initial data.
+    """
+
+    def __init__(self, ewm: EWM):
+        if ewm.axis != 0:
+            raise NotImplementedError("online is only implemented for axis=0")
+        self._ewm = ewm
+        obj = ewm._selected_obj
+        if obj.ndim == 2:
+            excluded = ewm._get_excluded_columns()
+            obj = obj.drop(columns=[c for c in obj.columns if c in excluded])
+        self.obj = obj
+        self._state = None
+        self._last_time = None
+
+    def reset(self) -> None:
+        """
+        Discard the state of the rows seen so far.
+        """
+        self._state = None
+        self._last_time = None
+
+    def _get_update_deltas(self, update, update_times) -> np.ndarray:
+        """
+        Return the spacing of the rows of ``update`` from the previous row.
+        """
+        ewm = self._ewm
+        if ewm.times is None:
+            if update_times is not None:
+                raise ValueError(
+                    "update_times is only supported when times is specified"
+                )
+            return np.ones(len(update), dtype=np.float64)
+
+        if update_times is None:
+            raise ValueError("update_times must be passed when times is specified")
+        if not is_datetime64_ns_dtype(update_times):
+            raise ValueError("update_times must be datetime64[ns] dtype.")
+        if len(update_times) != len(update):
+            raise ValueError("update_times must be the same length as update.")
+        times = np.asarray(update_times, dtype="M8[ns]").view(np.int64)
+        times = np.concatenate([[self._last_time], times])
+        return np.diff(times) / Timedelta(ewm.halflife).value
+
+    def mean(self, update=None, update_times=None) -> FrameOrSeries:
+        """
+        Exponential weighted moving average.
+
+        Parameters
+        ----------
+        update : Series or DataFrame, optional
+            New rows following the rows seen so far, with the same columns as
+            the initial data. If not passed, the state is reset and the
+            average is computed over the initial data.
+        update_times : np.ndarray, Series, optional
+            The times of the rows of ``update``, required if ``times`` was
+            specified. If ``times`` was the name of a column, it defaults to
+            this column of ``update``.
+
+        Returns
+        -------
+        Series or DataFrame
+            The average at each row of the initial data or of ``update``.
+        """
+        ewm = self._ewm
+        if update is None:
+            if update_times is not None:
+                raise ValueError("update_times can only be passed with update")
+            data = self.obj
+            deltas = np.concatenate([[1.0], ewm._get_deltas(len(data))])
+            times = ewm.times
+            ncols = 1 if data.ndim == 1 else data.shape[1]
+            state = (
+                np.full(ncols, np.nan),
+                np.ones(ncols),
+                np.zeros(ncols, dtype=np.int64),
+            )
+        else:
+            if self._state is None:
+                raise ValueError(
+                    "Must call mean with update=None first before passing update"
+                )
+            if not isinstance(update, type(self.obj)):
+                raise TypeError(f"update must be a {type(self.obj).__name__}")
+            times_column = ewm._times_column
+            if update.ndim == 2 and times_column is not None and times_column in update:
+                if update_times is None:
+                    update_times = update[times_column]
+                update = update.drop(columns=[times_column])
+            if update.ndim == 2 and not update.columns.equals(self.obj.columns):
+                raise ValueError("update must have the same columns as the object")
+            data = update
+            deltas = self._get_update_deltas(update, update_times)
+            times = update_times
+            state = tuple(x.copy() for x in self._state)
+
+        values = ewm._prep_values(data.to_numpy())
+        result = window_aggregations.ewma_online(
+            values.reshape(len(data), -1),
+            deltas,
+            int(ewm.min_periods),
+            ewm._com,
+            ewm.adjust,
+            ewm.ignore_na,
+            *state,
         )
+        self._state = state
+        if times is not None and len(times):
+            self._last_time = np.asarray(times, dtype="M8[ns]").view(np.int64)[-1]
+
+        if data.ndim == 1:
+            return data._constructor(result[:, 0], index=data.index, name=data.name)
+        return data._constructor(result, index=data.index, columns=data.columns)
@@ -141,6 +141,7 @@ class Expanding(_Rolling_and_Expanding):
         engine_kwargs: Optional[Dict[str, bool]] = None,
         args=None,
         kwargs=None,
+        method: str = "single",
     ):
         return super().apply(
             func,
@@ -149,6 +150,7 @@ class Expanding(_Rolling_and_Expanding):
             engine_kwargs=engine_kwargs,
             args=args,
             kwargs=kwargs,
+            method=method,
         )
 
     @Substitution(name="expanding")
@@ -237,6 +239,26 @@ class Expanding(_Rolling_and_Expanding):
             quantile=quantile, interpolation=interpolation, **kwargs
         )
 
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["rank"])
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        return super().rank(method=method, ascending=ascending, pct=pct, **kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["argmax"])
+    def argmax(self, **kwargs):
+        return super().argmax(**kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["argmin"])
+    def argmin(self, **kwargs):
+        return super().argmin(**kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["nunique"])
+    def nunique(self, **kwargs):
+        return super().nunique(**kwargs)
+
     @Substitution(name="expanding", func_name="cov")
     @Appender(_doc_template)
     @Appender(_shared_docs["cov"])
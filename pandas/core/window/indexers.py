@@ -1,9 +1,12 @@
 """Indexer objects for computing start/end window bounds for rolling operations"""
-from typing import Dict, Optional, Tuple, Type, Union
+from typing import Optional, Tuple, Type, Union
 
 import numpy as np
 
-from pandas._libs.window.indexers import calculate_variable_window_bounds
+from pandas._libs.window.indexers import (
+    calculate_grouped_variable_window_bounds,
+    calculate_variable_window_bounds,
+)
 from pandas.util._decorators import Appender
 
 get_window_bounds_doc = """
@@ -179,17 +182,21 @@ class GroupbyRollingIndexer(BaseIndexer):
         self,
         index_array: Optional[np.ndarray],
         window_size: int,
-        groupby_indicies: Dict,
+        group_lengths: np.ndarray,
         rolling_indexer: Union[Type[FixedWindowIndexer], Type[VariableWindowIndexer]],
         **kwargs,
     ):
         """
         Parameters
         ----------
+        index_array : ndarray or None
+            the index of the values, in group order
+        group_lengths : ndarray[int64]
+            the number of values of each group, the values being sorted by group
         **kwargs :
             keyword arguments that will be available when get_window_bounds is called
         """
-        self.groupby_indicies = groupby_indicies
+        self.group_lengths = group_lengths
         self.rolling_indexer = rolling_indexer
         super().__init__(index_array, window_size, **kwargs)
 
@@ -201,37 +208,63 @@ class GroupbyRollingIndexer(BaseIndexer):
         center: Optional[bool] = None,
         closed: Optional[str] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
-        # 1) For each group, get the indices that belong to the group
-        # 2) Use the indices to calculate the start & end bounds of the window
-        # 3) Append the window bounds in group order
-        start_arrays = []
-        end_arrays = []
-        window_indicies_start = 0
-        for key, indicies in self.groupby_indicies.items():
-            if self.index_array is not None:
-                index_array = self.index_array.take(indicies)
-            else:
-                index_array = self.index_array
-            indexer = self.rolling_indexer(
-                index_array=index_array, window_size=self.window_size,
+        # The values are sorted by group, so the bounds of all the groups are
+        # computed at once: variable windows are restarted at each group
+        # boundary, fixed windows are computed over all the values and clipped
+        # to the start of their group
+        if self.rolling_indexer is VariableWindowIndexer:
+            return calculate_grouped_variable_window_bounds(
+                self.group_lengths, self.window_size, closed, self.index_array
             )
-            start, end = indexer.get_window_bounds(
-                len(indicies), min_periods, center, closed
-            )
-            start = start.astype(np.int64)
-            end = end.astype(np.int64)
-            # Cannot use groupby_indicies as they might not be monotonic with the object
-            # we're rolling over
-            window_indicies = np.arange(
-                window_indicies_start, window_indicies_start + len(indicies),
-            )
-            window_indicies_start += len(indicies)
-            # Extend as we'll be slicing window like [start, end)
-            window_indicies = np.append(
-                window_indicies, [window_indicies[-1] + 1]
-            ).astype(np.int64)
-            start_arrays.append(window_indicies.take(start))
-            end_arrays.append(window_indicies.take(end))
-        start = np.concatenate(start_arrays)
-        end = np.concatenate(end_arrays)
-        return start, end
+
+        group_lengths = self.group_lengths
+        indexer = self.rolling_indexer(window_size=self.window_size)
+        start, end = indexer.get_window_bounds(
+            int(group_lengths.sum()), min_periods, center, closed
+        )
+        group_starts = np.cumsum(group_lengths) - group_lengths
+        start = np.maximum(start, np.repeat(group_starts, group_lengths))
+        return start.astype(np.int64), end.astype(np.int64)
+
+
+class ExponentialMovingWindowIndexer(BaseIndexer):
+    """Calculate ewm window bounds (the entire window)"""
+
+    @Appender(get_window_bounds_doc)
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: Optional[int] = None,
+        center: Optional[bool] = None,
+        closed: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+
+        return np.array([0], dtype=np.int64), np.array([num_values], dtype=np.int64)
+
+
+class GroupbyExponentialMovingWindowIndexer(BaseIndexer):
+    """Calculate groupby ewm window bounds (the entire window of each group)"""
+
+    def __init__(self, group_lengths: np.ndarray, **kwargs):
+        """
+        Parameters
+        ----------
+        group_lengths : ndarray[int64]
+            the number of values of each group, the values being sorted by group
+        **kwargs :
+            keyword arguments that will be available when get_window_bounds is called
+        """
+        self.group_lengths = group_lengths
+        super().__init__(**kwargs)
+
+    @Appender(get_window_bounds_doc)
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: Optional[int] = None,
+        center: Optional[bool] = None,
+        closed: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+
+        end = np.cumsum(self.group_lengths, dtype=np.int64)
+        return end - self.group_lengths, end
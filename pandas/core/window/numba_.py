@@ -6,11 +6,21 @@ from pandas._typing import Scalar
 from pandas.compat._optional import import_optional_dependency
 
 from pandas.core.util.numba_ import (
+    NUMBA_FUNC_CACHE,
     check_kwargs_and_nopython,
     get_jit_arguments,
     jit_user_function,
 )
 
+# integer codes of the quantile interpolation methods, passed to the kernels
+interpolation_codes = {
+    "linear": 0,
+    "lower": 1,
+    "higher": 2,
+    "nearest": 3,
+    "midpoint": 4,
+}
+
 
 def generate_numba_apply_func(
     args: Tuple,
@@ -72,3 +82,278 @@ def generate_numba_apply_func(
         return result
 
     return roll_apply
+
+
+def generate_numba_table_func(
+    args: Tuple,
+    kwargs: Dict[str, Any],
+    func: Callable[..., np.ndarray],
+    engine_kwargs: Optional[Dict[str, bool]],
+):
+    """
+    Generate a numba jitted apply function passing all the columns of each
+    window at once to the user's function.
+
+    1. jit the user's function
+    2. Return a rolling apply function with the jitted function inline
+
+    The user's function receives the 2D window of values and must return
+    either a scalar or a 1D array with a value per column.
+
+    Parameters
+    ----------
+    args : tuple
+        *args to be passed into the function
+    kwargs : dict
+        **kwargs to be passed into the function
+    func : function
+        function to be applied to each window and will be JITed
+    engine_kwargs : dict
+        dictionary of arguments to be passed into numba.jit
+
+    Returns
+    -------
+    Numba function
+    """
+    nopython, nogil, parallel = get_jit_arguments(engine_kwargs)
+
+    check_kwargs_and_nopython(kwargs, nopython)
+
+    numba_func = jit_user_function(func, nopython, nogil, parallel)
+
+    numba = import_optional_dependency("numba")
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def roll_table(
+        values: np.ndarray, begin: np.ndarray, end: np.ndarray, minimum_periods: int,
+    ) -> np.ndarray:
+        result = np.empty((len(begin), values.shape[1]))
+        for i in loop_range(len(result)):
+            start = begin[i]
+            stop = end[i]
+            window = values[start:stop]
+            count_nan = np.sum(np.isnan(window), axis=0)
+            result[i, :] = numba_func(window, *args)
+            for j in range(values.shape[1]):
+                if len(window) - count_nan[j] < minimum_periods:
+                    result[i, j] = np.nan
+        return result
+
+    return roll_table
+
+
+def _roll_sum(values: np.ndarray, nobs: int) -> float:
+    total = 0.0
+    for val in values:
+        if not np.isnan(val):
+            total += val
+    return total
+
+
+def _roll_mean(values: np.ndarray, nobs: int) -> float:
+    if nobs == 0:
+        return np.nan
+    total = 0.0
+    for val in values:
+        if not np.isnan(val):
+            total += val
+    return total / nobs
+
+
+def _roll_var(values: np.ndarray, nobs: int, ddof: int) -> float:
+    # two passes, as the windows are small compared to the data
+    if nobs <= ddof:
+        return np.nan
+    if nobs == 1:
+        return 0.0
+    mean = 0.0
+    for val in values:
+        if not np.isnan(val):
+            mean += val
+    mean /= nobs
+    ssqdm = 0.0
+    for val in values:
+        if not np.isnan(val):
+            ssqdm += (val - mean) ** 2
+    return ssqdm / (nobs - ddof)
+
+
+def _roll_min(values: np.ndarray, nobs: int) -> float:
+    if nobs == 0:
+        return np.nan
+    result = np.inf
+    for val in values:
+        if val < result:
+            result = val
+    return result
+
+
+def _roll_max(values: np.ndarray, nobs: int) -> float:
+    if nobs == 0:
+        return np.nan
+    result = -np.inf
+    for val in values:
+        if val > result:
+            result = val
+    return result
+
+
+def _roll_quantile(
+    values: np.ndarray, nobs: int, quantile: float, interpolation: int
+) -> float:
+    # same interpolation rules as the cython roll_quantile
+    if nobs == 0:
+        return np.nan
+    valid = np.sort(values[~np.isnan(values)])
+    if nobs == 1:
+        return valid[0]
+
+    idx_with_fraction = quantile * (nobs - 1)
+    idx = int(idx_with_fraction)
+    if idx_with_fraction == idx:
+        return valid[idx]
+
+    vlow = valid[idx]
+    vhigh = valid[idx + 1]
+    if interpolation == 0:
+        return vlow + (vhigh - vlow) * (idx_with_fraction - idx)
+    elif interpolation == 1:
+        return vlow
+    elif interpolation == 2:
+        return vhigh
+    elif interpolation == 3:
+        if idx_with_fraction - idx == 0.5:
+            if idx % 2 == 0:
+                return vlow
+            return vhigh
+        elif idx_with_fraction - idx < 0.5:
+            return vlow
+        return vhigh
+    return (vlow + vhigh) / 2.0
+
+
+def _roll_skew(values: np.ndarray, nobs: int) -> float:
+    if nobs < 3:
+        return np.nan
+    mean = 0.0
+    for val in values:
+        if not np.isnan(val):
+            mean += val
+    mean /= nobs
+    m2 = 0.0
+    m3 = 0.0
+    for val in values:
+        if not np.isnan(val):
+            delta = val - mean
+            m2 += delta ** 2
+            m3 += delta ** 3
+    B = m2 / nobs
+    if B <= 0:
+        return np.nan
+    C = m3 / nobs
+    return np.sqrt(nobs * (nobs - 1.0)) * C / ((nobs - 2) * B ** 1.5)
+
+
+def _roll_kurt(values: np.ndarray, nobs: int) -> float:
+    if nobs < 4:
+        return np.nan
+    mean = 0.0
+    for val in values:
+        if not np.isnan(val):
+            mean += val
+    mean /= nobs
+    m2 = 0.0
+    m4 = 0.0
+    for val in values:
+        if not np.isnan(val):
+            delta = val - mean
+            m2 += delta ** 2
+            m4 += delta ** 4
+    B = m2 / nobs
+    if B == 0:
+        return np.nan
+    D = m4 / nobs
+    K = (nobs * nobs - 1.0) * D / (B * B) - 3 * ((nobs - 1.0) ** 2)
+    return K / ((nobs - 2.0) * (nobs - 3.0))
+
+
+_reductions: Dict[str, Callable[..., float]] = {
+    "sum": _roll_sum,
+    "mean": _roll_mean,
+    "var": _roll_var,
+    "min": _roll_min,
+    "max": _roll_max,
+    "quantile": _roll_quantile,
+    "skew": _roll_skew,
+    "kurt": _roll_kurt,
+}
+
+
+def generate_numba_reduction_func(
+    how: str, engine_kwargs: Optional[Dict[str, bool]]
+) -> Callable:
+    """
+    Generate a numba jitted function computing a built-in reduction of each
+    window of each column.
+
+    The returned function takes the values as a 2D array, the start and end
+    bounds of the windows, the minimum number of observations and the
+    arguments of the reduction (ddof for var, the quantile and the
+    interpolation code for quantile), and returns an array of shape
+    (nwindows, ncolumns). The columns are computed in parallel with
+    ``parallel=True``.
+
+    Parameters
+    ----------
+    how : {'sum', 'mean', 'var', 'min', 'max', 'quantile', 'skew', 'kurt'}
+        Name of the reduction.
+    engine_kwargs : dict
+        dictionary of arguments to be passed into numba.jit
+
+    Returns
+    -------
+    Numba function
+    """
+    nopython, nogil, parallel = get_jit_arguments(engine_kwargs)
+
+    cache_key = (_reductions[how], f"rolling_{how}_{nopython}_{nogil}_{parallel}")
+    if cache_key in NUMBA_FUNC_CACHE:
+        return NUMBA_FUNC_CACHE[cache_key]
+
+    numba = import_optional_dependency("numba")
+
+    reduction = numba.jit(_reductions[how], nopython=nopython, nogil=nogil)
+
+    if parallel:
+        loop_range = numba.prange
+    else:
+        loop_range = range
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def roll_reduce(
+        values: np.ndarray,
+        begin: np.ndarray,
+        end: np.ndarray,
+        minimum_periods: int,
+        *args,
+    ) -> np.ndarray:
+        num_windows = len(begin)
+        num_columns = values.shape[1]
+        result = np.empty((num_windows, num_columns))
+        for j in loop_range(num_columns):
+            for i in range(num_windows):
+                window = values[begin[i] : end[i], j]
+                nobs = len(window) - np.sum(np.isnan(window))
+                if nobs >= minimum_periods:
+                    result[i, j] = reduction(window, nobs, *args)
+                else:
+                    result[i, j] = np.nan
+        return result
+
+    NUMBA_FUNC_CACHE[cache_key] = roll_reduce
+    return roll_reduce
@@ -6,13 +6,13 @@ from datetime import timedelta
 from functools import partial
 import inspect
 from textwrap import dedent
-from typing import Callable, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 
 from pandas._libs.tslibs import to_offset
 import pandas._libs.window.aggregations as window_aggregations
-from pandas._typing import Axis, FrameOrSeries, Scalar
+from pandas._typing import Axis, FrameOrSeries, Label, Scalar
 from pandas.compat._optional import import_optional_dependency
 from pandas.compat.numpy import function as nv
 from pandas.util._decorators import Appender, Substitution, cache_readonly
@@ -38,7 +38,7 @@ from pandas.core.dtypes.generic import (
 from pandas.core.base import DataError, PandasObject, SelectionMixin, ShallowMixin
 import pandas.core.common as com
 from pandas.core.construction import extract_array
-from pandas.core.indexes.api import Index, MultiIndex, ensure_index
+from pandas.core.indexes.api import Index, ensure_index
 from pandas.core.util.numba_ import NUMBA_FUNC_CACHE
 from pandas.core.window.common import (
     WindowGroupByMixin,
@@ -50,10 +50,14 @@ from pandas.core.window.common import (
 from pandas.core.window.indexers import (
     BaseIndexer,
     FixedWindowIndexer,
-    GroupbyRollingIndexer,
     VariableWindowIndexer,
 )
-from pandas.core.window.numba_ import generate_numba_apply_func
+from pandas.core.window.numba_ import (
+    generate_numba_apply_func,
+    generate_numba_reduction_func,
+    generate_numba_table_func,
+    interpolation_codes,
+)
 
 from pandas.tseries.offsets import DateOffset
 
@@ -133,6 +137,20 @@ def get_weighted_roll_func(cfunc: Callable) -> Callable:
     return func
 
 
+def _use_numba(engine: str, engine_kwargs: Optional[Dict]) -> bool:
+    """
+    Validate the engine of a built-in aggregation and return whether it is
+    computed with numba.
+    """
+    if engine == "numba":
+        return True
+    elif engine == "cython":
+        if engine_kwargs is not None:
+            raise ValueError("cython engine does not accept engine_kwargs")
+        return False
+    raise ValueError("engine must be either 'numba' or 'cython'")
+
+
 class _Window(PandasObject, ShallowMixin, SelectionMixin):
     _attributes: List[str] = [
         "window",
@@ -469,15 +487,20 @@ class _Window(PandasObject, ShallowMixin, SelectionMixin):
             )
         return window_func
 
-    def _get_cython_func_type(self, func: str) -> Callable:
+    def _get_cython_func_type(self, func: str, table: bool = False) -> Callable:
         """
         Return a variable or fixed cython function type.
 
-        Variable algorithms do not use window while fixed do.
+        Variable algorithms do not use window while fixed do. With
+        ``table=True`` the function computes all the columns of a 2D array
+        over the same window bounds in a single call.
         """
+        suffix = "_2d" if table else ""
         if self.is_freq_type or isinstance(self.window, BaseIndexer):
-            return self._get_roll_func(f"{func}_variable")
-        return partial(self._get_roll_func(f"{func}_fixed"), win=self._get_window())
+            return self._get_roll_func(f"{func}_variable{suffix}")
+        return partial(
+            self._get_roll_func(f"{func}_fixed{suffix}"), win=self._get_window()
+        )
 
     def _get_window_indexer(self, window: int) -> BaseIndexer:
         """
@@ -498,6 +521,8 @@ class _Window(PandasObject, ShallowMixin, SelectionMixin):
         is_weighted: bool = False,
         name: Optional[str] = None,
         use_numba_cache: bool = False,
+        method: str = "single",
+        keys: Optional[Sequence[Label]] = None,
         **kwargs,
     ):
         """
@@ -517,6 +542,13 @@ class _Window(PandasObject, ShallowMixin, SelectionMixin):
         use_numba_cache : bool
             whether to cache a numba compiled function. Only available for numba
             enabled methods (so far only apply)
+        method : {'single', 'table'}, default 'single'
+            whether func is called on each column ('single') or on the 2D
+            values of all the columns of a block at once ('table')
+        keys : sequence, optional
+            with method='table', func returns a result per key along a last
+            axis, and the results are concatenated as columns labelled by the
+            keys
         **kwargs
             additional arguments for rolling function and window function
 
@@ -546,12 +578,24 @@ class _Window(PandasObject, ShallowMixin, SelectionMixin):
                     raise DataError("No numeric types to aggregate") from err
 
             if values.size == 0:
+                if keys is not None:
+                    values = np.repeat(values[..., np.newaxis], len(keys), axis=-1)
                 results.append(values.copy())
                 continue
 
+            if method == "table":
+                # the rows to roll over as the first axis, one column per series
+                if values.ndim == 1:
+                    table = values.reshape(-1, 1)
+                else:
+                    table = values if self.axis == 0 else values.T
+
             # calculation function
             offset = calculate_center_offset(window) if center else 0
-            additional_nans = np.array([np.nan] * offset)
+            if method == "table":
+                additional_nans = np.full((offset, table.shape[1]), np.nan)
+            else:
+                additional_nans = np.array([np.nan] * offset)
 
             if not is_weighted:
 
@@ -584,20 +628,40 @@ class _Window(PandasObject, ShallowMixin, SelectionMixin):
                     return func(x, window, self.min_periods)
 
             with np.errstate(all="ignore"):
-                if values.ndim > 1:
+                if method == "table":
+                    result = calc(table)
+                    if values.ndim == 1:
+                        result = result[:, 0]
+                    elif self.axis == 1:
+                        result = np.swapaxes(result, 0, 1)
+                elif values.ndim > 1:
                     result = np.apply_along_axis(calc, self.axis, values)
                 else:
                     result = calc(values)
                     result = np.asarray(result)
 
             if use_numba_cache:
-                NUMBA_FUNC_CACHE[(kwargs["original_func"], "rolling_apply")] = func
+                cache_name = "rolling_apply" if method == "single" else "rolling_table"
+                NUMBA_FUNC_CACHE[(kwargs["original_func"], cache_name)] = func
 
             if center:
                 result = self._center_window(result, window)
 
             results.append(result)
 
+        if keys is not None:
+            from pandas import concat
+
+            return concat(
+                [
+                    self._wrap_results(
+                        [result[..., k] for result in results], block_list, obj, exclude
+                    )
+                    for k in range(len(keys))
+                ],
+                axis=1,
+                keys=keys,
+            )
         return self._wrap_results(results, block_list, obj, exclude)
 
     def aggregate(self, func, *args, **kwargs):
@@ -1318,6 +1382,14 @@ class _Rolling_and_Expanding(_Rolling):
         Positional arguments to be passed into func.
     kwargs : dict, default None
         Keyword arguments to be passed into func.
+    method : {'single', 'table'}, default 'single'
+        * ``'single'`` : passes each column of each window to ``func``.
+        * ``'table'`` : passes the values of all the columns of each window
+          as a 2D ndarray to ``func``, which must return a scalar or an
+          ndarray with a value per column. Only available with
+          ``engine='numba'``.
+
+          .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -1346,6 +1418,7 @@ class _Rolling_and_Expanding(_Rolling):
         engine_kwargs: Optional[Dict] = None,
         args: Optional[Tuple] = None,
         kwargs: Optional[Dict] = None,
+        method: str = "single",
     ):
         if args is None:
             args = ()
@@ -1357,35 +1430,45 @@ class _Rolling_and_Expanding(_Rolling):
         offset = calculate_center_offset(window) if self.center else 0
         if not is_bool(raw):
             raise ValueError("raw parameter must be `True` or `False`")
+        if method not in ("single", "table"):
+            raise ValueError("method must be either 'single' or 'table'")
 
         if engine == "cython":
             if engine_kwargs is not None:
                 raise ValueError("cython engine does not accept engine_kwargs")
+            if method == "table":
+                raise ValueError("method='table' requires engine='numba'")
             apply_func = self._generate_cython_apply_func(
                 args, kwargs, raw, offset, func
             )
         elif engine == "numba":
             if raw is False:
                 raise ValueError("raw must be `True` when using the numba engine")
-            cache_key = (func, "rolling_apply")
+            if method == "single":
+                cache_key = (func, "rolling_apply")
+                generate_func = generate_numba_apply_func
+            else:
+                cache_key = (func, "rolling_table")
+                generate_func = generate_numba_table_func
             if cache_key in NUMBA_FUNC_CACHE:
                 # Return an already compiled version of roll_apply if available
                 apply_func = NUMBA_FUNC_CACHE[cache_key]
             else:
-                apply_func = generate_numba_apply_func(
-                    args, kwargs, func, engine_kwargs
-                )
+                apply_func = generate_func(args, kwargs, func, engine_kwargs)
         else:
             raise ValueError("engine must be either 'numba' or 'cython'")
 
         # TODO: Why do we always pass center=False?
+        # The cython roll_generic centers the windows itself, the numba
+        # functions rely on _apply to do it
         # name=func & raw=raw for WindowGroupByMixin._apply
         return self._apply(
             apply_func,
-            center=False,
+            center=self.center if engine == "numba" else False,
             floor=0,
             name=func,
             use_numba_cache=engine == "numba",
+            method=method,
             raw=raw,
             original_func=func,
             args=args,
@@ -1411,12 +1494,35 @@ class _Rolling_and_Expanding(_Rolling):
 
         return apply_func
 
-    def sum(self, *args, **kwargs):
+    def _numba_apply(
+        self, how: str, engine_kwargs: Optional[Dict], *aggregator_args, **kwargs
+    ):
+        """
+        Compute a built-in aggregation of the windows of all the columns of a
+        block at once with a numba jitted kernel.
+        """
+        aggregator = generate_numba_reduction_func(how, engine_kwargs)
+
+        def window_func(values, begin, end, min_periods):
+            return aggregator(values, begin, end, min_periods, *aggregator_args)
+
+        return self._apply(
+            window_func, center=self.center, name=how, method="table", **kwargs
+        )
+
+    def sum(self, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("sum", args, kwargs)
-        window_func = self._get_cython_func_type("roll_sum")
         kwargs.pop("floor", None)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply("sum", engine_kwargs, floor=0, **kwargs)
+        window_func = self._get_cython_func_type("roll_sum", table=True)
         return self._apply(
-            window_func, center=self.center, floor=0, name="sum", **kwargs
+            window_func,
+            center=self.center,
+            floor=0,
+            name="sum",
+            method="table",
+            **kwargs,
         )
 
     _shared_docs["max"] = dedent(
@@ -1430,8 +1536,10 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def max(self, *args, **kwargs):
+    def max(self, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("max", args, kwargs)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply("max", engine_kwargs, **kwargs)
         window_func = self._get_cython_func_type("roll_max")
         return self._apply(window_func, center=self.center, name="max", **kwargs)
 
@@ -1472,15 +1580,21 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def min(self, *args, **kwargs):
+    def min(self, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("min", args, kwargs)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply("min", engine_kwargs, **kwargs)
         window_func = self._get_cython_func_type("roll_min")
         return self._apply(window_func, center=self.center, name="min", **kwargs)
 
-    def mean(self, *args, **kwargs):
+    def mean(self, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("mean", args, kwargs)
-        window_func = self._get_cython_func_type("roll_mean")
-        return self._apply(window_func, center=self.center, name="mean", **kwargs)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply("mean", engine_kwargs, **kwargs)
+        window_func = self._get_cython_func_type("roll_mean", table=True)
+        return self._apply(
+            window_func, center=self.center, name="mean", method="table", **kwargs
+        )
 
     _shared_docs["median"] = dedent(
         """
@@ -1519,16 +1633,37 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def median(self, **kwargs):
-        window_func = self._get_roll_func("roll_median_c")
+    def median(self, engine="cython", engine_kwargs=None, **kwargs):
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply(
+                "quantile", engine_kwargs, 0.5, interpolation_codes["linear"], **kwargs
+            )
+        # two heaps for fixed windows, a skiplist for variable windows
+        window_func = self._get_cython_func_type("roll_median")
         # GH 32865. Move max window size calculation to
         # the median function implementation
         return self._apply(window_func, center=self.center, name="median", **kwargs)
 
-    def std(self, ddof=1, *args, **kwargs):
+    def std(self, ddof=1, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("std", args, kwargs)
         kwargs.pop("require_min_periods", None)
-        window_func = self._get_cython_func_type("roll_var")
+        if _use_numba(engine, engine_kwargs):
+            aggregator = generate_numba_reduction_func("var", engine_kwargs)
+
+            def zsqrt_func(values, begin, end, min_periods):
+                return zsqrt(aggregator(values, begin, end, min_periods, ddof))
+
+            return self._apply(
+                zsqrt_func,
+                center=self.center,
+                require_min_periods=1,
+                name="std",
+                method="table",
+                ddof=ddof,
+                **kwargs,
+            )
+
+        window_func = self._get_cython_func_type("roll_var", table=True)
 
         def zsqrt_func(values, begin, end, min_periods):
             return zsqrt(window_func(values, begin, end, min_periods, ddof=ddof))
@@ -1539,20 +1674,28 @@ class _Rolling_and_Expanding(_Rolling):
             center=self.center,
             require_min_periods=1,
             name="std",
+            method="table",
             ddof=ddof,
             **kwargs,
         )
 
-    def var(self, ddof=1, *args, **kwargs):
+    def var(self, ddof=1, *args, engine="cython", engine_kwargs=None, **kwargs):
         nv.validate_window_func("var", args, kwargs)
         kwargs.pop("require_min_periods", None)
-        window_func = partial(self._get_cython_func_type("roll_var"), ddof=ddof)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply(
+                "var", engine_kwargs, ddof, require_min_periods=1, ddof=ddof, **kwargs
+            )
+        window_func = partial(
+            self._get_cython_func_type("roll_var", table=True), ddof=ddof
+        )
         # ddof passed again for compat with groupby.rolling
         return self._apply(
             window_func,
             center=self.center,
             require_min_periods=1,
             name="var",
+            method="table",
             ddof=ddof,
             **kwargs,
         )
@@ -1568,14 +1711,19 @@ class _Rolling_and_Expanding(_Rolling):
         Keyword arguments to be passed into func.
     """
 
-    def skew(self, **kwargs):
-        window_func = self._get_cython_func_type("roll_skew")
+    def skew(self, engine="cython", engine_kwargs=None, **kwargs):
         kwargs.pop("require_min_periods", None)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply(
+                "skew", engine_kwargs, require_min_periods=3, **kwargs
+            )
+        window_func = self._get_cython_func_type("roll_skew", table=True)
         return self._apply(
             window_func,
             center=self.center,
             require_min_periods=3,
             name="skew",
+            method="table",
             **kwargs,
         )
 
@@ -1611,14 +1759,19 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def kurt(self, **kwargs):
-        window_func = self._get_cython_func_type("roll_kurt")
+    def kurt(self, engine="cython", engine_kwargs=None, **kwargs):
         kwargs.pop("require_min_periods", None)
+        if _use_numba(engine, engine_kwargs):
+            return self._numba_apply(
+                "kurt", engine_kwargs, require_min_periods=4, **kwargs
+            )
+        window_func = self._get_cython_func_type("roll_kurt", table=True)
         return self._apply(
             window_func,
             center=self.center,
             require_min_periods=4,
             name="kurt",
+            method="table",
             **kwargs,
         )
 
@@ -1628,8 +1781,12 @@ class _Rolling_and_Expanding(_Rolling):
 
     Parameters
     ----------
-    quantile : float
-        Quantile to compute. 0 <= quantile <= 1.
+    quantile : float or list-like of float
+        Quantile to compute. 0 <= quantile <= 1. With a list-like, the
+        quantiles of each window are computed together and returned as a
+        DataFrame with a column per quantile, per column of the caller.
+
+        .. versionchanged:: 1.1.0
     interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
         .. versionadded:: 0.23.0
 
@@ -1678,7 +1835,30 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def quantile(self, quantile, interpolation="linear", **kwargs):
+    def quantile(
+        self,
+        quantile,
+        interpolation="linear",
+        engine="cython",
+        engine_kwargs=None,
+        **kwargs,
+    ):
+        if is_list_like(quantile):
+            return self._quantiles(
+                quantile, interpolation, engine, engine_kwargs, **kwargs
+            )
+        if _use_numba(engine, engine_kwargs):
+            if interpolation not in interpolation_codes:
+                raise ValueError(f"Interpolation '{interpolation}' is not supported")
+            return self._numba_apply(
+                "quantile",
+                engine_kwargs,
+                quantile,
+                interpolation_codes[interpolation],
+                quantile=quantile,
+                interpolation=interpolation,
+                **kwargs,
+            )
         if quantile == 1.0:
             window_func = self._get_cython_func_type("roll_max")
         elif quantile == 0.0:
@@ -1696,6 +1876,267 @@ class _Rolling_and_Expanding(_Rolling):
         kwargs["interpolation"] = interpolation
         return self._apply(window_func, center=self.center, name="quantile", **kwargs)
 
+    def _quantiles(self, quantiles, interpolation, engine, engine_kwargs, **kwargs):
+        """
+        Compute several quantiles, maintaining a single skiplist per column
+        with the cython engine.
+
+        Returns a DataFrame with a column per quantile for a Series, and a
+        column per pair of column and quantile for a DataFrame.
+        """
+        from pandas import concat
+
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if quantiles.ndim != 1 or len(quantiles) == 0:
+            raise ValueError("quantile must be a scalar or a non-empty 1D list-like")
+
+        if _use_numba(engine, engine_kwargs):
+            result = concat(
+                [
+                    self.quantile(
+                        q, interpolation, engine=engine, engine_kwargs=engine_kwargs
+                    )
+                    for q in quantiles
+                ],
+                axis=1,
+                keys=quantiles,
+            )
+        else:
+            window_func = partial(
+                self._get_roll_func("roll_quantiles"),
+                win=self._get_window(),
+                quantiles=quantiles,
+                interpolation=interpolation,
+            )
+
+            def compute_all(values, begin, end, min_periods):
+                # the quantiles of each column of a block along the last axis
+                return np.stack(
+                    [
+                        window_func(values[:, j], begin, end, min_periods)
+                        for j in range(values.shape[1])
+                    ],
+                    axis=1,
+                )
+
+            result = self._apply(
+                compute_all,
+                center=self.center,
+                name="quantile",
+                method="table",
+                keys=quantiles,
+                interpolation=interpolation,
+                **kwargs,
+            )
+
+        if result.columns.nlevels > 1:
+            # group the quantiles of each column
+            ncols = len(result.columns) // len(quantiles)
+            indexer = [
+                k * ncols + j for j in range(ncols) for k in range(len(quantiles))
+            ]
+            result = result.iloc[:, indexer]
+            result.columns = result.columns.swaplevel()
+        return result
+
+    _shared_docs["rank"] = dedent(
+        """
+    Calculate the %(name)s rank of each value within its window.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    method : {'average', 'min', 'max'}, default 'average'
+        How to rank the group of records that have the same value:
+
+            * average: average rank of the group
+            * min: lowest rank in the group
+            * max: highest rank in the group
+    ascending : bool, default True
+        Whether or not the elements should be ranked in ascending order.
+    pct : bool, default False
+        Whether or not to display the returned rankings in percentile
+        form.
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    pandas.Series.%(name)s : Calling object with Series data.
+    pandas.DataFrame.%(name)s : Calling object with DataFrames.
+    pandas.Series.rank : Equivalent method for Series.
+    pandas.DataFrame.rank : Equivalent method for DataFrame.
+
+    Examples
+    --------
+    >>> s = pd.Series([1, 4, 2, 3, 5, 3])
+    >>> s.rolling(3).rank()
+    0    NaN
+    1    NaN
+    2    2.0
+    3    2.0
+    4    3.0
+    5    1.5
+    dtype: float64
+    """
+    )
+
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        if self.center:
+            raise NotImplementedError("center is not implemented for rank")
+        window_func = partial(
+            self._get_roll_func("roll_rank"),
+            percentile=pct,
+            method=method,
+            ascending=ascending,
+        )
+
+        # Pass through for groupby.rolling
+        kwargs["method"] = method
+        kwargs["ascending"] = ascending
+        kwargs["pct"] = pct
+        return self._apply(window_func, center=False, name="rank", **kwargs)
+
+    _shared_docs["argmax"] = dedent(
+        """
+    Calculate the %(name)s position of the maximum.
+
+    The position is relative to the start of the window, and is the one of
+    the first occurrence of the maximum, NaNs being ignored.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    pandas.Series.%(name)s : Calling object with Series data.
+    pandas.DataFrame.%(name)s : Calling object with DataFrames.
+    pandas.Series.argmax : Similar method for Series.
+
+    Examples
+    --------
+    >>> s = pd.Series([3, 1, 2, 5, 4])
+    >>> s.rolling(3).argmax()
+    0    NaN
+    1    NaN
+    2    0.0
+    3    2.0
+    4    1.0
+    dtype: float64
+    """
+    )
+
+    def argmax(self, **kwargs):
+        window_func = self._get_roll_func("roll_argmax")
+        return self._apply(window_func, center=self.center, name="argmax", **kwargs)
+
+    _shared_docs["argmin"] = dedent(
+        """
+    Calculate the %(name)s position of the minimum.
+
+    The position is relative to the start of the window, and is the one of
+    the first occurrence of the minimum, NaNs being ignored.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    pandas.Series.%(name)s : Calling object with Series data.
+    pandas.DataFrame.%(name)s : Calling object with DataFrames.
+    pandas.Series.argmin : Similar method for Series.
+
+    Examples
+    --------
+    >>> s = pd.Series([3, 1, 2, 5, 4])
+    >>> s.rolling(3).argmin()
+    0    NaN
+    1    NaN
+    2    1.0
+    3    0.0
+    4    0.0
+    dtype: float64
+    """
+    )
+
+    def argmin(self, **kwargs):
+        window_func = self._get_roll_func("roll_argmin")
+        return self._apply(window_func, center=self.center, name="argmin", **kwargs)
+
+    _shared_docs["nunique"] = dedent(
+        """
+    Calculate the %(name)s number of distinct values.
+
+    NaNs are not counted.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    pandas.Series.%(name)s : Calling object with Series data.
+    pandas.DataFrame.%(name)s : Calling object with DataFrames.
+    pandas.Series.nunique : Equivalent method for Series.
+    pandas.DataFrame.nunique : Equivalent method for DataFrame.
+
+    Examples
+    --------
+    >>> s = pd.Series([1, 2, 1, 1, 3])
+    >>> s.rolling(3).nunique()
+    0    NaN
+    1    NaN
+    2    2.0
+    3    2.0
+    4    2.0
+    dtype: float64
+    """
+    )
+
+    def nunique(self, **kwargs):
+        window_func = self._get_roll_func("roll_nunique")
+        return self._apply(window_func, center=self.center, name="nunique", **kwargs)
+
     _shared_docs[
         "cov"
     ] = """
@@ -1720,7 +2161,17 @@ class _Rolling_and_Expanding(_Rolling):
             Keyword arguments to be passed into func.
     """
 
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+    def cov(
+        self,
+        other=None,
+        pairwise=None,
+        ddof=1,
+        engine="cython",
+        engine_kwargs=None,
+        **kwargs,
+    ):
+        # validate eagerly as the means are only computed per pair of columns
+        _use_numba(engine, engine_kwargs)
         if other is None:
             other = self._selected_obj
             # only default unset
@@ -1746,7 +2197,7 @@ class _Rolling_and_Expanding(_Rolling):
             Y = Y.astype("float64")
             mean = lambda x: x.rolling(
                 window, self.min_periods, center=self.center
-            ).mean(**kwargs)
+            ).mean(engine=engine, engine_kwargs=engine_kwargs, **kwargs)
             count = (
                 (X + Y)
                 .rolling(window=window, min_periods=0, center=self.center)
@@ -1869,7 +2320,10 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def corr(self, other=None, pairwise=None, **kwargs):
+    def corr(
+        self, other=None, pairwise=None, engine="cython", engine_kwargs=None, **kwargs
+    ):
+        _use_numba(engine, engine_kwargs)
         if other is None:
             other = self._selected_obj
             # only default unset
@@ -1892,7 +2346,10 @@ class _Rolling_and_Expanding(_Rolling):
                 window=window, min_periods=self.min_periods, center=self.center
             )
 
-            return a.cov(b, **kwargs) / (a.std(**kwargs) * b.std(**kwargs))
+            engine_args = {"engine": engine, "engine_kwargs": engine_kwargs}
+            return a.cov(b, **engine_args, **kwargs) / (
+                a.std(**engine_args, **kwargs) * b.std(**engine_args, **kwargs)
+            )
 
         return _flex_binary_moment(
             self._selected_obj, other._selected_obj, _get_corr, pairwise=bool(pairwise)
@@ -2033,6 +2490,47 @@ class Rolling(_Rolling_and_Expanding):
 
     agg = aggregate
 
+    def online(self) -> "OnlineRolling":
+        """
+        Return an object computing the rolling window calculations of new
+        rows, keeping only the rows of the last window instead of the whole
+        history.
+
+        .. versionadded:: 1.1.0
+
+        Returns
+        -------
+        OnlineRolling
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"A": [1.0, 2.0, 3.0]})
+        >>> online = df.rolling(2).online()
+        >>> online.sum()
+             A
+        0  NaN
+        1  3.0
+        2  5.0
+        >>> online.sum(update=pd.DataFrame({"A": [4.0, 5.0]}, index=[3, 4]))
+             A
+        3  7.0
+        4  9.0
+
+        Each method keeps its own rows, so the same rows are passed to each
+        of the statistics.
+
+        >>> online.max()
+             A
+        0  NaN
+        1  2.0
+        2  3.0
+        >>> online.max(update=pd.DataFrame({"A": [4.0, 5.0]}, index=[3, 4]))
+             A
+        3  4.0
+        4  5.0
+        """
+        return OnlineRolling(self)
+
     @Substitution(name="rolling")
     @Appender(_shared_docs["count"])
     def count(self):
@@ -2056,6 +2554,7 @@ class Rolling(_Rolling_and_Expanding):
         engine_kwargs=None,
         args=None,
         kwargs=None,
+        method="single",
     ):
         return super().apply(
             func,
@@ -2064,6 +2563,7 @@ class Rolling(_Rolling_and_Expanding):
             engine_kwargs=engine_kwargs,
             args=args,
             kwargs=kwargs,
+            method=method,
         )
 
     @Substitution(name="rolling")
@@ -2152,6 +2652,26 @@ class Rolling(_Rolling_and_Expanding):
             quantile=quantile, interpolation=interpolation, **kwargs
         )
 
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["rank"])
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        return super().rank(method=method, ascending=ascending, pct=pct, **kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["argmax"])
+    def argmax(self, **kwargs):
+        return super().argmax(**kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["argmin"])
+    def argmin(self, **kwargs):
+        return super().argmin(**kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["nunique"])
+    def nunique(self, **kwargs):
+        return super().nunique(**kwargs)
+
     @Substitution(name="rolling", func_name="cov")
     @Appender(_doc_template)
     @Appender(_shared_docs["cov"])
@@ -2172,105 +2692,10 @@ class RollingGroupby(WindowGroupByMixin, Rolling):
     Provide a rolling groupby implementation.
     """
 
-    def _apply(
-        self,
-        func: Callable,
-        center: bool,
-        require_min_periods: int = 0,
-        floor: int = 1,
-        is_weighted: bool = False,
-        name: Optional[str] = None,
-        use_numba_cache: bool = False,
-        **kwargs,
-    ):
-        result = Rolling._apply(
-            self,
-            func,
-            center,
-            require_min_periods,
-            floor,
-            is_weighted,
-            name,
-            use_numba_cache,
-            **kwargs,
-        )
-        # Cannot use _wrap_outputs because we calculate the result all at once
-        # Compose MultiIndex result from grouping levels then rolling level
-        # Aggregate the MultiIndex data as tuples then the level names
-        grouped_object_index = self._groupby._selected_obj.index
-        grouped_index_name = [grouped_object_index.name]
-        groupby_keys = [grouping.name for grouping in self._groupby.grouper._groupings]
-        result_index_names = groupby_keys + grouped_index_name
-
-        result_index_data = []
-        for key, values in self._groupby.grouper.indices.items():
-            for value in values:
-                if not is_list_like(key):
-                    data = [key, grouped_object_index[value]]
-                else:
-                    data = [*key, grouped_object_index[value]]
-                result_index_data.append(tuple(data))
-
-        result_index = MultiIndex.from_tuples(
-            result_index_data, names=result_index_names
-        )
-        result.index = result_index
-        return result
-
     @property
     def _constructor(self):
         return Rolling
 
-    def _create_blocks(self, obj: FrameOrSeries):
-        """
-        Split data into blocks & return conformed data.
-        """
-        # Ensure the object we're rolling over is monotonically sorted relative
-        # to the groups
-        groupby_order = np.concatenate(
-            list(self._groupby.grouper.indices.values())
-        ).astype(np.int64)
-        obj = obj.take(groupby_order)
-        return super()._create_blocks(obj)
-
-    def _get_cython_func_type(self, func: str) -> Callable:
-        """
-        Return the cython function type.
-
-        RollingGroupby needs to always use "variable" algorithms since processing
-        the data in group order may not be monotonic with the data which
-        "fixed" algorithms assume
-        """
-        return self._get_roll_func(f"{func}_variable")
-
-    def _get_window_indexer(self, window: int) -> GroupbyRollingIndexer:
-        """
-        Return an indexer class that will compute the window start and end bounds
-
-        Parameters
-        ----------
-        window : int
-            window size for FixedWindowIndexer
-
-        Returns
-        -------
-        GroupbyRollingIndexer
-        """
-        rolling_indexer: Union[Type[FixedWindowIndexer], Type[VariableWindowIndexer]]
-        if self.is_freq_type:
-            rolling_indexer = VariableWindowIndexer
-            index_array = self._groupby._selected_obj.index.asi8
-        else:
-            rolling_indexer = FixedWindowIndexer
-            index_array = None
-        window_indexer = GroupbyRollingIndexer(
-            index_array=index_array,
-            window_size=window,
-            groupby_indicies=self._groupby.indices,
-            rolling_indexer=rolling_indexer,
-        )
-        return window_indexer
-
     def _gotitem(self, key, ndim, subset=None):
         # we are setting the index on the actual object
         # here so our index is carried thru to the selected obj
@@ -2288,3 +2713,145 @@ class RollingGroupby(WindowGroupByMixin, Rolling):
         level.
         """
         pass
+
+
+def _online_dispatch(name: str):
+    """
+    Dispatch to the rolling window calculation over the rows kept and the
+    new rows.
+    """
+
+    def outer(self, *args, update=None, **kwargs):
+        # each method and arguments has its own rows kept
+        key = (name, repr(args), repr(sorted(kwargs.items())))
+        return self._apply_online(
+            lambda rolling: getattr(rolling, name)(*args, **kwargs), update, key
+        )
+
+    outer.__name__ = name
+    outer.__doc__ = f"""
+    Rolling {name} of the initial data, or of the rows of ``update``.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Arguments and keyword arguments of :meth:`Rolling.{name}`.
+    update : Series or DataFrame, optional
+        New rows following the rows seen so far by this method with the
+        same arguments. If not passed, the rows kept are reset and the
+        calculation is done over the initial data.
+
+    Returns
+    -------
+    Series or DataFrame
+    """
+    return outer
+
+
+class OnlineRolling:
+    """
+    Rolling window calculations updated with new rows.
+
+    Only the rows which can be in the window of a new row are kept after each
+    call, i.e. the last ``window - 1`` rows of a fixed window or the rows
+    within the window of the last row of an offset based window. The windows
+    of the new rows are computed over these rows and the new rows, so the cost
+    of an update is proportional to the window and the number of new rows.
+    Returned by :meth:`Rolling.online`.
+
+    The rows are kept separately for each method and its arguments, so the
+    same new rows are passed to each of the statistics computed.
+
+    Parameters
+    ----------
+    rolling : Rolling
+        The rolling window over the initial data.
+    """
+
+    def __init__(self, rolling: Rolling):
+        if rolling.axis != 0:
+            raise NotImplementedError("online is only implemented for axis=0")
+        if rolling.center:
+            raise NotImplementedError("online is not implemented for center=True")
+        if isinstance(rolling.window, BaseIndexer):
+            raise NotImplementedError(
+                "online is not implemented for BaseIndexer subclasses"
+            )
+        self._rolling_kwargs = dict(
+            window=rolling.win_freq if rolling.is_freq_type else rolling.window,
+            min_periods=rolling.min_periods,
+            on=rolling.on,
+            closed=rolling.closed,
+        )
+        self._selection = rolling._selection
+        self.obj = rolling.obj
+        self._kept: Dict[Tuple[str, str, str], FrameOrSeries] = {}
+
+    def reset(self) -> None:
+        """
+        Discard the rows kept.
+        """
+        self._kept = {}
+
+    def _get_rolling(self, data: FrameOrSeries) -> Rolling:
+        rolling = data.rolling(**self._rolling_kwargs)
+        if self._selection is not None:
+            rolling = rolling[self._selection]
+        return rolling
+
+    def _rows_to_keep(self, rolling: Rolling) -> slice:
+        """
+        The rows which can be in the window of a row following ``rolling``.
+        """
+        nrows = len(rolling.obj)
+        if not nrows:
+            return slice(None)
+        if rolling.is_freq_type:
+            # the index is monotonic, so these rows are the last rows
+            on = rolling._on.asi8
+            within = np.abs(on - on[-1]) <= rolling.window
+            return slice(int(within.argmax()), None)
+        return slice(max(nrows - max(rolling.window - 1, 0), 0), None)
+
+    def _apply_online(
+        self,
+        func: Callable,
+        update: Optional[FrameOrSeries],
+        key: Tuple[str, str, str],
+    ):
+        if update is None:
+            data = self.obj
+            nkept = 0
+        else:
+            if key not in self._kept:
+                raise ValueError(
+                    f"Must call {key[0]} with update=None first before passing update"
+                )
+            if not isinstance(update, type(self.obj)):
+                raise TypeError(f"update must be a {type(self.obj).__name__}")
+            if update.ndim == 2 and not update.columns.equals(self.obj.columns):
+                raise ValueError("update must have the same columns as the object")
+            from pandas import concat
+
+            data = concat([self._kept[key], update])
+            nkept = len(self._kept[key])
+
+        rolling = self._get_rolling(data)
+        result = func(rolling)
+        self._kept[key] = data.iloc[self._rows_to_keep(rolling)]
+        return result.iloc[nkept:]
+
+    count = _online_dispatch("count")
+    sum = _online_dispatch("sum")
+    mean = _online_dispatch("mean")
+    median = _online_dispatch("median")
+    var = _online_dispatch("var")
+    std = _online_dispatch("std")
+    min = _online_dispatch("min")
+    max = _online_dispatch("max")
+    skew = _online_dispatch("skew")
+    kurt = _online_dispatch("kurt")
+    quantile = _online_dispatch("quantile")
+    apply = _online_dispatch("apply")
+    aggregate = _online_dispatch("aggregate")
+    agg = aggregate
@@ -7,11 +7,14 @@ from io import BufferedIOBase, BytesIO, RawIOBase
 import mmap
 import os
 import pathlib
+import queue
+import threading
 from typing import (
     IO,
     TYPE_CHECKING,
     Any,
     AnyStr,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -31,6 +34,7 @@ import zipfile
 
 from pandas._typing import FilePathOrBuffer
 from pandas.compat import _get_lzma_file, _import_lzma
+from pandas.compat._optional import import_optional_dependency
 
 from pandas.core.dtypes.common import is_file_like
 
@@ -255,7 +259,92 @@ def file_path_to_url(path: str) -> str:
     return urljoin("file:", pathname2url(path))
 
 
-_compression_to_extension = {"gzip": ".gz", "bz2": ".bz2", "zip": ".zip", "xz": ".xz"}
+_compression_to_extension = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "zip": ".zip",
+    "xz": ".xz",
+    "zstd": ".zst",
+    "lz4": ".lz4",
+}
+
+
+def _open_gzip(path_or_buf, mode: str, **compression_args) -> IO:
+    if isinstance(path_or_buf, str):
+        return gzip.open(path_or_buf, mode, **compression_args)
+    return gzip.GzipFile(fileobj=path_or_buf, **compression_args)
+
+
+def _open_bz2(path_or_buf, mode: str, **compression_args) -> IO:
+    if isinstance(path_or_buf, str):
+        return bz2.BZ2File(path_or_buf, mode, **compression_args)
+    return bz2.BZ2File(path_or_buf, **compression_args)
+
+
+def _open_xz(path_or_buf, mode: str, **compression_args) -> IO:
+    return _get_lzma_file(lzma)(path_or_buf, mode, **compression_args)
+
+
+def _open_zstd(path_or_buf, mode: str, **compression_args) -> IO:
+    zstandard = import_optional_dependency("zstandard")
+    # zstandard.open returns a text wrapper unless asked for binary mode
+    mode = mode.replace("b", "") + "b"
+    if "r" in mode:
+        dctx = zstandard.ZstdDecompressor(**compression_args)
+        return zstandard.open(path_or_buf, mode, dctx=dctx)
+    cctx = zstandard.ZstdCompressor(**compression_args)
+    return zstandard.open(path_or_buf, mode, cctx=cctx)
+
+
+def _open_lz4(path_or_buf, mode: str, **compression_args) -> IO:
+    import_optional_dependency("lz4")
+    import lz4.frame
+
+    return lz4.frame.open(path_or_buf, mode, **compression_args)
+
+
+# compression method -> callable(path_or_buf, mode, **compression_args)
+# returning a binary file-like object; "zip" is handled in get_handle
+_compression_openers: Dict[str, Callable[..., IO]] = {
+    "gzip": _open_gzip,
+    "bz2": _open_bz2,
+    "xz": _open_xz,
+    "zstd": _open_zstd,
+    "lz4": _open_lz4,
+}
+
+
+def register_compression(
+    method: str, extension: str, opener: Callable[..., IO]
+) -> None:
+    """
+    Register a compression method for the readers and writers using
+    :func:`get_handle`.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    ----------
+    method : str
+        Name of the compression method, as passed to ``compression=``.
+    extension : str
+        File extension, including the dot, used to infer the method when
+        ``compression='infer'``.
+    opener : callable
+        ``opener(path_or_buf, mode, **compression_args)`` must return a binary
+        file-like object. ``path_or_buf`` is either a file path or a binary
+        buffer and ``compression_args`` holds any additional entries of a
+        dict passed as ``compression``.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is already registered.
+    """
+    if method in _compression_to_extension:
+        raise ValueError(f"Compression method '{method}' is already registered")
+    _compression_to_extension[method] = extension
+    _compression_openers[method] = opener
 
 
 def get_compression_method(
@@ -304,10 +393,10 @@ def infer_compression(
     ----------
     filepath_or_buffer : str or file handle
         File path or object.
-    compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', None}
+    compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', 'zstd', 'lz4', None}
         If 'infer' and `filepath_or_buffer` is path-like, then detect
         compression from the following extensions: '.gz', '.bz2', '.zip',
-        or '.xz' (otherwise no compression).
+        '.xz', '.zst' or '.lz4' (otherwise no compression).
 
     Returns
     -------
@@ -368,12 +457,14 @@ def get_handle(
     compression : str or dict, default None
         If string, specifies compression mode. If dict, value at key 'method'
         specifies compression mode. Compression mode must be one of {'infer',
-        'gzip', 'bz2', 'zip', 'xz', None}. If compression mode is 'infer'
+        'gzip', 'bz2', 'zip', 'xz', 'zstd', 'lz4', None} or a method added
+        with :func:`register_compression`. If compression mode is 'infer'
         and `filepath_or_buffer` is path-like, then detect compression from
-        the following extensions: '.gz', '.bz2', '.zip', or '.xz' (otherwise
-        no compression). If dict and compression mode is one of
-        {'zip', 'gzip', 'bz2'}, or inferred as one of the above,
-        other entries passed as additional compression options.
+        the following extensions: '.gz', '.bz2', '.zip', '.xz', '.zst' or
+        '.lz4' (otherwise no compression). If dict, other entries are passed
+        as additional compression options, except for 'threaded': if True,
+        a compressed file opened for reading is decompressed in a background
+        thread.
 
         .. versionchanged:: 1.0.0
 
@@ -385,6 +476,7 @@ def get_handle(
 
            Passing compression options as keys in dict is now
            supported for compression modes 'gzip' and 'bz2' as well as 'zip'.
+           Added the 'zstd' and 'lz4' modes and the 'threaded' option.
 
     memory_map : boolean, default False
         See parsers._parser_params for more information.
@@ -426,31 +518,10 @@ def get_handle(
 
     if compression:
 
-        # GH33398 the type ignores here seem related to mypy issue #5382;
-        # it may be possible to remove them once that is resolved.
-
-        # GZ Compression
-        if compression == "gzip":
-            if is_path:
-                f = gzip.open(
-                    path_or_buf, mode, **compression_args  # type: ignore
-                )
-            else:
-                f = gzip.GzipFile(
-                    fileobj=path_or_buf, **compression_args  # type: ignore
-                )
-
-        # BZ Compression
-        elif compression == "bz2":
-            if is_path:
-                f = bz2.BZ2File(
-                    path_or_buf, mode, **compression_args  # type: ignore
-                )
-            else:
-                f = bz2.BZ2File(path_or_buf, **compression_args)  # type: ignore
+        threaded = compression_args.pop("threaded", False)
 
         # ZIP Compression
-        elif compression == "zip":
+        if compression == "zip":
             zf = _BytesZipFile(path_or_buf, mode, **compression_args)
             # Ensure the container is closed as well.
             handles.append(zf)
@@ -468,15 +539,17 @@ def get_handle(
                         f"Only one file per ZIP: {zip_names}"
                     )
 
-        # XZ Compression
-        elif compression == "xz":
-            f = _get_lzma_file(lzma)(path_or_buf, mode)
+        elif compression in _compression_openers:
+            f = _compression_openers[compression](path_or_buf, mode, **compression_args)
 
         # Unrecognized Compression
         else:
             msg = f"Unrecognized compression type: {compression}"
             raise ValueError(msg)
 
+        if threaded and "r" in mode:
+            f = _ThreadedReader(f)
+
         handles.append(f)
 
     elif is_path:
@@ -548,6 +621,114 @@ class _BytesZipFile(zipfile.ZipFile, BytesIO):  # type: ignore
         return self.fp is None
 
 
+class _ThreadedReader(BufferedIOBase):
+    """
+    Read a binary file-like object in a background thread.
+
+    The thread reads chunks of ``chunksize`` bytes into a queue holding at
+    most ``maxsize`` of them, so that e.g. decompression runs concurrently
+    with the parsing of the previously decompressed data. The decompressors
+    of the standard library release the GIL while they work.
+
+    Parameters
+    ----------
+    handle : file-like object
+        Binary handle to read from, closed when this object is closed.
+    chunksize : int, default 1 MiB
+    maxsize : int, default 4
+    """
+
+    def __init__(self, handle: IO, chunksize: int = 2 ** 20, maxsize: int = 4):
+        self.handle = handle
+        self.chunksize = chunksize
+        self._queue: "queue.Queue" = queue.Queue(maxsize)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self.handle.read(self.chunksize)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except BaseException as err:
+            # re-raised in the consumer thread
+            self._put(err)
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _next_chunk(self) -> bool:
+        """
+        Refill the buffer from the queue, returns False at end of file.
+        """
+        if self._eof:
+            return False
+        chunk = self._queue.get()
+        if isinstance(chunk, BaseException):
+            self._eof = True
+            raise chunk
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = chunk
+        self._pos = 0
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def read1(self, size: int = -1) -> bytes:
+        if self._pos >= len(self._buffer) and not self._next_chunk():
+            return b""
+        if size is None or size < 0:
+            size = len(self._buffer) - self._pos
+        data = self._buffer[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                data = self.read1()
+                if not data:
+                    return b"".join(chunks)
+                chunks.append(data)
+
+        chunks = []
+        while size > 0:
+            data = self.read1(size)
+            if not data:
+                break
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        self.handle.close()
+        super().close()
+
+
 class _MMapWrapper(abc.Iterator):
     """
     Wrapper for the Python's mmap class so that it can be properly read in
@@ -1,5 +1,7 @@
 """ feather-format compat """
 
+from distutils.version import LooseVersion
+
 from pandas.compat._optional import import_optional_dependency
 
 from pandas import DataFrame, Int64Index, RangeIndex
@@ -64,7 +66,9 @@ def to_feather(df: DataFrame, path, **kwargs):
     feather.write_feather(df, path, **kwargs)
 
 
-def read_feather(path, columns=None, use_threads: bool = True):
+def read_feather(
+    path, columns=None, use_threads: bool = True, memory_map: bool = False
+):
     """
     Load a feather-format object from the file path.
 
@@ -90,6 +94,21 @@ def read_feather(path, columns=None, use_threads: bool = True):
         Whether to parallelize reading using multiple threads.
 
        .. versionadded:: 0.24.0
+    memory_map : bool, default False
+        Map the file into memory and build the DataFrame on top of the
+        mapping. Numeric, boolean and timezone-naive ``datetime64[ns]``
+        columns without missing values become zero-copy, read-only views into
+        the mapped file, so several processes reading the same file share its
+        pages through the OS page cache. Other columns, e.g. strings and
+        categoricals, are still converted. Only supported for local files and
+        requires pyarrow >= 0.17.0. Compressed columns are decompressed into
+        memory, write the file with ``compression="uncompressed"`` to get
+        zero-copy views.
+
+        Note that every column is kept in its own block, operations that
+        consolidate the blocks copy the data into memory.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -100,6 +119,9 @@ def read_feather(path, columns=None, use_threads: bool = True):
 
     path, _, _, should_close = get_filepath_or_buffer(path)
 
+    if memory_map:
+        return _read_feather_memory_map(path, columns, use_threads)
+
     df = feather.read_feather(path, columns=columns, use_threads=bool(use_threads))
 
     # s3fs only validates the credentials when the file is closed.
@@ -107,3 +129,21 @@ def read_feather(path, columns=None, use_threads: bool = True):
         path.close()
 
     return df
+
+
+def _read_feather_memory_map(path, columns, use_threads: bool) -> DataFrame:
+    """
+    Read a local Feather file as a DataFrame backed by a memory map.
+    """
+    pyarrow = import_optional_dependency("pyarrow")
+    from pyarrow import feather
+
+    if LooseVersion(pyarrow.__version__) < LooseVersion("0.17.0"):
+        raise ImportError("memory_map=True requires pyarrow >= 0.17.0")
+    if not isinstance(path, str):
+        raise ValueError("memory_map=True is only supported for local file paths")
+
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    # one block per column lets pyarrow hand out views on the mapped buffers
+    # instead of copying every column into a consolidated 2D block
+    return table.to_pandas(use_threads=bool(use_threads), split_blocks=True)
@@ -5,6 +5,8 @@ HTML IO.
 """
 
 from collections import abc
+import codecs
+from html.parser import HTMLParser
 import numbers
 import os
 import re
@@ -17,7 +19,7 @@ from pandas.core.dtypes.common import is_list_like
 
 from pandas.core.construction import create_series_with_explicit_dtype
 
-from pandas.io.common import is_url, urlopen, validate_header_arg
+from pandas.io.common import is_url, stringify_path, urlopen, validate_header_arg
 from pandas.io.formats.printing import pprint_thing
 from pandas.io.parsers import TextParser
 
@@ -764,6 +766,308 @@ class _LxmlFrameParser(_HtmlFrameParser):
         return table.xpath(".//tfoot//tr")
 
 
+# elements without an end tag, they never open a hidden region
+_VOID_ELEMENTS = frozenset(
+    [
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    ]
+)
+
+
+def _is_hidden(attrs) -> bool:
+    return "display:none" in (attrs.get("style") or "").replace(" ", "")
+
+
+class _StreamingCell:
+    """
+    A <td> or <th> element, holding the text seen while it was open.
+    """
+
+    __slots__ = ["tag", "attrs", "text", "hidden"]
+
+    def __init__(self, tag, attrs, hidden):
+        self.tag = tag
+        self.attrs = attrs
+        self.text = []
+        self.hidden = hidden
+
+    def get(self, attr):
+        return self.attrs.get(attr)
+
+
+class _StreamingTable:
+    """
+    The rows of a <table> element seen by :class:`_TableExtractor`.
+
+    Rows are only kept if the table has the requested attributes and is
+    displayed.
+    """
+
+    def __init__(self, attrs, hidden, collect):
+        self.attrs = attrs
+        self.hidden = hidden
+        self.collect = collect and not hidden
+        self.matched = False
+        self.thead = []
+        self.tbody = []
+        self.tfoot = []
+        self.root = []
+        self.section = self.root
+        self.row = None
+        self.row_hidden = False
+        self.cell = None
+
+    def start_section(self, tag):
+        self.end_row()
+        self.section = getattr(self, tag)
+
+    def end_section(self):
+        self.end_row()
+        self.section = self.root
+
+    def start_row(self, hidden):
+        self.end_row()
+        self.row = []
+        self.row_hidden = hidden
+
+    def end_row(self):
+        self.end_cell()
+        if self.row is not None and self.collect and not self.row_hidden:
+            self.section.append(self.row)
+        self.row = None
+
+    def start_cell(self, tag, attrs, hidden):
+        self.end_cell()
+        if self.row is None:
+            # a cell outside of a <tr>, e.g. <thead><th>foo</th></thead>
+            self.start_row(False)
+        self.cell = _StreamingCell(tag, attrs, hidden)
+
+    def end_cell(self):
+        if self.cell is not None and not self.cell.hidden:
+            self.row.append(self.cell)
+        self.cell = None
+
+
+class _TableExtractor(HTMLParser):
+    """
+    Event-based collector of the rows of the <table> elements of a document.
+
+    Only the tables are kept while the document is fed: text outside of
+    tables is dropped as it is seen, and the rows of a table are released as
+    soon as it is closed if it does not contain text matching ``match``.
+    Missing end tags of cells, rows and table sections are implied by the
+    next cell, row or section, like HTML parsers do.
+    """
+
+    def __init__(self, match, attrs, displayed_only):
+        super().__init__(convert_charrefs=True)
+        self.match = match
+        self.attrs = attrs
+        self.displayed_only = displayed_only
+        self.ntables = 0
+        self.tables = []  # in document order, None once discarded
+        self._open = []  # (index in self.tables, table), innermost last
+        self._text = []
+        self._hidden_tag = None
+        self._hidden_depth = 0
+
+    def _flush_text(self):
+        # text nodes may arrive in pieces, only test the match on whole nodes
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+
+        if self.match.search(text):
+            for _, table in self._open:
+                table.matched = True
+        if self._hidden_depth:
+            return
+        for _, table in reversed(self._open):
+            if table.cell is not None:
+                table.cell.text.append(text)
+            if table.hidden:
+                # the text of hidden tables is not part of the outer cells
+                break
+
+    def handle_data(self, data):
+        if self._open:
+            self._text.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        attrs = dict(attrs)
+        hidden = self.displayed_only and _is_hidden(attrs)
+
+        if tag == "table":
+            hidden = hidden or bool(self._hidden_depth)
+            collect = all(attrs.get(k) == v for k, v in self.attrs.items())
+            table = _StreamingTable(attrs, hidden, collect)
+            self._open.append((len(self.tables), table))
+            self.tables.append(None)
+            self.ntables += 1
+            return
+        elif not self._open:
+            return
+
+        table = self._open[-1][1]
+        if self._hidden_depth:
+            if tag == self._hidden_tag:
+                self._hidden_depth += 1
+        elif tag in ("td", "th"):
+            table.start_cell(tag, attrs, hidden)
+        elif tag == "tr":
+            table.start_row(hidden)
+        elif tag in ("thead", "tbody", "tfoot"):
+            table.start_section(tag)
+        elif hidden and tag not in _VOID_ELEMENTS:
+            self._hidden_tag = tag
+            self._hidden_depth = 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if not self._open:
+            return
+
+        table = self._open[-1][1]
+        if self._hidden_depth and tag == self._hidden_tag:
+            self._hidden_depth -= 1
+        elif tag in ("td", "th", "tr", "thead", "tbody", "tfoot", "table"):
+            # a hidden region cannot outlive the cell it started in
+            self._hidden_depth = 0
+            if tag in ("td", "th"):
+                table.end_cell()
+            elif tag == "tr":
+                table.end_row()
+            elif tag != "table":
+                table.end_section()
+            else:
+                self._end_table()
+
+    def _end_table(self):
+        index, table = self._open.pop()
+        table.end_row()
+        if table.collect and table.matched:
+            self.tables[index] = table
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        while self._open:
+            self._end_table()
+
+
+class _StreamingFrameParser(_HtmlFrameParser):
+    """
+    HTML to DataFrame parser that streams the document through the standard
+    library's :class:`html.parser.HTMLParser`.
+
+    No document tree is built: the input is read in chunks and only the
+    text of the cells of matching tables is kept, so neither lxml nor
+    BeautifulSoup is needed and memory does not grow with the size of the
+    document.
+
+    See Also
+    --------
+    pandas.io.html._HtmlFrameParser
+    pandas.io.html._LxmlFrameParser
+
+    Notes
+    -----
+    Documentation strings for this class are in the base class
+    :class:`pandas.io.html._HtmlFrameParser`.
+    """
+
+    _chunksize = 2 ** 16
+
+    def _text_getter(self, obj):
+        return "".join(obj.text)
+
+    def _equals_tag(self, obj, tag):
+        return obj.tag == tag
+
+    def _parse_td(self, row):
+        return row
+
+    def _parse_thead_tr(self, table):
+        return table.thead
+
+    def _parse_tbody_tr(self, table):
+        # HTML spec: at most one of these lists has content
+        return table.tbody + table.root
+
+    def _parse_tfoot_tr(self, table):
+        return table.tfoot
+
+    def _parse_tables(self, doc, match, attrs):
+        if attrs:
+            # give class attribute as class_ because class is a python keyword
+            attrs = {("class" if k == "class_" else k): v for k, v in attrs.items()}
+        extractor = _TableExtractor(match, attrs or {}, self.displayed_only)
+        for chunk in doc:
+            extractor.feed(chunk)
+        extractor.close()
+
+        if not extractor.ntables:
+            raise ValueError("No tables found")
+        tables = [table for table in extractor.tables if table is not None]
+        if not tables:
+            raise ValueError(f"No tables found matching regex {repr(match.pattern)}")
+        return tables
+
+    def _build_doc(self):
+        """
+        Return an iterator over the text of the document, read in chunks.
+
+        See Also
+        --------
+        pandas.io.html._HtmlFrameParser._build_doc
+        """
+        io = stringify_path(self.io)
+        if is_url(io):
+            with urlopen(io) as f:
+                yield from self._read_chunks(f)
+        elif hasattr(io, "read"):
+            yield from self._read_chunks(io)
+        elif isinstance(io, (str, bytes)):
+            try:
+                is_file = os.path.isfile(io)
+            except (TypeError, ValueError):
+                is_file = False
+            if is_file:
+                with open(io, "rb") as f:
+                    yield from self._read_chunks(f)
+            elif isinstance(io, bytes):
+                yield io.decode(self.encoding or "utf-8")
+            else:
+                yield io
+        else:
+            raise TypeError(f"Cannot read object of type '{type(io).__name__}'")
+
+    def _read_chunks(self, f):
+        decoder = codecs.getincrementaldecoder(self.encoding or "utf-8")()
+        while True:
+            chunk = f.read(self._chunksize)
+            if not chunk:
+                break
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield decoder.decode(b"", final=True)
+
+
 def _expand_elements(body):
     data = [len(elem) for elem in body]
     lens = create_series_with_explicit_dtype(data, dtype_if_empty=object)
@@ -805,6 +1109,7 @@ _valid_parsers = {
     None: _LxmlFrameParser,
     "html5lib": _BeautifulSoupHtml5LibFrameParser,
     "bs4": _BeautifulSoupHtml5LibFrameParser,
+    "stream": _StreamingFrameParser,
 }
 
 
@@ -843,7 +1148,7 @@ def _parser_dispatch(flavor):
         # Although we call this above, we want to raise here right before use.
         bs4 = import_optional_dependency("bs4")  # noqa:F841
 
-    else:
+    elif flavor in (None, "lxml"):
         if not _HAS_LXML:
             raise ImportError("lxml not found, please install it")
     return _valid_parsers[flavor]
@@ -962,7 +1267,14 @@ def read_html(
         The parsing engine to use. 'bs4' and 'html5lib' are synonymous with
         each other, they are both there for backwards compatibility. The
         default of ``None`` tries to use ``lxml`` to parse and if that fails it
-        falls back on ``bs4`` + ``html5lib``.
+        falls back on ``bs4`` + ``html5lib``. 'stream' reads the document in
+        chunks with the standard library's ``html.parser`` and only keeps the
+        cells of the tables, without building a document tree. It does not
+        require any optional dependency.
+
+        .. versionchanged:: 1.1.0
+
+           The 'stream' flavor was added.
 
     header : int or list-like or None, optional
         The row (or list of rows for a :class:`~pandas.MultiIndex`) to use to
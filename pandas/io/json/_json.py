@@ -19,7 +19,12 @@ from pandas import DataFrame, MultiIndex, Series, isna, to_datetime
 from pandas.core.construction import create_series_with_explicit_dtype
 from pandas.core.reshape.concat import concat
 
-from pandas.io.common import get_filepath_or_buffer, get_handle, infer_compression
+from pandas.io.common import (
+    get_compression_method,
+    get_filepath_or_buffer,
+    get_handle,
+    infer_compression,
+)
 from pandas.io.json._normalize import convert_to_line_delimits
 from pandas.io.json._table_schema import build_table_schema, parse_table_schema
 from pandas.io.parsers import _validate_integer
@@ -495,12 +500,20 @@ def read_json(
         This can only be passed if `lines=True`.
         If this is None, the file will be read into memory all at once.
 
-    compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', None}, default 'infer'
-        For on-the-fly decompression of on-disk data. If 'infer', then use
-        gzip, bz2, zip or xz if path_or_buf is a string ending in
-        '.gz', '.bz2', '.zip', or 'xz', respectively, and no decompression
-        otherwise. If using 'zip', the ZIP file must contain only one data
-        file to be read in. Set to None for no decompression.
+    compression : str or dict, default 'infer'
+        For on-the-fly decompression of on-disk data, one of 'infer', 'gzip',
+        'bz2', 'zip', 'xz', 'zstd', 'lz4' or None. If 'infer', then use
+        gzip, bz2, zip, xz, zstd or lz4 if path_or_buf is a string ending in
+        '.gz', '.bz2', '.zip', '.xz', '.zst' or '.lz4', respectively, and no
+        decompression otherwise. If using 'zip', the ZIP file must contain
+        only one data file to be read in. Set to None for no decompression.
+        If dict, the compression method is given by the key ``'method'`` and
+        other entries are passed to the decompressor, except for
+        ``'threaded'``: if True the data is decompressed in a background
+        thread.
+
+        .. versionchanged:: 1.1.0
+           Added 'zstd', 'lz4' and support for dicts.
 
     nrows : int, optional
         The number of lines from the line-delimited jsonfile that has to be read.
@@ -589,10 +602,13 @@ def read_json(
     if encoding is None:
         encoding = "utf-8"
 
+    compression, compression_args = get_compression_method(compression)
     compression = infer_compression(path_or_buf, compression)
     filepath_or_buffer, _, compression, should_close = get_filepath_or_buffer(
         path_or_buf, encoding=encoding, compression=compression
     )
+    if compression and compression_args:
+        compression = dict(compression_args, method=compression)
 
     json_reader = JsonReader(
         filepath_or_buffer,
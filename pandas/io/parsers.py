@@ -7,6 +7,7 @@ import csv
 import datetime
 from io import StringIO, TextIOWrapper
 import itertools
+import os
 import re
 import sys
 from textwrap import fill
@@ -65,8 +66,10 @@ from pandas.core.tools import datetimes as tools
 
 from pandas.io.common import (
     get_filepath_or_buffer,
+    get_compression_method,
     get_handle,
     infer_compression,
+    stringify_path,
     validate_header_arg,
 )
 from pandas.io.date_converters import generic_parser
@@ -275,12 +278,20 @@ chunksize : int, optional
     See the `IO Tools docs
     <https://pandas.pydata.org/pandas-docs/stable/io.html#io-chunking>`_
     for more information on ``iterator`` and ``chunksize``.
-compression : {{'infer', 'gzip', 'bz2', 'zip', 'xz', None}}, default 'infer'
-    For on-the-fly decompression of on-disk data. If 'infer' and
+compression : str or dict, default 'infer'
+    For on-the-fly decompression of on-disk data, one of 'infer', 'gzip',
+    'bz2', 'zip', 'xz', 'zstd', 'lz4' or None. If 'infer' and
     `filepath_or_buffer` is path-like, then detect compression from the
-    following extensions: '.gz', '.bz2', '.zip', or '.xz' (otherwise no
-    decompression). If using 'zip', the ZIP file must contain only one data
-    file to be read in. Set to None for no decompression.
+    following extensions: '.gz', '.bz2', '.zip', '.xz', '.zst' or '.lz4'
+    (otherwise no decompression). If using 'zip', the ZIP file must contain
+    only one data file to be read in. Set to None for no decompression.
+    If dict, the compression method is given by the key ``'method'`` and
+    other entries are passed to the decompressor, except for ``'threaded'``:
+    if True the data is decompressed in a background thread, concurrently
+    with the parsing.
+
+    .. versionchanged:: 1.1.0
+       Added 'zstd', 'lz4' and support for dicts.
 thousands : str, optional
     Thousands separator.
 decimal : str, default '.'
@@ -422,6 +433,7 @@ def _read(filepath_or_buffer: FilePathOrBuffer, kwds):
         kwds["encoding"] = encoding
 
     compression = kwds.get("compression", "infer")
+    compression, compression_args = get_compression_method(compression)
     compression = infer_compression(filepath_or_buffer, compression)
 
     # TODO: get_filepath_or_buffer could return
@@ -431,6 +443,8 @@ def _read(filepath_or_buffer: FilePathOrBuffer, kwds):
     fp_or_buf, _, compression, should_close = get_filepath_or_buffer(
         filepath_or_buffer, encoding, compression
     )
+    if compression and compression_args:
+        compression = dict(compression_args, method=compression)
     kwds["compression"] = compression
 
     if kwds.get("date_parser", None) is not None:
@@ -745,6 +759,11 @@ def read_fwf(
         .. versionadded:: 0.24.0
     **kwds : optional
         Optional keyword arguments can be passed to ``TextFileReader``.
+        ``engine`` can be 'c' or 'python'. By default the C tokenizer is used
+        unless the column specifications overlap or another option is only
+        supported by the python engine.
+
+        .. versionchanged:: 1.1.0
 
     Returns
     -------
@@ -776,10 +795,158 @@ def read_fwf(
 
     kwds["colspecs"] = colspecs
     kwds["infer_nrows"] = infer_nrows
-    kwds["engine"] = "python-fwf"
+    kwds["engine"] = _fwf_engine(filepath_or_buffer, kwds)
     return _read(filepath_or_buffer, kwds)
 
 
+def _fwf_engine(filepath_or_buffer, kwds) -> str:
+    """
+    Pick the engine used by read_fwf.
+
+    The C tokenizer ("c-fwf") is used when the column specifications can be
+    cut from each line in a single forward pass and no other option needs the
+    python engine. ``colspecs="infer"`` is resolved here from the first lines
+    of a local file or seekable buffer, so the C tokenizer gets the inferred
+    specifications.
+    """
+    engine = kwds.pop("engine", None)
+    if engine in ("python", "python-fwf"):
+        return "python-fwf"
+
+    reason = _fwf_c_unsupported(kwds)
+    if reason is None and isinstance(kwds["colspecs"], str):
+        colspecs = _infer_fwf_colspecs(filepath_or_buffer, kwds)
+        if colspecs is None:
+            reason = "colspecs='infer' with this source or skiprows"
+        else:
+            kwds["colspecs"] = colspecs
+    if reason is None and not _is_forward_colspecs(kwds["colspecs"]):
+        reason = "overlapping, unsorted or negative colspecs"
+
+    if reason is None:
+        kwds["colspecs"] = list(kwds["colspecs"])
+        return "c-fwf"
+    elif engine == "c":
+        raise ValueError(f"the 'c' engine does not support {reason} in read_fwf")
+    return "python-fwf"
+
+
+def _fwf_c_unsupported(kwds) -> Optional[str]:
+    """
+    Return the option that prevents using the C fixed-width tokenizer, if any.
+    """
+    for argname in ("dialect", "comment", "lineterminator"):
+        if kwds.get(argname) is not None:
+            return argname
+    for argname in ("skipfooter", "delim_whitespace"):
+        if kwds.get(argname):
+            return argname
+
+    # the python engine skips converters for missing values and casts float
+    # data to integer dtypes, the C engine does neither
+    if kwds.get("converters"):
+        return "converters"
+    dtype = kwds.get("dtype")
+    dtypes = dtype.values() if isinstance(dtype, dict) else [dtype]
+    if any(dt is not None and is_integer_dtype(dt) for dt in dtypes):
+        return "integer dtype"
+
+    # the delimiter characters are stripped byte-wise by the tokenizer
+    delimiter = kwds.get("delimiter")
+    if delimiter is not None and any(ord(c) > 127 for c in delimiter):
+        return "non-ASCII delimiter"
+    return None
+
+
+def _is_forward_colspecs(colspecs) -> bool:
+    """
+    Check that ``colspecs`` are sorted, non-overlapping and non-negative.
+    """
+    if not isinstance(colspecs, (list, tuple)) or not colspecs:
+        return False
+
+    prev_end = 0
+    for i, colspec in enumerate(colspecs):
+        if not (isinstance(colspec, (list, tuple)) and len(colspec) == 2):
+            return False
+        start, end = colspec
+        if start is None:
+            start = 0
+        if not is_integer(start) or start < prev_end:
+            return False
+        if end is None:
+            # only the last column can run to the end of the line
+            if i != len(colspecs) - 1:
+                return False
+        elif not is_integer(end) or end <= start:
+            return False
+        prev_end = end
+    return True
+
+
+def _infer_fwf_colspecs(filepath_or_buffer, kwds) -> Optional[List]:
+    """
+    Detect colspecs from the first lines of a local file or seekable buffer.
+
+    Returns None if those lines cannot be read without consuming the source.
+    """
+    infer_nrows = kwds["infer_nrows"]
+    skiprows = kwds.get("skiprows")
+    if callable(skiprows):
+        return None
+    elif is_integer(skiprows):
+        skiprows = set(range(skiprows))
+    else:
+        skiprows = set() if skiprows is None else set(skiprows)
+    nlines = infer_nrows + len(skiprows)
+
+    filepath_or_buffer = stringify_path(filepath_or_buffer)
+    if isinstance(filepath_or_buffer, str):
+        if not os.path.isfile(filepath_or_buffer):
+            return None
+        f, handles = get_handle(
+            filepath_or_buffer,
+            "r",
+            encoding=kwds.get("encoding"),
+            compression=kwds.get("compression", "infer"),
+        )
+        try:
+            lines = list(itertools.islice(f, nlines))
+        finally:
+            for handle in handles:
+                handle.close()
+    elif (
+        hasattr(filepath_or_buffer, "read")
+        and getattr(filepath_or_buffer, "seekable", lambda: False)()
+        and kwds.get("compression", "infer") in ("infer", None)
+    ):
+        position = filepath_or_buffer.tell()
+        lines = []
+        while len(lines) < nlines:
+            line = filepath_or_buffer.readline()
+            if not line:
+                break
+            lines.append(line)
+        filepath_or_buffer.seek(position)
+
+        encoding = kwds.get("encoding") or "utf-8"
+        lines = [
+            line.decode(encoding) if isinstance(line, bytes) else line for line in lines
+        ]
+    else:
+        return None
+
+    reader = FixedWidthReader(
+        iter(lines),
+        "infer",
+        kwds.get("delimiter"),
+        kwds.get("comment"),
+        skiprows,
+        infer_nrows,
+    )
+    return reader.colspecs
+
+
 class TextFileReader(abc.Iterator):
     """
 
@@ -900,7 +1067,7 @@ class TextFileReader(abc.Iterator):
             if argname in kwds:
                 value = kwds[argname]
 
-                if engine != "c" and value != default:
+                if engine not in ("c", "c-fwf") and value != default:
                     if "python" in engine and argname not in _python_unsupported:
                         pass
                     elif value == _deprecated_defaults.get(argname, default):
@@ -914,7 +1081,7 @@ class TextFileReader(abc.Iterator):
                 value = _deprecated_defaults.get(argname, default)
             options[argname] = value
 
-        if engine == "python-fwf":
+        if engine in ("python-fwf", "c-fwf"):
             for argname, default in _fwf_defaults.items():
                 options[argname] = kwds.get(argname, default)
 
@@ -930,7 +1097,7 @@ class TextFileReader(abc.Iterator):
             # "next(...)" when iterating through such an object, meaning it
             # needs to have that attribute ("next" for Python 2.x, "__next__"
             # for Python 3.x)
-            if engine != "c" and not hasattr(f, next_attr):
+            if engine not in ("c", "c-fwf") and not hasattr(f, next_attr):
                 msg = "The 'python' engine cannot iterate through this file buffer."
                 raise ValueError(msg)
 
@@ -963,7 +1130,7 @@ class TextFileReader(abc.Iterator):
             if engine == "c" and sep == r"\s+":
                 result["delim_whitespace"] = True
                 del result["delimiter"]
-            elif engine not in ("python", "python-fwf"):
+            elif engine not in ("python", "python-fwf", "c-fwf"):
                 # wait until regex engine integrated
                 fallback_reason = (
                     "the 'c' engine does not support "
@@ -981,7 +1148,7 @@ class TextFileReader(abc.Iterator):
                     encodeable = False
             except UnicodeDecodeError:
                 encodeable = False
-            if not encodeable and engine not in ("python", "python-fwf"):
+            if not encodeable and engine not in ("python", "python-fwf", "c-fwf"):
                 fallback_reason = (
                     f"the separator encoded in {encoding} "
                     "is > 1 char long, and the 'c' engine "
@@ -994,7 +1161,7 @@ class TextFileReader(abc.Iterator):
             if (
                 len(quotechar) == 1
                 and ord(quotechar) > 127
-                and engine not in ("python", "python-fwf")
+                and engine not in ("python", "python-fwf", "c-fwf")
             ):
                 fallback_reason = (
                     "ord(quotechar) > 127, meaning the "
@@ -1006,7 +1173,7 @@ class TextFileReader(abc.Iterator):
         if fallback_reason and engine_specified:
             raise ValueError(fallback_reason)
 
-        if engine == "c":
+        if engine in ("c", "c-fwf"):
             for arg in _c_unsupported:
                 del result[arg]
 
@@ -1083,7 +1250,7 @@ class TextFileReader(abc.Iterator):
 
         # handle skiprows; this is internally handled by the
         # c-engine, so only need for python parsers
-        if engine != "c":
+        if engine not in ("c", "c-fwf"):
             if is_integer(skiprows):
                 skiprows = list(range(skiprows))
             if skiprows is None:
@@ -1108,7 +1275,7 @@ class TextFileReader(abc.Iterator):
             raise
 
     def _make_engine(self, engine="c"):
-        if engine == "c":
+        if engine in ("c", "c-fwf"):
             self._engine = CParserWrapper(self.f, **self.options)
         else:
             if engine == "python":
@@ -1118,7 +1285,7 @@ class TextFileReader(abc.Iterator):
             else:
                 raise ValueError(
                     f"Unknown engine: {engine} (valid options "
-                    'are "c", "python", or "python-fwf")'
+                    'are "c", "c-fwf", "python", or "python-fwf")'
                 )
             self._engine = klass(self.f, **self.options)
 
@@ -1918,6 +2085,11 @@ class CParserWrapper(ParserBase):
 
         ParserBase.__init__(self, kwds)
 
+        # only colspecs is used by the fixed-width tokenizer, read_fwf has
+        # already resolved widths and inferred colspecs
+        kwds.pop("widths", None)
+        kwds.pop("infer_nrows", None)
+
         encoding = kwds.get("encoding")
 
         if kwds.get("compression") is None and encoding:
@@ -1,19 +1,36 @@
 """ pickle compat """
+import io
+import mmap
 import pickle
-from typing import Any, Optional
+import struct
+from typing import IO, Any, List, Optional
 import warnings
+import zipfile
 
 from pandas._typing import FilePathOrBuffer
 from pandas.compat import pickle_compat as pc
 
 from pandas.io.common import get_filepath_or_buffer, get_handle
 
+# Files written with ``out_of_band=True`` start with this magic string instead
+# of a bare pickle stream. Pickles of protocol 2 and above always begin with
+# the PROTO opcode (b"\x80"), so the two layouts cannot be confused.
+_OOB_MAGIC = b"PDPKLOOB"
+# n_buffers, payload length
+_OOB_HEADER = struct.Struct("<QQ")
+# offset, length of each out-of-band buffer
+_OOB_ENTRY = struct.Struct("<QQ")
+# out-of-band buffers are aligned on cache line boundaries within the file so
+# that memory-mapped buffers give aligned numpy arrays
+_OOB_ALIGNMENT = 64
+
 
 def to_pickle(
     obj: Any,
     filepath_or_buffer: FilePathOrBuffer,
     compression: Optional[str] = "infer",
     protocol: int = pickle.HIGHEST_PROTOCOL,
+    out_of_band: bool = False,
 ):
     """
     Pickle (serialize) object to file.
@@ -43,6 +60,14 @@ def to_pickle(
         HIGHEST_PROTOCOL.
 
         .. [1] https://docs.python.org/3/library/pickle.html
+    out_of_band : bool, default False
+        Write the underlying data buffers (e.g. the block values of a
+        DataFrame) out-of-band, next to the pickle stream instead of
+        inside it. This requires pickle protocol 5 (Python >= 3.8) and
+        allows :func:`read_pickle` to memory-map the buffers back with
+        ``memory_map=True`` instead of copying them.
+
+        .. versionadded:: 1.1.0
 
     See Also
     --------
@@ -80,11 +105,19 @@ def to_pickle(
     )
     if not isinstance(fp_or_buf, str) and compression == "infer":
         compression = None
-    f, fh = get_handle(fp_or_buf, "wb", compression=compression, is_text=False)
     if protocol < 0:
         protocol = pickle.HIGHEST_PROTOCOL
+    if out_of_band and protocol < 5:
+        raise ValueError(
+            "out_of_band=True requires pickle protocol 5 or higher, "
+            f"got protocol={protocol}"
+        )
+    f, fh = get_handle(fp_or_buf, "wb", compression=compression, is_text=False)
     try:
-        f.write(pickle.dumps(obj, protocol=protocol))
+        if out_of_band:
+            _write_out_of_band(f, obj, protocol)
+        else:
+            f.write(pickle.dumps(obj, protocol=protocol))
     finally:
         f.close()
         for _f in fh:
@@ -97,7 +130,9 @@ def to_pickle(
 
 
 def read_pickle(
-    filepath_or_buffer: FilePathOrBuffer, compression: Optional[str] = "infer"
+    filepath_or_buffer: FilePathOrBuffer,
+    compression: Optional[str] = "infer",
+    memory_map: bool = False,
 ):
     """
     Load pickled pandas object (or any object) from file.
@@ -120,6 +155,14 @@ def read_pickle(
         the following extensions: '.gz', '.bz2', '.zip', or '.xz' (otherwise no
         compression) If 'infer' and 'path_or_url' is not path-like, then use
         None (= no decompression).
+    memory_map : bool, default False
+        If the file was written with ``out_of_band=True``, is uncompressed and
+        lives on the local file system, map it into memory and back the
+        unpickled arrays by the mapping instead of reading them into memory.
+        The mapping is copy-on-write: modifying the returned object never
+        changes the file. Ignored for any other input.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -168,6 +211,19 @@ def read_pickle(
         compression = None
     f, fh = get_handle(fp_or_buf, "rb", compression=compression, is_text=False)
 
+    if _peek(f, len(_OOB_MAGIC)) == _OOB_MAGIC:
+        try:
+            return _read_out_of_band(f, memory_map=memory_map)
+        finally:
+            f.close()
+            for _f in fh:
+                _f.close()
+            if should_close:
+                try:
+                    fp_or_buf.close()
+                except ValueError:
+                    pass
+
     # 1) try standard library Pickle
     # 2) try pickle_compat (older pandas version) to handle subclass changes
     # 3) try pickle_compat with latin-1 encoding upon a UnicodeDecodeError
@@ -197,3 +253,116 @@ def read_pickle(
                 fp_or_buf.close()
             except ValueError:
                 pass
+
+
+# ---------------------------------------------------------------------
+# out-of-band buffers (pickle protocol 5)
+
+
+def _padding(pos: int) -> int:
+    return -pos % _OOB_ALIGNMENT
+
+
+def _write_out_of_band(f: IO, obj: Any, protocol: int) -> None:
+    """
+    Write ``obj`` as a pickle stream followed by its out-of-band buffers.
+
+    The layout is the magic string, the number of buffers and the payload
+    length, an ``(offset, length)`` entry per buffer, the pickle payload and
+    finally the raw buffers, each aligned on ``_OOB_ALIGNMENT`` bytes. Offsets
+    are relative to the start of the magic string.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    payload = pickle.dumps(obj, protocol=protocol, buffer_callback=buffers.append)
+    raw = [buf.raw() for buf in buffers]
+
+    pos = len(_OOB_MAGIC) + _OOB_HEADER.size + _OOB_ENTRY.size * len(raw) + len(payload)
+    entries = []
+    for buf in raw:
+        pos += _padding(pos)
+        entries.append(_OOB_ENTRY.pack(pos, buf.nbytes))
+        pos += buf.nbytes
+
+    chunks = [_OOB_MAGIC, _OOB_HEADER.pack(len(raw), len(payload))]
+    chunks.extend(entries)
+    chunks.append(payload)
+    pos = sum(len(chunk) for chunk in chunks)
+    for buf in raw:
+        chunks.append(b"\x00" * _padding(pos))
+        chunks.append(buf)
+        pos += _padding(pos) + buf.nbytes
+
+    if isinstance(f, zipfile.ZipFile):
+        # _BytesZipFile writes a new archive member on every call
+        f.write(b"".join(chunks))
+    else:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def _peek(f: IO, n: int) -> bytes:
+    """
+    Return the first ``n`` bytes of ``f`` without consuming them.
+    """
+    if hasattr(f, "peek"):
+        return f.peek(n)[:n]
+    if f.seekable():
+        pos = f.tell()
+        data = f.read(n)
+        f.seek(pos)
+        return data
+    return b""
+
+
+def _read_exact(f: IO, n: int) -> bytearray:
+    buf = bytearray(n)
+    view = memoryview(buf)
+    pos = 0
+    while pos < n:
+        read = f.readinto(view[pos:])
+        if not read:
+            raise ValueError("Unexpected end of file while reading pickle buffers")
+        pos += read
+    return buf
+
+
+def _read_out_of_band(f: IO, memory_map: bool = False) -> Any:
+    """
+    Load an object written by ``to_pickle(..., out_of_band=True)``.
+
+    With ``memory_map=True`` and a regular uncompressed file, the buffers
+    are handed to the unpickler as slices of a copy-on-write memory map of the
+    file, so no data is copied. Otherwise every buffer is read into its own
+    writable ``bytearray``.
+    """
+    if memory_map and isinstance(f, io.BufferedReader):
+        start = f.tell()
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(mm)[start:]
+        pos = len(_OOB_MAGIC)
+        n_buffers, payload_len = _OOB_HEADER.unpack_from(view, pos)
+        pos += _OOB_HEADER.size
+        buffers = []
+        for _ in range(n_buffers):
+            offset, length = _OOB_ENTRY.unpack_from(view, pos)
+            pos += _OOB_ENTRY.size
+            buffers.append(view[offset : offset + length])
+        # the buffers (and the arrays built on top of them) keep the mapping
+        # alive, it is released once the last of them is garbage collected
+        return pickle.loads(view[pos : pos + payload_len], buffers=buffers)
+
+    pos = len(_OOB_MAGIC) + _OOB_HEADER.size
+    header = _read_exact(f, pos)
+    n_buffers, payload_len = _OOB_HEADER.unpack_from(header, len(_OOB_MAGIC))
+    entries = _read_exact(f, _OOB_ENTRY.size * n_buffers)
+    pos += len(entries)
+    payload = _read_exact(f, payload_len)
+    pos += payload_len
+
+    buffers = []
+    for i in range(n_buffers):
+        offset, length = _OOB_ENTRY.unpack_from(entries, i * _OOB_ENTRY.size)
+        _read_exact(f, offset - pos)
+        buffers.append(_read_exact(f, length))
+        pos = offset + length
+    return pickle.loads(payload, buffers=buffers)
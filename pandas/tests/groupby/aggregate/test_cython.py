@@ -236,3 +236,94 @@ def test_cython_with_timestamp_and_nat(op, data):
 
     result = df.groupby("a").aggregate(op)
     tm.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize(
+    "op", ["sum", "prod", "min", "max", "mean", "median", "var", "first", "last"]
+)
+@pytest.mark.parametrize("ncols", [1, 5])
+@pytest.mark.parametrize("num_threads", [2, 3, 0])
+def test_cython_agg_num_threads(monkeypatch, op, ncols, num_threads):
+    monkeypatch.setattr(pd.core.groupby.ops, "_parallel_min_size", 0)
+    rng = np.random.RandomState(2)
+    df = DataFrame(rng.randn(1000, ncols))
+    df.iloc[::7, 0] = np.nan
+    if op == "prod":
+        df = 1 + df / 100
+    df["key"] = rng.randint(0, 40, len(df))
+    # a group with only NaN values
+    df.loc[df["key"] == 3, 0] = np.nan
+
+    expected = getattr(df.groupby("key"), op)()
+    with pd.option_context("compute.num_threads", num_threads):
+        result = getattr(df.groupby("key"), op)()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "M8[ns]"])
+def test_cython_agg_num_threads_dtypes(monkeypatch, dtype):
+    monkeypatch.setattr(pd.core.groupby.ops, "_parallel_min_size", 0)
+    df = DataFrame(np.arange(600).reshape(200, 3).astype(dtype))
+    df["key"] = np.arange(200) % 7
+
+    for op in ["sum", "min", "max"]:
+        if op == "sum" and dtype == "M8[ns]":
+            continue
+        expected = getattr(df.groupby("key"), op)()
+        with pd.option_context("compute.num_threads", 2):
+            result = getattr(df.groupby("key"), op)()
+        tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        ["count", "sum", "mean", "var", "std", "min", "max"],
+        {"a": "mean", "b": ["min", "std"]},
+        {"b": "sum", "a": "var"},
+    ],
+)
+@pytest.mark.parametrize("dropna", [True, False])
+def test_cython_agg_fused(func, dropna):
+    # list and dict specs of float64 columns are computed in a single pass
+    np.random.seed(0)
+    df = DataFrame(
+        {
+            "key": np.random.choice([1.0, 2.0, np.nan, 4.0], 50),
+            "a": np.random.randn(50),
+            "b": np.random.randn(50),
+        }
+    )
+    df.loc[::5, "a"] = np.nan
+    df.loc[df["key"] == 4, "b"] = np.nan
+    gb = df.groupby("key", dropna=dropna)
+
+    result = gb.agg(func)
+    if isinstance(func, list):
+        expected = pd.concat({col: gb[col].agg(func) for col in ["a", "b"]}, axis=1)
+    else:
+        expected = pd.concat(
+            {
+                (col, f): getattr(gb[col], f)()
+                for col, fs in func.items()
+                for f in (fs if isinstance(fs, list) else [fs])
+            },
+            axis=1,
+        )
+        if not any(isinstance(fs, list) for fs in func.values()):
+            expected.columns = expected.columns.droplevel(1)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_cython_agg_fused_fallback():
+    # unsupported columns and aggregations are computed separately
+    df = DataFrame({"key": [1, 1, 2], "a": [1.0, 2.0, 3.0], "b": [1, 2, 3]})
+    result = df.groupby("key").agg({"a": ["sum", "median"], "b": "mean"})
+    expected = DataFrame(
+        [[3.0, 1.5, 1.5], [3.0, 3.0, 3.0]],
+        index=Index([1, 2], name="key"),
+        columns=pd.MultiIndex.from_tuples(
+            [("a", "sum"), ("a", "median"), ("b", "mean")]
+        ),
+    )
+    tm.assert_frame_equal(result, expected)
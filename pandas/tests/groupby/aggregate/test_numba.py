@@ -4,7 +4,7 @@ import pytest
 from pandas.errors import NumbaUtilError
 import pandas.util._test_decorators as td
 
-from pandas import DataFrame
+from pandas import DataFrame, Index, Series, date_range
 import pandas._testing as tm
 from pandas.core.util.numba_ import NUMBA_FUNC_CACHE
 
@@ -113,3 +113,111 @@ def test_cache(jit, pandas_obj, nogil, parallel, nopython):
     result = grouped.agg(func_1, engine="numba", engine_kwargs=engine_kwargs)
     expected = grouped.agg(lambda x: np.mean(x) - 3.4, engine="cython")
     tm.assert_equal(result, expected)
+
+
+@pytest.fixture
+def numba_data():
+    return DataFrame(
+        {
+            "key": ["a", "b", "a", "c", "b", "a", "c", "b"],
+            "x": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0, 8.0],
+            "y": np.arange(8, dtype="float64")[::-1],
+        }
+    )
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize("method", ["sum", "min", "max", "mean", "var", "std"])
+@pytest.mark.parametrize("pandas_obj", ["Series", "DataFrame"])
+def test_numba_reduction_vs_cython(numba_data, method, pandas_obj):
+    grouped = numba_data.groupby("key")
+    if pandas_obj == "Series":
+        grouped = grouped["x"]
+
+    result = getattr(grouped, method)(engine="numba")
+    expected = getattr(grouped, method)()
+    tm.assert_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize("min_count", [0, 2, 3])
+def test_numba_sum_min_count(numba_data, min_count):
+    grouped = numba_data.groupby("key")
+    result = grouped.sum(min_count=min_count, engine="numba")
+    expected = grouped.sum(min_count=min_count)
+    tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+@pytest.mark.parametrize("q", [0.3, 0.5, [0.25, 0.75]])
+def test_numba_quantile_vs_cython(numba_data, interpolation, q):
+    grouped = numba_data.groupby("key")
+    result = grouped.quantile(q, interpolation=interpolation, engine="numba")
+    expected = grouped.quantile(q, interpolation=interpolation)
+    tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+def test_numba_reduction_cache(numba_data):
+    grouped = numba_data.groupby("key")
+    grouped.mean(engine="numba", engine_kwargs={"parallel": True})
+    assert any(
+        key[1] == "groupby_mean_True_False_True" for key in NUMBA_FUNC_CACHE
+    )
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.parametrize("as_index", [True, False])
+def test_numba_frame_udf_scalar(numba_data, as_index):
+    def func(values, index, column_names):
+        return np.nansum(values[:, 0] * values[:, 1])
+
+    grouped = numba_data.groupby("key", as_index=as_index)
+    result = grouped.agg(func, engine="numba")
+    assert (func, "groupby_frame_agg") in NUMBA_FUNC_CACHE
+
+    expected = numba_data.groupby("key").apply(
+        lambda df: np.nansum(df["x"] * df["y"])
+    )
+    if not as_index:
+        expected = expected.reset_index()
+    tm.assert_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+def test_numba_frame_udf_array(numba_data):
+    def func(values, index, column_names):
+        return values.sum(axis=0) / len(index)
+
+    result = numba_data.groupby("key").agg(func, engine="numba")
+    # the missing values are passed as NaN, which numpy propagates
+    expected = numba_data.groupby("key").agg(lambda x: x.sum(skipna=False) / len(x))
+    tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+def test_numba_frame_udf_dtypes():
+    def func(values, index, column_names):
+        return values[:, 0].sum() + values[:, 1].sum() + (index[-1] - index[0])
+
+    df = DataFrame(
+        {"key": ["a", "b", "a"], "x": [1, 2, 3], "y": [True, False, True]},
+        index=date_range("2020", periods=3, freq="ns"),
+    )
+    result = df.groupby("key").agg(func, engine="numba")
+    expected = Series([8.0, 2.0], index=Index(["a", "b"], name="key"))
+    tm.assert_series_equal(result, expected)
+
+    with pytest.raises(NotImplementedError, match="index of object dtype"):
+        df.set_axis(list("xyz")).groupby("key").agg(func, engine="numba")
+    with pytest.raises(NotImplementedError, match="object dtype"):
+        df.assign(y="z").groupby("key").agg(func, engine="numba")
+
+
+@td.skip_if_installed("numba")
+def test_numba_reduction_not_installed(numba_data):
+    with pytest.raises(ImportError, match="Missing optional dependency 'numba'"):
+        numba_data.groupby("key").sum(engine="numba")
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from pandas import DataFrame
+import pandas._testing as tm
+from pandas.core.groupby import GroupByAccumulator
+
+
+@pytest.fixture
+def df():
+    np.random.seed(2)
+    n = 500
+    df = DataFrame(
+        {
+            "A": np.random.randint(0, 10, n),
+            "B": np.random.choice(["x", "y", None], n),
+            "C": np.random.randn(n),
+            "D": np.random.randint(0, 100, n),
+            "E": np.random.choice(["foo", "bar", "baz"], n),
+        }
+    )
+    df.loc[::7, "C"] = np.nan
+    return df
+
+
+def _chunks(df, size=73):
+    return [df.iloc[i : i + size] for i in range(0, len(df), size)]
+
+
+def _accumulate(df, by, func, **kwargs):
+    acc = GroupByAccumulator(by, func, **kwargs)
+    for chunk in _chunks(df):
+        acc.update(chunk)
+    return acc
+
+
+@pytest.mark.parametrize(
+    "func", ["count", "sum", "mean", "var", "std", "min", "max", "first", "last"]
+)
+@pytest.mark.parametrize("by", ["A", ["A", "B"]])
+def test_accumulator_matches_groupby(df, func, by):
+    if by == "A":
+        # min/max of object columns with missing values is not supported
+        df = df.drop(columns="B")
+    result = _accumulate(df, by, func).result()
+    expected = getattr(df.groupby(by), func)()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("func, q", [("median", 0.5), ("quantile", 0.3)])
+def test_accumulator_quantile(df, func, q):
+    # exact while the groups hold fewer values than sketch_size
+    result = _accumulate(df, "A", func, q=q).result()
+    expected = df.groupby("A")[["C", "D"]].quantile(q)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_accumulator_quantile_sketch():
+    np.random.seed(3)
+    df = DataFrame({"A": np.random.randint(0, 3, 30000), "C": np.random.randn(30000)})
+    acc = _accumulate(df, "A", "median", sketch_size=50)
+    result = acc.result()
+    expected = df.groupby("A").median()
+    tm.assert_index_equal(result.index, expected.index)
+    assert (result - expected).abs().max().max() < 0.01
+
+
+@pytest.mark.parametrize("q", [0.001, 0.01, 0.5, 0.99, 0.999])
+def test_accumulator_quantile_sketch_rank_error(q):
+    # the t-digest bounds the error on the rank of the quantiles, and is the
+    # most accurate in the tails
+    np.random.seed(4)
+    df = DataFrame({"A": 0, "C": np.random.exponential(size=50000)})
+    acc = GroupByAccumulator("A", "quantile", q=q, sketch_size=100)
+    for chunk in _chunks(df, 5000):
+        acc.update(chunk)
+    result = acc.result().loc[0, "C"]
+    rank = (df["C"] < result).mean()
+    assert abs(rank - q) <= np.pi * np.sqrt(q * (1 - q)) / 100
+
+
+def test_accumulator_list_and_dict(df):
+    df = df.drop(columns="B")
+    result = _accumulate(df, "A", ["sum", "mean"]).result()
+    expected = df.groupby("A")[["C", "D"]].agg(["sum", "mean"])
+    tm.assert_frame_equal(result, expected)
+
+    result = _accumulate(df, "A", {"C": "mean", "E": "max"}).result()
+    expected = df.groupby("A").agg({"C": "mean", "E": "max"})
+    tm.assert_frame_equal(result, expected)
+
+    result = _accumulate(df, "A", {"C": ["min", "max"], "D": "var"}).result()
+    expected = df.groupby("A").agg({"C": ["min", "max"], "D": ["var"]})
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_accumulator_sort_dropna(df, sort, dropna):
+    result = _accumulate(df, ["B", "A"], "sum", sort=sort, dropna=dropna).result()
+    expected = df.groupby(["B", "A"], sort=sort, dropna=dropna).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_accumulator_ddof(df):
+    result = _accumulate(df, "A", "var", ddof=0).result()
+    expected = df.groupby("A")[["C", "D"]].agg(lambda x: x.var(ddof=0))
+    tm.assert_frame_equal(result, expected)
+
+
+def test_accumulator_merge(df):
+    chunks = _chunks(df, 100)
+    left = GroupByAccumulator("A", ["mean", "std", "median", "last"])
+    right = GroupByAccumulator("A", ["mean", "std", "median", "last"])
+    for chunk in chunks[:3]:
+        left.update(chunk)
+    for chunk in chunks[3:]:
+        right.update(chunk)
+
+    result = left.merge(right).result()
+    expected = _accumulate(df, "A", ["mean", "std", "median", "last"]).result()
+    tm.assert_frame_equal(result, expected)
+    assert left.ngroups + right.ngroups > left.merge(right).ngroups
+
+    empty = GroupByAccumulator("A", ["mean", "std", "median", "last"])
+    tm.assert_frame_equal(empty.merge(left).result(), left.result())
+
+    with pytest.raises(ValueError, match="different aggregations"):
+        left.merge(GroupByAccumulator("A", "sum"))
+
+
+def test_accumulator_single_chunk(df):
+    result = GroupByAccumulator("A", "mean").update(df).result()
+    expected = df.groupby("A").mean()
+    tm.assert_frame_equal(result, expected)
+    assert GroupByAccumulator("A", "mean").update(df).ngroups == 10
+
+
+def test_accumulator_invalid(df):
+    with pytest.raises(ValueError, match="func must be one of"):
+        GroupByAccumulator("A", "prod")
+    with pytest.raises(ValueError, match="q must be between"):
+        GroupByAccumulator("A", "quantile", q=2)
+    with pytest.raises(ValueError, match="No chunk"):
+        GroupByAccumulator("A", "sum").result()
+    with pytest.raises(TypeError, match="only supported for numeric"):
+        _accumulate(df, "A", {"E": "mean"}).result()
+
+    acc = GroupByAccumulator("A", "sum").update(df)
+    with pytest.raises(KeyError, match="missing"):
+        acc.update(df.drop(columns="C"))
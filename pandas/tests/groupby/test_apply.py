@@ -115,6 +115,26 @@ def test_fast_apply():
     assert not mutated
 
 
+def test_apply_groups_have_own_index():
+    # cached attributes of the index of a group do not leak into the next
+    df = DataFrame(
+        {"A": ["foo", "bar", "foo", "bar", "foo", "bar", "foo", "foo"]},
+        index=pd.date_range("2014", periods=8),
+    )
+    result = df.groupby("A").apply(lambda x: x.index.inferred_freq)
+    expected = Series(["2D", None], index=Index(["bar", "foo"], name="A"))
+    tm.assert_series_equal(result, expected)
+
+
+def test_apply_groups_kept_by_function():
+    # a group the function holds on to is not overwritten by the next one
+    df = DataFrame({"A": [1, 2, 1, 2, 1], "B": np.arange(5.0)})
+    groups = []
+    df.groupby("A").apply(lambda x: groups.append(x))
+    tm.assert_frame_equal(groups[0], df.iloc[[0, 2, 4]])
+    tm.assert_frame_equal(groups[-1], df.iloc[[1, 3]])
+
+
 @pytest.mark.parametrize(
     "df, group_names",
     [
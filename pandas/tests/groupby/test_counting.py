@@ -74,6 +74,17 @@ class TestCounting:
         tm.assert_series_equal(expected, g.cumcount())
         tm.assert_series_equal(expected, sg.cumcount())
 
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_cumcount_nan_keys(self, ascending):
+        df = DataFrame({"A": [1, np.nan, 1, np.nan, 2, 1]})
+        g = df.groupby("A")
+
+        if ascending:
+            expected = Series([0, 0, 1, 1, 0, 2])
+        else:
+            expected = Series([2, 1, 1, 0, 0, 0])
+        tm.assert_series_equal(g.cumcount(ascending=ascending), expected)
+
     def test_ngroup(self):
         df = DataFrame({"A": list("aaaba")})
         g = df.groupby("A")
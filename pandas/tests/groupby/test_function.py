@@ -1031,3 +1031,55 @@ def test_groupby_sum_below_mincount_nullable_integer():
         {"b": [pd.NA] * 3, "c": [pd.NA] * 3}, dtype="Int64", index=idx
     )
     tm.assert_frame_equal(result, expected)
+
+
+def _expected_ohlcv(df, by, index):
+    # open, high, low, close, volume, vwap, count and first and last
+    # timestamps, each computed in its own pass
+    valid = df[df["price"].notna()].assign(time=df.index[df["price"].notna()])
+    grouped = valid.groupby(by)
+    volume = grouped["size"].sum()
+    notional = (valid["price"] * valid["size"]).groupby(valid[by]).sum()
+    expected = DataFrame(
+        {
+            "open": grouped["price"].first(),
+            "high": grouped["price"].max(),
+            "low": grouped["price"].min(),
+            "close": grouped["price"].last(),
+            "volume": volume,
+            "vwap": notional / volume.where(volume != 0),
+            "count": grouped["price"].count(),
+            "first_time": grouped["time"].first(),
+            "last_time": grouped["time"].last(),
+        }
+    ).reindex(index)
+    expected[["volume", "count"]] = expected[["volume", "count"]].fillna(0)
+    expected["count"] = expected["count"].astype(np.int64)
+    return expected
+
+
+@pytest.mark.parametrize("tz", [None, "US/Eastern"])
+def test_groupby_ohlcv(tz):
+    df = DataFrame(
+        {
+            "sym": list("abacabbcad"),
+            "price": [10.0, 20.0, 11.0, np.nan, 9.0, 21.0, 22.0, np.nan, 12.0, 5.0],
+            "size": [100, 50, np.nan, 10, 200, 60, 40, 30, 100, np.nan],
+        },
+        index=date_range("2020-01-01 09:30", periods=10, freq="s", tz=tz),
+    )
+    result = df.groupby("sym").ohlcv("price", "size")
+    expected = _expected_ohlcv(df, "sym", Index(list("abcd"), name="sym"))
+    tm.assert_frame_equal(result, expected)
+
+    result = df.reset_index().groupby("sym").ohlcv("price", "size", time="index")
+    tm.assert_frame_equal(result, expected)
+
+    result = df.groupby("sym", as_index=False).ohlcv("price", "size")
+    tm.assert_frame_equal(result, expected.reset_index())
+
+
+def test_groupby_ohlcv_requires_timestamps():
+    df = DataFrame({"sym": ["a"], "price": [1.0], "size": [1.0]})
+    with pytest.raises(TypeError, match="ohlcv requires datetime-like timestamps"):
+        df.groupby("sym").ohlcv("price", "size")
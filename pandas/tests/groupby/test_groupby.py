@@ -1296,6 +1296,21 @@ def test_int32_overflow():
     assert len(left) == len(right)
 
 
+def test_groupby_multi_key_overflow_no_sort():
+    # the product of the key cardinalities does not fit an int64
+    n = 10000
+    rng = np.random.RandomState(0)
+    keys = DataFrame({c: rng.permutation(n) for c in "ABCDE"})
+    df = keys.iloc[np.arange(2 * n) % n].reset_index(drop=True)
+    df["F"] = np.arange(2 * n)
+
+    result = df.groupby(list("ABCDE"), sort=False).sum()
+    expected = df.groupby(list("ABCDE")).sum()
+    tm.assert_frame_equal(result, expected.reindex(result.index))
+    # groups come in the order they are first seen
+    tm.assert_index_equal(result.index, MultiIndex.from_frame(keys))
+
+
 def test_groupby_sort_multi():
     df = DataFrame(
         {
@@ -167,3 +167,32 @@ def test_nunique_preserves_column_level_names():
     result = test.groupby([0, 0, 0]).nunique()
     expected = pd.DataFrame([2], columns=test.columns)
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_nunique_approx(dropna):
+    np.random.seed(0)
+    n = 50000
+    df = pd.DataFrame(
+        {
+            "key": np.random.randint(0, 4, n),
+            "high": np.random.randint(0, 40000, n).astype(float),
+            "low": np.random.choice(list("abcde"), n),
+        }
+    )
+    df.loc[::10, "high"] = np.nan
+    df.loc[df["key"] == 3, "low"] = None
+
+    result = df.groupby("key").nunique(dropna=dropna, approx=True)
+    expected = df.groupby("key").nunique(dropna=dropna)
+    # exact for small cardinalities, about 0.8% of standard error for the
+    # large ones
+    tm.assert_series_equal(result["low"], expected["low"])
+    assert ((result["high"] / expected["high"] - 1).abs() < 0.03).all()
+
+
+def test_nunique_approx_empty_groups():
+    ser = Series([np.nan, 1.0, 2.0, np.nan], index=pd.Index([0, 1, 0, 2]))
+    result = ser.groupby(level=0).nunique(approx=True)
+    expected = Series([1, 1, 0], index=pd.Index([0, 1, 2]))
+    tm.assert_series_equal(result, expected)
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import DataFrame, Index, MultiIndex, Series
+import pandas._testing as tm
+from pandas.core.groupby import GroupByPlan
+
+
+@pytest.fixture
+def df():
+    return DataFrame(
+        {
+            "A": ["foo", "bar", "foo", "bar", "foo", "bar", "foo", "foo"],
+            "B": ["one", "one", "two", "three", "two", "two", "one", "three"],
+            "C": np.arange(8, dtype="float64"),
+            "D": np.arange(8, 0, -1),
+        }
+    )
+
+
+@pytest.mark.parametrize("keys", ["A", ["A", "B"]])
+@pytest.mark.parametrize("sort", [True, False])
+def test_plan_groupby(df, keys, sort):
+    plan = df.groupby(keys, sort=sort).plan()
+    assert isinstance(plan, GroupByPlan)
+
+    expected = df.groupby(keys, sort=sort).sum()
+    tm.assert_index_equal(plan.result_index, expected.index)
+    assert plan.ngroups == len(expected)
+
+    tm.assert_frame_equal(df.groupby(plan).sum(), expected)
+    tm.assert_frame_equal(plan.groupby(df).sum(), expected)
+
+
+def test_plan_other_frame(df):
+    plan = df.groupby(["A", "B"]).plan()
+    other = df.assign(C=df["C"] * 2, E=1).set_index(Index(list("abcdefgh")))
+
+    result = plan.groupby(other).mean()
+    expected = other.groupby(["A", "B"]).mean()
+    tm.assert_frame_equal(result, expected)
+
+    result = plan.groupby(other)["C"].apply(list)
+    expected = other.groupby(["A", "B"])["C"].apply(list)
+    tm.assert_series_equal(result, expected)
+
+    result = plan.groupby(other).groups
+    expected = other.groupby(["A", "B"]).groups
+    assert result.keys() == expected.keys()
+    for key in expected:
+        tm.assert_index_equal(result[key], expected[key])
+
+
+def test_plan_keeps_groupby_options(df):
+    plan = df.groupby("A", as_index=False, sort=False).plan()
+    result = plan.groupby(df).sum()
+    expected = df.groupby("A", as_index=False, sort=False).sum()
+    tm.assert_frame_equal(result, expected)
+
+    result = plan.groupby(df, as_index=True).sum()
+    expected = df.groupby("A", sort=False).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_plan_observed():
+    cat = pd.Categorical(["a", "a", "b"], categories=["a", "b", "c"])
+    df = DataFrame({"A": cat, "B": [1, 2, 3]})
+    plan = df.groupby("A", observed=True).plan()
+    result = plan.groupby(df).sum()
+    expected = df.groupby("A", observed=True).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_plan_level():
+    ser = Series([1, 2, 3, 4], index=MultiIndex.from_product([[1, 2], ["x", "y"]]))
+    plan = ser.groupby(level=1).plan()
+    result = plan.groupby(ser * 2).sum()
+    expected = (ser * 2).groupby(level=1).sum()
+    tm.assert_series_equal(result, expected)
+
+    with pytest.raises(ValueError, match="do not match"):
+        plan.groupby(ser.reset_index(drop=True))
+
+
+def test_plan_freq():
+    df = DataFrame({"v": range(6)}, index=pd.date_range("2020", periods=6, freq="12H"))
+    plan = df.groupby(pd.Grouper(freq="D")).plan()
+    result = plan.groupby(df * 2).sum()
+    expected = (df * 2).groupby(pd.Grouper(freq="D")).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda df: df.assign(A=df["A"].str.upper()),
+        lambda df: df.assign(A=df["A"].astype("category")),
+        lambda df: df.drop(columns="A"),
+        lambda df: df.iloc[:-1],
+    ],
+)
+def test_plan_mismatch(df, modify):
+    plan = df.groupby("A").plan()
+    other = modify(df)
+    assert not plan.matches(other)
+    with pytest.raises(ValueError, match="do not match"):
+        other.groupby(plan)
+
+
+def test_plan_detects_inplace_modification(df):
+    plan = df.groupby("A").plan()
+    assert plan.matches(df)
+
+    df.loc[0, "A"] = "bar"
+    assert not plan.matches(df)
+    with pytest.raises(ValueError, match="do not match"):
+        df.groupby(plan)
+
+
+def test_plan_axis_mismatch(df):
+    plan = df.groupby("A").plan()
+    assert not plan.matches(df, axis=1)
+    with pytest.raises(ValueError, match="do not match"):
+        df.groupby(plan, axis=1)
+
+
+def test_plan_nan_keys():
+    df = DataFrame({"A": [1.0, np.nan, 1.0, np.nan], "B": range(4)})
+    plan = df.groupby("A", dropna=False).plan()
+    assert plan.matches(df.copy())
+    result = plan.groupby(df).sum()
+    expected = df.groupby("A", dropna=False).sum()
+    tm.assert_frame_equal(result, expected)
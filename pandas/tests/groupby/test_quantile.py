@@ -232,3 +232,43 @@ def test_groupby_quantile_nullable_array(values, q):
 
     expected = pd.Series(true_quantiles * 2, index=idx, name="b")
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+@pytest.mark.parametrize("nqs", [3, 50])
+def test_quantile_array_matches_scalar(interpolation, nqs):
+    # all the quantiles are computed at once, by selection or after sorting
+    # the values when there are many of them
+    np.random.seed(0)
+    df = DataFrame(
+        {"key": np.random.randint(0, 5, 200), "a": np.random.randn(200).round(1)}
+    )
+    df.loc[::4, "a"] = np.nan
+    df.loc[df["key"] == 3, "a"] = np.nan
+    qs = list(np.random.permutation(np.linspace(0, 1, nqs)))
+
+    result = df.groupby("key").quantile(qs, interpolation=interpolation)
+    expected = pd.concat(
+        {q: df.groupby("key").quantile(q, interpolation=interpolation) for q in qs}
+    )
+    expected = expected.swaplevel().loc[result.index]
+    tm.assert_frame_equal(result, expected)
+
+    result = df.groupby("key")["a"].quantile(qs[0], interpolation=interpolation)
+    expected = df.groupby("key")["a"].apply(
+        lambda x: x.quantile(qs[0], interpolation=interpolation)
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_quantile_datetime_with_nat():
+    dti = pd.date_range("2020-01-01", periods=6, freq="D").insert(0, pd.NaT)
+    df = DataFrame({"key": [0, 0, 0, 0, 1, 1, 1], "t": dti})
+    result = df.groupby("key").quantile([0.0, 1.0])
+    expected = DataFrame(
+        {"t": pd.to_datetime(["2020-01-01", "2020-01-03", "2020-01-04", "2020-01-06"])},
+        index=pd.MultiIndex.from_product([[0, 1], [0.0, 1.0]], names=["key", None]),
+    )
+    tm.assert_frame_equal(result, expected)
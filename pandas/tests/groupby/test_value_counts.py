@@ -9,7 +9,15 @@ from itertools import product
 import numpy as np
 import pytest
 
-from pandas import DataFrame, Grouper, MultiIndex, Series, date_range, to_datetime
+from pandas import (
+    DataFrame,
+    Grouper,
+    Index,
+    MultiIndex,
+    Series,
+    date_range,
+    to_datetime,
+)
 import pandas._testing as tm
 
 
@@ -107,3 +115,17 @@ def test_series_groupby_value_counts_with_grouper():
     expected.index.names = result.index.names
 
     tm.assert_series_equal(result, expected)
+
+
+def test_series_groupby_value_counts_empty():
+    df = DataFrame({"A": [], "B": []}, dtype="int64")
+    result = df.groupby("A")["B"].value_counts()
+    expected = Series(
+        [],
+        index=MultiIndex.from_arrays(
+            [Index([], dtype="int64"), Index([], dtype="int64")], names=["A", "B"]
+        ),
+        name="B",
+        dtype="int64",
+    )
+    tm.assert_series_equal(result, expected)
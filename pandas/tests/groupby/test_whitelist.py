@@ -282,6 +282,7 @@ def test_tab_completion(mframe):
         "ngroups",
         "nth",
         "ohlc",
+        "ohlcv",
         "plot",
         "prod",
         "size",
@@ -327,7 +328,9 @@ def test_tab_completion(mframe):
         "backfill",
         "rolling",
         "expanding",
+        "ewm",
         "pipe",
+        "plan",
     }
     assert results == expected
 
@@ -367,7 +370,6 @@ def test_groupby_selection_with_methods(df):
         "ffill",
         "bfill",
         "pct_change",
-        "tshift",
     ]
 
     for m in methods:
@@ -380,6 +382,7 @@ def test_groupby_selection_with_methods(df):
     # methods which aren't just .foo()
     tm.assert_frame_equal(g.fillna(0), g_exp.fillna(0))
     tm.assert_frame_equal(g.dtypes, g_exp.dtypes)
+    tm.assert_frame_equal(g.tshift(freq="D"), g_exp.tshift(freq="D"))
     tm.assert_frame_equal(g.apply(lambda x: x.sum()), g_exp.apply(lambda x: x.sum()))
 
     tm.assert_frame_equal(g.resample("D").mean(), g_exp.resample("D").mean())
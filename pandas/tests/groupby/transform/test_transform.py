@@ -1205,3 +1205,56 @@ def test_transform_lambda_indexing():
         ),
     )
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "func, kwargs",
+    [
+        ("sum", {}),
+        ("sum", {"min_count": 3}),
+        ("mean", {}),
+        ("min", {}),
+        ("max", {}),
+        ("var", {}),
+        ("var", {"ddof": 0}),
+        ("std", {"ddof": 2}),
+    ],
+)
+def test_transform_reduction_broadcast(func, kwargs):
+    # the reductions of float columns are broadcast by the cython kernel
+    df = DataFrame(
+        {
+            "A": ["x", "y", np.nan, "x", "y", "x", "z", "y"],
+            "B": [1.0, np.nan, 3.0, 4.0, 5.0, 6.0, np.nan, 8.0],
+            "C": [0.5, 1.5, 2.5, np.nan, 4.5, 5.5, 6.5, 7.5],
+        }
+    )
+    gb = df.groupby("A")
+    ids = [0, 1, -1, 0, 1, 0, 2, 1]
+
+    result = gb.transform(func, **kwargs)
+    agg = getattr(gb, func)(**kwargs)
+    expected = DataFrame(
+        {col: agg[col].values.take(ids) for col in ["B", "C"]}, index=df.index
+    )
+    expected.iloc[2] = np.nan
+    tm.assert_frame_equal(result, expected)
+
+    result = gb["B"].transform(func, **kwargs)
+    tm.assert_series_equal(result, expected["B"])
+
+
+@pytest.mark.parametrize(
+    "func, values",
+    [
+        (lambda x: x - x.min(), [0.0, 0.0, np.nan, 3.0, 4.0]),
+        (lambda x: len(x), [2.0, 2.0, np.nan, 2.0, 2.0]),
+        (lambda x: "s", ["s", "s", np.nan, "s", "s"]),
+    ],
+)
+def test_transform_udf_missing_keys(func, values):
+    # rows without group are missing
+    df = DataFrame({"A": [1, 2, np.nan, 1, 2], "B": [1, 2, 3, 4, 6]})
+    result = df.groupby("A")["B"].transform(func)
+    expected = Series(values, name="B")
+    tm.assert_series_equal(result, expected)
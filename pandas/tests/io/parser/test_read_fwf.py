@@ -1,7 +1,7 @@
 """
 Tests the 'read_fwf' function in parsers.py. This
 test suite is independent of the others because the
-engine is set to 'python-fwf' internally.
+engine is set to 'c-fwf' or 'python-fwf' internally.
 """
 
 from datetime import datetime
@@ -616,3 +616,77 @@ def test_fwf_compression(compression_only, infer):
 
         result = read_fwf(path, **kwargs)
         tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "data,kwargs",
+    [
+        ("A   B   \n1   2   \n\n    \n3   4\n5", dict(widths=[4, 4])),
+        ("A B\r\n1 2\r\n3 4", dict(widths=[2, 2])),
+        (
+            "col1  col2 col3\n  1.5 x    \u00e9\nabcdef \u00e9\u00e9\u00e9  zz\n",
+            dict(colspecs=[(0, 6), (6, 11), (11, None)]),
+        ),
+        ("col1  col2 col3\n  1.5 x    \u00e9\nabcdef \u00e9\u00e9\u00e9  zz\n", dict()),
+        ("a~~b~c\n~1~~2~3\n4~~~5~~\n", dict(delimiter="~")),
+        ("a b c\n1 2 3\n4 5 6\n7 8 9\n", dict(widths=[2, 2, 2], skiprows=[1])),
+        ("a b c\n1 2 3\n4 5 6\n7 8 9\n", dict(skiprows=2, header=None)),
+        (
+            "a b c\n1 2 3\n4 5 6\n7 8 9\n",
+            dict(widths=[2, 2, 2], skiprows=lambda x: x == 2),
+        ),
+        ("a b c\n1 2 3\n4 5 6\n", dict(colspecs=[(0, 1), (4, 5)], index_col=0)),
+    ],
+)
+def test_c_engine_matches_python(data, kwargs):
+    expected = read_fwf(StringIO(data), engine="python", **kwargs)
+
+    result = read_fwf(StringIO(data), engine="c", **kwargs)
+    tm.assert_frame_equal(result, expected)
+
+    result = read_fwf(BytesIO(data.encode("utf-8")), engine="c", **kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_c_engine_chunksize():
+    data = "\n".join(f"{i:5d}{i * 2:6d}  x{i}" for i in range(1000))
+    expected = read_fwf(StringIO(data), header=None, engine="python")
+
+    reader = read_fwf(StringIO(data), header=None, engine="c", chunksize=77)
+    result = pd.concat(reader)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_c_engine_carriage_return_file():
+    with tm.ensure_clean() as path:
+        with open(path, "w", newline="") as f:
+            f.write("A B\r1 2\r3 4\r")
+
+        result = read_fwf(path, engine="c")
+    expected = DataFrame({"A": [1, 3], "B": [2, 4]})
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs,engine",
+    [
+        (dict(widths=[2, 2]), "c-fwf"),
+        (dict(), "c-fwf"),
+        (dict(widths=[2, 2], comment="#"), "python-fwf"),
+        (dict(colspecs=[(0, 2), (1, 3)]), "python-fwf"),
+        (dict(colspecs=[(0, -1)]), "python-fwf"),
+        (dict(widths=[2, 2], converters={"A": str}), "python-fwf"),
+        (dict(widths=[2, 2], dtype={"A": "int32"}), "python-fwf"),
+        (dict(widths=[2, 2], engine="python"), "python-fwf"),
+    ],
+)
+def test_engine_selection(kwargs, engine):
+    reader = read_fwf(StringIO("A B\n1 2\n"), iterator=True, **kwargs)
+    assert reader.engine == engine
+    reader.close()
+
+
+def test_c_engine_unsupported_raises():
+    msg = "the 'c' engine does not support comment in read_fwf"
+    with pytest.raises(ValueError, match=msg):
+        read_fwf(StringIO("A B\n1 2\n"), widths=[2, 2], comment="#", engine="c")
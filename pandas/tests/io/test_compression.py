@@ -1,3 +1,4 @@
+from io import BytesIO, StringIO
 import os
 import subprocess
 import sys
@@ -5,6 +6,8 @@ import textwrap
 
 import pytest
 
+import pandas.util._test_decorators as td
+
 import pandas as pd
 import pandas._testing as tm
 
@@ -184,3 +187,119 @@ def test_bzip_compression_level(obj, method):
     """
     with tm.ensure_clean() as path:
         getattr(obj, method)(path, compression={"method": "bz2", "compresslevel": 1})
+
+
+@pytest.mark.parametrize(
+    "method, ext",
+    [
+        pytest.param("zstd", ".zst", marks=td.skip_if_no("zstandard")),
+        pytest.param("lz4", ".lz4", marks=td.skip_if_no("lz4")),
+    ],
+)
+@pytest.mark.parametrize(
+    "write_method, read_method",
+    [("to_csv", "read_csv"), ("to_json", "read_json"), ("to_pickle", "read_pickle")],
+)
+def test_zstd_lz4_roundtrip(method, ext, write_method, read_method):
+    df = pd.DataFrame(
+        100 * [[0.123456, 0.234567, 0.567567], [12.32112, 123123.2, 321321.2]],
+        columns=["X", "Y", "Z"],
+    )
+    kwargs = {"index": False} if write_method == "to_csv" else {}
+    with tm.ensure_clean("compressed" + ext) as path:
+        getattr(df, write_method)(path, compression=method, **kwargs)
+        result = getattr(pd, read_method)(path, compression=method)
+        tm.assert_frame_equal(result, df)
+
+        # inferred from the extension
+        result = getattr(pd, read_method)(path)
+        tm.assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize("engine", ["c", "python"])
+def test_read_csv_threaded(compression_only, engine):
+    df = pd.DataFrame({"a": range(10000), "b": ["x", "y"] * 5000})
+    with tm.ensure_clean() as path:
+        df.to_csv(path, compression=compression_only, index=False)
+        compression = {"method": compression_only, "threaded": True}
+        result = pd.read_csv(path, compression=compression, engine=engine)
+        tm.assert_frame_equal(result, df)
+
+        reader = pd.read_csv(path, compression=compression, chunksize=1000)
+        result = pd.concat(reader, ignore_index=True)
+        tm.assert_frame_equal(result, df)
+
+
+def test_read_json_threaded(compression_only):
+    df = pd.DataFrame({"a": range(1000), "b": ["x", "y"] * 500})
+    with tm.ensure_clean() as path:
+        df.to_json(path, compression=compression_only, orient="records", lines=True)
+        compression = {"method": compression_only, "threaded": True}
+        result = pd.read_json(path, compression=compression, lines=True)
+        tm.assert_frame_equal(result, df)
+
+
+def test_read_fwf_threaded(compression_only):
+    data = "\n".join(f"{i:<6d}{i * 2:>6d}" for i in range(1000)) + "\n"
+    expected = pd.read_fwf(StringIO(data), widths=[6, 6], header=None)
+    with tm.ensure_clean() as path:
+        tm.write_to_compressed(compression_only, path, data.encode())
+        compression = {"method": compression_only, "threaded": True}
+        result = pd.read_fwf(path, widths=[6, 6], header=None, compression=compression)
+        tm.assert_frame_equal(result, expected)
+
+
+def test_threaded_reader():
+    data = bytes(range(256)) * 1000
+    reader = icom._ThreadedReader(BytesIO(data), chunksize=1000, maxsize=2)
+    assert reader.read(10) == data[:10]
+    assert reader.read1(5000) == data[10:1000]
+    buf = bytearray(500)
+    assert reader.readinto(buf) == 500
+    assert bytes(buf) == data[1000:1500]
+    assert reader.read() == data[1500:]
+    assert reader.read() == b""
+    reader.close()
+    assert reader.closed
+
+
+def test_threaded_reader_raises():
+    class FailingReader(BytesIO):
+        def read(self, size=-1):
+            raise OSError("read failed")
+
+    reader = icom._ThreadedReader(FailingReader())
+    with pytest.raises(OSError, match="read failed"):
+        reader.read()
+    reader.close()
+
+
+def test_threaded_reader_close_early():
+    # the background thread must not block on the full queue after close
+    reader = icom._ThreadedReader(BytesIO(b"x" * 100000), chunksize=10, maxsize=1)
+    assert reader.read(5) == b"xxxxx"
+    reader.close()
+    assert not reader._thread.is_alive()
+
+
+def test_register_compression(monkeypatch):
+    monkeypatch.setattr(icom, "_compression_to_extension", {})
+    monkeypatch.setattr(icom, "_compression_openers", {})
+
+    opened = []
+
+    def opener(path_or_buf, mode, **kwargs):
+        opened.append(kwargs)
+        return icom._open_gzip(path_or_buf, mode)
+
+    icom.register_compression("custom", ".custom", opener)
+    msg = "Compression method 'custom' is already registered"
+    with pytest.raises(ValueError, match=msg):
+        icom.register_compression("custom", ".custom", opener)
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    with tm.ensure_clean("test.custom") as path:
+        df.to_csv(path, index=False)
+        result = pd.read_csv(path, compression={"method": "custom", "level": 3})
+    tm.assert_frame_equal(result, df)
+    assert opened == [{}, {"level": 3}]
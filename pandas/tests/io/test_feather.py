@@ -180,3 +180,45 @@ class TestFeather:
         expected = pd.read_feather(feather_file)
         res = pd.read_feather(url)
         tm.assert_frame_equal(expected, res)
+
+    @td.skip_if_no("pyarrow", min_version="0.17.0")
+    @pytest.mark.parametrize("columns", [None, ["int", "string"]])
+    def test_memory_map(self, columns):
+        df = pd.DataFrame(
+            {
+                "int": np.arange(10, dtype="int64"),
+                "float": np.arange(10, dtype="float64"),
+                "string": list("abcdefghij"),
+                "category": pd.Categorical(list("aabbccddee")),
+                "dt": pd.date_range("20130101", periods=10),
+            }
+        )
+        expected = df if columns is None else df[columns]
+        self.check_round_trip(
+            df,
+            expected=expected,
+            write_kwargs=dict(compression="uncompressed"),
+            columns=columns,
+            memory_map=True,
+        )
+
+    @td.skip_if_no("pyarrow", min_version="0.17.0")
+    def test_memory_map_zero_copy(self):
+        df = pd.DataFrame({"A": np.arange(100, dtype="int64"), "B": np.ones(100)})
+        with tm.ensure_clean() as path:
+            to_feather(df, path, compression="uncompressed")
+            result = read_feather(path, memory_map=True)
+            tm.assert_frame_equal(result, df)
+            # the values are read-only views on the mapped file
+            for col in ["A", "B"]:
+                assert not result[col].values.flags.writeable
+
+    @td.skip_if_no("pyarrow", min_version="0.17.0")
+    def test_memory_map_buffer_raises(self):
+        df = pd.DataFrame({"A": [1, 2, 3]})
+        with tm.ensure_clean() as path:
+            to_feather(df, path)
+            with open(path, "rb") as fh:
+                msg = "memory_map=True is only supported for local file paths"
+                with pytest.raises(ValueError, match=msg):
+                    read_feather(fh, memory_map=True)
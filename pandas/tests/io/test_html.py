@@ -84,11 +84,62 @@ def test_same_ordering(datapath):
     assert_framelist_equal(dfs_lxml, dfs_bs4)
 
 
+def test_stream_chunk_boundaries(monkeypatch):
+    html = """<html><body><p>not a table</p>
+    <table id="first"><tr><th>A</th><th>B</th></tr>
+    <tr><td>1&amp;2</td><td>caf\u00e9</td></tr></table>
+    <table id="second"><tr><th>C</th></tr><tr><td>3</td></tr></table>
+    </body></html>"""
+    expected = read_html(StringIO(html), flavor="stream")
+
+    monkeypatch.setattr(pandas.io.html._StreamingFrameParser, "_chunksize", 3)
+    result = read_html(BytesIO(html.encode("utf-8")), flavor="stream")
+    assert_framelist_equal(result, expected)
+    tm.assert_frame_equal(result[0], DataFrame({"A": ["1&2"], "B": ["caf\u00e9"]}))
+
+
+def test_stream_implied_end_tags():
+    html = """<table>
+    <thead><tr><th>A<th>B
+    <tbody><tr><td>1<td>2
+    <tr><td>3<td>4
+    </table>"""
+    result = read_html(html, flavor="stream")[0]
+    expected = DataFrame({"A": [1, 3], "B": [2, 4]})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_stream_nested_and_hidden():
+    html = """<table id="outer">
+    <tr><th>A</th><th>B</th></tr>
+    <tr><td>x<span style="display: none">hidden</span></td>
+    <td><table id="inner"><tr><td>y</td></tr></table></td></tr>
+    <tr style="display:none"><td>1</td><td>2</td></tr>
+    </table>"""
+    outer, inner = read_html(html, flavor="stream")
+    tm.assert_frame_equal(outer, DataFrame({"A": ["x"], "B": ["y"]}))
+    tm.assert_frame_equal(inner, DataFrame({0: ["y"]}))
+
+    result = read_html(html, flavor="stream", attrs={"id": "inner"})
+    assert len(result) == 1
+    tm.assert_frame_equal(result[0], inner)
+
+    result = read_html(html, flavor="stream", displayed_only=False)[0]
+    assert result.shape == (2, 2)
+    assert result.iloc[0, 0] == "xhidden"
+
+
+def test_stream_no_tables():
+    with pytest.raises(ValueError, match="No tables found$"):
+        read_html("<html><p>text</p></html>", flavor="stream")
+
+
 @pytest.mark.parametrize(
     "flavor",
     [
         pytest.param("bs4", marks=td.skip_if_no("bs4")),
         pytest.param("lxml", marks=td.skip_if_no("lxml")),
+        "stream",
     ],
     scope="class",
 )
@@ -1085,6 +1136,7 @@ class TestReadHtml:
         assert isinstance(dfs[0], DataFrame)
 
     @pytest.mark.slow
+    @td.skip_if_no("lxml")
     def test_fallback_success(self, datapath):
         banklist_data = datapath("io", "data", "html", "banklist.html")
         self.read_html(banklist_data, match=".*Water.*", flavor=["lxml", "html5lib"])
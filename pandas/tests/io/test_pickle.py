@@ -20,9 +20,15 @@ import shutil
 from warnings import catch_warnings, simplefilter
 import zipfile
 
+import numpy as np
 import pytest
 
-from pandas.compat import _get_lzma_file, _import_lzma, is_platform_little_endian
+from pandas.compat import (
+    PY38,
+    _get_lzma_file,
+    _import_lzma,
+    is_platform_little_endian,
+)
 import pandas.util._test_decorators as td
 
 import pandas as pd
@@ -381,6 +387,80 @@ class TestProtocol:
             tm.assert_frame_equal(df, df2)
 
 
+@pytest.mark.skipif(not PY38, reason="pickle protocol 5 requires Python 3.8")
+class TestOutOfBand:
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame(
+            {
+                "a": np.arange(10, dtype="int64"),
+                "b": np.arange(10, dtype="float64") / 3,
+                "c": list("abcdefghij"),
+                "d": pd.Categorical(list("xyxyxyxyxy")),
+                "e": pd.date_range("2020-01-01", periods=10, tz="US/Eastern"),
+                "f": pd.array(list(range(9)) + [None], dtype="Int64"),
+            }
+        )
+
+    @pytest.mark.parametrize("memory_map", [True, False])
+    def test_roundtrip(self, df, memory_map):
+        with tm.ensure_clean() as path:
+            df.to_pickle(path, out_of_band=True)
+            result = pd.read_pickle(path, memory_map=memory_map)
+        tm.assert_frame_equal(result, df)
+
+    def test_roundtrip_series(self):
+        ser = pd.Series(np.random.randn(100), name="x")
+        with tm.ensure_clean() as path:
+            ser.to_pickle(path, out_of_band=True)
+            result = pd.read_pickle(path, memory_map=True)
+        tm.assert_series_equal(result, ser)
+
+    def test_file_layout(self, df):
+        with tm.ensure_clean() as path:
+            df.to_pickle(path, out_of_band=True)
+            with open(path, "rb") as fh:
+                assert fh.read(8) == b"PDPKLOOB"
+            # regular pickles are still readable by the stdlib
+            df.to_pickle(path)
+            with open(path, "rb") as fh:
+                tm.assert_frame_equal(pickle.load(fh), df)
+
+    def test_memory_map_copy_on_write(self):
+        df = pd.DataFrame(np.arange(20.0).reshape(10, 2), columns=["a", "b"])
+        with tm.ensure_clean() as path:
+            df.to_pickle(path, out_of_band=True)
+            result = pd.read_pickle(path, memory_map=True)
+            result.iloc[0, 0] = 100.0
+            assert result.iloc[0, 0] == 100.0
+            tm.assert_frame_equal(pd.read_pickle(path, memory_map=True), df)
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "zip", "xz", None])
+    def test_compression(self, df, compression):
+        with tm.ensure_clean() as path:
+            df.to_pickle(path, compression=compression, out_of_band=True)
+            result = pd.read_pickle(path, compression=compression, memory_map=True)
+        tm.assert_frame_equal(result, df)
+
+    def test_buffer(self, df):
+        with tm.ensure_clean() as path:
+            with open(path, "wb") as fh:
+                fh.write(b"prefix")
+                df.to_pickle(fh, out_of_band=True)
+            for memory_map in [True, False]:
+                with open(path, "rb") as fh:
+                    fh.read(6)
+                    result = pd.read_pickle(fh, memory_map=memory_map)
+                tm.assert_frame_equal(result, df)
+
+    @pytest.mark.parametrize("protocol", [0, 2, 4])
+    def test_invalid_protocol(self, df, protocol):
+        msg = "out_of_band=True requires pickle protocol 5"
+        with tm.ensure_clean() as path:
+            with pytest.raises(ValueError, match=msg):
+                df.to_pickle(path, protocol=protocol, out_of_band=True)
+
+
 @pytest.mark.parametrize(
     ["pickle_file", "excols"],
     [
@@ -1762,3 +1762,97 @@ def test_resample_apply_product():
         columns=["A", "B"],
     )
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("tz", [None, "UTC"])
+@pytest.mark.parametrize("freq, n", [("15min", 2000), ("15min", 20), ("D", 2000)])
+def test_resample_tick_bins(closed, tz, freq, n):
+    # the bins of a fixed frequency are located in the values by binary search
+    # when there are more values than bins, and by a linear scan otherwise
+    np.random.seed(8)
+    values = np.random.randint(0, 3 * 24 * 60, n) * 60 * 10 ** 9
+    index = DatetimeIndex(Timestamp("2020-01-01").value + values, tz=tz)
+    index = index.insert(0, pd.NaT).sort_values()
+    ser = Series(np.arange(n + 1), index=index)
+
+    result = ser.resample(freq, closed=closed, label=closed).sum()
+
+    valid = ser[ser.index.notna()]
+    if closed == "left":
+        keys = valid.index.floor(freq)
+    else:
+        keys = valid.index.ceil(freq)
+    expected = valid.groupby(keys).sum()
+    expected = expected.reindex(
+        date_range(expected.index[0], expected.index[-1], freq=freq), fill_value=0
+    )
+    # the NaT bin drops the freq of the labels
+    tm.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_resample_ohlcv():
+    index = DatetimeIndex(
+        [
+            "2020-01-01 09:30:05",
+            "2020-01-01 09:30:40",
+            "2020-01-01 09:31:10",
+            "2020-01-01 09:31:50",
+            "2020-01-01 09:34:00",
+            "2020-01-01 09:34:30",
+        ]
+    )
+    df = DataFrame(
+        {
+            "price": [10.0, 12.0, np.nan, 11.0, 9.0, 10.0],
+            "size": [100.0, 50.0, 20.0, np.nan, 200.0, 100.0],
+        },
+        index=index,
+    )
+    result = df.resample("min").ohlcv("price", "size")
+
+    times = Series(index, index=index).where(df["price"].notna())
+    r = df.resample("min")
+    expected = r["price"].ohlc()
+    expected["volume"] = df["size"].where(df["price"].notna()).resample("min").sum()
+    notional = (df["price"] * df["size"]).resample("min").sum()
+    expected["vwap"] = notional / expected["volume"].where(expected["volume"] != 0)
+    expected["count"] = r["price"].count()
+    expected["first_time"] = times.resample("min").min()
+    expected["last_time"] = times.resample("min").max()
+    tm.assert_frame_equal(result, expected)
+
+    # the timestamps may be a column
+    result = df.reset_index().resample("min", on="index").ohlcv("price", "size")
+    expected.index.name = "index"
+    tm.assert_frame_equal(result, expected)
+
+
+def test_resample_ohlcv_empty():
+    df = DataFrame(
+        {"sym": [], "price": [], "size": []}, index=DatetimeIndex([], name="t")
+    )
+    result = df.resample("min").ohlcv("price", "size")
+
+    columns = ["open", "high", "low", "close", "volume", "vwap"]
+    expected = DataFrame(
+        {column: np.array([], dtype=np.float64) for column in columns},
+        index=DatetimeIndex([], freq="min", name="t"),
+    )
+    expected["count"] = np.array([], dtype=np.int64)
+    expected["first_time"] = DatetimeIndex([])
+    expected["last_time"] = DatetimeIndex([])
+    tm.assert_frame_equal(result, expected)
+
+    result = df.reset_index().resample("min", on="t").ohlcv("price", "size")
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("n", [30, 2])
+def test_resample_dst_values_before_first_bin(n):
+    # the binary search of the bins checks that the values fit the edges, as
+    # the linear scan does
+    index = date_range("2020-03-05 03:00", periods=n, freq="H", tz="US/Eastern")
+    ser = Series(np.arange(n), index=index)
+    with pytest.raises(ValueError, match="Values falls before first bin"):
+        ser.resample("2D", closed="right").sum()
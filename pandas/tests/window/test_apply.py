@@ -126,6 +126,24 @@ def test_invalid_engine_kwargs_cython():
         )
 
 
+def test_invalid_method():
+    with pytest.raises(ValueError, match="method must be either 'single' or 'table'"):
+        Series(range(1)).rolling(1).apply(lambda x: x, raw=True, method="foo")
+    with pytest.raises(ValueError, match="method='table' requires engine='numba'"):
+        Series(range(1)).rolling(1).apply(lambda x: x, raw=True, method="table")
+
+
+@pytest.mark.parametrize(
+    "method", ["sum", "mean", "max", "min", "median", "std", "var", "skew", "kurt"]
+)
+def test_invalid_engine_aggregation(method):
+    roll = Series(range(5)).rolling(2)
+    with pytest.raises(ValueError, match="engine must be either 'numba' or 'cython'"):
+        getattr(roll, method)(engine="foo")
+    with pytest.raises(ValueError, match="cython engine does not accept engine_kwargs"):
+        getattr(roll, method)(engine_kwargs={"nopython": False})
+
+
 def test_invalid_raw_numba():
     with pytest.raises(
         ValueError, match="raw must be `True` when using the numba engine"
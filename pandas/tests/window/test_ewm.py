@@ -3,7 +3,8 @@ import pytest
 
 from pandas.errors import UnsupportedFunctionCall
 
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, date_range, to_datetime
+import pandas._testing as tm
 from pandas.core.window import EWM
 
 
@@ -64,3 +65,63 @@ def test_numpy_compat(method):
         getattr(e, method)(1, 2, 3)
     with pytest.raises(UnsupportedFunctionCall, match=msg):
         getattr(e, method)(dtype=np.float64)
+
+
+def test_ewma_times_not_datetime_type():
+    msg = r"times must be datetime64\[ns\] dtype."
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).ewm(times=np.arange(5))
+
+
+def test_ewma_times_not_same_length():
+    msg = "times must be the same length as the object."
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).ewm(times=np.arange(4).astype("datetime64[ns]"))
+
+
+def test_ewma_halflife_not_correct_type():
+    msg = "halflife must be a string or datetime.timedelta object"
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).ewm(halflife=1, times=np.arange(5).astype("datetime64[ns]"))
+
+
+def test_ewma_halflife_without_times():
+    msg = "halflife can only be a timedelta convertible argument if times is not None."
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).ewm(halflife="1 day")
+
+
+def test_ewma_times_com_not_supported():
+    times = date_range("2020", periods=5)
+    msg = "com, span, and alpha are not supported when times is specified"
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).ewm(com=0.5, halflife="1 day", times=times)
+
+
+@pytest.mark.parametrize("func", ["mean", "var", "std", "cov", "corr"])
+@pytest.mark.parametrize("ignore_na", [True, False])
+def test_ewm_regular_times_matches_halflife(func, ignore_na):
+    # evenly spaced times decay the weights as a constant halflife
+    np.random.seed(6)
+    df = DataFrame({"A": np.random.randn(20), "B": np.random.randn(20)})
+    df.iloc[3] = np.nan
+    times = date_range("2020", periods=20, freq="2D")
+    result = getattr(df.ewm(halflife="5D", times=times, ignore_na=ignore_na), func)()
+    expected = getattr(df.ewm(halflife=2.5, ignore_na=ignore_na), func)()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_ewma_irregular_times():
+    values = np.array([1.0, 5.0, 2.0, 8.0, 3.0])
+    times = to_datetime(
+        ["2020-01-01", "2020-01-02", "2020-01-05", "2020-01-06", "2020-01-11"]
+    )
+    df = DataFrame({"A": values, "time": times})
+    result = df.ewm(halflife="2 days", times="time").mean()
+
+    days = np.asarray((times - times[0]).days, dtype=np.float64)
+    expected = []
+    for i in range(len(values)):
+        weights = 0.5 ** ((days[i] - days[: i + 1]) / 2)
+        expected.append((weights * values[: i + 1]).sum() / weights.sum())
+    tm.assert_frame_equal(result, DataFrame({"A": expected}))
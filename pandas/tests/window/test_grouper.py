@@ -59,7 +59,19 @@ class TestGrouperGrouping:
         g = self.frame.groupby("A")
         r = g.rolling(window=4)
 
-        for f in ["sum", "mean", "min", "max", "count", "kurt", "skew"]:
+        for f in [
+            "sum",
+            "mean",
+            "min",
+            "max",
+            "count",
+            "kurt",
+            "skew",
+            "rank",
+            "argmax",
+            "argmin",
+            "nunique",
+        ]:
             result = getattr(r, f)()
             expected = g.apply(lambda x: getattr(x.rolling(4), f)())
             tm.assert_frame_equal(result, expected)
@@ -138,7 +150,19 @@ class TestGrouperGrouping:
         g = self.frame.groupby("A")
         r = g.expanding()
 
-        for f in ["sum", "mean", "min", "max", "count", "kurt", "skew"]:
+        for f in [
+            "sum",
+            "mean",
+            "min",
+            "max",
+            "count",
+            "kurt",
+            "skew",
+            "rank",
+            "argmax",
+            "argmin",
+            "nunique",
+        ]:
 
             result = getattr(r, f)()
             expected = g.apply(lambda x: getattr(x.expanding(), f)())
@@ -208,3 +232,136 @@ class TestGrouperGrouping:
             name="value",
         )
         tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("closed", [None, "left", "right", "both", "neither"])
+    def test_groupby_rolling_offset_unsorted_groups(self, closed):
+        df = DataFrame(
+            {
+                "A": ["b", "a", "b", "a", "a", "b"],
+                "B": [1.0, 2.0, 4.0, 8.0, 16.0, 32.0],
+            },
+            index=pd.date_range("2020", periods=6, freq="12H"),
+        )
+        result = df.groupby("A").rolling("2D", closed=closed).sum()
+        expected = get_groupby(df, by="A", mutated=True).apply(
+            lambda x: x.rolling("2D", closed=closed).sum()
+        )
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_groupby_rolling_expanding_group_order(self, sort):
+        df = DataFrame({"A": ["b", "a", "b", np.nan, "a", "b"], "B": range(6)})
+        g = df.groupby("A", sort=sort)
+        g_mutated = get_groupby(df, by="A", sort=sort, mutated=True)
+        expected = g_mutated.B.apply(lambda x: x.rolling(2, min_periods=1).sum())
+        result = g.rolling(2, min_periods=1).B.sum()
+        tm.assert_series_equal(result, expected)
+
+        expected = g_mutated.B.apply(lambda x: x.expanding().mean())
+        result = g.B.expanding().mean()
+        tm.assert_series_equal(result, expected)
+
+    def test_groupby_rolling_multiindex(self):
+        index = pd.MultiIndex.from_arrays(
+            [[1, 2, 3, 4], list("wxyz")], names=["x", "y"]
+        )
+        df = DataFrame({"A": [1, 2, 1, 2], "B": [1.0, 2.0, 3.0, 4.0]}, index=index)
+        result = df.groupby("A").B.rolling(2, min_periods=1).sum()
+        expected = Series(
+            [1.0, 4.0, 2.0, 6.0],
+            index=pd.MultiIndex.from_arrays(
+                [[1, 1, 2, 2], [1, 3, 2, 4], list("wyxz")], names=["A", "x", "y"]
+            ),
+            name="B",
+        )
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("func", ["mean", "var", "std"])
+    @pytest.mark.parametrize("ignore_na", [True, False])
+    def test_groupby_ewm(self, func, ignore_na):
+        df = DataFrame(
+            {"A": ["b", "a", "b", np.nan, "a", "b", "a"], "B": range(7)},
+            index=list("pqrstuv"),
+        )
+        df.loc["r", "B"] = np.nan
+        result = getattr(df.groupby("A").ewm(com=1.0, ignore_na=ignore_na), func)()
+        expected = get_groupby(df, by="A", mutated=True).apply(
+            lambda x: getattr(x.ewm(com=1.0, ignore_na=ignore_na), func)()
+        )
+        tm.assert_frame_equal(result, expected)
+
+        result = getattr(df.groupby("A").B.ewm(alpha=0.3, adjust=False), func)()
+        expected = get_groupby(df, by="A", mutated=True).B.apply(
+            lambda x: getattr(x.ewm(alpha=0.3, adjust=False), func)()
+        )
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("func", ["cov", "corr"])
+    def test_groupby_ewm_cov_corr(self, func):
+        np.random.seed(5)
+        df = DataFrame(
+            {"A": np.random.choice(["x", "y"], 20), "B": np.random.randn(20)}
+        ).assign(C=lambda x: x.B * 2 + np.random.randn(20))
+        g = df.groupby("A")
+        g_mutated = get_groupby(df, by="A", mutated=True)
+
+        result = getattr(g.ewm(span=3), func)()
+        expected = g_mutated.apply(lambda x: getattr(x.ewm(span=3), func)())
+        tm.assert_frame_equal(result, expected)
+
+        result = getattr(g.B.ewm(span=3), func)(df["C"])
+        expected = g_mutated.B.apply(
+            lambda x: getattr(x.ewm(span=3), func)(df.loc[x.index, "C"])
+        )
+        tm.assert_series_equal(result, expected, check_names=False)
+
+    def test_groupby_ewm_times(self):
+        df = DataFrame({"A": [1, 2, 1, 2, 1], "B": [0.0, 1.0, 2.0, 3.0, 4.0]})
+        times = pd.to_datetime(
+            ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-05", "2020-01-10"]
+        )
+        result = df.groupby("A").B.ewm(halflife="2 days", times=times).mean()
+        expected = pd.concat(
+            [
+                df.B[df.A == 1].ewm(halflife="2 days", times=times[::2]).mean(),
+                df.B[df.A == 2].ewm(halflife="2 days", times=times[1::2]).mean(),
+            ],
+            keys=[1, 2],
+            names=["A", None],
+        )
+        tm.assert_series_equal(result, expected)
+
+    def test_groupby_ewm_times_column(self):
+        # the group keys and the times are not computed
+        df = DataFrame(
+            {
+                "sym": ["x", "y", "x", "y", "x"],
+                "ts": pd.to_datetime(
+                    [
+                        "2020-01-01",
+                        "2020-01-02",
+                        "2020-01-03",
+                        "2020-01-05",
+                        "2020-01-10",
+                    ]
+                ),
+                "price": [0.0, 1.0, 2.0, 3.0, 4.0],
+                "size": [1, 2, 3, 4, 5],
+            }
+        )
+        result = df.groupby("sym").ewm(halflife="2 days", times="ts").mean()
+        expected = pd.concat(
+            [
+                group[["price", "size"]]
+                .ewm(halflife="2 days", times=group["ts"])
+                .mean()
+                for _, group in df.groupby("sym")
+            ],
+            keys=["x", "y"],
+            names=["sym", None],
+        )
+        tm.assert_frame_equal(result, expected)
+
+        result = df[["ts", "price"]].ewm(halflife="2 days", times="ts").mean()
+        expected = df[["price"]].ewm(halflife="2 days", times=df["ts"]).mean()
+        tm.assert_frame_equal(result, expected)
@@ -3,7 +3,7 @@ import pytest
 
 import pandas.util._test_decorators as td
 
-from pandas import Series
+from pandas import DataFrame, Series
 import pandas._testing as tm
 from pandas.core.util.numba_ import NUMBA_FUNC_CACHE
 
@@ -73,3 +73,102 @@ class TestApply:
         )
         expected = roll.apply(func_1, engine="cython", raw=True)
         tm.assert_series_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+@pytest.mark.filterwarnings("ignore:\\nThe keyword argument")
+class TestEngine:
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("sum", ()),
+            ("mean", ()),
+            ("max", ()),
+            ("min", ()),
+            ("median", ()),
+            ("std", ()),
+            ("var", (0,)),
+            ("skew", ()),
+            ("kurt", ()),
+            ("quantile", (0.3,)),
+            ("cov", ()),
+            ("corr", ()),
+        ],
+    )
+    @pytest.mark.parametrize("center", [True, False])
+    def test_numba_vs_cython(self, method, args, center, nogil, parallel, nopython):
+        engine_kwargs = {"nogil": nogil, "parallel": parallel, "nopython": nopython}
+        df = DataFrame(np.random.randn(30, 3), columns=list("ABC"))
+        df.iloc[[2, 11, 12], 1] = np.nan
+
+        roll = df.rolling(5, min_periods=3, center=center)
+        result = getattr(roll, method)(
+            *args, engine="numba", engine_kwargs=engine_kwargs
+        )
+        expected = getattr(roll, method)(*args, engine="cython")
+        tm.assert_frame_equal(result, expected)
+
+        expanding = df["B"].expanding()
+        result = getattr(expanding, method)(
+            *args, engine="numba", engine_kwargs=engine_kwargs
+        )
+        expected = getattr(expanding, method)(*args)
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+    )
+    def test_quantile_interpolation(self, interpolation):
+        s = Series(np.random.randn(20))
+        roll = s.rolling(6, min_periods=1)
+        result = roll.quantile(0.35, interpolation, engine="numba")
+        expected = roll.quantile(0.35, interpolation)
+        tm.assert_series_equal(result, expected)
+
+        with pytest.raises(ValueError, match="Interpolation 'foo' is not supported"):
+            roll.quantile(0.35, "foo", engine="numba")
+
+    def test_groupby_rolling(self):
+        df = DataFrame({"A": [1, 2, 1, 2, 1, 2] * 3, "B": np.arange(18.0)})
+        roll = df.groupby("A").rolling(2)
+        result = roll.mean(engine="numba")
+        expected = roll.mean()
+        tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numba", "0.46.0")
+class TestTableMethod:
+    @pytest.mark.parametrize("center", [True, False])
+    def test_table_vs_single(self, center):
+        import numba
+
+        @numba.jit(nopython=True)
+        def column_sums(x):
+            result = np.empty(x.shape[1])
+            for j in range(x.shape[1]):
+                result[j] = np.nansum(x[:, j])
+            return result
+
+        df = DataFrame(np.random.randn(20, 3), columns=list("ABC"))
+        df.iloc[[3, 8], 0] = np.nan
+        roll = df.rolling(4, min_periods=1, center=center)
+        result = roll.apply(column_sums, raw=True, engine="numba", method="table")
+        expected = roll.sum()
+        tm.assert_frame_equal(result, expected)
+        assert (column_sums, "rolling_table") in NUMBA_FUNC_CACHE
+
+    def test_table_scalar(self):
+        import numba
+
+        @numba.jit(nopython=True)
+        def first_column_max(x):
+            return x[:, 0].max()
+
+        df = DataFrame({"A": np.arange(6.0), "B": np.arange(6.0) * -1})
+        result = df.rolling(2).apply(
+            first_column_max, raw=True, engine="numba", method="table"
+        )
+        expected = DataFrame(
+            {"A": df["A"].rolling(2).max(), "B": df["A"].rolling(2).max()}
+        )
+        tm.assert_frame_equal(result, expected)
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+from pandas import DataFrame, Series, concat, date_range, to_timedelta
+import pandas._testing as tm
+
+
+@pytest.fixture
+def frame():
+    np.random.seed(7)
+    df = DataFrame(
+        {"A": np.random.randn(50), "B": np.random.randn(50)},
+        index=date_range("2020", periods=50, freq="H")
+        + to_timedelta(np.random.randint(0, 50, 50), unit="min"),
+    )
+    df.iloc[[3, 10, 11], 0] = np.nan
+    return df
+
+
+def _run_online(online, data, method, *args, start=10, step=7, **kwargs):
+    results = [getattr(online, method)(*args)]
+    for i in range(start, len(data), step):
+        results.append(
+            getattr(online, method)(*args, update=data.iloc[i : i + step], **kwargs)
+        )
+    return concat(results)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"com": 0.5},
+        {"alpha": 0.3, "adjust": False},
+        {"span": 4, "ignore_na": True, "min_periods": 3},
+    ],
+)
+def test_online_ewm_mean(frame, kwargs):
+    online = frame.iloc[:10].ewm(**kwargs).online()
+    result = _run_online(online, frame, "mean")
+    expected = frame.ewm(**kwargs).mean()
+    tm.assert_frame_equal(result, expected)
+
+    online = frame["A"].iloc[:10].ewm(**kwargs).online()
+    result = _run_online(online, frame["A"], "mean")
+    tm.assert_series_equal(result, expected["A"])
+
+
+def test_online_ewm_mean_times(frame):
+    times = frame.index
+    online = frame.iloc[:10].ewm(halflife="3H", times=times[:10]).online()
+    results = [online.mean()]
+    for i in range(10, 50, 13):
+        update = frame.iloc[i : i + 13]
+        results.append(online.mean(update=update, update_times=update.index))
+    expected = frame.ewm(halflife="3H", times=times).mean()
+    tm.assert_frame_equal(concat(results), expected)
+
+    with pytest.raises(ValueError, match="update_times must be passed"):
+        online.mean(update=frame.iloc[:2])
+
+
+def test_online_ewm_mean_times_column(frame):
+    # the times column is not averaged, and gives the times of the updates
+    df = frame.assign(t=frame.index).reset_index(drop=True)
+    online = df.iloc[:10].ewm(halflife="3H", times="t").online()
+    result = concat([online.mean(), online.mean(update=df.iloc[10:])])
+    expected = df.ewm(halflife="3H", times="t").mean()
+    tm.assert_frame_equal(result, expected)
+    tm.assert_frame_equal(
+        expected,
+        frame.ewm(halflife="3H", times=frame.index).mean().reset_index(drop=True),
+    )
+
+
+def test_online_ewm_reset(frame):
+    online = frame.ewm(com=0.5).online()
+    with pytest.raises(ValueError, match="Must call mean with update=None"):
+        online.mean(update=frame)
+    online.mean()
+    online.mean(update=frame.iloc[:5])
+    tm.assert_frame_equal(online.mean(), frame.ewm(com=0.5).mean())
+
+    online.reset()
+    with pytest.raises(ValueError, match="Must call mean with update=None"):
+        online.mean(update=frame)
+
+
+@pytest.mark.parametrize(
+    "window, kwargs",
+    [(3, {}), (5, {"min_periods": 1}), ("3H", {}), ("3H", {"closed": "both"})],
+)
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("count", ()),
+        ("sum", ()),
+        ("mean", ()),
+        ("median", ()),
+        ("var", ()),
+        ("max", ()),
+        ("quantile", (0.3,)),
+        ("agg", (["sum", "std"],)),
+    ],
+)
+def test_online_rolling(frame, window, kwargs, method, args):
+    online = frame.iloc[:10].rolling(window, **kwargs).online()
+    result = _run_online(online, frame, method, *args, step=6)
+    expected = getattr(frame.rolling(window, **kwargs), method)(*args)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_online_rolling_keeps_last_window(frame):
+    online = frame.rolling(3).online()
+    online.sum()
+    (kept,) = online._kept.values()
+    assert len(kept) == 2
+
+    online = frame.rolling("3H").online()
+    online.sum()
+    (kept,) = online._kept.values()
+    last = frame.index[-1]
+    tm.assert_frame_equal(kept, frame[frame.index >= last - to_timedelta("3H")])
+
+
+def test_online_rolling_several_statistics(frame):
+    # each method keeps its own rows, so the same update is passed to each
+    online = frame.iloc[:10].rolling(3).online()
+    online.sum()
+    online.mean()
+    online.quantile(0.2)
+    online.quantile(0.8)
+    update = frame.iloc[10:20]
+    expected = frame.iloc[:20].rolling(3)
+
+    result = online.sum(update=update)
+    tm.assert_frame_equal(result, expected.sum().iloc[10:])
+    result = online.mean(update=update)
+    tm.assert_frame_equal(result, expected.mean().iloc[10:])
+    result = online.quantile(0.2, update=update)
+    tm.assert_frame_equal(result, expected.quantile(0.2).iloc[10:])
+    result = online.quantile(0.8, update=update)
+    tm.assert_frame_equal(result, expected.quantile(0.8).iloc[10:])
+
+    with pytest.raises(ValueError, match="Must call std with update=None"):
+        online.std(update=update)
+
+    online.reset()
+    with pytest.raises(ValueError, match="Must call sum with update=None"):
+        online.sum(update=update)
+
+
+def test_online_rolling_selection(frame):
+    online = frame.rolling(3)["A"].online()
+    online.sum()
+    result = online.sum(update=frame.iloc[:4])
+    expected = concat([frame.iloc[-2:], frame.iloc[:4]])["A"].rolling(3).sum()
+    tm.assert_series_equal(result, expected.iloc[2:])
+
+
+def test_online_invalid(frame):
+    with pytest.raises(NotImplementedError, match="center=True"):
+        frame.rolling(3, center=True).online()
+
+    online = frame.rolling(3).online()
+    online.sum()
+    with pytest.raises(TypeError, match="update must be a DataFrame"):
+        online.sum(update=Series([1.0]))
+    with pytest.raises(ValueError, match="same columns"):
+        online.sum(update=frame[["B", "A"]])
+
+    online = frame.ewm(com=0.5).online()
+    online.mean()
+    with pytest.raises(ValueError, match="update_times is only supported"):
+        online.mean(update=frame.iloc[:2], update_times=frame.index[:2])
@@ -663,3 +663,295 @@ def test_iter_rolling_datetime(expected, expected_index, window):
 
     for (expected, actual) in zip(expected, ser.rolling(window)):
         tm.assert_series_equal(actual, expected)
+
+
+@pytest.mark.parametrize("method", ["sum", "mean", "std", "var", "skew", "kurt"])
+@pytest.mark.parametrize(
+    "window, kwargs",
+    [(4, {}), (4, {"center": True}), (6, {"min_periods": 1}), ("3D", {})],
+)
+def test_rolling_wide_frame_matches_columns(method, window, kwargs):
+    # all the columns of a block are computed over the same window bounds in a
+    # single call to the kernel
+    np.random.seed(2)
+    df = DataFrame(
+        np.random.randn(30, 8), index=date_range("2020-01-01", periods=30, freq="D")
+    )
+    df.iloc[[3, 4, 17], 2] = np.nan
+    df[8] = np.arange(30)
+
+    result = getattr(df.rolling(window, **kwargs), method)()
+    expected = df.apply(lambda x: getattr(x.rolling(window, **kwargs), method)())
+    tm.assert_frame_equal(result, expected)
+
+    result = getattr(df.T.rolling(window, axis=1, **kwargs), method)()
+    tm.assert_frame_equal(result, expected.T)
+
+
+@pytest.mark.parametrize(
+    "func, args",
+    [
+        ("roll_sum", ()),
+        ("roll_mean", ()),
+        ("roll_var", (0,)),
+        ("roll_skew", ()),
+        ("roll_kurt", ()),
+    ],
+)
+def test_rolling_2d_kernels(func, args):
+    from pandas._libs.window import aggregations
+
+    np.random.seed(3)
+    values = np.random.randn(50, 6)
+    values[[2, 9, 10], 1] = np.nan
+    start = np.maximum(np.arange(50) - 5, 0).astype("int64")
+    end = np.arange(1, 51, dtype="int64")
+
+    variable = getattr(aggregations, f"{func}_variable_2d")
+    fixed = getattr(aggregations, f"{func}_fixed_2d")
+    for k in range(values.shape[1]):
+        column = values[:, k].copy()
+        result = variable(values, start, end, 3, *args)[:, k]
+        expected = getattr(aggregations, f"{func}_variable")(
+            column, start, end, 3, *args
+        )
+        tm.assert_numpy_array_equal(result, expected)
+
+        result = fixed(values, start, end, 3, 6, *args)[:, k]
+        expected = getattr(aggregations, f"{func}_fixed")(
+            column, start, end, 3, 6, *args
+        )
+        tm.assert_numpy_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 10, 100])
+@pytest.mark.parametrize("min_periods", [1, 3])
+def test_rolling_median_fixed_heaps(window, min_periods):
+    from pandas._libs.window import aggregations
+
+    np.random.seed(4)
+    # many ties and missing values
+    values = np.random.randint(0, 5, 60).astype(float)
+    values[[0, 7, 8, 9, 30, 59]] = np.nan
+    start = np.maximum(np.arange(60) - window + 1, 0).astype("int64")
+    end = np.arange(1, 61, dtype="int64")
+    minp = min(min_periods, window)
+
+    result = aggregations.roll_median_fixed(values, start, end, minp, window)
+    expected = aggregations.roll_median_variable(values, start, end, minp)
+    tm.assert_numpy_array_equal(result, expected)
+
+
+def test_rolling_median_nan_empties_lower_half():
+    # removing a value empties the lower heap before a larger value enters
+    result = Series([0, np.nan, 1, 3, 1.0]).rolling(3, min_periods=1).median()
+    expected = Series([0, 0, 0.5, 2, 1.0])
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("window", [2, 3, 4, 7])
+@pytest.mark.parametrize("min_periods", [1, 2, None])
+def test_rolling_median_random_nans(window, min_periods):
+    np.random.seed(11)
+    for _ in range(50):
+        values = np.random.randint(0, 6, 25).astype(float)
+        values[np.random.rand(25) < 0.3] = np.nan
+        minp = window if min_periods is None else min(min_periods, window)
+
+        result = Series(values).rolling(window, min_periods=min_periods).median()
+
+        expected = np.full(len(values), np.nan)
+        for i in range(len(values)):
+            window_values = values[max(i - window + 1, 0) : i + 1]
+            if np.isfinite(window_values).sum() >= minp:
+                expected[i] = np.nanmedian(window_values)
+        tm.assert_series_equal(result, Series(expected))
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "lower", "nearest"])
+def test_rolling_quantile_list(interpolation):
+    np.random.seed(5)
+    df = DataFrame(
+        {"A": np.random.randn(40), "B": np.random.randn(40)},
+        index=date_range("2020-01-01", periods=40, freq="H"),
+    )
+    df.iloc[[2, 5, 6], 0] = np.nan
+    quantiles = [0.05, 0.5, 0.95, 1.0]
+
+    for roll in [df.rolling(6), df.rolling("4H"), df.rolling(5, center=True)]:
+        result = roll.quantile(quantiles, interpolation=interpolation)
+        expected = pd.concat(
+            {
+                (col, q): roll.quantile(q, interpolation=interpolation)[col]
+                for col in df.columns
+                for q in quantiles
+            },
+            axis=1,
+        )
+        tm.assert_frame_equal(result, expected)
+
+        result = roll["A"].quantile(quantiles, interpolation=interpolation)
+        expected.columns = expected.columns.droplevel(0)
+        tm.assert_frame_equal(result, expected.iloc[:, : len(quantiles)])
+
+
+def test_rolling_quantile_list_invalid():
+    ser = Series(range(5))
+    with pytest.raises(ValueError, match="non-empty 1D list-like"):
+        ser.rolling(2).quantile([])
+    with pytest.raises(ValueError, match=r"quantile value 1.5 not in \[0, 1\]"):
+        ser.rolling(2).quantile([0.5, 1.5])
+
+
+def _last_rank(x, method, ascending, pct):
+    if np.isnan(x[-1]):
+        return np.nan
+    return Series(x).rank(method=method, ascending=ascending, pct=pct).iloc[-1]
+
+
+def _nanarg(func):
+    def f(x):
+        return np.nan if np.isnan(x).all() else func(x)
+
+    return f
+
+
+@pytest.fixture
+def frame_with_ties():
+    np.random.seed(11)
+    df = DataFrame(
+        {
+            "A": np.random.randint(0, 6, 60).astype(float),
+            "B": np.random.randint(0, 3, 60).astype(float),
+        },
+        index=date_range("2020-01-01", periods=60, freq="H")
+        + pd.to_timedelta(np.random.randint(0, 90, 60), unit="min"),
+    )
+    df.iloc[[4, 9, 10, 11, 30], 0] = np.nan
+    return df.sort_index()
+
+
+@pytest.mark.parametrize("method", ["average", "min", "max"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("pct", [True, False])
+@pytest.mark.parametrize("window", [1, 4, "3H"])
+def test_rolling_rank(frame_with_ties, method, ascending, pct, window):
+    roll = frame_with_ties.rolling(window, min_periods=1)
+    result = roll.rank(method=method, ascending=ascending, pct=pct)
+    expected = roll.apply(_last_rank, raw=True, args=(method, ascending, pct))
+    tm.assert_frame_equal(result, expected)
+
+    result = frame_with_ties.expanding().rank(method=method, ascending=ascending)
+    expected = frame_with_ties.expanding().apply(
+        _last_rank, raw=True, args=(method, ascending, False)
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "method, func",
+    [
+        ("argmax", _nanarg(np.nanargmax)),
+        ("argmin", _nanarg(np.nanargmin)),
+        ("nunique", lambda x: len(set(x[~np.isnan(x)])) or np.nan),
+    ],
+)
+@pytest.mark.parametrize(
+    "window, kwargs",
+    [
+        (1, {}),
+        (5, {}),
+        (5, {"min_periods": 1}),
+        (5, {"center": True}),
+        ("3H", {}),
+        ("3H", {"closed": "both"}),
+    ],
+)
+def test_rolling_argmax_argmin_nunique(frame_with_ties, method, func, window, kwargs):
+    roll = frame_with_ties.rolling(window, **kwargs)
+    result = getattr(roll, method)()
+    expected = roll.apply(func, raw=True)
+    tm.assert_frame_equal(result, expected)
+
+    result = getattr(frame_with_ties.expanding(), method)()
+    expected = frame_with_ties.expanding().apply(func, raw=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_rolling_rank_invalid():
+    ser = Series(range(5))
+    with pytest.raises(NotImplementedError, match="center is not implemented"):
+        ser.rolling(3, center=True).rank()
+    with pytest.raises(ValueError, match="Method 'first' is not supported"):
+        ser.rolling(3).rank(method="first")
+
+
+@pytest.mark.parametrize("window", [5, "5s"])
+@pytest.mark.parametrize(
+    "method, func",
+    [
+        ("sum", np.sum),
+        ("mean", np.mean),
+        ("var", lambda x: np.var(x, ddof=1)),
+        ("std", lambda x: np.std(x, ddof=1)),
+    ],
+)
+def test_rolling_precision_after_large_values(window, method, func):
+    # the accumulators are compensated and re-anchored once large values
+    # have left the window, so the small values are not lost in the error
+    np.random.seed(5)
+    values = np.random.randn(200) * 1e-3
+    values[::40] += 1e10
+    ser = Series(values, index=date_range("2020-01-01", periods=200, freq="s"))
+    result = getattr(ser.rolling(window, min_periods=2), method)()
+    expected = ser.rolling(window, min_periods=2).apply(func, raw=True)
+    assert result.isna().equals(expected.isna())
+    assert ((result - expected).abs() <= 1e-9 * expected.abs()).iloc[1:].all()
+
+
+def test_rolling_var_constant_after_large_value():
+    ser = Series([1e10, 1.0, 1.0, 1.0, 1.0, 1.0])
+    result = ser.rolling(3).var()
+    assert (result.iloc[3:] == 0).all()
+
+
+@pytest.mark.parametrize("window", [4, "4s"])
+def test_rolling_sum_alternating_signs(window):
+    # the windows sum to zero at every other step, which must not trigger a
+    # recomputation of every window
+    ser = Series(
+        np.tile([1.0, -1.0], 50), index=date_range("2020", periods=100, freq="s")
+    )
+    result = ser.rolling(window, min_periods=4).sum()
+    expected = Series(0.0, index=ser.index)
+    expected.iloc[:3] = np.nan
+    tm.assert_series_equal(result, expected)
+    result = ser.rolling(window, min_periods=4).mean()
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("window", [3, "3s"])
+def test_rolling_sum_reanchor_after_reanchor(window):
+    # a window recomputed one step earlier does not prevent recomputing the
+    # window the large values have just left
+    ser = Series(
+        [1e16, -1e16, 1e16, 0.1, 0.2, 0.3],
+        index=date_range("2020", periods=6, freq="s"),
+    )
+    result = ser.rolling(window).sum()
+    tm.assert_almost_equal(result.iloc[-1], 0.6)
+    result = ser.rolling(window).mean()
+    tm.assert_almost_equal(result.iloc[-1], 0.2)
+
+
+def test_rolling_sum_random_spikes():
+    # the windows the spikes have left are as precise as without spikes
+    np.random.seed(35)
+    values = np.random.rand(500)
+    spikes = np.random.rand(500) < 0.05
+    values[spikes] = np.random.choice([1e16, -1e16], spikes.sum())
+    result = Series(values).rolling(10).sum()
+
+    for i in range(9, 500):
+        if not spikes[i - 9 : i + 1].any():
+            tm.assert_almost_equal(result[i], values[i - 9 : i + 1].sum())